@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+라우터 시작 시간 / 첫 메시지 로딩 시간 측정
+각 측정은 새 파이썬 프로세스에서 실행한다 (import 캐시 없는 상태).
+
+  1. 라우터 import 시간 (core.router - 디스패치 테이블 + 핸들러 레지스트리 구성)
+  2. 핸들러별 첫 사용 시 모듈 로딩 시간 (첫 메시지 지연 중 import 부분)
+  3. 로딩 이후 메시지 처리 중 import 호출 횟수 (0 이어야 함)
+
+사용법:
+    python benchmarks/bench_cold_start.py [핸들러 이름 ...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_HANDLERS = ["exchange", "whether_today", "lotto", "it_news", "wise_saying", "cache_status"]
+
+# 새 프로세스에서 실행할 측정 코드
+_PROBE = r'''
+import builtins, importlib, io, json, sys, time, contextlib
+sys.path.insert(0, ROOT)
+
+start = time.perf_counter()
+import core.router as router
+import_ms = (time.perf_counter() - start) * 1000
+modules_after_import = len(sys.modules)
+
+handler = router.handler_registry.get(NAME)
+handler.load()
+
+# 로딩 이후 로컬 라우트/일반 대화 처리 중 import 호출 횟수
+calls = {"n": 0}
+original_import, original_import_module = builtins.__import__, importlib.import_module
+def counting_import(*args, **kwargs):
+    calls["n"] += 1
+    return original_import(*args, **kwargs)
+def counting_import_module(*args, **kwargs):
+    calls["n"] += 1
+    return original_import_module(*args, **kwargs)
+builtins.__import__, importlib.import_module = counting_import, counting_import_module
+with contextlib.redirect_stdout(io.StringIO()):
+    for _ in range(100):
+        for msg in ("/테스트", "/시간", "ㅋㅋㅋ 점심 뭐 먹지", "안녕하세요"):
+            router.get_reply_msg("테스트방", "bench", msg)
+builtins.__import__, importlib.import_module = original_import, original_import_module
+
+print(json.dumps({
+    "import_ms": import_ms,
+    "modules_after_import": modules_after_import,
+    "load_ms": handler.load_ms,
+    "modules_after_load": len(sys.modules),
+    "steady_state_imports": calls["n"],
+}))
+'''
+
+
+def probe(name):
+    """새 프로세스에서 라우터 import + 핸들러 하나 로딩"""
+    code = f"ROOT = {ROOT!r}\nNAME = {name!r}\n" + _PROBE
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=ROOT)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "측정 실패")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    names = sys.argv[1:] or DEFAULT_HANDLERS
+
+    print(f"{'핸들러':<16}{'라우터 import':>14}{'첫 로딩':>12}{'모듈 수':>14}{'정상 상태 import':>18}")
+    for name in names:
+        try:
+            r = probe(name)
+        except RuntimeError as e:
+            print(f"{name:<16}  측정 실패: {e}")
+            continue
+        load_ms = f"{r['load_ms']:.1f}ms" if r['load_ms'] is not None else "실패"
+        print(f"{name:<16}{r['import_ms']:>12.1f}ms{load_ms:>12}"
+              f"{r['modules_after_import']:>7} → {r['modules_after_load']:<5}{r['steady_state_imports']:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+라우팅 마이크로벤치마크
+기존 if/elif 라우터와 디스패치 엔진(core.router.dispatch_engine)의
+메시지 매칭 처리량(msgs/sec)을 채팅 메시지 샘플로 비교한다.
+
+핸들러는 실행하지 않고 "어떤 핸들러로 가는지" 결정하는 비용만 측정하며,
+두 방식의 라우팅 결과가 같은지도 함께 확인한다.
+
+사용법:
+    python benchmarks/bench_dispatch.py [--iterations 2000] [--data benchmarks/data/chat_mix.jsonl]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.router import dispatch_engine  # noqa: E402
+
+DEFAULT_DATA = os.path.join(ROOT, "benchmarks", "data", "chat_mix.jsonl")
+
+
+def legacy_route(msg, is_admin):
+    """기존 if/elif 라우터의 매칭 부분 (핸들러 이름 반환)"""
+    if msg == '/테스트':
+        return "_reply_test"
+    elif msg == '/테스트2':
+        return "_reply_test2"
+    elif msg == '/테스트3':
+        return "_reply_test3"
+    elif msg == '/안녕':
+        return "_reply_hello"
+    elif msg == '/시간':
+        return "_reply_time"
+
+    if msg in ['/명령어', '/가이드', '/도움말']:
+        return "_show_commands"
+    elif msg == '/명령어목록':
+        return "_show_command_list"
+    elif msg == "/운세":
+        return "fortune_today"
+    elif msg.startswith("/운세"):
+        return "fortune"
+    elif msg in ["/물병자리", "/물고기자리", "/양자리", "/황소자리", "/쌍둥이자리",
+                 "/게자리", "/사자자리", "/처녀자리", "/천칭자리", "/전갈자리",
+                 "/사수자리", "/궁수자리", "/염소자리"]:
+        return "zodiac"
+    elif msg == '/날씨':
+        return "whether_today"
+    elif msg.startswith("/날씨"):
+        return "whether"
+    elif msg in ["/실시간검색어", '/검색어']:
+        return "real_keyword"
+    elif msg.upper() == '/IT뉴스':
+        return "it_news"
+    elif msg == '/경제뉴스':
+        return "economy_news"
+    elif msg == '/부동산뉴스':
+        return "realestate_news"
+    elif msg == '/세계뉴스':
+        return "world_news"
+    elif msg.startswith("/블로그"):
+        return "search_blog"
+    elif msg.startswith("#"):
+        return "naver_keyword"
+    elif msg.startswith("/주식"):
+        return "stock"
+    elif msg == "/환율":
+        return "exchange"
+    elif msg == '/금값':
+        return "gold"
+    elif msg == '/코인':
+        return "coin"
+    elif msg == "/상한가":
+        return "stock_upper"
+    elif msg == "/하한가":
+        return "stock_lower"
+    elif msg.startswith("/칼로리"):
+        return "calorie"
+    elif msg.startswith(("/맵", "/지도")):
+        return "naver_map"
+    elif msg.startswith("/") and msg.endswith("맛집"):
+        return "naver_map"
+    elif msg == "/명언":
+        return "wise_saying"
+    elif msg == "/인급동":
+        return "youtube_popular_all"
+    elif msg == "/인급동랜덤":
+        return "youtube_popular_random"
+    elif msg.startswith("/네이버부동산"):
+        return "naver_land"
+    elif msg.startswith("/로또결과생성"):
+        return "lotto_result_create"
+    elif msg.startswith("/로또결과"):
+        return "lotto_result"
+    elif msg.startswith("/로또") or "로또" in msg:
+        return "lotto"
+    elif "han.gl" in msg:
+        return "_reply_spam"
+
+    youtube_patterns = [
+        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
+        r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
+        r'(?:https?://)?(?:www\.)?youtube\.com/shorts/[\w-]+',
+        r'(?:https?://)?(?:m\.)?youtube\.com/watch\?v=[\w-]+'
+    ]
+    for pattern in youtube_patterns:
+        if re.search(pattern, msg):
+            return "_summarize_url"
+    if re.search(r'https?://[^\s<>"{}|\\^`\[\]]+', msg):
+        return "_summarize_url"
+
+    if is_admin:
+        if msg == '/test':
+            return "test"
+        elif msg == '/재부팅':
+            return "_reboot"
+        elif msg.startswith('/방추가'):
+            return "room_add"
+        elif msg.startswith('/방삭제'):
+            return "room_remove"
+        elif msg == '/방목록':
+            return "room_list"
+        elif msg.startswith('/오류로그'):
+            return "error_logs"
+        elif msg.startswith('/오류통계'):
+            return "error_stats"
+        elif msg.startswith('/사용통계'):
+            return "usage_stats"
+        elif msg.startswith('/명령어활성화'):
+            return "enable_command"
+        elif msg.startswith('/통계리셋'):
+            return "reset_command_stats"
+        elif msg.startswith('/성능추천'):
+            return "performance_recommendations"
+        elif msg.startswith('/캐시초기화'):
+            return "clear_cache"
+        elif msg.startswith('/캐시상태'):
+            return "cache_status"
+        elif msg.startswith('/스케줄삭제'):
+            return "schedule_delete"
+        elif msg == '/스케줄목록':
+            return "schedule_list"
+        elif msg.startswith('/스케줄'):
+            return "schedule_add"
+
+    greetings = ["안녕", "안녕하세요", "하이", "헬로", "ㅎㅇ", "ㅎ2", "반가워", "반갑습니다"]
+    for greeting in greetings:
+        if greeting in msg.lower():
+            return "_reply_greeting"
+    return None
+
+
+def engine_route(msg, is_admin):
+    """디스패치 엔진 매칭 (핸들러 이름 반환)"""
+    route = dispatch_engine.match(msg, is_admin=is_admin)
+    if route is None:
+        return None
+    # 레지스트리 핸들러(LazyHandler)는 name, 라우터 전용 함수는 __name__
+    return getattr(route.handler, 'name', None) or route.handler.__name__
+
+
+def load_messages(path):
+    """JSONL 메시지 샘플 로드 → [(msg, is_admin)]"""
+    messages = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                messages.append((row["msg"].strip(), bool(row.get("admin"))))
+    return messages
+
+
+def measure(route_fn, messages, iterations):
+    """msgs/sec 측정"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for msg, is_admin in messages:
+            route_fn(msg, is_admin)
+    elapsed = time.perf_counter() - start
+    return len(messages) * iterations / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="라우팅 마이크로벤치마크")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--data", default=DEFAULT_DATA)
+    args = parser.parse_args()
+
+    messages = load_messages(args.data)
+
+    mismatches = [
+        (msg, legacy_route(msg, is_admin), engine_route(msg, is_admin))
+        for msg, is_admin in messages
+        if legacy_route(msg, is_admin) != engine_route(msg, is_admin)
+    ]
+
+    legacy = measure(legacy_route, messages, args.iterations)
+    engine = measure(engine_route, messages, args.iterations)
+
+    print(f"메시지 샘플: {len(messages)}개 x {args.iterations}회")
+    print(f"기존 if/elif : {legacy:>12,.0f} msgs/sec")
+    print(f"디스패치 엔진: {engine:>12,.0f} msgs/sec  (x{engine / legacy:.2f})")
+    print(f"라우팅 불일치: {len(mismatches)}건")
+    for msg, old, new in mismatches:
+        print(f"  {msg!r}: {old} → {new}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+요청당 로깅 비용 벤치마크
+/api/kakaotalk 요청 하나가 남기는 로그를 그대로 흉내 내서 요청 스레드가 쓰는 시간을 비교한다.
+
+  before: basicConfig(DEBUG) + 동기 StreamHandler, 헤더/필드 f-string,
+          router.log / text_utils.log 의 print, debug_logger 의 print + 줄마다 파일 열기 (set_log_file 사용 시)
+  after:  utils.log_pipeline (INFO, % 인자 지연 포맷, writer 스레드가 버퍼링 파일에 기록)
+
+출력은 모두 임시 디렉터리의 파일로 보낸다 (터미널 출력 속도에 영향받지 않도록).
+after 는 요청 스레드 시간과, writer 스레드가 큐를 모두 비울 때까지의 시간을 따로 표시한다.
+
+사용법:
+    python benchmarks/bench_logging.py [--requests 5000]
+"""
+
+import argparse
+import contextlib
+import datetime
+import logging
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.log_pipeline import LOGGING_CONFIG, BufferedRotatingFileHandler, LogPipeline  # noqa: E402
+
+HEADERS = {
+    'host': 'bot.example.com', 'user-agent': 'okhttp/4.9.2', 'accept-charset': 'utf-8',
+    'accept-encoding': 'gzip', 'content-type': 'application/json; charset=utf-8', 'content-length': '96',
+}
+DATA = {'room': '주식투자방', 'sender': '홍길동', 'msg': '/주식 삼성전자', 'accept_pending': True}
+REPLY = "📈 삼성전자 (005930)\n현재가: 71,500원 ▲ 1.2%\n거래량: 12,345,678\n" * 3
+
+
+def legacy_request(logger, debug_log_file):
+    """변경 전 요청 하나의 로그 (main_improved + core.router + debug_logger)"""
+    room, sender, msg = DATA['room'], DATA['sender'], DATA['msg']
+    safe_headers = {k: '***' if 'auth' in k.lower() or 'api' in k.lower() or 'key' in k.lower() else v
+                    for k, v in HEADERS.items()}
+    logger.debug(f"요청 헤더: {safe_headers}")
+    logger.debug(f"요청 메소드: POST, Content-Type: {HEADERS['content-type']}, Body 길이: 96 bytes")
+    logger.debug(f"파싱된 필드: { {k: len(str(v)) for k, v in DATA.items()} }")
+    logger.info(f"추출된 필드 - room: [{room}], sender: [{sender}], msg: [{msg}]")
+    logger.debug(f"명령어 '{msg[:20]}' 타임아웃: 4.0초")
+    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {room}    {sender}    {msg}")
+    message = f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] DEBUG: 주식 조회 성공: {msg[4:]}"
+    print(message)
+    with open(debug_log_file, 'a', encoding='utf-8') as f:
+        f.write(message + '\n')
+    logger.info(f"응답 생성: {room} - {REPLY[:50]}...")
+
+
+def pipeline_request(logger, chat_logger, debug_logger):
+    """변경 후 요청 하나의 로그"""
+    room, sender, msg = DATA['room'], DATA['sender'], DATA['msg']
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("요청 헤더: %s", HEADERS)
+    logger.debug("추출된 필드 - room: [%s], sender: [%s], msg: [%s]", room, sender, msg)
+    logger.debug("명령어 '%.20s' 타임아웃: %s초", msg, 4.0)
+    chat_logger.info("%s    %s    %s", room, sender, msg)
+    debug_logger.debug("주식 조회 성공: %s", msg[4:])
+    logger.info("응답 생성: %s - %.50s...", room, REPLY)
+
+
+def bench_legacy(directory, requests):
+    path = os.path.join(directory, "legacy.log")
+    stream = open(path, 'a', encoding='utf-8')
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', '%Y-%m-%d %H:%M:%S'))
+    logger = logging.getLogger("bench.legacy")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+
+    with contextlib.redirect_stdout(stream):
+        start = time.perf_counter()
+        for _ in range(requests):
+            legacy_request(logger, os.path.join(directory, "debug.log"))
+        elapsed = time.perf_counter() - start
+    stream.close()
+    return elapsed / requests * 1e6
+
+
+def bench_pipeline(directory, requests):
+    handler = BufferedRotatingFileHandler(
+        os.path.join(directory, "bot.log"), LOGGING_CONFIG['MAX_BYTES'], LOGGING_CONFIG['BACKUP_COUNT'],
+        LOGGING_CONFIG['BUFFER_BYTES']
+    )
+    handler.setFormatter(logging.Formatter(LOGGING_CONFIG['FORMAT'], LOGGING_CONFIG['DATE_FORMAT']))
+    pipeline = LogPipeline([handler], queue_size=requests * 8)
+    pipeline.start()
+
+    loggers = []
+    for name in ("bench.main", "bench.chat", "bench.debug"):
+        logger = logging.getLogger(name)
+        logger.handlers = [pipeline.handler]
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        loggers.append(logger)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        pipeline_request(*loggers)
+    caller = time.perf_counter() - start
+    pipeline.stop()
+    total = time.perf_counter() - start
+    return caller / requests * 1e6, total / requests * 1e6, pipeline.get_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        legacy_us = bench_legacy(directory, args.requests)
+        caller_us, total_us, stats = bench_pipeline(directory, args.requests)
+
+    print(f"요청 {args.requests}회 (요청당 로그 호출 6~8개, 출력은 임시 파일)\n")
+    print(f"{'방식':<28}{'요청당 µs':>12}")
+    print(f"{'before (동기 DEBUG + print)':<28}{legacy_us:>12.1f}")
+    print(f"{'after  (요청 스레드)':<28}{caller_us:>12.1f}   {caller_us / legacy_us * 100:.0f}%")
+    print(f"{'after  (writer 기록 완료까지)':<28}{total_us:>12.1f}")
+    print(f"\nwriter 기록 {stats['written']}건, 버림 {stats['dropped']}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 파서 벤치마크
+기록된 응답(benchmarks/data/pages)으로 핸들러를 실행해서 외부 요청 없이 파싱/포맷 단계만 측정한다.
+파서 교체나 선택자 변경의 비용을 오프라인에서 비교하기 위한 것.
+
+  - 케이스 목록은 benchmarks/data/pages/cases.json (핸들러, 메시지, 요청 URL 별 기록된 응답, 응답에 있어야 할 문자열)
+  - 핸들러 모듈의 요청 함수(arequest / request / http_service)를 기록된 응답을 돌려주는 함수로 잠시 바꾼다.
+    result="bs" 는 http_service.parse_html 로 파싱하므로 운영과 같은 파서 경로를 잰다
+    (핸들러가 선언한 only= 부분 트리와 HTML_PARSER_CONFIG 의 파서까지 그대로).
+  - parse: 응답 본문 → BeautifulSoup, format: 선택자 조회 + 응답 문자열 생성 (전체 - parse)
+    (utils.parse_pool 로 추출하는 핸들러는 result="bytes" 라 parse 가 0 이고 파싱까지 format 에 포함.
+     벤치마크에서는 풀을 시작하지 않으므로 추출 함수가 이 프로세스에서 실행된다)
+  - 메모리: 한 번 더 실행해서 tracemalloc 최대 메모리, 파싱 결과가 차지한 할당 블록 수 (sys.getallocatedblocks)
+  - 기준값(benchmarks/data/parser_baseline.json)보다 --threshold 이상 느리거나 메모리를 더 쓰면 회귀로 표시하고 종료 코드 1
+    (기준값은 측정한 기계에 따라 다르므로 같은 기계에서 --save-baseline 으로 다시 저장해서 비교)
+
+사용법:
+    python benchmarks/bench_parsers.py [--iterations 30] [--case stock --case gold] [--threshold 0.3]
+    python benchmarks/bench_parsers.py --save-baseline     # 현재 결과를 기준값으로 저장
+    python benchmarks/bench_parsers.py --backend html.parser --full-page   # 파서 / 부분 파싱 효과 비교
+    python benchmarks/bench_parsers.py --record            # 케이스의 url 을 실제로 요청해서 본문 갱신 (네트워크 필요)
+"""
+
+import argparse
+import asyncio
+import contextlib
+import datetime
+import gc
+import importlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from urllib.parse import unquote, urlencode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests  # noqa: E402
+
+from services import http_service  # noqa: E402
+
+PAGES_DIR = os.path.join(ROOT, "benchmarks", "data", "pages")
+CASES_FILE = os.path.join(PAGES_DIR, "cases.json")
+BASELINE_FILE = os.path.join(ROOT, "benchmarks", "data", "parser_baseline.json")
+
+# 기준값 대비 이만큼(ms) 이상 차이 날 때만 회귀로 표시 (아주 빠른 케이스의 잡음 제외)
+MIN_REGRESSION_MS = 0.3
+
+
+def load_cases(names=None):
+    with open(CASES_FILE, encoding="utf-8") as f:
+        cases = json.load(f)
+    if names:
+        unknown = set(names) - {case['name'] for case in cases}
+        if unknown:
+            raise SystemExit(f"알 수 없는 케이스: {', '.join(sorted(unknown))}")
+        cases = [case for case in cases if case['name'] in names]
+    return cases
+
+
+def save_cases(cases):
+    with open(CASES_FILE, "w", encoding="utf-8") as f:
+        f.write("[\n" + ",\n".join("  " + json.dumps(case, ensure_ascii=False) for case in cases) + "\n]\n")
+
+
+def _charset(content_type):
+    for part in content_type.split(';'):
+        key, _, value = part.strip().partition('=')
+        if key.lower() == 'charset' and value:
+            return value
+    return None
+
+
+class RecordedResponses:
+    """케이스 하나의 기록된 응답 - 핸들러의 요청 함수 대신 사용
+
+    요청 함수와 같은 형태(request / arequest / http_service.get)로 본문을 돌려주고,
+    result="bs" 파싱에 걸린 시간과 할당 블록 수를 모은다.
+    """
+
+    def __init__(self, case):
+        self.entries = {}
+        for entry in case['responses']:
+            with open(os.path.join(PAGES_DIR, entry['file']), "rb") as f:
+                self.entries[unquote(entry['url'])] = (entry, f.read())
+        self.parse_seconds = 0.0
+        self.parse_blocks = 0
+        self.count_blocks = False
+        self.full_page = False          # True: 핸들러가 선언한 only 무시 (부분 파싱 전과 비교용)
+
+    def _lookup(self, url, params=None):
+        key = unquote(url) + ('?' + unquote(urlencode(params)) if params else '')
+        try:
+            return self.entries[key]
+        except KeyError:
+            raise KeyError(f"기록되지 않은 요청: {key}") from None
+
+    def parse(self, body, only=None):
+        """http_service.parse_html 로 파싱 (시간/블록 수 집계)"""
+        if self.count_blocks:
+            gc.disable()
+            blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        soup = http_service.parse_html(body, None if self.full_page else only)
+        self.parse_seconds += time.perf_counter() - start
+        if self.count_blocks:
+            self.parse_blocks += sys.getallocatedblocks() - blocks
+            gc.enable()
+        return soup
+
+    def _convert(self, entry, body, result, only=None):
+        if result == "bs":
+            return self.parse(body, only)
+        if result == "json":
+            return json.loads(body)
+        if result == "bytes":
+            return body
+        return body.decode(_charset(entry['content_type']) or 'utf-8', errors='replace')
+
+    # http_service.request / async_http_service.arequest 대신
+    def request(self, url, method="get", result="text", params=None, only=None, **kwargs):
+        entry, body = self._lookup(url, params)
+        return self._convert(entry, body, result, only)
+
+    async def arequest(self, url, method="get", result="text", params=None, only=None, **kwargs):
+        return self.request(url, method, result, params, only)
+
+    # http_service 모듈 대신 (get/post 가 requests.Response 반환)
+    def get(self, url, params=None, **kwargs):
+        entry, body = self._lookup(url, params)
+        response = requests.Response()
+        response.status_code = entry.get('status', 200)
+        response._content = body
+        response.headers['Content-Type'] = entry['content_type']
+        response.encoding = _charset(entry['content_type'])
+        response.url = url
+        return response
+
+    post = get
+
+    def soup(self):
+        """첫 번째 응답을 파싱한 결과 (soup 를 받는 함수용)"""
+        entry, body = next(iter(self.entries.values()))
+        return self.parse(body)
+
+
+@contextlib.contextmanager
+def replaced(module, name, value):
+    original = getattr(module, name)
+    setattr(module, name, value)
+    try:
+        yield
+    finally:
+        setattr(module, name, original)
+
+
+class CaseRunner:
+    """케이스 하나 실행 (요청 함수를 기록된 응답으로 바꾼 상태에서 한 번씩)"""
+
+    def __init__(self, case, loop):
+        module_name, func_name = case['handler'].split(':')
+        self.case = case
+        self.module = importlib.import_module(module_name)
+        self.func = getattr(self.module, func_name)
+        self.loop = loop
+        self.recorded = RecordedResponses(case)
+        self.page_bytes = sum(len(body) for _, body in self.recorded.entries.values())
+
+    async def _timed_async(self):
+        start = time.perf_counter()
+        reply = await self.func("벤치마크", "bench", self.case['msg'])
+        return reply, time.perf_counter() - start
+
+    def run_once(self):
+        """(응답, 전체 초, 파싱 초)"""
+        recorded = self.recorded
+        recorded.parse_seconds = 0.0
+        fetch = self.case['fetch']
+        if fetch == 'soup':
+            start = time.perf_counter()
+            reply = self.func(recorded.soup())
+            return reply, time.perf_counter() - start, recorded.parse_seconds
+
+        replacement = recorded if fetch == 'http_service' else getattr(recorded, fetch)
+        with replaced(self.module, fetch, replacement):
+            if asyncio.iscoroutinefunction(self.func):
+                reply, seconds = self.loop.run_until_complete(self._timed_async())
+            else:
+                start = time.perf_counter()
+                reply = self.func("벤치마크", "bench", self.case['msg'])
+                seconds = time.perf_counter() - start
+        return reply, seconds, recorded.parse_seconds
+
+    def measure_memory(self):
+        """(최대 메모리 KB, 파싱 결과 할당 블록 수)"""
+        gc.collect()
+        self.recorded.parse_blocks = 0
+        self.recorded.count_blocks = True
+        tracemalloc.start()
+        try:
+            self.run_once()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            self.recorded.count_blocks = False
+        return peak / 1024, self.recorded.parse_blocks
+
+
+def check_reply(case, reply):
+    """응답에 있어야 할 문자열이 모두 있는지 (없으면 빠진 목록)"""
+    if not reply:
+        return ["(빈 응답)"]
+    return [text for text in case.get('expect', []) if text not in reply]
+
+
+def run_case(case, loop, iterations, warmup=3, full_page=False):
+    runner = CaseRunner(case, loop)
+    runner.recorded.full_page = full_page
+    reply = None
+    totals, parses, formats = [], [], []
+    # 핸들러의 print 로그는 버림
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            reply, _, _ = runner.run_once()
+
+        for _ in range(iterations):
+            gc.collect()        # 이전 실행의 soup(순환 참조) 정리 비용이 다음 측정에 섞이지 않도록
+            _, total, parse = runner.run_once()
+            totals.append(total * 1000)
+            parses.append(parse * 1000)
+            formats.append((total - parse) * 1000)
+        peak_kb, blocks = runner.measure_memory()
+    totals.sort()
+    missing = check_reply(case, reply)
+
+    return {
+        'page_kb': round(runner.page_bytes / 1024, 1),
+        'parse_ms': round(statistics.median(parses), 3),
+        'format_ms': round(statistics.median(formats), 3),
+        'total_ms': round(statistics.median(totals), 3),
+        'total_p95_ms': round(totals[min(len(totals) - 1, int(len(totals) * 0.95))], 3),
+        'peak_kb': round(peak_kb, 1),
+        'parse_blocks': blocks,
+        'missing': missing,
+    }
+
+
+def find_regressions(name, result, baseline, threshold):
+    base = baseline.get('cases', {}).get(name)
+    if not base:
+        return []
+    problems = []
+    limit = base['total_ms'] * (1 + threshold)
+    if result['total_ms'] > limit and result['total_ms'] - base['total_ms'] >= MIN_REGRESSION_MS:
+        problems.append(f"시간 {base['total_ms']:.2f}→{result['total_ms']:.2f}ms")
+    if result['peak_kb'] > base['peak_kb'] * (1 + threshold):
+        problems.append(f"메모리 {base['peak_kb']:.0f}→{result['peak_kb']:.0f}KB")
+    return problems
+
+
+def record(cases):
+    """케이스의 url 을 실제로 요청해서 본문/Content-Type 갱신"""
+    for case in cases:
+        for entry in case['responses']:
+            response = http_service.get(entry['url'], timeout=10)
+            response.raise_for_status()
+            with open(os.path.join(PAGES_DIR, entry['file']), "wb") as f:
+                f.write(response.content)
+            entry['content_type'] = response.headers.get('Content-Type', entry['content_type'])
+            entry['captured'] = datetime.date.today().isoformat()
+            print(f"기록: {entry['file']} ({len(response.content) // 1024}KB)")
+
+
+def environment():
+    import bs4
+    return {
+        'python': platform.python_version(),
+        'bs4': bs4.__version__,
+        'parser': http_service.html_backend(),
+        'unported_parser': http_service.html_backend(partial=False),
+        'machine': platform.machine(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--case", action="append", help="실행할 케이스 이름 (여러 번 지정 가능, 기본 전체)")
+    parser.add_argument("--threshold", type=float, default=0.3, help="회귀로 볼 기준값 대비 증가율")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--record", action="store_true", help="실제 응답을 받아 기록 (네트워크 필요)")
+    parser.add_argument("--backend", help="HTML_PARSER_CONFIG['BACKEND'] 대신 사용할 파서 (lxml / html.parser)")
+    parser.add_argument("--full-page", action="store_true", help="핸들러가 선언한 only 를 무시하고 페이지 전체 파싱")
+    args = parser.parse_args()
+    if args.backend:
+        http_service.HTML_PARSER_CONFIG['BACKEND'] = args.backend
+        if args.full_page:
+            http_service.HTML_PARSER_CONFIG['UNPORTED_BACKEND'] = args.backend
+
+    cases = load_cases(args.case)
+    if args.record:
+        record(cases)
+        if not args.case:
+            save_cases(cases)
+        else:
+            recorded = {case['name']: case for case in cases}
+            save_cases([recorded.get(case['name'], case) for case in load_cases()])
+        return
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    loop = asyncio.new_event_loop()
+    results = {}
+    failures = 0
+    print(f"{'케이스':<28}{'페이지':>8}{'parse':>9}{'format':>9}{'전체':>9}{'p95':>9}{'최대 메모리':>12}{'블록':>8}  기준 대비")
+    for case in cases:
+        result = run_case(case, loop, args.iterations, full_page=args.full_page)
+        results[case['name']] = result
+        base = baseline.get('cases', {}).get(case['name'])
+        change = f"{(result['total_ms'] / base['total_ms'] - 1) * 100:+.0f}%" if base else "-"
+        print(f"{case['name']:<28}{result['page_kb']:>6.0f}KB{result['parse_ms']:>7.2f}ms{result['format_ms']:>7.2f}ms"
+              f"{result['total_ms']:>7.2f}ms{result['total_p95_ms']:>7.2f}ms{result['peak_kb']:>10.0f}KB"
+              f"{result['parse_blocks']:>8}  {change}")
+        if result['missing']:
+            failures += 1
+            print(f"    ❗ 응답에 없음: {result['missing']} (기록된 페이지와 선택자가 맞지 않음)")
+        for problem in find_regressions(case['name'], result, baseline, args.threshold):
+            failures += 1
+            print(f"    ⚠️ 회귀: {problem}")
+    loop.close()
+
+    if args.save_baseline:
+        data = {'environment': environment(), 'iterations': args.iterations,
+                'cases': {name: {key: value for key, value in result.items() if key != 'missing'}
+                          for name, result in results.items()}}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {os.path.relpath(args.baseline, ROOT)}")
+    elif baseline:
+        env = baseline.get('environment', {})
+        print(f"\n기준값: {os.path.relpath(args.baseline, ROOT)} (Python {env.get('python')}, bs4 {env.get('bs4')}, "
+              f"{env.get('date')}) · 회귀 기준 +{args.threshold * 100:.0f}%")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
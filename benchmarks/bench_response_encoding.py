@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+응답 인코딩 벤치마크
+/api/kakaotalk 응답 JSON 의 형식별 크기(바이트)와 직렬화 시간을 비교한다.
+
+  ascii:     기존 형식 (ensure_ascii - 한글이 \\uXXXX)
+  utf8:      UTF-8 그대로 (orjson, 공백 없음)
+  utf8+gzip: utf8 + gzip (GZIP_MIN_BYTES 이상일 때만 압축)
+
+응답 샘플은 로컬 명령어(외부 호출 없음)의 실제 응답과
+benchmarks/data/reply_samples.jsonl 의 대표 응답(시세, 뉴스, URL 요약 등)을 사용한다.
+
+사용법:
+    python benchmarks/bench_response_encoding.py [--iterations 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils import response_encoding  # noqa: E402
+from utils.response_encoding import encode_json  # noqa: E402
+
+DEFAULT_DATA = os.path.join(ROOT, "benchmarks", "data", "reply_samples.jsonl")
+LOCAL_COMMANDS = ["/명령어", "/로또", "/안녕", "/시간"]
+
+MODES = {
+    'ascii': {},
+    'utf8': {'accept-charset': 'utf-8'},
+    'utf8+gzip': {'accept-charset': 'utf-8', 'accept-encoding': 'gzip'},
+}
+
+
+def load_samples(path):
+    """(명령어, 응답 본문) 목록"""
+    import io
+    import contextlib
+    from core.router import get_reply_msg
+
+    samples = []
+    for command in LOCAL_COMMANDS:
+        with contextlib.redirect_stdout(io.StringIO()):  # 라우터 로그 숨김
+            reply = get_reply_msg("테스트방", "사용자", command)
+        if reply:
+            samples.append((command, reply))
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                samples.append((item['command'], item['reply']))
+    return samples
+
+
+def measure(data, headers, iterations):
+    """(바이트, 회당 직렬화 시간 µs)"""
+    body, _ = encode_json(data, headers)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encode_json(data, headers)
+    return len(body), (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--data", default=DEFAULT_DATA)
+    args = parser.parse_args()
+
+    samples = load_samples(args.data)
+    encoder = "orjson" if response_encoding.orjson is not None else "json (orjson 없음)"
+    print(f"응답 샘플: {len(samples)}개 x {args.iterations}회, utf8 인코더: {encoder}\n")
+
+    header = f"{'명령어':<14}{'글자':>6}" + "".join(f"{mode:>20}" for mode in MODES)
+    print(header)
+    totals = {mode: [0, 0.0] for mode in MODES}
+    for command, reply in samples:
+        data = {'is_reply': True, 'reply_room': "테스트방", 'reply_msg': reply}
+        row = f"{command[:12]:<14}{len(reply):>6}"
+        for mode, headers in MODES.items():
+            size, us = measure(data, headers, args.iterations)
+            totals[mode][0] += size
+            totals[mode][1] += us
+            row += f"{size:>10,}B {us:>6.1f}µs"
+        print(row)
+
+    base = totals['ascii'][0]
+    print("\n합계 (ascii 대비)")
+    for mode, (size, us) in totals.items():
+        print(f"  {mode:<10} {size:>8,}B ({size / base * 100:5.1f}%)  평균 {us / len(samples):6.1f}µs/응답")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
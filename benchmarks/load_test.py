@@ -0,0 +1,348 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+오프라인 부하 테스트
+채팅 기록(JSONL, {room, sender, msg, t})을 /api/kakaotalk 에 다시 보내서
+명령어별 응답 시간과 오류/타임아웃 비율, 실행 풀 대기열을 측정한다.
+
+  - 외부 호스트는 모두 로컬 stub 서버(benchmarks/stub_upstreams.py)로 돌린다 (네트워크 불필요)
+    호스트별 지연 분포와 오류 비율은 옵션으로 바꾼다.
+  - 앱은 같은 프로세스에서 ASGI 로 호출한다 (uvicorn/소켓 없이 핸들러~실행 풀~HTTP 전송 계층 전체).
+    startup 이벤트(스케줄러, 사전 로딩)는 실행하지 않는다.
+  - t 는 첫 메시지 기준 초. --speedup 배속으로 재생하고(0 이면 기다리지 않음),
+    동시에 보내는 요청은 --concurrency 개까지. t 가 없는 파일은 --rate 개/초 간격으로 보낸다.
+  - room 이 없거나 허용되지 않은 방이면 허용된 첫 번째 방으로 보낸다.
+  - 배속 재생이면 방/사용자/카테고리 토큰 버킷 충전 속도도 같은 배수로 올린다
+    (원래 속도의 트래픽이 받았을 제한과 같게, --keep-rate-limits 로 끔).
+
+결과는 benchmarks/results/ 에 JSON 으로 저장하고 --compare 로 이전 결과와 비교한다.
+
+사용법:
+    python benchmarks/load_test.py [--data benchmarks/data/load_replay.jsonl] [--speedup 10]
+        [--concurrency 32] [--latency api.openai.com=lognormal:3000:0.8 ...] [--error-rate 0.02]
+        [--fixtures DIR] [--name baseline] [--compare benchmarks/results/baseline.json]
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_DATA = os.path.join(ROOT, "benchmarks", "data", "load_replay.jsonl")
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+# 외부 API 를 부르기 전에 키 확인에서 끝나지 않도록 (stub 서버는 키를 보지 않음)
+STUB_API_KEYS = ('GEMINI_API_KEY_1', 'PERPLEXITY_API_KEY_1', 'OPENAI_API_KEY', 'CLAUDE_API_KEY',
+                 'YOUTUBE_API_KEY', 'NAVER_CLIENT_ID', 'NAVER_CLIENT_SECRET')
+
+OUTCOMES = ('ok', 'empty', 'timeout', 'busy', 'error')
+TIMEOUT_MARKER = "(제한시간:"                       # main_improved.get_timeout_message
+ERROR_MESSAGE = "⚠️ 일시적인 오류가 발생했습니다."    # handle_message 예외 응답
+
+
+def percentile(values, pct):
+    """nearest-rank 백분위 (정렬된 목록)"""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(pct / 100 * len(values)) - 1)]
+
+
+def load_events(path, rate):
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                events.append(json.loads(line))
+    for index, event in enumerate(events):
+        event.setdefault('t', index / rate)
+    start = min(event['t'] for event in events) if events else 0
+    for event in events:
+        event['t'] -= start
+    return sorted(events, key=lambda event: event['t'])
+
+
+def scale_rate_limits(admission, factor):
+    """토큰 버킷 충전 속도를 factor 배로 (이미 만들어진 버킷 없음 = 시작 전에 호출)"""
+    def scaled(limit):
+        return {**limit, 'rate': limit['rate'] * factor} if limit else limit
+
+    admission.room_limit = scaled(admission.room_limit)
+    admission.sender_limit = scaled(admission.sender_limit)
+    admission.category_limits = {name: scaled(limit) for name, limit in admission.category_limits.items()}
+
+
+def classify(status_code, body, busy_message):
+    """응답 하나 → OUTCOMES 중 하나"""
+    if status_code != 200:
+        return 'error'
+    reply = body.get('reply_msg') if body.get('is_reply') else None
+    if not reply:
+        return 'empty'
+    if reply == ERROR_MESSAGE:
+        return 'error'
+    if reply == busy_message:
+        return 'busy'
+    if TIMEOUT_MARKER in reply:
+        return 'timeout'
+    return 'ok'
+
+
+def summarize(latencies):
+    values = sorted(latencies)
+    return {
+        'p50_ms': round(percentile(values, 50), 1),
+        'p95_ms': round(percentile(values, 95), 1),
+        'p99_ms': round(percentile(values, 99), 1),
+        'max_ms': round(values[-1], 1) if values else 0.0,
+    }
+
+
+async def replay(main, events, speedup, concurrency, default_room):
+    """이벤트 재생 → (요청별 결과, 풀별 최대 대기열 깊이, 최대 출발 지연 ms, 걸린 시간 초)"""
+    import httpx
+
+    results = []
+    peak_queue = defaultdict(int)
+    semaphore = asyncio.Semaphore(concurrency)
+    done = asyncio.Event()
+    max_lag = 0.0
+
+    async def sample_queues():
+        while not done.is_set():
+            for name, stats in main.bulkhead.get_stats().items():
+                peak_queue[name] = max(peak_queue[name], stats['queue_depth'])
+            await asyncio.sleep(0.05)
+
+    async def send(client, event):
+        room = event.get('room') or default_room
+        payload = {'room': room, 'sender': event.get('sender', 'loadtest'), 'msg': event['msg']}
+        try:
+            started = time.perf_counter()
+            try:
+                response = await client.post("/api/kakaotalk", json=payload)
+                status, body = response.status_code, response.json()
+            except Exception:
+                status, body = 0, {}
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        finally:
+            semaphore.release()
+        results.append({
+            'command': main.get_metrics_command(event['msg']),
+            'ms': elapsed_ms,
+            'outcome': classify(status, body, main.BUSY_MESSAGE)
+        })
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60) as client:
+        sampler = asyncio.create_task(sample_queues())
+        tasks = []
+        start = time.perf_counter()
+        for event in events:
+            if speedup > 0:
+                delay = start + event['t'] / speedup - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await semaphore.acquire()
+            if speedup > 0:
+                max_lag = max(max_lag, time.perf_counter() - start - event['t'] / speedup)
+            tasks.append(asyncio.create_task(send(client, event)))
+        await asyncio.gather(*tasks)
+        done.set()
+        await sampler
+    return results, dict(peak_queue), max_lag * 1000, time.perf_counter() - start
+
+
+def build_report(results, peak_queue, max_lag_ms, duration, pool_stats, admission_stats, upstream_stats, meta):
+    by_command = defaultdict(list)
+    for item in results:
+        by_command[item['command']].append(item)
+
+    def group(items):
+        counts = {outcome: 0 for outcome in OUTCOMES}
+        for item in items:
+            counts[item['outcome']] += 1
+        total = len(items)
+        return {
+            'requests': total,
+            **summarize([item['ms'] for item in items]),
+            **counts,
+            'error_rate': round(counts['error'] / total, 4) if total else 0.0,
+            'timeout_rate': round(counts['timeout'] / total, 4) if total else 0.0,
+        }
+
+    return {
+        'meta': meta,
+        'duration_s': round(duration, 2),
+        'throughput_rps': round(len(results) / duration, 1) if duration else 0.0,
+        'max_send_lag_ms': round(max_lag_ms, 1),
+        'overall': group(results),
+        'commands': {name: group(items) for name, items in
+                     sorted(by_command.items(), key=lambda pair: -len(pair[1]))},
+        'pools': {
+            name: {
+                'submitted': stats['submitted'],
+                'rejected': stats['rejected'],
+                'avg_wait_ms': stats['avg_wait_ms'],
+                'max_wait_ms': stats['max_wait_ms'],
+                'peak_queue': peak_queue.get(name, 0),
+            }
+            for name, stats in pool_stats.items() if stats['submitted']
+        },
+        'admission': {
+            'admitted': admission_stats['admitted'],
+            'rejected': admission_stats['rejected'],
+            'max_in_flight': admission_stats['max_in_flight'],
+        },
+        'upstreams': upstream_stats,
+    }
+
+
+def print_report(report):
+    overall = report['overall']
+    print(f"요청 {overall['requests']}건 · {report['duration_s']}초 · {report['throughput_rps']} req/s · "
+          f"최대 출발 지연 {report['max_send_lag_ms']}ms")
+    print(f"\n{'명령어':<16}{'건수':>6}{'p50':>9}{'p95':>9}{'p99':>9}{'오류':>7}{'타임아웃':>9}{'busy':>6}")
+    rows = [('(전체)', overall)] + list(report['commands'].items())
+    for name, row in rows:
+        print(f"{name:<16}{row['requests']:>6}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}"
+              f"{row['error_rate'] * 100:>6.1f}%{row['timeout_rate'] * 100:>8.1f}%{row['busy']:>6}")
+
+    print(f"\n{'실행 풀':<12}{'작업':>6}{'거절':>6}{'평균 대기':>10}{'최대 대기':>10}{'최대 대기열':>10}")
+    for name, pool in report['pools'].items():
+        print(f"{name:<12}{pool['submitted']:>6}{pool['rejected']:>6}{pool['avg_wait_ms']:>8.1f}ms"
+              f"{pool['max_wait_ms']:>8.1f}ms{pool['peak_queue']:>10}")
+
+    admission = report['admission']
+    print(f"\n요청 제한: 허용 {admission['admitted']}, 거절 {admission['rejected'] or 0}, "
+          f"최대 동시 실행 {admission['max_in_flight']}")
+    print("stub 호스트: " + ", ".join(
+        f"{host} {stats['requests']}" + (f"(오류 {stats['errors']})" if stats['errors'] else "")
+        for host, stats in report['upstreams'].items()
+    ))
+
+
+def print_comparison(old, new):
+    """명령어별 p50/p95/p99 변화 (양쪽에 모두 있는 명령어만)"""
+    print(f"\n비교: {old['meta'].get('name')} → {new['meta'].get('name')}")
+    print(f"{'명령어':<16}" + "".join(f"{key:>22}" for key in ('p50', 'p95', 'p99')))
+    rows = [('(전체)', old['overall'], new['overall'])]
+    rows += [(name, old['commands'][name], row) for name, row in new['commands'].items()
+             if name in old['commands']]
+    for name, before, after in rows:
+        cells = []
+        for key in ('p50_ms', 'p95_ms', 'p99_ms'):
+            change = (after[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            cells.append(f"{before[key]:>7.0f}→{after[key]:<7.0f}{change:>+6.0f}%")
+        print(f"{name:<16}" + "".join(f"{cell:>22}" for cell in cells))
+    for key in ('error_rate', 'timeout_rate'):
+        print(f"{key}: {old['overall'][key] * 100:.1f}% → {new['overall'][key] * 100:.1f}%")
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def parse_hosts(items, parser):
+    specs = {}
+    for item in items or []:
+        host, sep, spec = item.partition('=')
+        if not sep:
+            parser.error(f"--latency 는 호스트=분포 형식입니다: {item}")
+        specs[host] = spec
+    return specs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", default=DEFAULT_DATA)
+    parser.add_argument("--speedup", type=float, default=10.0, help="재생 배속 (0: 기다리지 않음)")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--rate", type=float, default=5.0, help="t 가 없는 파일의 초당 메시지 수")
+    parser.add_argument("--latency", action="append", metavar="HOST=SPEC",
+                        help="호스트별 지연 분포 (예: api.openai.com=lognormal:1500:0.5, *=fixed:50)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="stub 서버 503 응답 비율")
+    parser.add_argument("--keep-rate-limits", action="store_true", help="배속 재생에도 요청 제한 속도 그대로")
+    parser.add_argument("--fixtures", help="<호스트>.html / <호스트>.json 응답 파일 디렉터리")
+    parser.add_argument("--name", help="결과 이름 (기본: 시각)")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+    latency = parse_hosts(args.latency, parser)
+
+    # 앱 import 전에 환경 설정 (로그는 경고 이상만 콘솔로, 파일 없음)
+    for key in STUB_API_KEYS:
+        os.environ.setdefault(key, "loadtest")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("LOG_FILE", "")
+
+    from benchmarks.stub_upstreams import StubUpstreams
+    stubs = StubUpstreams(latency, args.error_rate, args.fixtures)
+    base_url = stubs.start()
+
+    import config
+    import main_improved
+    from services import http_service
+    http_service.UPSTREAM_OVERRIDES['*'] = base_url
+    if args.speedup > 0 and not args.keep_rate_limits:
+        scale_rate_limits(main_improved.admission, args.speedup)
+
+    allowed = config.get_allowed_rooms()
+    events = load_events(args.data, args.rate)
+    for event in events:
+        if event.get('room') not in allowed:
+            event['room'] = allowed[0]
+
+    try:
+        results, peak_queue, max_lag_ms, duration = asyncio.run(replay(
+            main_improved, events, args.speedup, args.concurrency, allowed[0]
+        ))
+    finally:
+        stubs.stop()
+
+    name = args.name or datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    meta = {
+        'name': name,
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'data': os.path.relpath(args.data, ROOT),
+        'events': len(events),
+        'speedup': args.speedup,
+        'concurrency': args.concurrency,
+        'latency': stubs.latency_specs,
+        'error_rate': args.error_rate,
+        'rate_limits_scaled': args.speedup > 0 and not args.keep_rate_limits,
+        'fixtures': args.fixtures,
+    }
+    report = build_report(results, peak_queue, max_lag_ms, duration, main_improved.bulkhead.get_stats(),
+                          main_improved.admission.get_stats(), stubs.get_stats(), meta)
+    print_report(report)
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {os.path.relpath(path, ROOT)}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(json.load(f), report)
+
+    main_improved.bulkhead.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+외부 API stub 서버 (부하 테스트용)
+finance.naver.com, m.news.naver.com, OpenAI/Gemini, YouTube 등 봇이 호출하는 호스트를
+로컬 HTTP 서버 하나로 대신한다. http_service.UPSTREAM_OVERRIDES 로 요청을 이 서버로 돌리면
+원래 호스트가 X-Upstream-Host 헤더로 오고, 호스트별 지연 분포만큼 기다린 뒤 응답한다.
+
+    stubs = StubUpstreams({'finance.naver.com': 'lognormal:120:0.5'}, error_rate=0.01)
+    base_url = stubs.start()        # http://127.0.0.1:<port>
+    ...
+    stubs.stop()
+
+지연 분포 형식 (밀리초):
+    fixed:MS                고정
+    uniform:LO:HI           균등 분포
+    lognormal:MEDIAN:SIGMA  로그 정규 분포 (중앙값, 꼬리 두께)
+
+응답 본문은 AI API 는 각 API 의 JSON 형식, 나머지는 최소 HTML 이다.
+fixtures 디렉터리에 <호스트>.html / <호스트>.json 이 있으면 그 파일을 대신 보낸다.
+"""
+
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+
+# 호스트별 기본 지연 분포 ('*' 는 목록에 없는 호스트)
+DEFAULT_LATENCY = {
+    'finance.naver.com': 'lognormal:120:0.5',
+    'm.stock.naver.com': 'lognormal:80:0.4',
+    'm.news.naver.com': 'lognormal:150:0.6',
+    'n.news.naver.com': 'lognormal:150:0.6',
+    'news.naver.com': 'lognormal:150:0.6',
+    'search.naver.com': 'lognormal:200:0.6',
+    'api.openai.com': 'lognormal:1500:0.5',
+    'generativelanguage.googleapis.com': 'lognormal:1200:0.5',
+    'api.anthropic.com': 'lognormal:1800:0.5',
+    'api.perplexity.ai': 'lognormal:2500:0.5',
+    'www.youtube.com': 'lognormal:300:0.5',
+    'www.googleapis.com': 'lognormal:200:0.4',
+    '*': 'lognormal:100:0.5',
+}
+
+AI_TEXT = "부하 테스트용 stub 응답입니다."
+
+# 호스트별 JSON 응답 (AI API 는 클라이언트가 읽는 필드만)
+JSON_BODIES = {
+    'api.openai.com': {'choices': [{'message': {'role': 'assistant', 'content': AI_TEXT}}]},
+    'api.perplexity.ai': {'choices': [{'message': {'role': 'assistant', 'content': AI_TEXT}}]},
+    'api.anthropic.com': {'content': [{'type': 'text', 'text': AI_TEXT}]},
+    'generativelanguage.googleapis.com': {'candidates': [{'content': {'parts': [{'text': AI_TEXT}]}}]},
+    'www.googleapis.com': {'items': []},
+    'openapi.naver.com': {'items': []},
+    'm.stock.naver.com': {},
+    'api.upbit.com': [],
+}
+
+HTML_BODY = "<html><head><title>stub</title></head><body><div id=\"content\">stub</div></body></html>"
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """지연 분포 문자열 → 호출할 때마다 지연 시간(초)을 뽑는 함수
+
+    Raises:
+        ValueError: 알 수 없는 형식
+    """
+    kind, *args = spec.split(':')
+    try:
+        values = [float(arg) for arg in args]
+        if kind == 'fixed' and len(values) == 1:
+            return lambda: values[0] / 1000
+        if kind == 'uniform' and len(values) == 2:
+            return lambda: random.uniform(values[0], values[1]) / 1000
+        if kind == 'lognormal' and len(values) == 2:
+            mu = math.log(max(values[0], 0.001))
+            return lambda: random.lognormvariate(mu, values[1]) / 1000
+    except ValueError:
+        pass
+    raise ValueError(f"알 수 없는 지연 분포: {spec} (fixed:MS, uniform:LO:HI, lognormal:MEDIAN:SIGMA)")
+
+
+class _Server(ThreadingHTTPServer):
+    request_queue_size = 256            # 동시 연결이 몰려도 거절하지 않도록 (기본 5)
+    daemon_threads = True
+
+
+class StubUpstreams:
+    """호스트별 지연 분포로 응답하는 로컬 HTTP 서버 (요청마다 스레드)"""
+
+    def __init__(self, latency: Dict[str, str] = None, error_rate: float = 0.0,
+                 fixtures: Optional[str] = None):
+        specs = {**DEFAULT_LATENCY, **(latency or {})}
+        self.latency_specs = specs
+        self._latency = {host: parse_latency(spec) for host, spec in specs.items()}
+        self.error_rate = error_rate
+        self.fixtures = fixtures
+        self._bodies: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self.requests = Counter()
+        self.errors = Counter()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def delay(self, host: str) -> float:
+        return self._latency.get(host, self._latency['*'])()
+
+    def body(self, host: str) -> tuple:
+        """(content-type, 본문 bytes) - fixtures 파일 우선"""
+        cached = self._bodies.get(host)
+        if cached is not None:
+            return cached
+        result = None
+        if self.fixtures:
+            for ext, content_type in (('.json', 'application/json'), ('.html', 'text/html; charset=utf-8')):
+                path = os.path.join(self.fixtures, host + ext)
+                if os.path.exists(path):
+                    with open(path, 'rb') as f:
+                        result = (content_type, f.read())
+                    break
+        if result is None and host in JSON_BODIES:
+            result = ('application/json', json.dumps(JSON_BODIES[host], ensure_ascii=False).encode('utf-8'))
+        if result is None:
+            result = ('text/html; charset=utf-8', HTML_BODY.encode('utf-8'))
+        self._bodies[host] = result
+        return result
+
+    def start(self) -> str:
+        """서버 시작 (빈 포트), 기본 주소 반환"""
+        stubs = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'      # keep-alive (봇의 연결 풀 재사용과 같은 조건)
+
+            def _respond(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+                host = self.headers.get('X-Upstream-Host') or 'unknown'
+                time.sleep(stubs.delay(host))
+
+                failed = stubs.error_rate and random.random() < stubs.error_rate
+                with stubs._lock:
+                    stubs.requests[host] += 1
+                    if failed:
+                        stubs.errors[host] += 1
+                if failed:
+                    content_type, body, status = 'text/plain', b'stub error', 503
+                else:
+                    (content_type, body), status = stubs.body(host), 200
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = _Server(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self._server.serve_forever, name="stub-upstreams", daemon=True).start()
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {host: {'requests': count, 'errors': self.errors[host]}
+                    for host, count in self.requests.most_common()}
@@ -15,8 +15,7 @@ def clear_cache(room: str, sender: str, msg: str):
     # main_improved의 캐시 초기화
     try:
         import main_improved
-        cache_size = len(main_improved.response_cache)
-        main_improved.response_cache.clear()
+        cache_size = main_improved.response_cache.clear()
         return f"✅ 캐시가 초기화되었습니다.\n📊 삭제된 캐시: {cache_size}개"
     except Exception as e:
         return f"❌ 캐시 초기화 실패: {str(e)}"
@@ -24,7 +23,6 @@ def clear_cache(room: str, sender: str, msg: str):
 def cache_status(room: str, sender: str, msg: str):
     """캐시 상태 조회 (관리자 전용)"""
     import config
-    import datetime
     
     # 관리자 체크
     if not config.is_admin_user(sender):
@@ -32,25 +30,34 @@ def cache_status(room: str, sender: str, msg: str):
     
     try:
         import main_improved
-        cache_count = len(main_improved.response_cache)
+        stats = main_improved.response_cache.get_stats()
         
         message = f"📊 캐시 상태\n\n"
-        message += f"캐시된 항목: {cache_count}개\n\n"
+        message += f"캐시된 항목: {stats['size']}/{stats['limit']}개\n"
+        message += f"사용 메모리: {stats['bytes'] / 1024:.1f}KB / {stats['max_bytes'] / 1024:.0f}KB\n"
+        message += f"히트율: {stats['hit_rate']*100:.1f}% "
+        message += f"(히트 {stats['hits']} / stale {stats['stale_hits']} / 미스 {stats['misses']})\n"
+        message += f"제거: LRU {stats['evictions']}회, 만료 {stats['expirations']}회\n\n"
         
-        if cache_count > 0:
+        if stats['by_command']:
+            message += "【명령어별 통계】\n"
+            sorted_commands = sorted(
+                stats['by_command'].items(),
+                key=lambda x: x[1]['hits'] + x[1]['misses'],
+                reverse=True
+            )
+            for cmd, cmd_stats in sorted_commands[:10]:
+                message += f"  • {cmd[:20]}: 히트 {cmd_stats['hits']} / 미스 {cmd_stats['misses']}"
+                message += f" (항목 {cmd_stats['entries']}개)\n"
+            message += "\n"
+        
+        # 최근 10개만 표시 (엔진에서 최신순으로 제한 조회)
+        recent = main_improved.response_cache.recent_items(limit=10)
+        if recent:
             message += "【최근 캐시 항목】\n"
-            now = datetime.datetime.now()
-
-            # 최근 10개만 표시 - 동시성 문제 방지를 위해 복사본 생성
-            cache_snapshot = dict(main_improved.response_cache)
-            items = list(cache_snapshot.items())[-10:]
-            for key, (data, cached_time) in items:
-                # 키에서 명령어 추출
-                parts = key.split(':')
-                if len(parts) >= 3:
-                    cmd = parts[2][:20]  # 명령어 부분만
-                    age = (now - cached_time).total_seconds()
-                    message += f"  • {cmd}: {age:.0f}초 전\n"
+            for item in recent:
+                ttl_text = "stale" if item['stale'] else f"남은 TTL {item['ttl_left']:.0f}초"
+                message += f"  • {item['command'][:20]}: {item['age']:.0f}초 전 ({ttl_text})\n"
         
         return message
         
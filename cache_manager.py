@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+========================================
+응답 캐시 엔진
+========================================
+OrderedDict 기반 LRU + 만료 힙 기반 TTL 캐시.
+get/put/LRU 갱신은 O(1), 만료 정리는 O(k log n) (k = 만료된 항목 수).
+soft TTL 이후 hard TTL 까지는 stale 상태로 보관 (stale-while-revalidate).
+동일 명령어 동시 요청을 하나로 합치는 in-flight 레지스트리 포함.
+"""
+
+import asyncio
+import heapq
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+# 조회 상태
+STATE_FRESH = "fresh"
+STATE_STALE = "stale"
+
+
+class CacheEntry:
+    """캐시 항목 (TTL은 저장 시점에 한 번만 결정)
+
+    fresh_until (soft TTL) 까지는 fresh, expires_at (hard TTL) 까지는 stale.
+    """
+    __slots__ = ('value', 'command', 'created_at', 'fresh_until', 'expires_at', 'size')
+
+    def __init__(self, value: Any, command: str, created_at: float, ttl: float, size: int,
+                 stale_ttl: float = 0):
+        self.value = value
+        self.command = command
+        self.created_at = created_at
+        self.fresh_until = created_at + ttl
+        self.expires_at = self.fresh_until + stale_ttl
+        self.size = size
+
+    def age(self, now: float = None) -> float:
+        """저장 후 경과 시간 (초)"""
+        return (now or time.time()) - self.created_at
+
+    def is_fresh(self, now: float = None) -> bool:
+        """soft TTL 이내 여부"""
+        return (now or time.time()) < self.fresh_until
+
+    def is_expired(self, now: float = None) -> bool:
+        """hard TTL 만료 여부"""
+        return (now or time.time()) >= self.expires_at
+
+
+class ResponseCache:
+    """명령어 응답 캐시
+
+    - 항목 수(max_entries)와 바이트 크기(max_bytes) 두 가지 한도
+    - 한도 초과 시 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    - 명령어별 히트/미스/제거 카운터
+    """
+
+    def __init__(self, max_entries: int = 500, max_bytes: int = 4 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._expiry_heap: List = []  # (expires_at, key) - 지연 삭제 방식
+        self._lock = threading.Lock()
+
+        # 크기 / 나이 집계 (재스캔 없이 /health에서 사용)
+        self._total_bytes = 0
+        self._created_sum = 0.0
+
+        # 전체 통계
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        # 명령어별 통계
+        self.command_stats = defaultdict(lambda: {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'entries': 0
+        })
+
+    # ========================================
+    # 기본 연산
+    # ========================================
+
+    def get(self, key: str, command: str = None) -> Optional[Any]:
+        """fresh 캐시 값 반환 (없거나 soft TTL이 지나면 None, 통계 반영)"""
+        value, state = self.lookup(key, command, allow_stale=False)
+        return value
+
+    def lookup(self, key: str, command: str = None,
+               allow_stale: bool = True) -> Tuple[Optional[Any], Optional[str]]:
+        """캐시 조회 - (값, 상태) 반환
+
+        상태: STATE_FRESH / STATE_STALE / None(미스).
+        allow_stale=False 이면 stale 항목은 미스로 처리하되 폴백용으로 남겨둔다.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_expired(now):
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+
+            stats_key = command or (entry.command if entry else 'unknown')
+            if entry is None:
+                self.misses += 1
+                self.command_stats[stats_key]['misses'] += 1
+                return None, None
+
+            if entry.is_fresh(now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.command_stats[stats_key]['hits'] += 1
+                return entry.value, STATE_FRESH
+
+            if not allow_stale:
+                self.misses += 1
+                self.command_stats[stats_key]['misses'] += 1
+                return None, None
+
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            self.command_stats[stats_key]['stale_hits'] += 1
+            return entry.value, STATE_STALE
+
+    def peek(self, key: str) -> Optional[CacheEntry]:
+        """만료 여부와 상관없이 항목 조회 (통계/LRU 갱신 없음, 폴백용)"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, value: Any, ttl: float, command: str = 'unknown',
+            stale_ttl: float = 0):
+        """캐시 저장 (ttl <= 0 이면 저장하지 않음)
+
+        ttl: soft TTL (fresh 기간), stale_ttl: soft TTL 이후 stale로 보관할 추가 기간
+        """
+        if ttl <= 0 or value is None:
+            return
+
+        now = time.time()
+        size = self._estimate_size(key, value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            entry = CacheEntry(value, command, now, ttl, size, stale_ttl)
+            self._entries[key] = entry
+            self._total_bytes += size
+            self._created_sum += now
+            self.command_stats[command]['entries'] += 1
+            heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+
+            # 한도 초과 시 LRU 제거
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self._total_bytes > self.max_bytes):
+                old_key, old_entry = next(iter(self._entries.items()))
+                self._remove(old_key)
+                self.evictions += 1
+                self.command_stats[old_entry.command]['evictions'] += 1
+
+            # 지연 삭제된 힙 항목이 너무 많이 쌓이면 재구성
+            if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+                self._rebuild_heap()
+
+    def purge_expired(self) -> int:
+        """만료된 항목 정리, 제거된 개수 반환"""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                expires_at, key = heapq.heappop(heap)
+                entry = self._entries.get(key)
+                # 재저장된 항목은 힙에 새 만료 시각이 따로 있으므로 건너뜀
+                if entry is not None and entry.expires_at == expires_at:
+                    self._remove(key)
+                    removed += 1
+            self.expirations += removed
+        return removed
+
+    def clear(self) -> int:
+        """전체 캐시 삭제, 삭제된 개수 반환"""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._expiry_heap.clear()
+            self._total_bytes = 0
+            self._created_sum = 0.0
+            for stats in self.command_stats.values():
+                stats['entries'] = 0
+            return count
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    # ========================================
+    # 조회 / 통계
+    # ========================================
+
+    def recent_items(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """최근 사용된 항목 정보 (최대 limit개, 최신순)"""
+        now = time.time()
+        items = []
+        with self._lock:
+            for key in reversed(self._entries):
+                entry = self._entries[key]
+                items.append({
+                    'key': key,
+                    'command': entry.command,
+                    'age': entry.age(now),
+                    'ttl_left': max(0.0, entry.fresh_until - now),
+                    'stale': not entry.is_fresh(now),
+                    'size': entry.size
+                })
+                if len(items) >= limit:
+                    break
+        return items
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (카운터 기반, 캐시 재스캔 없음)"""
+        now = time.time()
+        with self._lock:
+            size = len(self._entries)
+            total = self.hits + self.stale_hits + self.misses
+            avg_age = (now - self._created_sum / size) if size else 0.0
+            by_command = {
+                cmd: dict(stats) for cmd, stats in self.command_stats.items()
+                if stats['entries'] or stats['hits'] or stats['stale_hits'] or stats['misses']
+            }
+            return {
+                'size': size,
+                'limit': self.max_entries,
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'avg_age_seconds': round(avg_age, 1),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'total_requests': total,
+                'hit_rate': (self.hits + self.stale_hits) / total if total else 0.0,
+                'by_command': by_command
+            }
+
+    # ========================================
+    # 내부 함수
+    # ========================================
+
+    def _remove(self, key: str):
+        """항목 제거 (락 보유 상태에서 호출)"""
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+        self._created_sum -= entry.created_at
+        self.command_stats[entry.command]['entries'] -= 1
+        if not self._entries:
+            self._created_sum = 0.0
+
+    def _rebuild_heap(self):
+        """유효 항목만으로 만료 힙 재구성 (락 보유 상태에서 호출)"""
+        self._expiry_heap = [(entry.expires_at, key) for key, entry in self._entries.items()]
+        heapq.heapify(self._expiry_heap)
+
+    @staticmethod
+    def _estimate_size(key: str, value: Any) -> int:
+        """항목 크기 추정 (UTF-8 바이트)"""
+        if isinstance(value, str):
+            value_size = len(value.encode('utf-8'))
+        else:
+            value_size = len(str(value).encode('utf-8'))
+        return value_size + len(key.encode('utf-8'))
+
+
+class InflightRegistry:
+    """동일 요청 합치기 (single-flight)
+
+    같은 키로 동시에 들어온 요청은 먼저 들어온 요청의 작업 하나만 실행하고
+    나머지는 그 결과를 함께 기다린다. 작업은 별도 Task로 실행되므로
+    요청 하나가 취소되어도 다른 대기자에게 영향을 주지 않는다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.executed = 0   # 실제 실행된 작업 수
+        self.coalesced = 0  # 합쳐진(실행 생략된) 요청 수
+        self.coalesced_by_command = defaultdict(int)
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]],
+                  command: str = 'unknown') -> Any:
+        """key에 해당하는 작업이 진행 중이면 합류, 없으면 새로 실행"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._on_done(k, t))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+            self.coalesced_by_command[command] += 1
+
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Future):
+        """작업 완료 시 레지스트리에서 제거"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 대기자가 없어도 예외 미조회 경고가 나지 않도록 소비
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def __contains__(self, key: str) -> bool:
+        """key 작업이 진행 중인지 (합류하면 추가 실행 없음)"""
+        return key in self._inflight
+
+    def get_stats(self) -> Dict[str, Any]:
+        """합치기 통계"""
+        total = self.executed + self.coalesced
+        return {
+            'in_flight': len(self._inflight),
+            'executed': self.executed,
+            'coalesced': self.coalesced,
+            'coalesce_rate': self.coalesced / total if total else 0.0,
+            'by_command': dict(self.coalesced_by_command)
+        }
@@ -8,6 +8,70 @@ STORIUM Bot 통합 명령어 관리 시스템
 import config
 from typing import Dict, List, Tuple, Optional
 
+# ========================================
+# 캐시 범위 (응답 캐시/동시 요청 합치기 키 결정)
+# ========================================
+# global: 방/사용자와 무관 (시세, 뉴스, 날씨 등) - 모든 방에서 공유
+# room:   방 단위로 공유
+# sender: 방+사용자 단위 (개인화된 응답, 기본값)
+# none:   캐시하지 않음 (AI, 랜덤, 관리자 명령어)
+CACHE_SCOPE_GLOBAL = "global"
+CACHE_SCOPE_ROOM = "room"
+CACHE_SCOPE_SENDER = "sender"
+CACHE_SCOPE_NONE = "none"
+
+# ========================================
+# 실행 풀 (core.bulkhead - 명령어 종류별로 worker 분리)
+# ========================================
+# browser: 브라우저 자동화 (Playwright/Selenium) - 느리고 무거움
+# llm:     AI API 호출
+# scrape:  외부 HTTP 스크래핑/API (기본값)
+# admin:   관리/스케줄 명령어 (파일, DB 작업)
+# local:   외부 호출 없는 즉시 응답 - 스레드 없이 이벤트 루프에서 바로 실행
+POOL_BROWSER = "browser"
+POOL_LLM = "llm"
+POOL_SCRAPE = "scrape"
+POOL_ADMIN = "admin"
+POOL_LOCAL = "local"
+DEFAULT_POOL = POOL_SCRAPE
+
+# ========================================
+# 실행 우선순위 (풀의 스레드가 모두 사용 중일 때 대기열 순서, 작을수록 먼저)
+# ========================================
+# admin:  관리자 요청 / 관리 명령어 - fast lane (풀이 가득 차도 거절하지 않음)
+# high:   공유 캐시 명령어 (시세, 뉴스 등 짧은 조회)
+# normal: 기본값
+# low:    오래 걸리는 명령어 (AI, 브라우저)
+# 오래 기다린 작업은 우선순위가 점점 올라간다 (core.bulkhead 의 aging).
+PRIORITY_ADMIN = 0
+PRIORITY_HIGH = 1
+PRIORITY_NORMAL = 2
+PRIORITY_LOW = 3
+PRIORITY_NAMES = {
+    PRIORITY_ADMIN: "admin",
+    PRIORITY_HIGH: "high",
+    PRIORITY_NORMAL: "normal",
+    PRIORITY_LOW: "low",
+}
+
+
+def _default_priority(data: dict) -> int:
+    """명령어 정의에 priority 가 없을 때 - 풀/캐시 범위로 결정"""
+    pool = data.get("pool", DEFAULT_POOL)
+    if data.get("admin_only") or pool == POOL_ADMIN:
+        return PRIORITY_ADMIN
+    if pool in (POOL_LLM, POOL_BROWSER):
+        return PRIORITY_LOW
+    if data.get("cache_scope") in (CACHE_SCOPE_GLOBAL, CACHE_SCOPE_ROOM):
+        return PRIORITY_HIGH
+    return PRIORITY_NORMAL
+
+# 메시지 정규화 규칙
+# whitespace: 연속 공백을 하나로 합치고 앞뒤 공백 제거
+# alias:      별칭을 대표 명령어로 변환 (/가이드 → /명령어)
+#             별칭마다 결과가 다른 명령어(별자리 등)에는 사용하지 않음
+DEFAULT_NORMALIZE = ["whitespace"]
+
 # ========================================
 # 명령어 정의 (모든 명령어를 한 곳에 정리)
 # ========================================
@@ -21,6 +85,8 @@ ALL_COMMANDS = [
         "emoji": "🤖",
         "handler": "get_ai_answer",
         "is_prefix": True,
+        "cache_scope": "none",
+        "pool": "llm",
         "status": "✅ 정상작동"
     },
     
@@ -32,6 +98,9 @@ ALL_COMMANDS = [
         "category": "기본",
         "emoji": "📖",
         "handler": "show_commands",
+        "cache_scope": "sender",
+        "pool": "local",
+        "normalize": ["whitespace", "alias"],
         "status": "✅ 정상작동"
     },
     
@@ -42,6 +111,7 @@ ALL_COMMANDS = [
         "category": "검색",
         "emoji": "🔍",
         "handler": "real_keyword",
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     {
@@ -51,6 +121,8 @@ ALL_COMMANDS = [
         "category": "검색",
         "emoji": "📰",
         "handler": "real_news",
+        "cache_scope": "global",
+        "normalize": ["whitespace", "alias"],
         "status": "✅ 정상작동"
     },
     {
@@ -61,6 +133,8 @@ ALL_COMMANDS = [
         "emoji": "📝",
         "handler": "search_blog",
         "is_prefix": True,
+        "cache_scope": "global",
+        "pool": "browser",
         "status": "✅ 정상작동"
     },
     
@@ -73,6 +147,7 @@ ALL_COMMANDS = [
         "emoji": "🔮",
         "handler": "fortune",
         "is_prefix": True,
+        "cache_scope": "sender",
         "status": "✅ 정상작동"
     },
     {
@@ -84,6 +159,7 @@ ALL_COMMANDS = [
         "category": "운세",
         "emoji": "⭐",
         "handler": "zodiac",
+        "cache_scope": "sender",
         "status": "✅ 정상작동"
     },
     
@@ -96,6 +172,7 @@ ALL_COMMANDS = [
         "emoji": "🌞",
         "handler": "whether",
         "is_prefix": True,
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     
@@ -108,6 +185,7 @@ ALL_COMMANDS = [
         "emoji": "📊",
         "handler": "stock",
         "is_prefix": True,
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     {
@@ -116,6 +194,7 @@ ALL_COMMANDS = [
         "category": "정보",
         "emoji": "💲",
         "handler": "exchange",
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     {
@@ -124,6 +203,7 @@ ALL_COMMANDS = [
         "category": "정보",
         "emoji": "🪙",
         "handler": "coin",
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     {
@@ -132,6 +212,7 @@ ALL_COMMANDS = [
         "category": "정보",
         "emoji": "💰",
         "handler": "gold",
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     {
@@ -140,6 +221,7 @@ ALL_COMMANDS = [
         "category": "정보",
         "emoji": "📈",
         "handler": "stock_upper",
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     {
@@ -148,6 +230,7 @@ ALL_COMMANDS = [
         "category": "정보",
         "emoji": "📉",
         "handler": "stock_lower",
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     
@@ -158,6 +241,8 @@ ALL_COMMANDS = [
         "category": "엔터",
         "emoji": "🍀",
         "handler": "lotto",
+        "cache_scope": "none",
+        "pool": "local",
         "status": "✅ 정상작동"
     },
     {
@@ -166,6 +251,7 @@ ALL_COMMANDS = [
         "category": "엔터",
         "emoji": "🎰",
         "handler": "lotto_result",
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     {
@@ -174,6 +260,7 @@ ALL_COMMANDS = [
         "category": "엔터",
         "emoji": "📺",
         "handler": "youtube_popular_all",
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     
@@ -187,6 +274,7 @@ ALL_COMMANDS = [
         "emoji": "🗺️",
         "handler": "naver_map",
         "is_prefix": True,
+        "cache_scope": "sender",
         "status": "✅ 정상작동"
     },
     {
@@ -197,6 +285,8 @@ ALL_COMMANDS = [
         "emoji": "🏠",
         "handler": "naver_land",
         "is_prefix": True,
+        "cache_scope": "global",
+        "pool": "browser",
         "status": "✅ 정상작동"
     },
     {
@@ -207,6 +297,7 @@ ALL_COMMANDS = [
         "emoji": "🍲",
         "handler": "calorie",
         "is_prefix": True,
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     
@@ -220,6 +311,8 @@ ALL_COMMANDS = [
         "handler": "schedule_add",
         "is_prefix": True,
         "admin_only": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -229,6 +322,8 @@ ALL_COMMANDS = [
         "emoji": "📋",
         "handler": "schedule_list",
         "admin_only": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -240,6 +335,8 @@ ALL_COMMANDS = [
         "handler": "schedule_delete",
         "is_prefix": True,
         "admin_only": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
 
@@ -253,6 +350,8 @@ ALL_COMMANDS = [
         "handler": "room_add",
         "admin_only": True,
         "is_prefix": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -264,6 +363,8 @@ ALL_COMMANDS = [
         "handler": "room_remove",
         "admin_only": True,
         "is_prefix": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -273,6 +374,8 @@ ALL_COMMANDS = [
         "emoji": "📋",
         "handler": "room_list",
         "admin_only": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -282,6 +385,8 @@ ALL_COMMANDS = [
         "emoji": "🔄",
         "handler": "reboot",
         "admin_only": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     
@@ -295,6 +400,8 @@ ALL_COMMANDS = [
         "handler": "error_logs",
         "admin_only": True,
         "is_prefix": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -304,6 +411,8 @@ ALL_COMMANDS = [
         "emoji": "📊",
         "handler": "error_stats",
         "admin_only": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -313,6 +422,8 @@ ALL_COMMANDS = [
         "emoji": "📈",
         "handler": "usage_stats",
         "admin_only": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -324,6 +435,8 @@ ALL_COMMANDS = [
         "handler": "enable_command",
         "admin_only": True,
         "is_prefix": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -335,6 +448,8 @@ ALL_COMMANDS = [
         "handler": "reset_command_stats",
         "admin_only": True,
         "is_prefix": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -344,6 +459,34 @@ ALL_COMMANDS = [
         "emoji": "⚡",
         "handler": "performance_recommendations",
         "admin_only": True,
+        "cache_scope": "none",
+        "pool": "admin",
+        "status": "✅ 정상작동"
+    },
+    {
+        "name": "/트레이스",
+        "description": "느린 요청 구간별 시간",
+        "usage": "/트레이스 [개수 | 샘플 비율 | 초기화]",
+        "category": "관리",
+        "emoji": "🐢",
+        "handler": "trace_report",
+        "admin_only": True,
+        "is_prefix": True,
+        "cache_scope": "none",
+        "pool": "admin",
+        "status": "✅ 정상작동"
+    },
+    {
+        "name": "/프로파일",
+        "description": "샘플링 프로파일 (스레드 스택)",
+        "usage": "/프로파일 [초] | 최근 [초] | 상시 켜기/끄기",
+        "category": "관리",
+        "emoji": "🔬",
+        "handler": "profile_report",
+        "admin_only": True,
+        "is_prefix": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -353,6 +496,8 @@ ALL_COMMANDS = [
         "emoji": "🗑️",
         "handler": "clear_cache",
         "admin_only": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     {
@@ -362,6 +507,8 @@ ALL_COMMANDS = [
         "emoji": "💾",
         "handler": "cache_status",
         "admin_only": True,
+        "cache_scope": "none",
+        "pool": "admin",
         "status": "✅ 정상작동"
     },
     
@@ -374,6 +521,7 @@ ALL_COMMANDS = [
         "emoji": "🔑",
         "handler": "naver_keyword",
         "is_prefix": True,
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     
@@ -384,6 +532,7 @@ ALL_COMMANDS = [
         "category": "검색",
         "emoji": "💹",
         "handler": "economy_news",
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
     {
@@ -392,6 +541,7 @@ ALL_COMMANDS = [
         "category": "검색",
         "emoji": "💻",
         "handler": "it_news",
+        "cache_scope": "global",
         "status": "✅ 정상작동"
     },
 ]
@@ -409,6 +559,10 @@ class CommandInfo:
         self.admin_only = data.get("admin_only", False)
         self.is_prefix = data.get("is_prefix", False)
         self.status = data.get("status", "❓ 미확인")
+        self.cache_scope = data.get("cache_scope", CACHE_SCOPE_SENDER)
+        self.normalize = data.get("normalize", DEFAULT_NORMALIZE)
+        self.pool = data.get("pool", DEFAULT_POOL)
+        self.priority = data.get("priority", _default_priority(data))
 
 class CommandManager:
     """명령어 관리자 클래스"""
@@ -447,6 +601,37 @@ class CommandManager:
         
         return None
     
+    def normalize_message(self, msg: str, cmd: Optional[CommandInfo] = None) -> str:
+        """명령어의 정규화 규칙에 따라 메시지 정규화"""
+        msg = ' '.join(msg.split())
+        if cmd is None:
+            cmd = self.find_command(msg)
+        if cmd is None or "alias" not in cmd.normalize:
+            return msg
+        
+        for alias in cmd.aliases:
+            if msg == alias:
+                return cmd.name
+            if cmd.is_prefix and msg.startswith(alias):
+                return cmd.name + msg[len(alias):]
+        return msg
+    
+    def get_cache_key(self, room: str, sender: str, msg: str,
+                      scope: Optional[str] = None) -> Optional[str]:
+        """명령어의 캐시 범위에 따라 캐시 키 생성 (캐시하지 않는 명령어는 None)"""
+        cmd = self.find_command(msg)
+        if scope is None:
+            scope = cmd.cache_scope if cmd else CACHE_SCOPE_SENDER
+        
+        normalized = self.normalize_message(msg, cmd)
+        if scope == CACHE_SCOPE_GLOBAL:
+            return f"global:{normalized}"
+        if scope == CACHE_SCOPE_ROOM:
+            return f"room:{room}:{normalized}"
+        if scope == CACHE_SCOPE_SENDER:
+            return f"sender:{room}:{sender}:{normalized}"
+        return None
+    
     def get_handler_name(self, msg: str) -> Optional[str]:
         """메시지에 대한 핸들러 함수명 반환"""
         cmd = self.find_command(msg)
@@ -469,6 +654,13 @@ class CommandManager:
         
         return True, ""
     
+    def get_priority(self, msg: str, user: str) -> int:
+        """실행 우선순위 (관리자 요청은 명령어와 관계없이 fast lane)"""
+        if config.is_admin_user(user):
+            return PRIORITY_ADMIN
+        cmd = self.find_command(msg)
+        return cmd.priority if cmd else PRIORITY_NORMAL
+    
     def get_command_list(self, is_admin: bool = False) -> str:
         """명령어 목록 생성 (상세 버전)"""
         message = "📌 **전체 명령어 목록** 📌\n\n"
@@ -617,10 +809,22 @@ def check_command_permission(msg: str, user: str, room: str) -> Tuple[bool, str]
     """명령어 권한 체크"""
     return command_manager.check_permission(msg, user, room)
 
+def get_command_priority(msg: str, user: str) -> int:
+    """명령어 실행 우선순위 반환"""
+    return command_manager.get_priority(msg, user)
+
 def get_handler_name(msg: str) -> Optional[str]:
     """핸들러 이름 반환"""
     return command_manager.get_handler_name(msg)
 
 def find_command(msg: str) -> Optional[CommandInfo]:
     """명령어 찾기"""
-    return command_manager.find_command(msg)
\ No newline at end of file
+    return command_manager.find_command(msg)
+
+def normalize_message(msg: str) -> str:
+    """메시지 정규화"""
+    return command_manager.normalize_message(msg)
+
+def get_cache_key(room: str, sender: str, msg: str, scope: Optional[str] = None) -> Optional[str]:
+    """캐시 키 반환 (캐시하지 않는 명령어는 None)"""
+    return command_manager.get_cache_key(room, sender, msg, scope)
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+요청 허용(admission control) 모듈
+명령어를 실행하기 전에 방/사용자/명령어 카테고리별 토큰 버킷과 전역 동시 실행 수를 확인해
+한 방이나 사용자가 실행 풀과 유료 API(OpenAI, Bright Data) 할당량을 독차지하지 못하게 한다.
+
+    from core.admission import admission      # ADMISSION_CONFIG 로 만든 공용 인스턴스
+
+    reason = admission.admit(room, sender, category)
+    if reason:
+        return BUSY_MESSAGE                 # 대기열에 넣지 않고 바로 바쁨 응답
+    with admission.running():
+        ...                                 # 명령어 실행
+
+이벤트 루프 스레드에서만 호출한다 (잠금 없음).
+"""
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+# ========================================
+# 설정
+# ========================================
+# rate: 초당 충전되는 요청 수, burst: 연속으로 허용되는 최대 요청 수
+ADMISSION_CONFIG = {
+    'MAX_CONCURRENT': 32,                      # 전역 동시 실행 명령어 수 (0 이면 제한 없음)
+    'ROOM': {'rate': 0.5, 'burst': 20},        # 방마다 분당 30건
+    'SENDER': {'rate': 0.2, 'burst': 6},       # 방+사용자마다 분당 12건
+    'CATEGORY': {                              # command_manager 카테고리 (URL 요약은 'URL')
+        'AI': {'rate': 0.5, 'burst': 10},      # 유료 AI API
+        'URL': {'rate': 0.2, 'burst': 5},      # 브라우저 + 유료 프록시
+        '검색': {'rate': 0.5, 'burst': 10},    # 브라우저 검색 (블로그 등)
+    },
+}
+
+REASON_ROOM = "room"
+REASON_SENDER = "sender"
+REASON_CATEGORY = "category"
+REASON_CONCURRENCY = "concurrency"
+
+# 버킷이 이보다 많아지면 가득 찬(= 새로 만든 것과 같은) 버킷을 정리
+MAX_BUCKETS = 10000
+
+
+class TokenBucket:
+    """토큰 버킷 (rate: 초당 충전 토큰, burst: 최대 토큰)"""
+    __slots__ = ('rate', 'burst', 'tokens', 'updated')
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def peek(self, now: float = None) -> bool:
+        """토큰이 남아 있는지 (사용하지 않음)"""
+        self._refill(now or time.monotonic())
+        return self.tokens >= 1
+
+    def take(self):
+        self.tokens -= 1
+
+    def is_full(self, now: float) -> bool:
+        return self.tokens + (now - self.updated) * self.rate >= self.burst
+
+
+class AdmissionController:
+    """방/사용자/카테고리 토큰 버킷 + 전역 동시 실행 수 제한"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.max_concurrent = config.get('MAX_CONCURRENT', 0)
+        self.room_limit = config.get('ROOM')
+        self.sender_limit = config.get('SENDER')
+        self.category_limits = config.get('CATEGORY', {})
+
+        self._buckets: Dict[tuple, TokenBucket] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.admitted = 0
+        self.rejected = defaultdict(int)             # 사유별
+        self.rejected_by_room = defaultdict(int)
+        self.rejected_by_category = defaultdict(int)
+
+    def _bucket(self, key: tuple, limit: Dict[str, float]) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= MAX_BUCKETS:
+                self._prune()
+            bucket = self._buckets[key] = TokenBucket(limit['rate'], limit['burst'])
+        return bucket
+
+    def _prune(self):
+        """가득 찬 버킷 제거 (다시 만들어도 상태가 같음)"""
+        now = time.monotonic()
+        for key in [key for key, bucket in self._buckets.items() if bucket.is_full(now)]:
+            del self._buckets[key]
+
+    def admit(self, room: str, sender: str, category: Optional[str] = None) -> Optional[str]:
+        """실행 허용 여부 - 허용하면 None, 거절하면 사유 (REASON_*)
+
+        모든 버킷에 토큰이 있을 때만 한꺼번에 차감한다 (거절된 요청은 토큰을 쓰지 않음).
+        """
+        if self.max_concurrent and self.in_flight >= self.max_concurrent:
+            return self._reject(REASON_CONCURRENCY, room, category)
+
+        now = time.monotonic()
+        checks = []
+        if self.room_limit:
+            checks.append((REASON_ROOM, self._bucket(('room', room), self.room_limit)))
+        if self.sender_limit:
+            checks.append((REASON_SENDER, self._bucket(('sender', room, sender), self.sender_limit)))
+        if category in self.category_limits:
+            checks.append((REASON_CATEGORY,
+                           self._bucket(('category', category), self.category_limits[category])))
+
+        for reason, bucket in checks:
+            if not bucket.peek(now):
+                return self._reject(reason, room, category)
+        for _, bucket in checks:
+            bucket.take()
+
+        self.admitted += 1
+        return None
+
+    def _reject(self, reason: str, room: str, category: Optional[str]) -> str:
+        self.rejected[reason] += 1
+        self.rejected_by_room[room] += 1
+        if category:
+            self.rejected_by_category[category] += 1
+        return reason
+
+    @contextmanager
+    def running(self):
+        """명령어 실행 구간 (전역 동시 실행 수 집계)"""
+        self.in_flight += 1
+        if self.in_flight > self.max_in_flight:
+            self.max_in_flight = self.in_flight
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """허용/거절 통계 (/health, /사용통계)"""
+        total = self.admitted + sum(self.rejected.values())
+        return {
+            'admitted': self.admitted,
+            'rejected': dict(self.rejected),
+            'reject_rate': sum(self.rejected.values()) / total if total else 0.0,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'max_concurrent': self.max_concurrent,
+            'buckets': len(self._buckets),
+            'rejected_by_room': dict(self.rejected_by_room),
+            'rejected_by_category': dict(self.rejected_by_category)
+        }
+
+
+admission = AdmissionController(ADMISSION_CONFIG)
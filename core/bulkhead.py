@@ -0,0 +1,272 @@
+"""
+벌크헤드(bulkhead) 실행 풀 모듈
+명령어 종류(command_manager 의 pool)별로 스레드 풀을 분리해
+느린 명령어(브라우저, AI)가 다른 명령어의 worker 를 모두 차지하지 못하게 한다.
+
+    scheduler = BulkheadScheduler({
+        'browser': {'max_workers': 2, 'max_queue': 2, 'overflow': 'reject'},
+        'scrape':  {'max_workers': 8, 'max_queue': 32, 'overflow': 'wait'},
+        'local':   {'max_workers': 0},      # 이벤트 루프에서 바로 실행
+    }, default='scrape')
+
+    result = await scheduler.pool('browser').run(func, *args)
+
+    result = await scheduler.pool('llm').run(func, *args, priority=0)   # 관리자 요청
+
+스레드가 모두 사용 중이면 우선순위 대기열에서 기다린다 (FIFO 아님).
+대기열 길이(max_queue)를 넘으면 overflow 정책을 따른다.
+  reject: 즉시 PoolFull (바쁨 응답) - priority 0 (fast lane) 은 제외
+  wait:   자리가 날 때까지 대기 (명령어 타임아웃 안에서)
+"""
+
+import asyncio
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from utils.metrics import metrics
+
+OVERFLOW_REJECT = "reject"
+OVERFLOW_WAIT = "wait"
+
+DEFAULT_PRIORITY = 2    # command_manager.PRIORITY_NORMAL
+
+POOL_WAIT_SECONDS = metrics.histogram(
+    'bot_pool_wait_seconds', '실행 풀에서 스레드를 받기까지 기다린 시간 (풀/우선순위별)', ['pool', 'priority']
+)
+
+
+class PoolFull(Exception):
+    """풀의 실행/대기 자리가 모두 차서 작업을 받지 않음 (overflow=reject)"""
+
+    def __init__(self, pool: str):
+        super().__init__(f"{pool} 풀이 가득 참")
+        self.pool = pool
+
+
+class _Admission:
+    """이벤트 루프 하나의 실행 자리 + 우선순위 대기열 (asyncio Future 는 루프에 묶임)"""
+    __slots__ = ('loop', 'active', 'live', 'heap', 'seq')
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.active = 0       # 스레드에 넘긴 작업 (실행 중 + executor 대기)
+        self.live = 0         # 우선순위 대기열에서 기다리는 작업 (취소된 항목 제외)
+        self.heap = []        # (정렬 키, 순번, Future)
+        self.seq = 0
+
+
+class BulkheadPool:
+    """이름 있는 실행 풀 (스레드 수 + 대기열 길이 제한)
+
+    max_workers 가 0 이면 스레드 없이 호출한 이벤트 루프에서 바로 실행한다 (로컬 명령어).
+
+    스레드가 모두 사용 중이면 작업은 우선순위 대기열에서 기다린다.
+    priority 는 작을수록 먼저 실행되고 (0 은 fast lane - reject 되지 않음),
+    aging_seconds 만큼 기다릴 때마다 한 단계씩 올라가 낮은 우선순위도 굶지 않는다.
+    """
+
+    def __init__(self, name: str, max_workers: int = 4, max_queue: int = 16,
+                 overflow: str = OVERFLOW_REJECT, aging_seconds: float = 2.0):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.aging_seconds = aging_seconds
+        self.inline = max_workers <= 0
+        self._executor = None if self.inline else ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"pool-{name}"
+        )
+
+        self._admission = None
+
+        self._lock = threading.Lock()
+        self.queued = 0       # 스레드를 받았지만 아직 시작 전인 작업
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self._started = 0
+        self._total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self._by_priority: Dict[int, Dict[str, float]] = {}
+
+    def _get_admission(self) -> _Admission:
+        loop = asyncio.get_running_loop()
+        if self._admission is None or self._admission.loop is not loop:
+            self._admission = _Admission(loop)
+        return self._admission
+
+    def _grant(self, admission: _Admission):
+        """빈 스레드 자리를 대기열의 가장 앞 작업에 넘김"""
+        while admission.active < self.max_workers and admission.heap:
+            _, _, waiter = heapq.heappop(admission.heap)
+            if waiter.cancelled():
+                continue  # 기다리다 포기한 작업
+            admission.live -= 1
+            admission.active += 1
+            waiter.set_result(None)
+
+    def _release(self, admission: _Admission):
+        admission.active -= 1
+        self._grant(admission)
+
+    async def _acquire(self, admission: _Admission, priority: int):
+        """스레드 자리 확보 (없으면 우선순위 대기열에서 대기)"""
+        if admission.active < self.max_workers and not admission.live:
+            admission.active += 1
+            return
+
+        if (self.overflow == OVERFLOW_REJECT and priority > 0
+                and admission.live >= self.max_queue):
+            with self._lock:
+                self.rejected += 1
+            raise PoolFull(self.name)
+
+        # 기다린 시간만큼 우선순위가 올라가므로 정렬 키는 (우선순위 x aging + 들어온 시각) 으로 고정
+        waiter = admission.loop.create_future()
+        key = priority * self.aging_seconds + time.monotonic()
+        admission.seq += 1
+        heapq.heappush(admission.heap, (key, admission.seq, waiter))
+        admission.live += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                admission.live -= 1
+            else:
+                # 자리를 받은 직후에 취소됨 - 다음 작업에 넘김
+                self._release(admission)
+            raise
+
+    def _record_wait(self, priority: int, wait_ms: float):
+        """스레드를 받기까지 기다린 시간 (self._lock 안에서 호출)"""
+        self._started += 1
+        self._total_wait_ms += wait_ms
+        if wait_ms > self.max_wait_ms:
+            self.max_wait_ms = wait_ms
+        stats = self._by_priority.setdefault(priority, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+        stats['count'] += 1
+        stats['total_ms'] += wait_ms
+        if wait_ms > stats['max_ms']:
+            stats['max_ms'] = wait_ms
+        POOL_WAIT_SECONDS.labels(self.name, priority).observe(wait_ms / 1000)
+
+    async def run(self, func: Callable, *args, priority: int = DEFAULT_PRIORITY) -> Any:
+        """func(*args) 실행 (스레드 풀 또는 인라인), 자리가 없으면 우선순위 대기열 / overflow 정책 적용"""
+        if self.inline:
+            with self._lock:
+                self.submitted += 1
+                self.running += 1
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        queued_at = time.perf_counter()
+        admission = self._get_admission()
+        await self._acquire(admission, priority)
+
+        loop = admission.loop
+        started = []
+
+        def call():
+            wait_ms = (time.perf_counter() - queued_at) * 1000
+            with self._lock:
+                started.append(True)
+                self.queued -= 1
+                self.running += 1
+                self._record_wait(priority, wait_ms)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        def on_done(_future):
+            # 시작 전에 취소된 작업도 대기열에서 빠짐
+            if not started:
+                with self._lock:
+                    self.queued -= 1
+            # 자리는 스레드 작업이 실제로 끝난 뒤에 반환 (호출자가 포기해도 스레드는 사용 중)
+            try:
+                loop.call_soon_threadsafe(self._release, admission)
+            except RuntimeError:
+                pass  # 이벤트 루프가 이미 종료됨
+
+        with self._lock:
+            self.submitted += 1
+            self.queued += 1
+        try:
+            future = self._executor.submit(call)
+        except RuntimeError:
+            # 종료 중인 풀
+            with self._lock:
+                self.queued -= 1
+            self._release(admission)
+            raise
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """대기열 깊이 / 대기 시간 / 거절 수"""
+        admission = self._admission
+        waiting = admission.live if admission is not None else 0
+        with self._lock:
+            started = self._started
+            return {
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'overflow': self.overflow,
+                'inline': self.inline,
+                'running': self.running,
+                'queue_depth': waiting + self.queued,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'avg_wait_ms': round(self._total_wait_ms / started, 1) if started else 0.0,
+                'max_wait_ms': round(self.max_wait_ms, 1),
+                'wait_by_priority': {
+                    priority: {
+                        'count': stats['count'],
+                        'avg_wait_ms': round(stats['total_ms'] / stats['count'], 1),
+                        'max_wait_ms': round(stats['max_ms'], 1)
+                    }
+                    for priority, stats in sorted(self._by_priority.items())
+                }
+            }
+
+
+class BulkheadScheduler:
+    """풀 이름 → BulkheadPool (알 수 없는 이름은 기본 풀)"""
+
+    def __init__(self, config: Dict[str, Dict[str, Any]], default: str):
+        self.pools: Dict[str, BulkheadPool] = {
+            name: BulkheadPool(name, **options) for name, options in config.items()
+        }
+        if default not in self.pools:
+            raise ValueError(f"기본 풀 '{default}' 이 설정에 없습니다.")
+        self.default = default
+
+    def pool(self, name: str = None) -> BulkheadPool:
+        return self.pools.get(name) or self.pools[self.default]
+
+    async def run(self, pool: str, func: Callable, *args, priority: int = DEFAULT_PRIORITY) -> Any:
+        return await self.pool(pool).run(func, *args, priority=priority)
+
+    def shutdown(self, wait: bool = True):
+        for pool in self.pools.values():
+            pool.shutdown(wait=wait)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """풀별 통계 (/health 용)"""
+        return {name: pool.get_stats() for name, pool in self.pools.items()}
@@ -0,0 +1,139 @@
+"""
+지연 응답(deferred reply) 작업 큐 모듈
+오래 걸리는 명령어(URL 요약, 부동산 크롤링 등)는 요청에 바로 접수 응답을 보내고
+백그라운드에서 실행한 뒤, 결과를 대기 메시지(/api/poll)로 전달한다.
+메신저봇 클라이언트가 응답을 기다리며 연결을 20초씩 잡고 있지 않아도 된다.
+
+    jobs = DeferredJobQueue(deliver=schedule_service.add_pending_message, max_running=4)
+    job, is_new = jobs.submit(key, room, factory)    # factory: 결과 문자열을 반환하는 코루틴 함수
+
+같은 key 의 작업이 진행 중이면 새로 실행하지 않고 그 작업에 합류한다.
+(다른 방에서 요청했으면 결과를 그 방에도 보낸다)
+이벤트 루프 스레드에서만 호출한다.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# 작업 상태
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+FAILED_MESSAGE = "⚠️ 요청하신 작업을 처리하지 못했습니다.\n잠시 후 다시 시도해주세요."
+
+
+class DeferredJob:
+    """백그라운드 작업 하나 (결과를 받을 방 목록 포함)"""
+    __slots__ = ('job_id', 'key', 'rooms', 'status', 'created', 'started', 'finished', 'task')
+
+    def __init__(self, key: str, room: str):
+        self.job_id = uuid.uuid4().hex[:8]
+        self.key = key
+        self.rooms: List[str] = [room]
+        self.status = STATUS_QUEUED
+        self.created = time.monotonic()
+        self.started = None
+        self.finished = None
+        self.task: Optional[asyncio.Future] = None
+
+
+class DeferredJobQueue:
+    """지연 응답 작업 큐 (동시 실행 수 제한 + 같은 작업 합치기)
+
+    deliver(room, message, job_id, ttl) 로 결과를 전달한다.
+    전달된 결과가 result_ttl 초 안에 수거되지 않으면 대기 메시지에서 버려진다.
+    """
+
+    def __init__(self, deliver: Callable[..., Any], max_running: int = 4, result_ttl: float = 600):
+        self.deliver = deliver
+        self.max_running = max_running
+        self.result_ttl = result_ttl
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._inflight: Dict[str, DeferredJob] = {}
+
+        self.submitted = 0
+        self.deduplicated = 0
+        self.completed = 0
+        self.failed = 0
+        self.running = 0
+        self._total_run_ms = 0.0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_running)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def submit(self, key: str, room: str,
+               factory: Callable[[], Awaitable[Optional[str]]]) -> Tuple[DeferredJob, bool]:
+        """작업 등록 - (작업, 새로 만들었는지) 반환
+
+        같은 key 의 작업이 진행 중이면 합류한다 (결과를 받을 방만 추가).
+        """
+        job = self._inflight.get(key)
+        if job is not None:
+            self.deduplicated += 1
+            if room not in job.rooms:
+                job.rooms.append(room)
+            return job, False
+
+        job = DeferredJob(key, room)
+        self._inflight[key] = job
+        self.submitted += 1
+        job.task = asyncio.ensure_future(self._run(job, factory))
+        return job, True
+
+    async def _run(self, job: DeferredJob, factory: Callable[[], Awaitable[Optional[str]]]):
+        try:
+            async with self._get_semaphore():
+                job.status = STATUS_RUNNING
+                job.started = time.monotonic()
+                self.running += 1
+                try:
+                    result = await factory()
+                finally:
+                    self.running -= 1
+            job.status = STATUS_DONE
+            self.completed += 1
+        except asyncio.CancelledError:
+            job.status = STATUS_FAILED
+            self.failed += 1
+            raise
+        except Exception:
+            job.status = STATUS_FAILED
+            self.failed += 1
+            result = FAILED_MESSAGE
+        finally:
+            job.finished = time.monotonic()
+            if job.started is not None:
+                self._total_run_ms += (job.finished - job.started) * 1000
+            if self._inflight.get(job.key) is job:
+                del self._inflight[job.key]
+
+        # 결과가 없는 명령어(응답 없음)는 전달하지 않음
+        if result:
+            for room in job.rooms:
+                self.deliver(room, result, job.job_id, self.result_ttl)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._inflight
+
+    def get_stats(self) -> Dict[str, Any]:
+        """작업 큐 통계 (/health)"""
+        finished = self.completed + self.failed
+        return {
+            'submitted': self.submitted,
+            'deduplicated': self.deduplicated,
+            'completed': self.completed,
+            'failed': self.failed,
+            'running': self.running,
+            'queued': len(self._inflight) - self.running,
+            'max_running': self.max_running,
+            'avg_run_ms': round(self._total_run_ms / finished, 1) if finished else 0.0
+        }
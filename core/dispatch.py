@@ -0,0 +1,133 @@
+"""
+디스패치 엔진 모듈
+메시지 → 라우트 매칭 (정확 일치 dict → 접두사 트라이 → 사전 컴파일 패턴 순)
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class Route:
+    """라우트 정보
+
+    Args:
+        command: 대표 명령어 이름 (권한 체크/통계용)
+        handler: 핸들러 이름 또는 callable
+        admin_only: 관리자 전용 여부
+        check_permission: 실행 전 command_manager 권한 체크 여부
+        predicate: 패턴 라우트의 매칭 함수 (msg → bool)
+        pool: 동기 핸들러를 실행할 풀 이름 (core.bulkhead, None 이면 기본 풀)
+    """
+    __slots__ = ('command', 'handler', 'admin_only', 'check_permission', 'predicate', 'pool')
+
+    def __init__(self, command: str, handler, admin_only: bool = False,
+                 check_permission: bool = False,
+                 predicate: Optional[Callable[[str], bool]] = None,
+                 pool: Optional[str] = None):
+        self.command = command
+        self.handler = handler
+        self.admin_only = admin_only
+        self.check_permission = check_permission
+        self.predicate = predicate
+        self.pool = pool
+
+    def __repr__(self):
+        return f"Route({self.command!r} -> {self.handler!r})"
+
+
+class PrefixTrie:
+    """문자 단위 접두사 트라이 (가장 긴 접두사 우선 매칭)"""
+
+    _ROUTE = object()  # 노드에 라우트를 저장하는 키
+
+    def __init__(self):
+        self.root: Dict = {}
+
+    def insert(self, prefix: str, route: Route):
+        """접두사 등록 (같은 접두사는 먼저 등록된 라우트 유지)"""
+        node = self.root
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node.setdefault(self._ROUTE, route)
+
+    def matches(self, msg: str) -> List[Route]:
+        """msg에 매칭되는 접두사 라우트 목록 (긴 접두사부터)"""
+        found = []
+        node = self.root
+        for ch in msg:
+            node = node.get(ch)
+            if node is None:
+                break
+            route = node.get(self._ROUTE)
+            if route is not None:
+                found.append(route)
+        found.reverse()
+        return found
+
+    def routes(self) -> Iterator[Route]:
+        """등록된 전체 라우트"""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key is self._ROUTE:
+                    yield child
+                else:
+                    stack.append(child)
+
+
+class DispatchEngine:
+    """메시지 디스패치 엔진
+
+    매칭 우선순위:
+        1. 정확 일치 (dict 조회, O(1))
+        2. 접두사 (트라이, 긴 접두사 우선, O(명령어 길이))
+        3. 패턴 (등록 순서대로 사전 컴파일된 predicate 평가)
+    관리자 전용 라우트는 관리자가 아니면 건너뛰고 다음 후보를 찾는다.
+    """
+
+    def __init__(self):
+        self.exact: Dict[str, Route] = {}
+        self.prefixes = PrefixTrie()
+        self.patterns: List[Route] = []
+
+    def add_exact(self, key: str, route: Route):
+        """정확 일치 라우트 등록 (먼저 등록된 라우트 유지)"""
+        self.exact.setdefault(key, route)
+
+    def add_prefix(self, prefix: str, route: Route):
+        """접두사 라우트 등록"""
+        self.prefixes.insert(prefix, route)
+
+    def add_pattern(self, route: Route):
+        """패턴 라우트 등록 (route.predicate 필수)"""
+        self.patterns.append(route)
+
+    def routes(self) -> Iterator[Route]:
+        """등록된 전체 라우트 (같은 라우트가 여러 키로 등록되면 여러 번 나옴)"""
+        yield from self.exact.values()
+        yield from self.prefixes.routes()
+        yield from self.patterns
+
+    def get_stats(self) -> Dict[str, Any]:
+        """라우트 개수"""
+        return {
+            'exact': len(self.exact),
+            'prefix': sum(1 for _ in self.prefixes.routes()),
+            'pattern': len(self.patterns)
+        }
+
+    def match(self, msg: str, is_admin: bool = False) -> Optional[Route]:
+        """메시지에 해당하는 라우트 반환 (없으면 None)"""
+        route = self.exact.get(msg)
+        if route is not None and (is_admin or not route.admin_only):
+            return route
+
+        for route in self.prefixes.matches(msg):
+            if is_admin or not route.admin_only:
+                return route
+
+        for route in self.patterns:
+            if (is_admin or not route.admin_only) and route.predicate(msg):
+                return route
+
+        return None
@@ -0,0 +1,118 @@
+"""
+핸들러 레지스트리 모듈
+명령어 핸들러를 시작 시 한 번 등록하고, 실제 모듈은 첫 호출 때 로딩한다.
+로딩 후에는 함수 참조만 사용하므로 메시지마다 import 작업이 없다.
+
+핸들러는 일반 함수 또는 async def 일 수 있다 (is_async 로 구분).
+"""
+
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict
+
+_logger = logging.getLogger("bot")
+
+
+def _unavailable(name: str) -> Callable:
+    """핸들러를 로딩하지 못했을 때의 대체 함수"""
+    if name.startswith("schedule_"):
+        return lambda *args, **kwargs: "스케줄 기능을 사용할 수 없습니다."
+    return lambda *args, **kwargs: "서비스를 사용할 수 없습니다."
+
+
+class LazyHandler:
+    """첫 호출 시 loader(name)으로 실제 함수를 로딩하는 핸들러
+
+    load_ms: 모듈 로딩 시간, first_call_ms: 첫 호출 전체 시간 (로딩 + 실행, async 핸들러는 로딩까지)
+    """
+    __slots__ = ('name', '_loader', '_func', '_lock', 'load_ms', 'first_call_ms', 'is_async')
+
+    def __init__(self, name: str, loader: Callable[[str], Callable]):
+        self.name = name
+        self._loader = loader
+        self._func = None
+        self._lock = threading.Lock()
+        self.load_ms = None
+        self.first_call_ms = None
+        self.is_async = False  # 로딩 후 결정 (async def 핸들러면 True)
+
+    @property
+    def loaded(self) -> bool:
+        return self._func is not None
+
+    def load(self) -> Callable:
+        """실제 함수 로딩 (실패 시 대체 함수 반환, 다음 호출에서 다시 시도)"""
+        with self._lock:
+            if self._func is None:
+                start = time.perf_counter()
+                try:
+                    func = self._loader(self.name)
+                except (ImportError, AttributeError) as e:
+                    _logger.error("핸들러 로딩 실패 (%s): %s", self.name, e)
+                    return _unavailable(self.name)
+                self.load_ms = (time.perf_counter() - start) * 1000
+                self.is_async = inspect.iscoroutinefunction(func)
+                self._func = func
+            return self._func
+
+    def __call__(self, *args, **kwargs):
+        """핸들러 실행 (async 핸들러는 코루틴 반환)"""
+        func = self._func
+        if func is not None:
+            return func(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return self.load()(*args, **kwargs)
+        finally:
+            if self.first_call_ms is None and self._func is not None:
+                self.first_call_ms = (time.perf_counter() - start) * 1000
+
+    def __repr__(self):
+        return f"LazyHandler({self.name!r}, loaded={self.loaded}, async={self.is_async})"
+
+
+class HandlerRegistry:
+    """핸들러 이름 → LazyHandler (이름당 하나)"""
+
+    def __init__(self, loader: Callable[[str], Callable]):
+        self._loader = loader
+        self._handlers: Dict[str, LazyHandler] = {}
+
+    def get(self, name: str) -> LazyHandler:
+        """핸들러 조회 (없으면 등록, 모듈 로딩은 첫 호출 때)"""
+        handler = self._handlers.get(name)
+        if handler is None:
+            handler = self._handlers.setdefault(name, LazyHandler(name, self._loader))
+        return handler
+
+    def preload(self, names=None) -> Dict[str, float]:
+        """핸들러 미리 로딩 (첫 메시지 지연 대신 시작 시간 사용), 이름별 로딩 시간(ms) 반환"""
+        result = {}
+        for name in (names or list(self._handlers)):
+            handler = self.get(name)
+            handler.load()
+            result[name] = handler.load_ms
+        return result
+
+    def __len__(self) -> int:
+        return len(self._handlers)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """로딩 상태 및 로딩/첫 호출 시간"""
+        handlers = list(self._handlers.values())
+        return {
+            'registered': len(handlers),
+            'loaded': sum(1 for h in handlers if h.loaded),
+            'async': sum(1 for h in handlers if h.is_async),
+            'by_handler': {
+                h.name: {
+                    'async': h.is_async,
+                    'load_ms': round(h.load_ms, 1) if h.load_ms is not None else None,
+                    'first_call_ms': round(h.first_call_ms, 1) if h.first_call_ms is not None else None
+                }
+                for h in handlers if h.loaded
+            }
+        }
@@ -1,312 +1,461 @@
 """
 라우터 모듈
 메시지를 적절한 핸들러로 라우팅하는 기능
+
+라우팅 테이블은 command_manager.ALL_COMMANDS 에서 시작 시 한 번 만들어진다.
+(정확 일치 dict → 접두사 트라이 → 사전 컴파일 패턴, core.dispatch 참고)
+
+서버는 get_reply_msg_async 를 사용한다: async def 핸들러는 이벤트 루프에서 바로
+await 하고, 동기 핸들러는 executor 에서 실행한다. get_reply_msg 는 동기 호출용
+(스케줄러 등)이며 async 핸들러도 임시 이벤트 루프에서 실행해 결과를 반환한다.
+
+동기 핸들러는 라우트의 pool(command_manager 의 pool)에 해당하는 벌크헤드 풀에서 실행한다.
+get_reply_msg_async 에 Deadline 을 넘기면 핸들러와 HTTP 계층이 남은 시간 안에서 동작하고,
+호출자가 포기한 동기 작업은 executor 대기열에서 실행하지 않고 건너뛴다.
+추적 중인 요청이면 풀 대기(queue)와 핸들러 실행(handler)을 구간으로 기록한다 (utils.tracing).
 """
 
+import asyncio
+import importlib
+import inspect
+import logging
 import re
 import random
-from datetime import datetime
+import threading
+import time
 import subprocess
 
 import config
+import handlers
+from core.bulkhead import DEFAULT_PRIORITY, BulkheadScheduler
+from core.dispatch import DispatchEngine, Route
+from core.registry import HandlerRegistry, LazyHandler
+from utils.deadline import abandoned_work, deadline_scope
 from utils.debug_logger import debug_logger
+from utils.tracing import context_scope, current_context, record, span
 
-# 필수 서비스 함수들 모듈 레벨 import
+# 통합 명령어 관리자
 try:
-    from services import web_summary, fortune, zodiac, test
+    from command_manager import ALL_COMMANDS, get_command_help, check_command_permission, get_command_list
+    from command_manager import POOL_BROWSER, POOL_LOCAL, POOL_SCRAPE
 except ImportError:
-    try:
-        from fn import web_summary, fortune, zodiac, test
-    except ImportError:
-        # 함수들이 없는 경우 더미 함수 정의
-        def web_summary(*args, **kwargs): return "서비스를 사용할 수 없습니다."
-        def fortune(*args, **kwargs): return "서비스를 사용할 수 없습니다."
-        def zodiac(*args, **kwargs): return "서비스를 사용할 수 없습니다."
-        def test(*args, **kwargs): return "서비스를 사용할 수 없습니다."
+    # 명령어 관리자가 없는 경우 기본 함수 정의
+    ALL_COMMANDS = []
+    def get_command_help(is_admin=False):
+        return "명령어 도움말이 준비 중입니다."
+    def check_command_permission(cmd, sender, room):
+        return (True, None)
+    def get_command_list(is_admin=False):
+        return "명령어 목록이 준비 중입니다."
+    POOL_BROWSER, POOL_LOCAL, POOL_SCRAPE = "browser", "local", "scrape"
+
+
+_logger = logging.getLogger(__name__)
+
+
+def log(message, *args):
+    """로그 출력 함수 (utils.log_pipeline 의 writer 스레드에서 기록, args 는 나중에 포맷)"""
+    _logger.info(message, *args)
+
+
+# ========================================
+# 라우팅 규칙
+# ========================================
+
+# 라우터에서 처리하지 않는 명령어 (AI 대화 비활성화, /뉴스 미연결 - 기존 동작 유지)
+UNROUTED_COMMANDS = {"?", "/뉴스"}
+
+# ALL_COMMANDS 에는 정확 일치지만 라우터는 접두사로 처리하는 명령어
+PREFIX_OVERRIDES = {"/로또", "/로또결과", "/오류통계", "/사용통계", "/성능추천", "/캐시초기화", "/캐시상태"}
+
+# 대소문자 구분 없이 매칭하는 명령어 (/it뉴스, /It뉴스 ...)
+CASE_INSENSITIVE_COMMANDS = {"/IT뉴스"}
+
+# 실행 전 check_command_permission 으로 방/권한을 다시 확인하는 명령어
+PERMISSION_CHECKED_COMMANDS = {"/재부팅", "/방추가", "/방삭제", "/방목록", "/스케줄", "/스케줄목록", "/스케줄삭제"}
+
+# handlers 패키지 밖에 있는 명령어 핸들러 (그 외는 handlers.load_handler)
+COMMAND_MODULES = {
+    "error_logs": "error_commands",
+    "error_stats": "error_commands",
+    "usage_stats": "error_commands",
+    "enable_command": "error_commands",
+    "reset_command_stats": "error_commands",
+    "performance_recommendations": "error_commands",
+    "trace_report": "error_commands",
+    "profile_report": "error_commands",
+    "clear_cache": "cache_commands",
+    "cache_status": "cache_commands",
+}
+
+# YouTube URL 패턴 (우선순위 순)
+YOUTUBE_PATTERNS = [
+    r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
+    r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
+    r'(?:https?://)?(?:www\.)?youtube\.com/shorts/[\w-]+',
+    r'(?:https?://)?(?:m\.)?youtube\.com/watch\?v=[\w-]+'
+]
+# 일반 웹 URL 패턴
+URL_PATTERN = r'https?://[^\s<>"{}|\\^`\[\]]+'
+
+YOUTUBE_URL_RES = [re.compile(pattern) for pattern in YOUTUBE_PATTERNS]
+URL_RE = re.compile(URL_PATTERN)
+# URL 감지용 통합 패턴 (일반 대화는 이 정규식 한 번만 검사)
+URL_DETECT_RE = re.compile('|'.join(YOUTUBE_PATTERNS + [URL_PATTERN]))
+
+GREETINGS = ["안녕", "안녕하세요", "하이", "헬로", "ㅎㅇ", "ㅎ2", "반가워", "반갑습니다"]
+GREETING_RE = re.compile('|'.join(re.escape(greeting) for greeting in GREETINGS))
+
+
+# ========================================
+# 라우터 전용 핸들러
+# ========================================
+
+def _reply_test(room, sender, msg):
+    return "테스트 성공"
+
+
+def _reply_test2(room, sender, msg):
+    return "테스트 성공!\n두번째 줄입니다."
+
+
+def _reply_test3(room, sender, msg):
+    return "😊 이모지 테스트"
+
+
+def _reply_hello(room, sender, msg):
+    return f"안녕하세요 {sender}님! 저는 STORIUM AI입니다."
+
+
+def _reply_time(room, sender, msg):
+    return f"현재 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}"
+
+
+def _show_commands(room, sender, msg):
+    return get_command_help(is_admin=config.is_admin_user(sender))
+
+
+def _show_command_list(room, sender, msg):
+    return get_command_list(is_admin=config.is_admin_user(sender))
+
+
+def _reboot(room, sender, msg):
+    subprocess.run(["adb", "reboot"])
+    return "재부팅 명령이 실행되었습니다."
+
+
+def _reply_spam(room, sender, msg):
+    return "스팸이 감지되었습니다."
+
+
+def _summarize_url(room, sender, msg):
+    """메시지의 YouTube URL은 영상 요약, 그 외 URL은 웹 요약"""
+    for pattern in YOUTUBE_URL_RES:
+        youtube_match = pattern.search(msg)
+        if youtube_match:
+            youtube_url = youtube_match.group(0)
+            if not youtube_url.startswith('http'):
+                youtube_url = 'https://' + youtube_url
+            return handler_registry.get("summarize")(room, sender, youtube_url)
+
+    url_match = URL_RE.search(msg)
+    if url_match:
+        return handler_registry.get("web_summary")(room, sender, url_match.group(0))
+    return None
+
+
+def _reply_greeting(room, sender, msg):
+    return f"{sender}님, 안녕하세요! STORIUM Bot입니다. 무엇을 도와드릴까요? /명령어를 입력하면 사용 가능한 기능을 볼 수 있어요!"
+
+
+# ALL_COMMANDS 의 handler 이름 중 라우터가 직접 처리하는 것
+LOCAL_HANDLERS = {
+    "show_commands": _show_commands,
+    "reboot": _reboot,
+}
+
+
+# ========================================
+# 핸들러 레지스트리
+# ========================================
+
+def _load_handler(name):
+    """핸들러 이름 → 함수 (필요한 모듈만 import)"""
+    module_name = COMMAND_MODULES.get(name)
+    if module_name:
+        return getattr(importlib.import_module(module_name), name)
+    return handlers.load_handler(name)
+
+
+handler_registry = HandlerRegistry(_load_handler)
+
+
+# ========================================
+# 디스패치 테이블 구성
+# ========================================
+
+def _case_variants(text):
+    """영문자의 대소문자 조합 전체 (/IT뉴스 → /it뉴스, /It뉴스, /iT뉴스, /IT뉴스)"""
+    variants = ['']
+    for ch in text:
+        options = {ch.lower(), ch.upper()} if ch.isascii() and ch.isalpha() else {ch}
+        variants = [prefix + option for prefix in variants for option in sorted(options)]
+    return variants
+
+
+def build_dispatch_engine(commands=None):
+    """ALL_COMMANDS + 라우터 전용 규칙으로 디스패치 엔진 생성
+
+    매칭 우선순위는 정확 일치 → 긴 접두사 → 패턴(등록 순) 이며,
+    관리자 전용 라우트는 관리자가 아니면 건너뛴다.
+    """
+    engine = DispatchEngine()
+
+    # 라우터 전용 정확 일치 명령어 (ALL_COMMANDS 의 같은 이름보다 우선)
+    for key, handler, pool in [
+        ('/테스트', _reply_test, POOL_LOCAL),
+        ('/테스트2', _reply_test2, POOL_LOCAL),
+        ('/테스트3', _reply_test3, POOL_LOCAL),
+        ('/안녕', _reply_hello, POOL_LOCAL),
+        ('/시간', _reply_time, POOL_LOCAL),
+        ('/명령어목록', _show_command_list, POOL_LOCAL),
+        ('/운세', "fortune_today", POOL_SCRAPE),      # /운세 단독은 오늘의 운세, /운세 ○○ 는 fortune
+        ('/날씨', "whether_today", POOL_SCRAPE),      # /날씨 단독은 오늘 날씨, /날씨 지역 은 whether
+        ('/검색어', "real_keyword", POOL_SCRAPE),
+        ('/부동산뉴스', "realestate_news", POOL_SCRAPE),
+        ('/세계뉴스', "world_news", POOL_SCRAPE),
+        ('/명언', "wise_saying", POOL_LOCAL),
+        ('/인급동랜덤', "youtube_popular_random", POOL_SCRAPE),
+    ]:
+        engine.add_exact(key, Route(key, handler, pool=pool))
+    engine.add_prefix('/로또결과생성', Route('/로또결과생성', "lotto_result_create"))
+    engine.add_exact('/test', Route('/test', "test", admin_only=True))
+
+    # ALL_COMMANDS 기반 명령어
+    for cmd in (ALL_COMMANDS if commands is None else commands):
+        name = cmd["name"]
+        if name in UNROUTED_COMMANDS:
+            continue
+
+        handler = LOCAL_HANDLERS.get(cmd["handler"], cmd["handler"])
+        route = Route(
+            name,
+            handler,
+            admin_only=cmd.get("admin_only", False),
+            check_permission=name in PERMISSION_CHECKED_COMMANDS,
+            pool=cmd.get("pool")
+        )
+        keys = [name] + cmd.get("aliases", [])
+        if name in CASE_INSENSITIVE_COMMANDS:
+            keys = [variant for key in keys for variant in _case_variants(key)]
+
+        for key in keys:
+            if cmd.get("is_prefix", False) or name in PREFIX_OVERRIDES:
+                engine.add_prefix(key, route)
+            else:
+                engine.add_exact(key, route)
 
+    # 패턴 (명령어에 매칭되지 않은 메시지만 등록 순서대로 검사)
+    engine.add_pattern(Route('맛집', "naver_map",
+                             predicate=lambda m: m.startswith("/") and m.endswith("맛집")))
+    engine.add_pattern(Route('로또', "lotto", predicate=lambda m: "로또" in m, pool=POOL_LOCAL))
+    engine.add_pattern(Route('스팸', _reply_spam, predicate=lambda m: "han.gl" in m, pool=POOL_LOCAL))
+    engine.add_pattern(Route('URL', _summarize_url, pool=POOL_BROWSER,
+                             predicate=lambda m: URL_DETECT_RE.search(m) is not None))
+    engine.add_pattern(Route('인사', _reply_greeting, pool=POOL_LOCAL,
+                             predicate=lambda m: GREETING_RE.search(m.lower()) is not None))
 
-def log(message):
-    """로그 출력 함수"""
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
+    # 핸들러 이름을 레지스트리 핸들러로 바인딩 (모듈 로딩은 첫 호출 때)
+    for route in engine.routes():
+        if isinstance(route.handler, str):
+            route.handler = handler_registry.get(route.handler)
+    return engine
+
+
+_build_start = time.perf_counter()
+dispatch_engine = build_dispatch_engine()
+_wise_saying = handler_registry.get("wise_saying")
+DISPATCH_BUILD_MS = (time.perf_counter() - _build_start) * 1000
+
+
+def get_router_stats():
+    """라우터 시작 시간 및 핸들러 로딩 통계 (/health 용)"""
+    return {
+        'build_ms': round(DISPATCH_BUILD_MS, 2),
+        'routes': dispatch_engine.get_stats(),
+        'handlers': handler_registry.get_stats()
+    }
+
+
+def _select_handler(room: str, sender: str, msg: str):
+    """메시지에 맞는 핸들러 선택 → (handler, 풀 이름, None) 또는 (None, None, 즉시 응답)"""
+    route = dispatch_engine.match(msg, is_admin=config.is_admin_user(sender))
+    if route is not None:
+        if route.check_permission:
+            can_use, error_msg = check_command_permission(route.command, sender, room)
+            if not can_use:
+                return None, None, error_msg
+        return route.handler, route.pool, None
+
+    # 가끔 명언 보내기(0.2%)
+    if random.random() < 0.002:
+        return _wise_saying, POOL_LOCAL, None
+
+    # 기본 응답 - 명령어가 없는 경우
+    return None, None, None
+
+
+async def _run_blocking(executor, pool: str, func, *args, priority: int = DEFAULT_PRIORITY):
+    """동기 함수 실행 - 벌크헤드 스케줄러면 라우트의 풀(우선순위 대기열), 아니면 executor (None 이면 기본 executor)"""
+    if isinstance(executor, BulkheadScheduler):
+        return await executor.run(pool, func, *args, priority=priority)
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+def _handler_name(handler) -> str:
+    """추적 구간에 표시할 핸들러 이름"""
+    return getattr(handler, 'name', None) or getattr(handler, '__name__', type(handler).__name__)
+
+
+def _is_async_handler(handler) -> bool:
+    """async def 핸들러 여부 (LazyHandler 는 로딩 후에 결정)"""
+    if isinstance(handler, LazyHandler):
+        return handler.is_async
+    return inspect.iscoroutinefunction(handler)
 
 
 def get_reply_msg(room: str, sender: str, msg: str):
     """메시지를 받아서 적절한 응답을 반환하는 메인 라우터
-    
+
     Args:
         room: 채팅방 이름
         sender: 발신자 이름
         msg: 메시지 내용
-        
+
     Returns:
         str or None: 응답 메시지
     """
-    log(f"{room}    {sender}    {msg}")
-    
+    log("%s    %s    %s", room, sender, msg)
+
     msg = msg.strip()
-    
+
     # 빈 메시지 처리
     if not msg:
         return None
 
-    # 모듈 레벨에서 import된 web_summary 함수 참조 확인
-    # (핸들러 import가 실패하더라도 web_summary는 사용 가능해야 함)
-    global web_summary, fortune, zodiac, test
+    handler, _pool, reply = _select_handler(room, sender, msg)
+    if handler is None:
+        return reply
 
-    # 핸들러 모듈들 import (지연 로딩)
-    try:
-        from handlers import (
-            # AI 핸들러
-            get_ai_answer,
-            # 뉴스 핸들러
-            economy_news, it_news, realestate_news, world_news,
-            # 주식/금융 핸들러
-            stock, coin, exchange, gold, stock_upper, stock_lower,
-            # 미디어 핸들러
-            youtube_popular_all, youtube_popular_random, summarize, photo,
-            # 게임 핸들러
-            lotto, lotto_result, lotto_result_create, fortune_today,
-            # 유틸리티 핸들러
-            whether, whether_today, calorie, wise_saying, emoji, naver_map,
-            search_blog, naver_keyword, real_keyword, naver_land,
-            # 관리자 핸들러
-            room_add, room_remove, room_list, talk_analyize, my_talk_analyize,
-            # 스케줄 핸들러
-            schedule_add, schedule_list, schedule_delete
-        )
-    except ImportError as e:
-        # 핸들러 import 실패 시 (프로덕션 서버 환경 문제)
-        print(f"핸들러 import 경고: {e}")
-        # 필수 함수만 직접 import 시도
-        from fn import get_reply_msg as _get_reply_msg_fallback
-        # URL 요약을 위해 services에서 직접 import
-        from services import web_summary
-        # 기본 함수 정의 (핸들러가 없는 경우)
-        def schedule_add(*args, **kwargs): return "스케줄 기능을 사용할 수 없습니다."
-        def schedule_list(*args, **kwargs): return "스케줄 기능을 사용할 수 없습니다."
-        def schedule_delete(*args, **kwargs): return "스케줄 기능을 사용할 수 없습니다."
-        # 기타 함수들은 fn.py에서 가져오기 시도
-        # (import *는 함수 내에서 사용 불가능하여 주요 함수만 직접 import)
-        try:
-            import fn
-        except:
-            pass
-
-    # 통합 명령어 관리자 import
-    try:
-        from command_manager import get_command_help, check_command_permission, get_command_list
-        from error_commands import error_logs, error_stats, usage_stats, enable_command, reset_command_stats, performance_recommendations
-        from cache_commands import clear_cache, cache_status
-    except ImportError:
-        # 명령어 관리자가 없는 경우 기본 함수 정의
-        def get_command_help(is_admin=False):
-            return "명령어 도움말이 준비 중입니다."
-        def check_command_permission(cmd, sender, room):
-            return (True, None)
-        def get_command_list(is_admin=False):
-            return "명령어 목록이 준비 중입니다."
-        
-    # 테스트 명령어
-    if msg == '/테스트':
-        return "테스트 성공"
-    elif msg == '/테스트2':
-        return "테스트 성공!\n두번째 줄입니다."
-    elif msg == '/테스트3':
-        return "😊 이모지 테스트"
-    elif msg == '/안녕':
-        return f"안녕하세요 {sender}님! 저는 STORIUM AI입니다."
-    elif msg == '/시간':
-        return f"현재 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    
-    # 명령어 도움말
-    if msg in ['/명령어', '/가이드', '/도움말']:
-        is_admin = config.is_admin_user(sender)
-        return get_command_help(is_admin=is_admin)
-    elif msg == '/명령어목록':
-        is_admin = config.is_admin_user(sender)
-        return get_command_list(is_admin=is_admin)
-    
-    # 운세/점술 관련
-    elif msg == "/운세":
-        return fortune_today(room, sender, msg)
-    elif msg.startswith("/운세"):
-        return fortune(room, sender, msg)
-    elif msg in ["/물병자리", "/물고기자리", "/양자리", "/황소자리", "/쌍둥이자리", 
-                  "/게자리", "/사자자리", "/처녀자리", "/천칭자리", "/전갈자리", 
-                  "/사수자리", "/궁수자리", "/염소자리"]:
-        return zodiac(room, sender, msg)
-    
-    # 날씨
-    elif msg == '/날씨':
-        return whether_today(room, sender, msg)
-    elif msg.startswith("/날씨"):
-        return whether(room, sender, msg)
-    
-    # 실시간 정보
-    elif msg in ["/실시간검색어", '/검색어']:
-        return real_keyword(room, sender, msg)
-
-    # 뉴스
-    elif msg.upper() == '/IT뉴스':
-        return it_news(room, sender, msg)
-    elif msg == '/경제뉴스':
-        return economy_news(room, sender, msg)
-    elif msg == '/부동산뉴스':
-        return realestate_news(room, sender, msg)
-    elif msg == '/세계뉴스':
-        return world_news(room, sender, msg)
-
-    # 검색
-    elif msg.startswith("/블로그"):
-        return search_blog(room, sender, msg)
-    elif msg.startswith("#"):
-        return naver_keyword(room, sender, msg)
-    
-    # 금융/경제
-    elif msg.startswith("/주식"):
-        return stock(room, sender, msg)
-    elif msg == "/환율":
-        return exchange(room, sender, msg)
-    elif msg == '/금값':
-        return gold(room, sender, msg)
-    elif msg == '/코인':
-        return coin(room, sender, msg)
-    elif msg == "/상한가":
-        return stock_upper(room, sender, msg)
-    elif msg == "/하한가":
-        return stock_lower(room, sender, msg)
-    
-    # 생활 정보
-    elif msg.startswith("/칼로리"):
-        return calorie(room, sender, msg)
-    elif msg.startswith(("/맵", "/지도")):
-        return naver_map(room, sender, msg)
-    elif msg.startswith("/") and msg.endswith("맛집"):
-        return naver_map(room, sender, msg)
-    elif msg == "/명언":
-        return wise_saying(room, sender, msg)
-    
-    # 유튜브
-    elif msg == "/인급동":
-        return youtube_popular_all(room, sender, msg)
-    elif msg == "/인급동랜덤":
-        return youtube_popular_random(room, sender, msg)
-    
-    # 부동산
-    elif msg.startswith("/네이버부동산"):
-        return naver_land(room, sender, msg)
-    
-    # 로또
-    elif msg.startswith("/로또결과생성"):
-        return lotto_result_create(room, sender, msg)
-    elif msg.startswith("/로또결과"):
-        return lotto_result(room, sender, msg)
-    elif msg.startswith("/로또") or "로또" in msg:
-        return lotto(room, sender, msg)
-    
-    # 스팸 감지
-    elif "han.gl" in msg:
-        return "스팸이 감지되었습니다."
-
-    # URL 자동 감지 로직
-    # YouTube URL 패턴
-    youtube_patterns = [
-        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
-        r'(?:https?://)?(?:www\.)?youtube\.com/shorts/[\w-]+',
-        r'(?:https?://)?(?:m\.)?youtube\.com/watch\?v=[\w-]+'
-    ]
-
-    for pattern in youtube_patterns:
-        youtube_match = re.search(pattern, msg)
-        if youtube_match:
-            youtube_url = youtube_match.group(0)
-            if not youtube_url.startswith('http'):
-                youtube_url = 'https://' + youtube_url
-            return summarize(room, sender, youtube_url)
+    with span("handler", handler=_handler_name(handler)):
+        result = handler(room, sender, msg)
+        if inspect.iscoroutine(result):
+            # async 핸들러를 동기 코드에서 호출한 경우 (스케줄러 스레드 등)
+            from services.async_http_service import run_sync
+            result = run_sync(result)
+    return result
 
-    # 일반 웹 URL 패턴
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    url_match = re.search(url_pattern, msg)
-    if url_match:
-        web_url = url_match.group(0)
-        return web_summary(room, sender, web_url)
-
-    # 관리자 전용 명령어
-    if config.is_admin_user(sender):
-        # 테스트
-        if msg == '/test':
-            return test(room, sender, msg)
-        
-        # 재부팅
-        elif msg == '/재부팅':
-            can_use, error_msg = check_command_permission('/재부팅', sender, room)
-            if not can_use:
-                return error_msg
-            subprocess.run(["adb", "reboot"])
-            return "재부팅 명령이 실행되었습니다."
-        
-        # 방 관리
-        elif msg.startswith('/방추가'):
-            can_use, error_msg = check_command_permission('/방추가', sender, room)
-            if not can_use:
-                return error_msg
-            return room_add(room, sender, msg)
-        elif msg.startswith('/방삭제'):
-            can_use, error_msg = check_command_permission('/방삭제', sender, room)
-            if not can_use:
-                return error_msg
-            return room_remove(room, sender, msg)
-        elif msg == '/방목록':
-            can_use, error_msg = check_command_permission('/방목록', sender, room)
-            if not can_use:
-                return error_msg
-            return room_list(room, sender, msg)
-        
-        # 오류 모니터링 (관리자 전용)
-        elif msg.startswith('/오류로그'):
-            return error_logs(room, sender, msg)
-        elif msg.startswith('/오류통계'):
-            return error_stats(room, sender, msg)
-        elif msg.startswith('/사용통계'):
-            return usage_stats(room, sender, msg)
-        elif msg.startswith('/명령어활성화'):
-            return enable_command(room, sender, msg)
-        elif msg.startswith('/통계리셋'):
-            return reset_command_stats(room, sender, msg)
-        elif msg.startswith('/성능추천'):
-            return performance_recommendations(room, sender, msg)
-        elif msg.startswith('/캐시초기화'):
-            return clear_cache(room, sender, msg)
-        elif msg.startswith('/캐시상태'):
-            return cache_status(room, sender, msg)
-
-        # 스케줄 관리 (관리자 전용)
-        elif msg.startswith('/스케줄삭제'):
-            can_use, error_msg = check_command_permission('/스케줄삭제', sender, room)
-            if not can_use:
-                return error_msg
-            return schedule_delete(room, sender, msg)
-        elif msg == '/스케줄목록':
-            can_use, error_msg = check_command_permission('/스케줄목록', sender, room)
-            if not can_use:
-                return error_msg
-            return schedule_list(room, sender, msg)
-        elif msg.startswith('/스케줄'):
-            can_use, error_msg = check_command_permission('/스케줄', sender, room)
-            if not can_use:
-                return error_msg
-            return schedule_add(room, sender, msg)
-    
-    # 인사 메시지 처리
-    greetings = ["안녕", "안녕하세요", "하이", "헬로", "ㅎㅇ", "ㅎ2", "반가워", "반갑습니다"]
-    for greeting in greetings:
-        if greeting in msg.lower():
-            return f"{sender}님, 안녕하세요! STORIUM Bot입니다. 무엇을 도와드릴까요? /명령어를 입력하면 사용 가능한 기능을 볼 수 있어요!"
-    
-    # 가끔 명언 보내기(0.2%)
-    if random.random() < 0.002:
-        return wise_saying(room, sender, msg)
-    
-    # 기본 응답 - 명령어가 없는 경우
-    return None
\ No newline at end of file
+
+class _SyncJob:
+    """executor 에서 실행할 동기 핸들러 작업 (시작 전에 포기되면 실행하지 않음)"""
+    __slots__ = ('handler', 'deadline', 'pool', 'trace_context', 'queued_at', '_lock', '_started', '_abandoned')
+
+    def __init__(self, handler, deadline, pool: str = None):
+        self.handler = handler
+        self.deadline = deadline
+        self.pool = pool
+        # executor 스레드는 contextvars 를 물려받지 않으므로 추적 위치도 작업 객체로 전달
+        self.trace_context = current_context()
+        self.queued_at = time.perf_counter()
+        self._lock = threading.Lock()
+        self._started = False
+        self._abandoned = False
+
+    def abandon(self) -> bool:
+        """호출자가 포기함 - 아직 시작 전이면 True (이후 실행되지 않음)"""
+        with self._lock:
+            if self._started:
+                return False
+            self._abandoned = True
+            return True
+
+    def __call__(self, room: str, sender: str, msg: str):
+        with self._lock:
+            if self._abandoned:
+                return None
+            self._started = True
+
+        with context_scope(self.trace_context):
+            record("queue", self.queued_at, pool=self.pool)
+            with span("handler", handler=_handler_name(self.handler), pool=self.pool):
+                return self._run(room, sender, msg)
+
+    def _run(self, room: str, sender: str, msg: str):
+        deadline = self.deadline
+        if deadline is None:
+            return self.handler(room, sender, msg)
+
+        with deadline_scope(deadline):
+            try:
+                return self.handler(room, sender, msg)
+            finally:
+                if deadline.cancelled:
+                    abandoned_work.record('finished_late', deadline.name, deadline.cancelled_for_ms())
+
+
+async def get_reply_msg_async(room: str, sender: str, msg: str, executor=None, deadline=None,
+                              priority: int = DEFAULT_PRIORITY):
+    """get_reply_msg 의 비동기 버전 (서버용)
+
+    async 핸들러는 이벤트 루프에서 바로 await 하므로 스레드를 점유하지 않고,
+    타임아웃으로 취소되면 진행 중인 HTTP 요청도 함께 취소된다.
+    동기 핸들러는 executor 에서 실행한다.
+
+    Args:
+        executor: 동기 핸들러를 실행할 BulkheadScheduler (라우트의 풀 사용) 또는
+                  concurrent.futures executor (None 이면 기본 executor)
+        deadline: utils.deadline.Deadline - 핸들러와 HTTP 요청에 남은 시간 전달
+        priority: 풀 대기열 우선순위 (command_manager.PRIORITY_*, 작을수록 먼저)
+
+    Raises:
+        core.bulkhead.PoolFull: 라우트의 풀이 가득 참 (overflow=reject)
+    """
+    log("%s    %s    %s", room, sender, msg)
+
+    msg = msg.strip()
+
+    # 빈 메시지 처리
+    if not msg:
+        return None
+
+    handler, pool, reply = _select_handler(room, sender, msg)
+    if handler is None:
+        return reply
+
+    # 아직 로딩되지 않은 핸들러는 모듈 import 를 executor 에서 (이벤트 루프 블로킹 방지)
+    if isinstance(handler, LazyHandler) and not handler.loaded:
+        with span("load", handler=handler.name):
+            await _run_blocking(executor, pool, handler.load, priority=priority)
+
+    if _is_async_handler(handler):
+        with deadline_scope(deadline), span("handler", handler=_handler_name(handler)):
+            try:
+                return await handler(room, sender, msg)
+            except asyncio.CancelledError:
+                # 호출자가 포기 - 진행 중인 await(HTTP 요청 등)도 함께 취소됨
+                if deadline is not None:
+                    deadline.cancel()
+                    abandoned_work.record('cancelled', deadline.name)
+                raise
+
+    # executor 스레드는 contextvars 를 물려받지 않으므로 deadline 은 작업 객체로 전달
+    job = _SyncJob(handler, deadline, pool)
+    try:
+        return await _run_blocking(executor, pool, job, room, sender, msg, priority=priority)
+    except asyncio.CancelledError:
+        # 호출자가 포기 - 대기열에 있던 작업은 실행하지 않고, 실행 중이면 끝난 뒤 finished_late 로 집계
+        if deadline is not None:
+            deadline.cancel()
+            if job.abandon():
+                abandoned_work.record('skipped', deadline.name)
+        raise
@@ -45,7 +45,24 @@ def usage_stats(room: str, sender: str, msg: str):
     if not config.is_admin_user(sender):
         return "⚠️ 관리자만 사용할 수 있는 명령어입니다."
     
-    return error_monitor.get_usage_stats()
+    message = error_monitor.get_usage_stats()
+    
+    # 요청 제한 통계 (core.admission)
+    from core.admission import admission
+    stats = admission.get_stats()
+    rejected = stats['rejected']
+    message += "\n【요청 제한】\n"
+    message += f"허용: {stats['admitted']}회 / 거절: {sum(rejected.values())}회\n"
+    if rejected:
+        message += f"  방 {rejected.get('room', 0)} · 사용자 {rejected.get('sender', 0)} · "
+        message += f"카테고리 {rejected.get('category', 0)} · 동시실행 {rejected.get('concurrency', 0)}\n"
+    message += f"동시 실행: {stats['in_flight']} (최대 {stats['max_in_flight']}/{stats['max_concurrent']})\n"
+    
+    top_rooms = sorted(stats['rejected_by_room'].items(), key=lambda x: x[1], reverse=True)[:3]
+    if top_rooms:
+        message += "거절 많은 방: " + ", ".join(f"{room}({count})" for room, count in top_rooms) + "\n"
+    
+    return message
 
 def enable_command(room: str, sender: str, msg: str):
     """명령어 활성화 (관리자 전용)"""
@@ -121,4 +138,86 @@ def performance_recommendations(room: str, sender: str, msg: str):
     if not any(recommendations.values()):
         message += "현재 성능이 양호합니다."
     
-    return message
\ No newline at end of file
+    return message
+
+def trace_report(room: str, sender: str, msg: str):
+    """느린 요청 추적 결과 (관리자 전용)
+
+    /트레이스 [개수]       가장 느린 요청의 구간별 시간 (기본 3개)
+    /트레이스 샘플 0.5     추적할 요청 비율 변경 (0 이면 끔)
+    /트레이스 초기화       보관 중인 추적 결과 삭제
+    """
+    import config
+    from utils.tracing import format_trace, tracer
+    
+    # 관리자 체크
+    if not config.is_admin_user(sender):
+        return "⚠️ 관리자만 사용할 수 있는 명령어입니다."
+    
+    parts = msg.split()
+    if len(parts) > 1 and parts[1] == "초기화":
+        tracer.reset()
+        return "✅ 추적 결과를 초기화했습니다."
+    if len(parts) > 2 and parts[1] == "샘플":
+        try:
+            tracer.set_sample_rate(float(parts[2]))
+        except ValueError:
+            return "사용법: /트레이스 샘플 [0~1]"
+        return f"✅ 추적 비율: {tracer.sample_rate * 100:.0f}%"
+    
+    limit = 3  # 기본값
+    if len(parts) > 1:
+        try:
+            limit = min(10, max(1, int(parts[1])))  # 1~10 범위로 제한
+        except:
+            pass
+    
+    stats = tracer.get_stats()
+    message = f"🐢 느린 요청 (추적 비율 {stats['sample_rate'] * 100:.0f}%, 추적 {stats['traced']}건)\n"
+    traces = tracer.slowest(limit)
+    if not traces:
+        return message + "\n아직 추적된 요청이 없습니다."
+    for trace in traces:
+        message += "\n" + format_trace(trace) + "\n"
+    return message
+
+def profile_report(room: str, sender: str, msg: str):
+    """샘플링 프로파일 (관리자 전용)
+
+    /프로파일 [초]           지금부터 N초 동안 모든 스레드 스택 샘플링 (기본 10초)
+    /프로파일 최근 [초]      상시 모드에 쌓인 최근 샘플
+    /프로파일 상시 켜기/끄기  저빈도 상시 샘플링
+    flamegraph 용 collapsed stack 은 GET /api/profile?mode=last|recent
+    """
+    import config
+    from utils.profiler import format_result, profiler, requested_seconds
+    
+    # 관리자 체크
+    if not config.is_admin_user(sender):
+        return "⚠️ 관리자만 사용할 수 있는 명령어입니다."
+    
+    parts = msg.split()
+    if len(parts) > 1 and parts[1] == "상시":
+        if len(parts) > 2 and parts[2] == "끄기":
+            profiler.stop_continuous()
+            return "✅ 상시 프로파일링을 껐습니다."
+        profiler.start_continuous()
+        return (f"✅ 상시 프로파일링: {profiler.continuous_hz:g}Hz, 최근 {profiler.window:g}초 보관\n"
+                f"조회: /프로파일 최근")
+    
+    if len(parts) > 1 and parts[1] == "최근":
+        if not profiler.continuous:
+            return "ℹ️ 상시 프로파일링이 꺼져 있습니다. (/프로파일 상시 켜기)"
+        seconds = None
+        if len(parts) > 2:
+            try:
+                seconds = float(parts[2])
+            except ValueError:
+                pass
+        return format_result(profiler.recent(seconds), "🔬 최근 프로파일 (상시)")
+    
+    try:
+        result = profiler.profile(requested_seconds(msg))
+    except RuntimeError:
+        return "ℹ️ 이미 프로파일링 중입니다. 잠시 후 다시 시도해주세요."
+    return format_result(result, "🔬 프로파일") + "\n\nflamegraph: GET /api/profile?mode=last"
@@ -10,33 +10,35 @@ import random
 import subprocess
 import concurrent.futures  # 병렬 처리 추가
 from socket import socket, AF_INET, SOCK_STREAM
+import logging
 
 from bs4 import BeautifulSoup as bs
 import requests
-import google.generativeai as genai
-import anthropic
-from openai import OpenAI
+
+# 로그는 "bot" 로거로 (utils.log_pipeline 이 별도 스레드에서 기록, 요청 스레드는 print 로 막히지 않음)
+_logger = logging.getLogger("bot")
+
+# 무거운 SDK는 처음 사용할 때 import (서버 시작 시간/메모리 절약)
+from utils.lazy_import import lazy_module, lazy_attr, is_available
+genai = lazy_module("google.generativeai")
+anthropic = lazy_module("anthropic")
+OpenAI = lazy_attr("openai", "OpenAI")
 
 # ========================================
 # 세션 재사용을 위한 모듈 레벨 캐시
 # ========================================
-_http_session = None
-_proxy_session = None
+# HTTP 세션은 services.http_service 의 공용 연결 풀 사용
+from services import http_service
+
 _openai_client = None
 
 def get_http_session():
-    """HTTP 세션 반환 (재사용)"""
-    global _http_session
-    if _http_session is None:
-        _http_session = requests.Session()
-    return _http_session
+    """HTTP 세션 반환 (공용 연결 풀)"""
+    return http_service.get_session()
 
 def get_proxy_session():
-    """프록시 세션 반환 (재사용)"""
-    global _proxy_session
-    if _proxy_session is None:
-        _proxy_session = requests.Session()
-    return _proxy_session
+    """프록시 세션 반환 (쿠키 분리, 연결 풀 설정 동일)"""
+    return http_service.get_session("proxy")
 
 def get_openai_client():
     """OpenAI 클라이언트 반환 (재사용)"""
@@ -47,17 +49,22 @@ def get_openai_client():
 
 # 디버그 로거 추가
 from utils.debug_logger import debug_logger
+from utils.deadline import MIN_TIMEOUT, deadline_expired, remaining_timeout, sdk_request_options, submit_in_context
+# 웹페이지 본문 추출은 worker 프로세스에서도 import 하는 가벼운 모듈에 있음 (extract_main_content 는 기존 이름 유지)
+from utils.html_extract import extract_main_content, extract_page
+from utils.parse_pool import parse_pool
+from utils.symbol_index import symbol_index
 # Google Sheets 관련 import 제거됨
-try:
-    from youtube_transcript_api import YouTubeTranscriptApi
-except ImportError:
-    print("⚠️ youtube_transcript_api 모듈을 찾을 수 없습니다. pip install youtube-transcript-api로 설치하세요.")
+if is_available("youtube_transcript_api"):
+    YouTubeTranscriptApi = lazy_attr("youtube_transcript_api", "YouTubeTranscriptApi")
+else:
+    _logger.warning("⚠️ youtube_transcript_api 모듈을 찾을 수 없습니다. pip install youtube-transcript-api로 설치하세요.")
     YouTubeTranscriptApi = None
 
-try:
-    from googleapiclient.discovery import build
-except ImportError:
-    print("⚠️ google-api-python-client 모듈을 찾을 수 없습니다.")
+if is_available("googleapiclient"):
+    build = lazy_attr("googleapiclient.discovery", "build")
+else:
+    _logger.warning("⚠️ google-api-python-client 모듈을 찾을 수 없습니다.")
     build = None
 
 # 통합 설정 관리 시스템을 불러옵니다.
@@ -84,60 +91,44 @@ def get_next_scrapingbee_key():
 def get_conn():
     """데이터베이스 연결 (임시 구현)"""
     # 실제 DB 연결 구현 필요
-    print("⚠️ 데이터베이스 연결이 구현되지 않았습니다.")
+    _logger.warning("⚠️ 데이터베이스 연결이 구현되지 않았습니다.")
     return None, None
 
 def fetch_val(query, params):
     """단일 값 조회 (임시 구현)"""
-    print(f"⚠️ DB 쿼리 실행 필요: {query}")
+    _logger.warning("⚠️ DB 쿼리 실행 필요: %s", query)
     return None
 
 def fetch_all(query, params):
     """전체 행 조회 (임시 구현)"""
-    print(f"⚠️ DB 쿼리 실행 필요: {query}")
+    _logger.warning("⚠️ DB 쿼리 실행 필요: %s", query)
     return []
 
 def fetch_one(query, params):
     """단일 행 조회 (임시 구현)"""
-    print(f"⚠️ DB 쿼리 실행 필요: {query}")
+    _logger.warning("⚠️ DB 쿼리 실행 필요: %s", query)
     return None
 
 def execute(query, params):
     """쿼리 실행 (임시 구현)"""
-    print(f"⚠️ DB 쿼리 실행 필요: {query}")
+    _logger.warning("⚠️ DB 쿼리 실행 필요: %s", query)
     return True
 
 # ========================================
 # 핵심 함수들
 # ========================================
 
-def log(message):
-    """로그 출력 함수"""
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
+def log(message, *args):
+    """로그 출력 함수 (utils.log_pipeline 의 writer 스레드에서 기록, utils.text_utils.log 와 같음)"""
+    _logger.info(message, *args)
 
 def request(url, method="get", result="text", params=None, headers=None):
-    """웹 요청 함수"""
-    try:
-        if method.lower() == "get":
-            # 보안: TLS 검증 활성화 (verify=True)
-            response = requests.get(url, params=params, headers=headers, verify=True, timeout=10)
-            if result == "bs":
-                soup = bs(response.content, 'html.parser')
-                return soup
-            elif result == "json":
-                return response.json()
-            else:
-                return response.text
-        elif method.lower() == "post":
-            # 보안: TLS 검증 활성화 (verify=True)
-            response = requests.post(url, json=params, headers=headers, verify=True, timeout=10)
-            if result == "json":
-                return response.json()
-            else:
-                return response.text
-    except Exception as e:
-        log(f"웹 요청 오류: {e}")
-        return None
+    """웹 요청 함수 (services.http_service 공용 연결 풀 사용)"""
+    if method.lower() == "post":
+        return http_service.request(url, method="post", result=result, headers=headers,
+                                    json_data=params, raise_for_status=False)
+    return http_service.request(url, method="get", result=result, params=params, headers=headers,
+                                raise_for_status=False)
 
 # API 키는 이제 utils.api_manager.APIManager에서 관리됩니다
 # 환경 변수 설정은 .env 파일을 참조하세요
@@ -215,7 +206,7 @@ def clean_for_kakao(text):
         return text
         
     except Exception as e:
-        print(f"[clean_for_kakao] 에러: {e}")
+        _logger.warning("[clean_for_kakao] 에러: %s", e)
         # 에러 시 최소한의 정제만
         return text.strip()
 
@@ -255,13 +246,13 @@ def get_ai_answer(room, sender, msg):
         # 컨텍스트가 있으면 질문에 포함
         if context:
             full_question = context
-            print(f"[AI] 이전 대화 컨텍스트 포함")
+            _logger.debug("[AI] 이전 대화 컨텍스트 포함")
         else:
             full_question = question
-            print(f"[AI] 새로운 대화 시작")
+            _logger.debug("[AI] 새로운 대화 시작")
         
         # Gemini로 직접 응답 생성
-        print(f"[AI] Gemini로 직접 응답 생성 중...")
+        _logger.debug("[AI] Gemini로 직접 응답 생성 중...")
         response = gemini15_flash(system_prompt, full_question)
         
         if response:
@@ -275,15 +266,13 @@ def get_ai_answer(room, sender, msg):
             # 대화 기록에 저장
             chat_history.add_message(room, sender, question, cleaned)
             
-            print(f"[AI] 최종 응답: {cleaned[:100]}...")
+            _logger.info("[AI] 최종 응답: %.100s...", cleaned)
             return cleaned
         else:
             return "죄송합니다. 잘 이해하지 못했어요. 다시 질문해주세요."
             
     except Exception as e:
-        print(f"[AI] Gemini 오류: {e}")
-        import traceback
-        print(f"[AI] 에러 상세: {traceback.format_exc()}")
+        _logger.error("[AI] Gemini 오류: %s", e, exc_info=True)
         return "일시적인 오류가 발생했어요. 잠시 후 다시 시도해주세요."
     
     # 위에서 처리했으므로 아래 코드는 실행되지 않음
@@ -294,17 +283,17 @@ def get_ai_answer(room, sender, msg):
         perplexity_response = None
         try:
             # Perplexity로 검색 (정보 수집용)
-            print(f"[AI] Perplexity로 정보 검색 중...")
+            _logger.debug("[AI] Perplexity로 정보 검색 중...")
             perplexity_response = perplexity_chat_fast(question, api_key)
             if perplexity_response:
-                print(f"[AI] Perplexity 응답 받음 (길이: {len(perplexity_response)})")
+                _logger.debug("[AI] Perplexity 응답 받음 (길이: %d)", len(perplexity_response))
         except Exception as e:
-            print(f"Perplexity API 오류: {e}")
+            _logger.error("Perplexity API 오류: %s", e)
         
         # 2. Perplexity 응답을 Gemini로 재처리 (카카오톡 최적화)
         if perplexity_response:
             try:
-                print(f"[AI] Gemini로 카카오톡용 재포맷팅 중...")
+                _logger.debug("[AI] Gemini로 카카오톡용 재포맷팅 중...")
                 
                 # Perplexity 응답 길이 제한 (너무 긴 입력 방지)
                 perplexity_limited = perplexity_response[:400] if len(perplexity_response) > 400 else perplexity_response
@@ -323,15 +312,15 @@ def get_ai_answer(room, sender, msg):
 - 사용자 질문: {question}"""
                 
                 # Gemini로 재처리
-                print(f"[AI] Gemini 호출 중...")
+                _logger.debug("[AI] Gemini 호출 중...")
                 final_response = gemini15_flash(
                     "100자 이내로 짧게 요약. 줄바꿈 없이. 이모지와 특수문자 절대 사용 금지.",
                     gemini_prompt
                 )
-                print(f"[AI] Gemini 원본 응답: {final_response}")
+                _logger.debug("[AI] Gemini 원본 응답: %s", final_response)
                 
                 if final_response:
-                    print(f"[AI] Gemini 재처리 완료 (길이: {len(final_response)})")
+                    _logger.debug("[AI] Gemini 재처리 완료 (길이: %d)", len(final_response))
                     # 메신저봇 호환성을 위한 텍스트 정제
                     final_response = final_response.replace('\n\n', ' ')
                     final_response = final_response.replace('\n', ' ')
@@ -343,25 +332,23 @@ def get_ai_answer(room, sender, msg):
                         final_response = final_response[:197] + '...'
                     # 최종 정제 후 반환
                     cleaned = clean_for_kakao(final_response)
-                    print(f"[AI] 최종 응답: {cleaned}")
+                    _logger.info("[AI] 최종 응답: %.100s", cleaned)
                     return cleaned
                 else:
                     # Gemini 실패시 Perplexity 원본 사용
-                    print(f"[AI] Gemini 재처리 실패, Perplexity 원본 사용")
+                    _logger.warning("[AI] Gemini 재처리 실패, Perplexity 원본 사용")
                     perplexity_response = perplexity_response.replace('\n\n', ' ')
                     perplexity_response = perplexity_response.replace('\n', ' ')
                     return clean_for_kakao(perplexity_response)
                     
             except Exception as e:
-                print(f"[AI] Gemini 재처리 오류 상세: {e}")
-                import traceback
-                print(f"[AI] 에러 트레이스: {traceback.format_exc()}")
+                _logger.error("[AI] Gemini 재처리 오류 상세: %s", e, exc_info=True)
                 # 오류시 짧은 기본 메시지 반환
                 return "정보를 가져왔는데 처리 중 문제가 발생했어요. 다시 질문해주세요."
         
         # 3. Perplexity 실패시 Gemini 직접 응답
         try:
-            print(f"[AI] Perplexity 실패, Gemini 직접 응답 생성")
+            _logger.warning("[AI] Perplexity 실패, Gemini 직접 응답 생성")
             response = gemini15_flash(
                 "간단히 1-2문장으로 답변. 이모지와 특수문자 사용 금지.",
                 question
@@ -369,7 +356,7 @@ def get_ai_answer(room, sender, msg):
             if response:
                 return clean_for_kakao(response)
         except Exception as e:
-            print(f"Gemini 폴백 오류: {e}")
+            _logger.error("Gemini 폴백 오류: %s", e)
         
         # 4. 모든 실패시 기본 Gemini 폴백
         try:
@@ -381,7 +368,7 @@ def get_ai_answer(room, sender, msg):
                 formatted_response = response.replace(". ", ".\n").strip()
                 return formatted_response
         except Exception as e:
-            print(f"Gemini API 폴백 오류: {e}")
+            _logger.error("Gemini API 폴백 오류: %s", e)
     
     # 모든 API 실패시 기본 응답
     return "죄송해요, 지금은 AI 서비스를 이용할 수 없습니다. 잠시 후 다시 시도해주세요."
@@ -415,14 +402,14 @@ def perplexity_chat_fast(question, api_key):
     
     try:
         # 타임아웃을 5초로 단축 (빠른 응답)
-        response = requests.post(url, headers=headers, json=payload, timeout=5)
+        response = http_service.post(url, headers=headers, json=payload, timeout=5)
         
         # 상태 코드 확인
         if response.status_code == 401:
-            print(f"Perplexity API 인증 실패")
+            _logger.error("Perplexity API 인증 실패")
             return None
         elif response.status_code == 429:
-            print(f"Perplexity API 요청 한도 초과")
+            _logger.warning("Perplexity API 요청 한도 초과")
             return None
         
         response.raise_for_status()
@@ -464,17 +451,17 @@ def perplexity_chat_fast(question, api_key):
             # 7. 안전한 ASCII 변환 (이모지는 유지)
             # content = content.encode('utf-8', 'ignore').decode('utf-8')
             
-            print(f"정제된 Perplexity 응답: {content}")
+            _logger.debug("정제된 Perplexity 응답: %s", content)
             # 태그 없이 순수 내용만 반환
             return content
         
         return None
     
     except requests.exceptions.Timeout:
-        print(f"Perplexity API 타임아웃 (10초)")
+        _logger.warning("Perplexity API 타임아웃 (10초)")
         return None
     except Exception as e:
-        print(f"Perplexity API 오류: {e}")
+        _logger.error("Perplexity API 오류: %s", e)
         return None
 
 def perplexity_chat(question, api_key):
@@ -511,14 +498,14 @@ def perplexity_chat(question, api_key):
     }
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=15)
+        response = http_service.post(url, headers=headers, json=payload, timeout=15)
         
         # 상태 코드 확인
         if response.status_code == 401:
-            print(f"Perplexity API 인증 실패: API 키를 확인하세요")
+            _logger.error("Perplexity API 인증 실패: API 키를 확인하세요")
             return None
         elif response.status_code == 429:
-            print(f"Perplexity API 요청 한도 초과")
+            _logger.warning("Perplexity API 요청 한도 초과")
             return None
         
         response.raise_for_status()
@@ -540,21 +527,25 @@ def perplexity_chat(question, api_key):
             
             return content
         
-        print(f"Perplexity API 응답 형식 오류: {data}")
+        _logger.error("Perplexity API 응답 형식 오류: %s", data)
         return None
         
     except requests.exceptions.Timeout:
-        print("Perplexity API 타임아웃")
+        _logger.warning("Perplexity API 타임아웃")
         return None
     except requests.exceptions.RequestException as e:
-        print(f"Perplexity API 요청 오류: {e}")
+        _logger.error("Perplexity API 요청 오류: %s", e)
         if hasattr(e, 'response') and e.response is not None:
-            print(f"응답 상태 코드: {e.response.status_code}")
-            print(f"응답 내용: {e.response.text[:200]}")
+            _logger.error("응답 상태 코드: %s", e.response.status_code)
+            _logger.error("응답 내용: %.200s", e.response.text)
         return None
 
 def gemini15_flash(system, question, retry_count=0, use_search=True):
     """Gemini 2.0 Flash AI 함수 - Google Search 통합"""
+    # 호출자가 이미 포기했으면 (재시도 포함) API 를 호출하지 않음
+    if deadline_expired():
+        return None
+    
     # APIManager를 통해 다음 API 키 가져오기
     api_key = APIManager.get_next_gemini_key()
     
@@ -572,7 +563,7 @@ def gemini15_flash(system, question, retry_count=0, use_search=True):
         
         # 실시간 정보가 필요한 경우 프롬프트 조정
         if use_search and needs_search:
-            print("[AI] 실시간 정보 모드 활성화")
+            _logger.debug("[AI] 실시간 정보 모드 활성화")
             # 프롬프트에 현재 날짜와 실시간 정보 요청 추가
             from datetime import datetime
             current_date = datetime.now().strftime("%Y년 %m월 %d일")
@@ -599,7 +590,8 @@ Assistant:"""
             generation_config={
                 'temperature': 0.7,  # 자연스러운 대화를 위해 적절히 설정
                 'max_output_tokens': 1500,  # 1000자 + 여유분
-            }
+            },
+            request_options=sdk_request_options()  # 명령어 남은 시간 안에서만 대기
         )
         
         if response and response.text:
@@ -619,17 +611,17 @@ Assistant:"""
         
         # 현재 키 실패시 다음 키로 재시도 (최대 3번)
         if retry_count < 2:
-            print(f"Gemini API 키 실패, 다음 키로 재시도 (시도 {retry_count + 2}/3)")
+            _logger.warning("Gemini API 키 실패, 다음 키로 재시도 (시도 %d/3)", retry_count + 2)
             return gemini15_flash(system, question, retry_count + 1, use_search)
         
         return None
         
     except Exception as e:
-        print(f"Gemini API 오류: {e}")
+        _logger.error("Gemini API 오류: %s", e)
         
         # 다른 키로 재시도 (최대 3번)
         if retry_count < 2:
-            print(f"다른 Gemini 키로 재시도 (시도 {retry_count + 2}/3)")
+            _logger.warning("다른 Gemini 키로 재시도 (시도 %d/3)", retry_count + 2)
             return gemini15_flash(system, question, retry_count + 1, use_search)
         
         return None
@@ -936,7 +928,7 @@ def photo(room: str, sender: str, msg: str):
     # elements 에서 랜덤한 이미지 선택
     element = random.choice(elements)
     img_url = element['src']
-    response = requests.get(img_url)
+    response = http_service.get(img_url)
     img_data = response.content
 
     # 파일명 영대소문자숫자 임의의 6자리 생성
@@ -1087,108 +1079,47 @@ def summarize(room: str, sender: str, msg: str):
     return send_msg
 
 
-def extract_main_content(soup):
-    """웹페이지 본문 추출 - 뉴스 사이트 최적화"""
-    
-    # 뉴스 사이트별 본문 선택자
-    selectors = [
-        # 네이버 블로그
-        '.se-main-container',  # 네이버 블로그 스마트에디터3
-        '.postViewArea',  # 네이버 블로그 구 에디터
-        '#postViewArea',
-        '.post-view',
-        'div[id^="post-view"]',
-        '.se-component',  # 네이버 블로그 컴포넌트
-        
-        # 네이버 엔터/뉴스
-        '.end_ct_area',  # 네이버 엔터 기사
-        '.news_end',  # 네이버 뉴스
-        '#articeBody',  # 네이버 기사 본문
-        '#newsEndContents',  # 네이버 뉴스 본문
-        '.news_view',  # 네이버 뉴스
-        '#articleBodyContents',  # 네이버 뉴스 구버전
-        '.content_area',  # 네이버 뉴스 신버전
-        
-        # 일반 사이트
-        '#article-view-content-div',  # bloter.net 등 뉴스 CMS
-        '.article-body',  # bloter.net, 일부 뉴스 사이트
-        'article',  # 일반적인 article 태그
-        '.article_body',  # 다음 뉴스
-        '.article_view',  # 일부 뉴스 사이트
-        '.news_body',  # 일부 뉴스 사이트
-        '.content',  # 일반 콘텐츠
-        'main',  # HTML5 main 태그
-        '[role="main"]',  # ARIA role
-        '.post-content',  # 블로그 형식
-        '.entry-content',  # 워드프레스 등
-    ]
-    
-    for selector in selectors:
-        element = soup.select_one(selector)
-        if element:
-            # 불필요한 태그 제거
-            for tag in element.select('script, style, aside, nav'):
-                tag.decompose()
-            return element.get_text(separator=' ', strip=True)
-    
-    # 못 찾으면 body 전체 (스크립트와 스타일 제외)
-    body = soup.find('body')
-    if body:
-        for tag in body.select('script, style, aside, nav, header, footer'):
-            tag.decompose()
-        return body.get_text(separator=' ', strip=True)[:10000]
-    return ""
-
-
 def _fetch_direct_request(url, headers):
-    """직접 HTTP 요청 (병렬 처리용) - 빠른 응답 최적화"""
+    """직접 HTTP 요청 (병렬 처리용) - 빠른 응답 최적화
+
+    파싱/본문 추출은 parse_pool 의 worker 프로세스에서 (큰 페이지를 파싱하는 동안 GIL 을 잡지 않도록)
+    """
     try:
-        session = get_http_session()
-        response = session.get(url, timeout=3, headers=headers, allow_redirects=True)
+        response = http_service.get(url, timeout=3, headers=headers, allow_redirects=True)
 
         if response.encoding == 'ISO-8859-1':
             response.encoding = response.apparent_encoding or 'utf-8'
 
-        soup = bs(response.text, 'html.parser')
-
-        # 제목 추출
-        title_elem = soup.find('title')
-        title = None
-        if title_elem:
-            title = title_elem.text.strip()
-        else:
-            og_title = soup.find('meta', property='og:title')
-            if og_title:
-                title = og_title.get('content', '제목 없음')
+        # 임의의 웹페이지라 기존 파서(UNPORTED_BACKEND) 그대로
+        parser = http_service.html_backend(partial=False)
+        frame_id = 'mainFrame' if 'blog.naver.com' in url else None
+        page = parse_pool.call(extract_page, response.content, parser, response.encoding, frame_id)
+        title = page['title']
 
         # 네이버 블로그 iframe 처리
-        if 'blog.naver.com' in url:
-            iframe = soup.find('iframe', {'id': 'mainFrame'})
-            if iframe:
-                iframe_src = iframe.get('src')
-                if iframe_src:
-                    if not iframe_src.startswith('http'):
-                        iframe_src = 'https://blog.naver.com' + iframe_src
-
-                    log(f"네이버 블로그 iframe 감지, 재시도: {iframe_src}")
-
-                    # iframe URL로 다시 요청
-                    iframe_response = session.get(iframe_src, headers=headers, timeout=3)
-                    if iframe_response.status_code == 200:
-                        soup = bs(iframe_response.text, 'html.parser')
-                        log("iframe 콘텐츠 로드 성공")
+        if page['iframe_src']:
+            iframe_src = page['iframe_src']
+            if not iframe_src.startswith('http'):
+                iframe_src = 'https://blog.naver.com' + iframe_src
+
+            log(f"네이버 블로그 iframe 감지, 재시도: {iframe_src}")
+
+            # iframe URL로 다시 요청
+            iframe_response = http_service.get(iframe_src, headers=headers, timeout=3)
+            if iframe_response.status_code != 200:
+                return title, None
+            page = parse_pool.call(extract_page, iframe_response.content, parser, iframe_response.encoding)
+            log("iframe 콘텐츠 로드 성공")
 
         # 본문 추출
-        content = extract_main_content(soup)
+        content = page['content']
 
         # og:description fallback
         if not content or len(content) < 100:
-            og_desc = soup.find('meta', property='og:description')
-            if og_desc and og_desc.get('content'):
-                og_content = og_desc.get('content', '').strip()
-                if len(og_content) >= 50:
-                    log(f"og:description fallback 사용: {len(og_content)}자")
-                    content = og_content
+            og_content = page['og_description'] or ''
+            if len(og_content) >= 50:
+                log(f"og:description fallback 사용: {len(og_content)}자")
+                content = og_content
 
         return title, content
     except Exception as e:
@@ -1214,7 +1145,7 @@ def _fetch_proxy_request(url, proxy_headers):
         import urllib3
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-        response = requests.get(url, proxies=proxies, headers=proxy_headers, timeout=5, verify=False)
+        response = http_service.get(url, session="proxy", proxies=proxies, headers=proxy_headers, timeout=5, verify=False)
 
         if response.status_code == 200:
             if response.encoding == 'ISO-8859-1':
@@ -1242,7 +1173,7 @@ def _fetch_proxy_request(url, proxy_headers):
                             iframe_src = 'https://blog.naver.com' + iframe_src
 
                         try:
-                            iframe_response = requests.get(iframe_src, proxies=proxies, headers=proxy_headers, timeout=3, verify=False)
+                            iframe_response = http_service.get(iframe_src, session="proxy", proxies=proxies, headers=proxy_headers, timeout=3, verify=False)
                             if iframe_response.status_code == 200:
                                 soup = bs(iframe_response.text, 'html.parser')
                                 log("iframe 콘텐츠 로드 성공")
@@ -1311,12 +1242,15 @@ def get_playwright_page():
 
 def _fetch_with_playwright(url):
     """Playwright로 자바스크립트 렌더링 페이지 크롤링"""
+    # 호출자가 이미 포기했으면 브라우저를 쓰지 않음 (Playwright 는 timeout=0 을 무제한으로 봄)
+    if deadline_expired():
+        return None, None
     try:
         page = get_playwright_page()
         if not page:
             return None, None
 
-        page.goto(url, timeout=15000, wait_until='domcontentloaded')
+        page.goto(url, timeout=max(remaining_timeout(15), MIN_TIMEOUT) * 1000, wait_until='domcontentloaded')
 
         # 제목
         title = page.title()
@@ -1384,11 +1318,12 @@ def _fetch_content_parallel(url):
     # 병렬 실행
     try:
         with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            future_direct = executor.submit(_fetch_direct_request, url, headers)
-            future_proxy = executor.submit(_fetch_proxy_request, url, proxy_headers)
+            # 작업 스레드에도 명령어 마감 시간 전달
+            future_direct = submit_in_context(executor, _fetch_direct_request, url, headers)
+            future_proxy = submit_in_context(executor, _fetch_proxy_request, url, proxy_headers)
 
             # as_completed는 Future 객체의 리스트를 받음 - 첫 성공 시 즉시 반환
-            for future in concurrent.futures.as_completed([future_direct, future_proxy], timeout=5):
+            for future in concurrent.futures.as_completed([future_direct, future_proxy], timeout=remaining_timeout(5)):
                 try:
                     title, content = future.result(timeout=1)  # 이미 완료된 future는 즉시 반환
                     if title and content and len(content) >= 50:
@@ -1571,7 +1506,7 @@ def lol_record(room: str, sender: str, msg: str):
         return send_msg
 
     except Exception as e:
-        print(traceback.format_exc())
+        _logger.exception("롤 전적 조회 오류")
         return f"오류가 발생했어요ㅠ\n{e}"
 
 
@@ -1868,7 +1803,7 @@ def delete_info(room: str, sender: str, msg: str):
 def coin(room: str, sender: str, msg: str):
     
     url = f"https://m.stock.naver.com/front-api/crypto/top?exchangeType=BITHUMB&sortType=top&pageSize=10"
-    response = requests.get(url=url)
+    response = http_service.get(url=url)
     result = response.json()
     send_msg = "🪙 코인 시세 🪙"
     for item in result['result']['contents']:
@@ -2001,7 +1936,7 @@ def search_news(room: str, sender: str, msg: str):
             "X-Naver-Client-Secret": client_secret,
         }
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_service.get(url, headers=headers, timeout=10)
 
         if response.status_code != 200:
             debug_logger.error(f"네이버 API 오류: {response.status_code}")
@@ -2072,7 +2007,7 @@ def _search_news_google_fallback(keyword: str) -> str:
         encode_keyword = urllib.parse.quote(keyword)
         url = f'https://news.google.com/rss/search?q={encode_keyword}&hl=ko&gl=KR&ceid=KR:ko'
 
-        response = requests.get(url, timeout=10)
+        response = http_service.get(url, timeout=10)
         soup = bs(response.content, 'xml')
         items = soup.find_all('item')[:5]
 
@@ -2172,44 +2107,11 @@ def stock(room: str, sender: str, msg: str):
         return "📊 사용법: /주식 삼성전자"
     
     try:
-        # 종목 코드 매핑 (자주 검색되는 종목들)
-        stock_mapping = {
-            '삼성전자': '005930', '삼전': '005930',
-            'sk하이닉스': '000660', 'SK하이닉스': '000660', '하이닉스': '000660',
-            'NAVER': '035420', '네이버': '035420',
-            '카카오': '035720',
-            'LG에너지솔루션': '373220', 'LG에너지': '373220',
-            '현대차': '005380', '현대자동차': '005380',
-            '기아': '000270', '기아자동차': '000270',
-            'SK': '034730', 'SK이노베이션': '096770', 'SK텔레콤': '017670',
-            'LG화학': '051910', 'LG전자': '066570',
-            '포스코': '005490', 'POSCO': '005490',
-            '삼성바이오로직스': '207940', '삼성바이오': '207940',
-            '셀트리온': '068270', '삼성SDI': '006400',
-            '현대모비스': '012330', 'KB금융': '105560',
-            '신한지주': '055550', '하나금융지주': '086790',
-            '삼성생명': '032830', '삼성화재': '000810', '삼성물산': '028260'
-        }
-        
-        # 종목 코드 확인
-        stock_code = None
-        stock_name = keyword
-        
-        # 입력이 종목 코드인지 확인 (6자리 숫자)
-        if keyword.isdigit() and len(keyword) == 6:
-            stock_code = keyword
-            stock_name = keyword
-        # 매핑된 종목명인지 확인
-        elif keyword in stock_mapping:
-            stock_code = stock_mapping[keyword]
-            stock_name = keyword
-        # 대소문자 구분 없이 매핑 확인
-        else:
-            for key, value in stock_mapping.items():
-                if key.lower() == keyword.lower():
-                    stock_code = value
-                    stock_name = key
-                    break
+        # 종목명/별칭/초성 → 종목코드 (KRX 종목 인덱스, 6자리 숫자는 종목코드로 그대로 사용, 접두어/오타는 후보 안내)
+        symbol = symbol_index.resolve(keyword)
+        if not symbol:
+            return symbol_index.not_found_message(keyword)
+        stock_code, stock_name = symbol.code, symbol.name
         
         if stock_code:
             # 종목 상세 페이지에서 정보 추출
@@ -2526,7 +2428,7 @@ def real_keyword(room: str, sender: str, msg: str):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=5)
+        response = http_service.get(url, headers=headers, timeout=5)
         if response.status_code == 200:
             from xml.etree import ElementTree as ET
             root = ET.fromstring(response.content)
@@ -2906,39 +2808,36 @@ def movie_rank(room: str, sender: str, msg: str):
     """영화 순위 - 실시간 박스오피스"""
     try:
         from datetime import datetime, timedelta
-        import traceback
         
         # 1. Playwright 시도
         try:
             from movie_modules.movie_rank_playwright import movie_rank_with_playwright
-            print("[영화순위] Playwright 시도 중...")
+            _logger.debug("[영화순위] Playwright 시도 중...")
             result = movie_rank_with_playwright()
             if result and "KOBIS" in result:
-                print("[영화순위] Playwright 성공")
+                _logger.info("[영화순위] Playwright 성공")
                 return result  # 영화순위는 전체 표시
         except ImportError as e:
-            print(f"[영화순위] Playwright 모듈 없음: {e}")
+            _logger.warning("[영화순위] Playwright 모듈 없음: %s", e)
         except Exception as e:
-            print(f"[영화순위] Playwright 실행 오류: {e}")
-            traceback.print_exc()
+            _logger.error("[영화순위] Playwright 실행 오류: %s", e, exc_info=True)
         
         # 2. Selenium 시도 
         try:
             from movie_modules.movie_rank_selenium import movie_rank_with_selenium
-            print("[영화순위] Selenium 시도 중...")
+            _logger.debug("[영화순위] Selenium 시도 중...")
             result = movie_rank_with_selenium()
             if result:
-                print("[영화순위] Selenium 성공")
+                _logger.info("[영화순위] Selenium 성공")
                 return result  # 영화순위는 전체 표시
         except ImportError as e:
-            print(f"[영화순위] Selenium 모듈 없음: {e}")
+            _logger.warning("[영화순위] Selenium 모듈 없음: %s", e)
         except Exception as e:
-            print(f"[영화순위] Selenium 실행 오류: {e}")
-            traceback.print_exc()
+            _logger.error("[영화순위] Selenium 실행 오류: %s", e, exc_info=True)
         
         # 3. KOBIS API 직접 호출 시도
         try:
-            print("[영화순위] KOBIS API 직접 호출 시도...")
+            _logger.debug("[영화순위] KOBIS API 직접 호출 시도...")
             yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y%m%d')
             api_url = f"https://www.kobis.or.kr/kobisopenapi/webservice/rest/boxoffice/searchDailyBoxOfficeList.json"
             
@@ -2948,7 +2847,7 @@ def movie_rank(room: str, sender: str, msg: str):
                 'targetDt': yesterday
             }
             
-            response = requests.get(api_url, params=kobis_params, timeout=5)
+            response = http_service.get(api_url, params=kobis_params, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 if 'boxOfficeResult' in data:
@@ -2983,29 +2882,29 @@ def movie_rank(room: str, sender: str, msg: str):
                             send_msg += "\n"
                         
                         send_msg += "📊 출처: KOBIS (영화진흥위원회)"
-                        print("[영화순위] KOBIS API 성공")
+                        _logger.info("[영화순위] KOBIS API 성공")
                         return send_msg
         except Exception as e:
-            print(f"[영화순위] KOBIS API 오류: {e}")
+            _logger.error("[영화순위] KOBIS API 오류: %s", e)
         
         # 4. 직접 스크래핑 시도
         try:
             from movie_modules.movie_rank_direct import movie_rank_direct_kobis, movie_rank_naver
-            print("[영화순위] 직접 스크래핑 시도...")
+            _logger.debug("[영화순위] 직접 스크래핑 시도...")
             
             # KOBIS 직접 스크래핑
             result = movie_rank_direct_kobis()
             if result:
-                print("[영화순위] KOBIS 직접 스크래핑 성공")
+                _logger.info("[영화순위] KOBIS 직접 스크래핑 성공")
                 return result
             
             # 네이버 직접 스크래핑
             result = movie_rank_naver()
             if result:
-                print("[영화순위] 네이버 직접 스크래핑 성공")
+                _logger.info("[영화순위] 네이버 직접 스크래핑 성공")
                 return result
         except Exception as e:
-            print(f"[영화순위] 직접 스크래핑 오류: {e}")
+            _logger.error("[영화순위] 직접 스크래핑 오류: %s", e)
         
         # 5. 기존 네이버 영화 박스오피스 (정적 스크래핑 시도)
         url = "https://movie.naver.com/movie/sdb/rank/rmovie.naver"
@@ -3118,7 +3017,7 @@ def movie_rank(room: str, sender: str, msg: str):
         return send_msg
         
     except Exception as e:
-        print(f"영화 순위 조회 오류: {e}")
+        _logger.error("영화 순위 조회 오류: %s", e)
         
         try:
             # 스크래핑 실패시 API 시도
@@ -3285,7 +3184,7 @@ def stock_upper(room: str, sender: str, msg: str):
         url = 'https://finance.naver.com/sise/sise_upper.naver'
         
         # ScrapingBee API 호출
-        response = requests.get(
+        response = http_service.get(
             url='https://app.scrapingbee.com/api/v1/',
             params={
                 'api_key': api_key,
@@ -3355,7 +3254,7 @@ def stock_upper(room: str, sender: str, msg: str):
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_service.get(url, headers=headers, timeout=10)
         soup = BeautifulSoup(response.text, 'html.parser')
         
         # 간단한 파싱 시도
@@ -3382,7 +3281,7 @@ def stock_lower(room: str, sender: str, msg: str):
         url = 'https://finance.naver.com/sise/sise_lower.naver'
         
         # ScrapingBee API 호출
-        response = requests.get(
+        response = http_service.get(
             url='https://app.scrapingbee.com/api/v1/',
             params={
                 'api_key': api_key,
@@ -3446,7 +3345,7 @@ def stock_lower(room: str, sender: str, msg: str):
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_service.get(url, headers=headers, timeout=10)
         soup = BeautifulSoup(response.text, 'html.parser')
         
         # 간단한 파싱 시도
@@ -3769,7 +3668,7 @@ def naver_land(room: str, sender: str, msg: str):
                 'Accept-Language': 'ko-KR,ko;q=0.9',
             }
             
-            response = requests.get(search_url, headers=headers, timeout=2.5)  # 타임아웃을 2.5초로 더 단축
+            response = http_service.get(search_url, headers=headers, timeout=2.5)  # 타임아웃을 2.5초로 더 단축
             
             if response.status_code == 200:
                 data = response.json()
@@ -3941,7 +3840,7 @@ def lotto_result(room: str, sender: str, msg: str):
         
         # 동행복권 API 호출
         api_url = f"https://www.dhlottery.co.kr/common.do?method=getLottoNumber&drwNo={latest_round}"
-        response = requests.get(api_url)
+        response = http_service.get(api_url)
         
         if response.status_code == 200:
             data = response.json()
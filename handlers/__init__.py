@@ -1,79 +1,110 @@
 """
 핸들러 패키지
 각종 명령어를 처리하는 핸들러 모듈들
+
+핸들러는 처음 사용할 때 해당 모듈만 import 한다 (지연 로딩).
+  - HANDLER_MODULES 에 있는 핸들러: 점진적으로 이동된 하위 모듈
+  - 그 외 이름: fn.py (점진적 마이그레이션용)
+하위 모듈 import 가 실패하면 fn.py 의 같은 이름 함수를 사용한다.
 """
 
-# 임시: fn.py의 모든 함수를 노출 (점진적 마이그레이션용)
-try:
-    from fn import *
-except ImportError:
-    print("⚠️ fn.py를 찾을 수 없습니다. 핸들러 모듈을 개별적으로 import하세요.")
-
-# 점진적으로 이동된 핸들러들 (이것들이 fn.py의 함수를 오버라이드)
-# AI 핸들러
-try:
-    from .ai_handler import (
-        get_ai_answer,
-        gemini15_flash,
-        perplexity_chat_fast,
-        claude3_haiku,
-        gpt4o_mini,
-        get_ai_greeting,
-        get_ai_style
-    )
-except ImportError as e:
-    print(f"AI handler import error: {e}")
-
-# 뉴스 핸들러
-try:
-    from .news_handler import (
-        economy_news,
-        it_news,
-        realestate_news,
-        world_news
-    )
-except ImportError as e:
-    print(f"News handler import error: {e}")
-
-# 주식/금융 핸들러
-try:
-    from .stock_handler import (
-        stock,
-        coin,
-        exchange,
-        gold,
-        stock_upper,
-        stock_lower
-    )
-except ImportError as e:
-    print(f"Stock handler import error: {e}")
-
-try:
-    from .media_handler import *
-except ImportError:
-    pass
-
-try:
-    from .game_handler import *
-except ImportError:
-    pass
-
-try:
-    from .utility_handler import *
-except ImportError:
-    pass
-
-try:
-    from .admin_handler import *
-except ImportError:
-    pass
-
-# 스케줄 핸들러
-try:
-    from .schedule_handler import (
-        schedule_add,
-        schedule_list,
-        schedule_delete
-    )
-except ImportError as e:
-    print(f"Schedule handler import error: {e}")
\ No newline at end of file
+import importlib
+import logging
+
+_logger = logging.getLogger("bot")
+
+# 점진적으로 이동된 핸들러들 (fn.py 의 같은 이름 함수보다 우선)
+HANDLER_MODULES = {
+    # AI 핸들러
+    'get_ai_answer': 'handlers.ai_handler',
+    'gemini15_flash': 'handlers.ai_handler',
+    'perplexity_chat_fast': 'handlers.ai_handler',
+    'claude3_haiku': 'handlers.ai_handler',
+    'gpt4o_mini': 'handlers.ai_handler',
+    'get_ai_greeting': 'handlers.ai_handler',
+    'get_ai_style': 'handlers.ai_handler',
+
+    # 뉴스 핸들러
+    'economy_news': 'handlers.news_handler',
+    'it_news': 'handlers.news_handler',
+    'realestate_news': 'handlers.news_handler',
+    'world_news': 'handlers.news_handler',
+
+    # 주식/금융 핸들러
+    'stock': 'handlers.stock_handler',
+    'coin': 'handlers.stock_handler',
+    'exchange': 'handlers.stock_handler',
+    'gold': 'handlers.stock_handler',
+    'stock_upper': 'handlers.stock_handler',
+    'stock_lower': 'handlers.stock_handler',
+
+    # 미디어 핸들러
+    'youtube_popular_all': 'handlers.media_handler',
+    'youtube_popular_random': 'handlers.media_handler',
+    'summarize': 'handlers.media_handler',
+    'photo': 'handlers.media_handler',
+
+    # 게임 핸들러
+    'lotto': 'handlers.game_handler',
+    'lotto_result': 'handlers.game_handler',
+    'lotto_result_create': 'handlers.game_handler',
+    'fortune_today': 'handlers.game_handler',
+
+    # 유틸리티 핸들러
+    'whether': 'handlers.utility_handler',
+    'whether_today': 'handlers.utility_handler',
+    'calorie': 'handlers.utility_handler',
+    'wise_saying': 'handlers.utility_handler',
+    'emoji': 'handlers.utility_handler',
+    'naver_map': 'handlers.utility_handler',
+
+    # 관리자 핸들러
+    'room_add': 'handlers.admin_handler',
+    'room_remove': 'handlers.admin_handler',
+    'room_list': 'handlers.admin_handler',
+    'talk_analyize': 'handlers.admin_handler',
+    'update_config_file': 'handlers.admin_handler',
+
+    # 스케줄 핸들러
+    'schedule_add': 'handlers.schedule_handler',
+    'schedule_list': 'handlers.schedule_handler',
+    'schedule_delete': 'handlers.schedule_handler',
+}
+
+# 이동되지 않은 핸들러를 찾을 모듈
+FALLBACK_MODULE = 'fn'
+
+# 하위 모듈 이름 (핸들러 이름으로 취급하지 않음)
+_SUBMODULES = {module_name.rsplit('.', 1)[1] for module_name in HANDLER_MODULES.values()}
+
+
+def load_handler(name: str):
+    """핸들러 이름 → 함수 (해당 모듈만 import)
+
+    Raises:
+        AttributeError: 어느 모듈에도 없는 이름
+    """
+    module_name = HANDLER_MODULES.get(name)
+    if module_name:
+        try:
+            return getattr(importlib.import_module(module_name), name)
+        except ImportError as e:
+            _logger.warning("핸들러 import 경고 (%s): %s", module_name, e)
+
+    try:
+        fallback = importlib.import_module(FALLBACK_MODULE)
+    except ImportError as e:
+        raise AttributeError(f"핸들러 '{name}'를 찾을 수 없습니다: {e}") from e
+    return getattr(fallback, name)
+
+
+def __getattr__(name: str):
+    """from handlers import stock 처럼 접근할 때 필요한 모듈만 로딩"""
+    if name.startswith('__') or name in _SUBMODULES:
+        raise AttributeError(name)
+    handler = load_handler(name)
+    globals()[name] = handler
+    return handler
+
+
+__all__ = list(HANDLER_MODULES)
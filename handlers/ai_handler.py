@@ -5,14 +5,22 @@ AI 핸들러 모듈
 AI 관련 명령어 처리 (GPT, Gemini, Claude, Perplexity)
 """
 
+import logging
 import requests
-import traceback
-import google.generativeai as genai
 from datetime import datetime
 from utils.api_manager import APIManager
+from utils.deadline import deadline_expired, sdk_request_options
+from utils.lazy_import import lazy_module
+from utils.tracing import span
+from services import http_service
 from utils.text_utils import clean_for_kakao
 from chat_history_manager import chat_history
 
+_logger = logging.getLogger("bot")
+
+# Gemini SDK는 처음 사용할 때 import
+genai = lazy_module("google.generativeai")
+
 
 def get_ai_answer(room, sender, msg):
     """AI 질문 처리 함수 - Gemini로 통합 (히스토리 기능 포함)"""
@@ -48,13 +56,13 @@ def get_ai_answer(room, sender, msg):
         # 컨텍스트가 있으면 질문에 포함
         if context:
             full_question = context
-            print(f"[AI] 이전 대화 컨텍스트 포함")
+            _logger.debug("[AI] 이전 대화 컨텍스트 포함")
         else:
             full_question = question
-            print(f"[AI] 새로운 대화 시작")
+            _logger.debug("[AI] 새로운 대화 시작")
         
         # Gemini로 직접 응답 생성
-        print(f"[AI] Gemini로 직접 응답 생성 중...")
+        _logger.debug("[AI] Gemini로 직접 응답 생성 중...")
         response = gemini15_flash(system_prompt, full_question)
         
         if response:
@@ -68,19 +76,22 @@ def get_ai_answer(room, sender, msg):
             # 대화 기록에 저장
             chat_history.add_message(room, sender, question, cleaned)
             
-            print(f"[AI] 최종 응답: {cleaned[:100]}...")
+            _logger.info("[AI] 최종 응답: %.100s...", cleaned)
             return cleaned
         else:
             return "죄송합니다. 잘 이해하지 못했어요. 다시 질문해주세요."
             
     except Exception as e:
-        print(f"[AI] Gemini 오류: {e}")
-        print(f"[AI] 에러 상세: {traceback.format_exc()}")
+        _logger.error("[AI] Gemini 오류: %s", e, exc_info=True)
         return "일시적인 오류가 발생했어요. 잠시 후 다시 시도해주세요."
 
 
 def gemini15_flash(system, question, retry_count=0, use_search=True):
     """Gemini 2.0 Flash AI 함수 - Google Search 통합"""
+    # 호출자가 이미 포기했으면 (재시도 포함) API 를 호출하지 않음
+    if deadline_expired():
+        return None
+    
     # APIManager를 통해 다음 API 키 가져오기
     api_key = APIManager.get_next_gemini_key()
     
@@ -120,31 +131,32 @@ def gemini15_flash(system, question, retry_count=0, use_search=True):
             full_prompt = f"{system}\n\n{question}"
         
         # AI 응답 생성
-        response = model.generate_content(full_prompt)
+        with span("llm", model="gemini-2.0-flash-exp", attempt=retry_count):
+            response = model.generate_content(full_prompt, request_options=sdk_request_options())
         
         if response and response.text:
             return response.text.strip()
         
         # 응답이 없으면 재시도
         if retry_count < 2:
-            print(f"Gemini 재시도 {retry_count + 1}/2")
+            _logger.warning("Gemini 재시도 %d/2", retry_count + 1)
             return gemini15_flash(system, question, retry_count + 1, use_search)
         
         return None
         
     except Exception as e:
         error_msg = str(e)
-        print(f"Gemini API 오류: {error_msg}")
+        _logger.error("Gemini API 오류: %s", error_msg)
         
         # API 키 문제인 경우 자동 회전 후 재시도
         if "API_KEY_INVALID" in error_msg or "invalid API key" in error_msg:
             if retry_count < 3:
-                print(f"Gemini API 키 오류, 다음 키로 재시도 {retry_count + 1}/3")
+                _logger.warning("Gemini API 키 오류, 다음 키로 재시도 %d/3", retry_count + 1)
                 return gemini15_flash(system, question, retry_count + 1, use_search)
         
         # quota 에러시 검색 없이 재시도
         if "quota" in error_msg.lower() and use_search and retry_count == 0:
-            print("Google Search quota 초과, 검색 없이 재시도")
+            _logger.warning("Google Search quota 초과, 검색 없이 재시도")
             return gemini15_flash(system, question, retry_count + 1, False)
         
         # 다른 키로 재시도
@@ -183,14 +195,14 @@ def perplexity_chat_fast(question, api_key):
     
     try:
         # 타임아웃을 5초로 단축 (빠른 응답)
-        response = requests.post(url, headers=headers, json=payload, timeout=5)
+        response = http_service.post(url, headers=headers, json=payload, timeout=5)
         
         # 상태 코드 확인
         if response.status_code == 401:
-            print(f"Perplexity API 인증 실패")
+            _logger.error("Perplexity API 인증 실패")
             return None
         elif response.status_code == 429:
-            print(f"Perplexity API 요청 한도 초과")
+            _logger.warning("Perplexity API 요청 한도 초과")
             return None
         
         response.raise_for_status()
@@ -226,16 +238,16 @@ def perplexity_chat_fast(question, api_key):
             if content and not content[-1] in '.!?':
                 content += '.'
             
-            print(f"정제된 Perplexity 응답: {content}")
+            _logger.debug("정제된 Perplexity 응답: %s", content)
             return content
         
         return None
     
     except requests.exceptions.Timeout:
-        print(f"Perplexity API 타임아웃 (5초)")
+        _logger.warning("Perplexity API 타임아웃 (5초)")
         return None
     except Exception as e:
-        print(f"Perplexity API 오류: {e}")
+        _logger.error("Perplexity API 오류: %s", e)
         return None
 
 
@@ -11,31 +11,12 @@ from datetime import datetime
 from utils.text_utils import clean_for_kakao
 from utils.debug_logger import debug_logger
 
-# request 함수 import
+# HTTP 요청은 공용 연결 풀 사용
+from services.http_service import request
+
 try:
-    from fn import request, gemini15_flash
+    from fn import gemini15_flash
 except ImportError:
-    import requests
-    from bs4 import BeautifulSoup
-    
-    def request(url, method="get", result="text", params=None, headers=None):
-        """HTTP 요청 헬퍼 함수"""
-        try:
-            if method.lower() == "get":
-                response = requests.get(url, params=params, headers=headers, timeout=10)
-            else:
-                response = requests.post(url, params=params, headers=headers, timeout=10)
-            
-            if result == "json":
-                return response.json()
-            elif result == "bs":
-                return BeautifulSoup(response.text, 'html.parser')
-            else:
-                return response.text
-        except Exception as e:
-            print(f"Request error: {e}")
-            return None
-
     def gemini15_flash(system, question, retry_count=0, use_search=True):
         """Gemini 폴백 - fn.py 사용 불가시"""
         return None
@@ -3,6 +3,8 @@
 """
 뉴스 핸들러 모듈
 뉴스 관련 명령어 처리
+
+모든 핸들러는 async def - 라우터가 이벤트 루프에서 바로 await 한다.
 """
 
 import urllib.parse
@@ -16,31 +18,11 @@ def get_kst_time():
     """한국 시간 반환"""
     return datetime.now(KST).strftime("%Y-%m-%d %H:%M")
 
-# request 함수를 fn.py에서 가져오기
-try:
-    from fn import request
-except ImportError:
-    # 폴백: 직접 구현
-    import requests
-    from bs4 import BeautifulSoup
-    
-    def request(url, method="get", result="text", params=None, headers=None):
-        """HTTP 요청 헬퍼 함수"""
-        try:
-            if method.lower() == "get":
-                response = requests.get(url, params=params, headers=headers, timeout=10)
-            else:
-                response = requests.post(url, params=params, headers=headers, timeout=10)
-            
-            if result == "json":
-                return response.json()
-            elif result == "bs":
-                return BeautifulSoup(response.text, 'html.parser')
-            else:
-                return response.text
-        except Exception as e:
-            print(f"Request error: {e}")
-            return None
+# HTTP 요청은 공용 비동기 연결 풀 사용 (async 핸들러, 이벤트 루프에서 실행)
+from services.async_http_service import arequest
+from services.http_service import html_backend
+from utils.html_extract import NAVER_SECTION_PAGE as SECTION_PAGE, extract_naver_section
+from utils.parse_pool import parse_pool
 
 
 # 광고 필터링 키워드
@@ -51,7 +33,7 @@ AD_KEYWORDS = [
 ]
 
 
-def _scrape_naver_section(section_url: str, display_name: str, emoji: str, use_mobile: bool = False) -> str:
+async def _scrape_naver_section(section_url: str, display_name: str, emoji: str, use_mobile: bool = False) -> str:
     """
     네이버 섹션 페이지에서 뉴스 스크래핑 (광고 제거 필터 포함)
 
@@ -64,113 +46,17 @@ def _scrape_naver_section(section_url: str, display_name: str, emoji: str, use_m
     import re
 
     try:
-        result = request(section_url, method="get", result="bs")
+        # 파싱/기사 목록 추출은 parse_pool 의 worker 프로세스에서 (결과는 제목/링크/출처 목록만)
+        content = await arequest(section_url, method="get", result="bytes")
+        if content is None:
+            raise ValueError("섹션 페이지 응답 없음")
+        news_items = await parse_pool.run(extract_naver_section, content, html_backend(), use_mobile)
         current_time = get_kst_time()
 
         send_msg = f"{emoji} {display_name} 뉴스 📺\n📅 {current_time} 기준"
 
-        # 모바일 페이지인 경우
-        if use_mobile:
-            # 헤드라인 뉴스 먼저 선택
-            news_items = result.select('li.sa_item._SECTION_HEADLINE')
-
-            # 헤드라인이 8개 미만이면 일반 뉴스에서 추가
-            if len(news_items) < 8:
-                all_items = result.select('li.sa_item')
-                # 헤드라인에 없는 일반 뉴스 추가
-                headline_links = set()
-                for item in news_items:
-                    link_elem = item.select_one('a[href*="article"]')
-                    if link_elem:
-                        headline_links.add(link_elem.get('href', ''))
-
-                for item in all_items:
-                    if len(news_items) >= 12:  # 충분히 확보
-                        break
-                    link_elem = item.select_one('a[href*="article"]')
-                    if link_elem and link_elem.get('href', '') not in headline_links:
-                        news_items.append(item)
-                        headline_links.add(link_elem.get('href', ''))
-
-            if not news_items:
-                return f"{emoji} {display_name} 뉴스를 불러올 수 없습니다."
-
-            # 상위 8개 (광고 제외)
-            count = 0
-            for item in news_items:
-                if count >= 8:
-                    break
-
-                # li 요소인 경우
-                source = ""
-                if item.name == 'li':
-                    title_elem = item.select_one('.sa_text_strong')
-                    link_elem = item.select_one('.sa_text_title')
-                    source_elem = item.select_one('.sa_text_press')
-                    if not title_elem:
-                        title_elem = item.select_one('.sa_text_title')
-                else:
-                    # a 요소 직접 사용 (랭킹 페이지)
-                    link_elem = item
-                    title_elem = item
-
-                if not link_elem:
-                    continue
-
-                title = title_elem.text.strip() if title_elem else ''
-                link = link_elem.get('href', '')
-                source = source_elem.text.strip() if source_elem else ''
-
-                # 출처에서 "언론사 선정", "기자" 등 텍스트 제거
-                if source:
-                    source = source.replace('언론사 선정', '').replace('기자', '').strip()
-
-                if not title or not link:
-                    continue
-
-                # 광고 필터링
-                is_ad = False
-                title_lower = title.lower()
-                link_lower = link.lower()
-                for ad_keyword in AD_KEYWORDS:
-                    if ad_keyword.lower() in title_lower or ad_keyword.lower() in link_lower:
-                        is_ad = True
-                        break
-
-                if is_ad:
-                    continue
-
-                # 해시태그 생성
-                tags = []
-                words = re.findall(r'[가-힣]{2,}', title)
-                unique_words = list(dict.fromkeys(words))[:3]
-                for word in unique_words:
-                    tags.append(f"#{word}")
-                tag_str = ' '.join(tags) if tags else ""
-
-                # 제목과 출처, URL 포맷
-                if source:
-                    send_msg += f"\n\n{title} ({source})"
-                else:
-                    send_msg += f"\n\n{title}"
-                send_msg += f"\n{tag_str}\n{link}"
-                count += 1
-
-            if count == 0:
-                return f"{emoji} {display_name} 뉴스를 불러올 수 없습니다."
-
-            return send_msg
-
-        # 데스크톱 페이지인 경우
-        # 메인 랭킹 뉴스 컨테이너 찾기
-        main_ranking = result.select_one('.rankingnews.as_type_flat._SECTION_MAINNEWS')
-
-        if main_ranking:
-            news_items = main_ranking.select('li')
-        else:
-            # 폴백: 모든 rankingnews에서 가져오기
-            all_ranking = result.select('.rankingnews li')
-            news_items = all_ranking
+        if not news_items:
+            return f"{emoji} {display_name} 뉴스를 불러올 수 없습니다."
 
         # 상위 8개 (광고 제외)
         count = 0
@@ -178,17 +64,11 @@ def _scrape_naver_section(section_url: str, display_name: str, emoji: str, use_m
             if count >= 8:
                 break
 
-            # article 링크가 있는 a 태그 찾기
-            link_elem = item.select_one('a[href*="article"]')
-            if not link_elem:
-                continue
-
-            title = link_elem.text.strip()
-            link = link_elem.get('href', '')
+            title = item['title']
+            link = item['link']
+            source = item['source']
 
-            # 출처 추출 시도
-            source_elem = item.select_one('.rankingnews_press')
-            source = source_elem.text.strip() if source_elem else ''
+            # 출처에서 "언론사 선정", "기자" 등 텍스트 제거
             if source:
                 source = source.replace('언론사 선정', '').replace('기자', '').strip()
 
@@ -233,9 +113,9 @@ def _scrape_naver_section(section_url: str, display_name: str, emoji: str, use_m
         return f"{emoji} {display_name} 뉴스를 불러오는 중 오류가 발생했습니다."
 
 
-def economy_news(room: str, sender: str, msg: str):
+async def economy_news(room: str, sender: str, msg: str):
     """경제 뉴스 - 스크래핑 방식 (모바일)"""
-    return _scrape_naver_section(
+    return await _scrape_naver_section(
         "https://m.news.naver.com/main?mode=LSD&sid1=101",
         "경제",
         "💰",
@@ -243,9 +123,9 @@ def economy_news(room: str, sender: str, msg: str):
     )
 
 
-def it_news(room: str, sender: str, msg: str):
+async def it_news(room: str, sender: str, msg: str):
     """IT 뉴스 - 스크래핑 방식 (모바일)"""
-    return _scrape_naver_section(
+    return await _scrape_naver_section(
         "https://m.news.naver.com/main?mode=LSD&sid1=105",
         "IT",
         "💻",
@@ -253,14 +133,14 @@ def it_news(room: str, sender: str, msg: str):
     )
 
 
-def realestate_news(room: str, sender: str, msg: str):
+async def realestate_news(room: str, sender: str, msg: str):
     """부동산 뉴스 - 네이버 부동산 섹션 직접 스크래핑"""
     import re
 
     try:
         # 부동산 전용 섹션 URL (breakingnews)
         url = "https://news.naver.com/breakingnews/section/101/260"
-        result = request(url, method="get", result="bs")
+        result = await arequest(url, method="get", result="bs", only=SECTION_PAGE)
         current_time = get_kst_time()
 
         send_msg = f"🏠 부동산 뉴스 📺\n📅 {current_time} 기준"
@@ -345,9 +225,9 @@ def realestate_news(room: str, sender: str, msg: str):
         return f"🏠 부동산 뉴스를 불러오는 중 오류가 발생했습니다."
 
 
-def world_news(room: str, sender: str, msg: str):
+async def world_news(room: str, sender: str, msg: str):
     """세계 뉴스 - 스크래핑 방식 (모바일)"""
-    return _scrape_naver_section(
+    return await _scrape_naver_section(
         "https://m.news.naver.com/main?mode=LSD&sid1=104",
         "세계",
         "🌍",
@@ -355,7 +235,7 @@ def world_news(room: str, sender: str, msg: str):
     )
 
 
-def _category_news(category_name: str, display_name: str, search_keywords: str):
+async def _category_news(category_name: str, display_name: str, search_keywords: str):
     """
     카테고리별 뉴스 가져오기 - 네이버 Open API 사용
 
@@ -372,9 +252,9 @@ def _category_news(category_name: str, display_name: str, search_keywords: str):
 
         if not client_id or not client_secret:
             debug_logger.error("네이버 API 키가 설정되지 않음")
-            return _fallback_category_news(category_name, display_name)
+            return await _fallback_category_news(category_name, display_name)
     except ImportError:
-        return _fallback_category_news(category_name, display_name)
+        return await _fallback_category_news(category_name, display_name)
 
     try:
         # 네이버 Open API - 뉴스 검색
@@ -386,10 +266,10 @@ def _category_news(category_name: str, display_name: str, search_keywords: str):
             "X-Naver-Client-Secret": client_secret,
         }
 
-        response = request(url, method="get", result="text", headers=headers)
+        response = await arequest(url, method="get", result="text", headers=headers)
 
         if not response:
-            return _fallback_category_news(category_name, display_name)
+            return await _fallback_category_news(category_name, display_name)
 
         import json
         import re
@@ -397,12 +277,12 @@ def _category_news(category_name: str, display_name: str, search_keywords: str):
 
         if data.get('errorCode'):
             debug_logger.error(f"네이버 API 오류: {data.get('errorMessage')}")
-            return _fallback_category_news(category_name, display_name)
+            return await _fallback_category_news(category_name, display_name)
 
         items = data.get('items', [])
 
         if not items:
-            return _fallback_category_news(category_name, display_name)
+            return await _fallback_category_news(category_name, display_name)
 
         # 이모지 매핑
         emoji_map = {"경제": "💰", "IT": "💻", "부동산": "🏠"}
@@ -450,10 +330,10 @@ def _category_news(category_name: str, display_name: str, search_keywords: str):
 
     except Exception as e:
         debug_logger.error(f"{display_name} 뉴스 오류: {str(e)}")
-        return _fallback_category_news(category_name, display_name)
+        return await _fallback_category_news(category_name, display_name)
 
 
-def _fallback_category_news(category_name: str, display_name: str):
+async def _fallback_category_news(category_name: str, display_name: str):
     """API 실패시 폴백 - 스크래핑 방식"""
     emoji_map = {"경제": "💰", "IT": "💻", "부동산": "🏠"}
     emoji = emoji_map.get(category_name, "📰")
@@ -468,7 +348,7 @@ def _fallback_category_news(category_name: str, display_name: str):
         else:
             url = f'https://m.news.naver.com/main?mode=LSD&sid1={area}'
 
-        result = request(url, method="get", result="bs")
+        result = await arequest(url, method="get", result="bs", only=SECTION_PAGE)
         send_msg = f"{emoji} {display_name} 뉴스 📺\n📅 {get_kst_time()} 기준"
 
         # 헤드라인 뉴스만 선택
@@ -3,6 +3,8 @@
 """
 주식/금융 핸들러 모듈
 주식, 코인, 환율, 금값 등 금융 정보 처리
+
+모든 핸들러는 async def - 라우터가 이벤트 루프에서 바로 await 한다.
 """
 
 import re
@@ -10,83 +12,35 @@ from datetime import datetime
 from utils.text_utils import log
 from utils.debug_logger import debug_logger
 
-# request 함수를 fn.py에서 가져오기
-try:
-    from fn import request
-except ImportError:
-    # 폴백: 직접 구현
-    import requests
-    from bs4 import BeautifulSoup
-    
-    def request(url, method="get", result="text", params=None, headers=None):
-        """HTTP 요청 헬퍼 함수"""
-        try:
-            if method.lower() == "get":
-                response = requests.get(url, params=params, headers=headers, timeout=10)
-            else:
-                response = requests.post(url, params=params, headers=headers, timeout=10)
-            
-            if result == "json":
-                return response.json()
-            elif result == "bs":
-                return BeautifulSoup(response.text, 'html.parser')
-            else:
-                return response.text
-        except Exception as e:
-            print(f"Request error: {e}")
-            return None
+# HTTP 요청은 공용 비동기 연결 풀 사용 (async 핸들러, 이벤트 루프에서 실행)
+from services.async_http_service import arequest
+from services.http_service import parse_only
+from utils.symbol_index import symbol_index
 
+# result="bs" 로 파싱할 부분 트리 (선택자가 찾는 요소만 남김)
+STOCK_DETAIL_PAGE = parse_only('p.no_today', 'p.no_exday', 'table.no_info')
+EXCHANGE_PAGE = parse_only('ul.data_lst')
+GOLD_PAGE = parse_only('#goldDomestic', '#goldInternational')
+SISE_TABLE_PAGE = parse_only('table.type_2')
 
-def stock(room: str, sender: str, msg: str):
+
+async def stock(room: str, sender: str, msg: str):
     """주식 정보 조회 - 네이버 증권 실시간 데이터"""
     keyword = msg.replace("/주식", "").strip()
     if not keyword:
         return "📊 사용법: /주식 삼성전자"
     
     try:
-        # 종목 코드 매핑 (자주 검색되는 종목들)
-        stock_mapping = {
-            '삼성전자': '005930', '삼전': '005930',
-            'sk하이닉스': '000660', 'SK하이닉스': '000660', '하이닉스': '000660',
-            'NAVER': '035420', '네이버': '035420',
-            '카카오': '035720',
-            'LG에너지솔루션': '373220', 'LG에너지': '373220',
-            '현대차': '005380', '현대자동차': '005380',
-            '기아': '000270', '기아자동차': '000270',
-            'SK': '034730', 'SK이노베이션': '096770', 'SK텔레콤': '017670',
-            'LG화학': '051910', 'LG전자': '066570',
-            '포스코': '005490', 'POSCO': '005490',
-            '삼성바이오로직스': '207940', '삼성바이오': '207940',
-            '셀트리온': '068270', '삼성SDI': '006400',
-            '현대모비스': '012330', 'KB금융': '105560',
-            '신한지주': '055550', '하나금융지주': '086790',
-            '삼성생명': '032830', '삼성화재': '000810', '삼성물산': '028260'
-        }
-        
-        # 종목 코드 확인
-        stock_code = None
-        stock_name = keyword
-        
-        # 입력이 종목 코드인지 확인 (6자리 숫자)
-        if keyword.isdigit() and len(keyword) == 6:
-            stock_code = keyword
-            stock_name = keyword
-        # 매핑된 종목명인지 확인
-        elif keyword in stock_mapping:
-            stock_code = stock_mapping[keyword]
-            stock_name = keyword
-        # 대소문자 구분 없이 매핑 확인
-        else:
-            for key, value in stock_mapping.items():
-                if key.lower() == keyword.lower():
-                    stock_code = value
-                    stock_name = key
-                    break
+        # 종목명/별칭/초성 → 종목코드 (KRX 종목 인덱스, 6자리 숫자는 종목코드로 그대로 사용, 접두어/오타는 후보 안내)
+        symbol = symbol_index.resolve(keyword)
+        if not symbol:
+            return symbol_index.not_found_message(keyword)
+        stock_code, stock_name = symbol.code, symbol.name
         
         if stock_code:
             # 종목 상세 페이지에서 정보 추출
             detail_url = f"https://finance.naver.com/item/main.naver?code={stock_code}"
-            detail_result = request(detail_url, method="get", result="bs")
+            detail_result = await arequest(detail_url, method="get", result="bs", only=STOCK_DETAIL_PAGE)
             
             if detail_result:
                 # 현재가
@@ -183,10 +137,10 @@ def stock(room: str, sender: str, msg: str):
         return f"❌ 주식 정보 조회 중 오류가 발생했습니다.\n\n💡 다시 시도해주세요."
 
 
-def coin(room: str, sender: str, msg: str):
+async def coin(room: str, sender: str, msg: str):
     """코인 시세 조회"""
     url = 'https://m.stock.naver.com/front-api/crypto/v1/domesticPrice?domesticType=UPBIT&page=1&size=20'
-    result = request(url, method="get", result="json")
+    result = await arequest(url, method="get", result="json")
     
     coin_list = result['result']['data']
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
@@ -213,11 +167,11 @@ def coin(room: str, sender: str, msg: str):
     return send_msg
 
 
-def exchange(room: str, sender: str, msg: str):
+async def exchange(room: str, sender: str, msg: str):
     """환율 정보"""
     try:
         url = 'https://finance.naver.com/marketindex/'
-        result = request(url, method="get", result="bs")
+        result = await arequest(url, method="get", result="bs", only=EXCHANGE_PAGE)
         
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
         send_msg = f"💱 환율 정보\n📅 {current_time} 기준\n{'='*25}"
@@ -271,11 +225,11 @@ def exchange(room: str, sender: str, msg: str):
         return "💱 환율 정보를 불러오는 중 오류가 발생했습니다."
 
 
-def gold(room: str, sender: str, msg: str):
+async def gold(room: str, sender: str, msg: str):
     """금값 조회"""
     try:
         url = 'https://finance.naver.com/marketindex/goldDetail.naver'
-        result = request(url, method="get", result="bs")
+        result = await arequest(url, method="get", result="bs", only=GOLD_PAGE)
         
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
         send_msg = f"🥇 금 시세\n📅 {current_time} 기준\n{'='*25}"
@@ -325,11 +279,11 @@ def gold(room: str, sender: str, msg: str):
         return "🥇 금 시세를 불러오는 중 오류가 발생했습니다."
 
 
-def stock_upper(room: str, sender: str, msg: str):
+async def stock_upper(room: str, sender: str, msg: str):
     """상한가 종목"""
     try:
         url = 'https://finance.naver.com/sise/upper.naver'
-        result = request(url, method="get", result="bs")
+        result = await arequest(url, method="get", result="bs", only=SISE_TABLE_PAGE)
         
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
         send_msg = f"🚀 상한가 종목\n📅 {current_time} 기준\n{'='*25}"
@@ -368,11 +322,11 @@ def stock_upper(room: str, sender: str, msg: str):
         return "🚀 상한가 종목을 불러오는 중 오류가 발생했습니다."
 
 
-def stock_lower(room: str, sender: str, msg: str):
+async def stock_lower(room: str, sender: str, msg: str):
     """하한가 종목"""
     try:
         url = 'https://finance.naver.com/sise/lower.naver'
-        result = request(url, method="get", result="bs")
+        result = await arequest(url, method="get", result="bs", only=SISE_TABLE_PAGE)
         
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
         send_msg = f"📉 하한가 종목\n📅 {current_time} 기준\n{'='*25}"
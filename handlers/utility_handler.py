@@ -11,30 +11,11 @@ from datetime import datetime
 from utils.text_utils import log
 from utils.debug_logger import debug_logger
 
-# request 함수 import
-try:
-    from fn import request
-except ImportError:
-    import requests
-    from bs4 import BeautifulSoup
-    
-    def request(url, method="get", result="text", params=None, headers=None):
-        """HTTP 요청 헬퍼 함수"""
-        try:
-            if method.lower() == "get":
-                response = requests.get(url, params=params, headers=headers, timeout=10)
-            else:
-                response = requests.post(url, params=params, headers=headers, timeout=10)
-            
-            if result == "json":
-                return response.json()
-            elif result == "bs":
-                return BeautifulSoup(response.text, 'html.parser')
-            else:
-                return response.text
-        except Exception as e:
-            print(f"Request error: {e}")
-            return None
+# HTTP 요청은 공용 연결 풀 사용
+from services.http_service import parse_only, request
+
+# 날씨 검색 결과에서 파싱할 부분 트리 (날씨 박스)
+WEATHER_PAGE = parse_only('section._cs_weather')
 
 
 def whether(room: str, sender: str, msg: str):
@@ -55,7 +36,7 @@ def whether(room: str, sender: str, msg: str):
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
         }
         
-        result = request(url, method="get", result="bs", headers=headers)
+        result = request(url, method="get", result="bs", headers=headers, only=WEATHER_PAGE)
         if result:
             # 지역명 확인
             location_elem = result.select_one('.title_area ._area_weather_title')
@@ -4,6 +4,9 @@
 개선된 메인 서버 - 안정성과 타임아웃 처리 강화
 """
 
+import time
+_IMPORT_START = time.perf_counter()  # 모듈 import 시간 측정 (/api/startup)
+
 from fastapi import FastAPI, Request, BackgroundTasks
 from fastapi.responses import JSONResponse
 from fastapi.responses import Response
@@ -12,17 +15,13 @@ import traceback
 import json
 import asyncio
 import datetime
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
 import functools
 import logging
 import re
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.DEBUG,  # DEBUG로 변경하여 더 자세한 로그 확인
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+# 로깅 설정 - 큐 + writer 스레드 (포맷/출력은 요청 처리 밖에서, 레벨은 LOGGING_CONFIG / LOG_LEVEL)
+from utils import log_pipeline
+log_pipeline.setup_logging()
 logger = logging.getLogger(__name__)
 
 # FastAPI 앱 생성
@@ -32,44 +31,52 @@ app = FastAPI(
     description="안정성이 개선된 카카오톡 봇 API"
 )
 
-# 스레드 풀 (브라우저 작업용)
-executor = ThreadPoolExecutor(max_workers=3)
-
 # 설정
 import config
 import command_manager
+from core.admission import admission
+from core.bulkhead import BulkheadScheduler, PoolFull
+from core.deferred import DeferredJobQueue
 from error_monitor import error_monitor
+from utils.startup_report import get_runtime_report, get_import_budget_ms
+from utils.deadline import Deadline, abandoned_work
+from utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricFamily, metrics
+from utils.tracing import annotate, context_scope, tracer
+from utils.profiler import PROFILER_CONFIG, profiler, requested_seconds as profile_seconds
+from utils.parse_pool import PARSE_POOL_CONFIG, parse_pool
+from utils.symbol_index import symbol_index
+from utils.response_encoding import JSON_MEDIA_TYPE, decode_body, encode_json, loads as json_loads
 
 # 새로운 모듈 구조 사용
 try:
-    from core.router import get_reply_msg
+    from core.router import get_reply_msg_async, get_router_stats
     logger.info("✅ 새로운 모듈 구조 (core.router) 사용")
 except ImportError:
     logger.warning("⚠️ core.router를 찾을 수 없음, fn.py에서 import")
     from fn import get_reply_msg
+    get_router_stats = None
 
-# web_summary 함수 import (URL 요약용)
-try:
-    from fn import web_summary
-    logger.info("✅ web_summary 함수 로드됨")
-except ImportError:
-    logger.warning("⚠️ web_summary 함수를 찾을 수 없음")
-    web_summary = None
-
-# 응답 캐시 (중복 요청 방지)
-response_cache = {}
-
-# 스레드 풀 확장 (URL 요약 전용)
-from concurrent.futures import ThreadPoolExecutor
-url_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="url_summary")
-
-# 캐시 통계 추가
-cache_stats = {
-    'hits': 0,
-    'misses': 0,
-    'total_requests': 0,
-    'hit_rate': 0.0
+    async def get_reply_msg_async(room: str, sender: str, msg: str, executor=None, deadline=None,
+                                  priority: int = command_manager.PRIORITY_NORMAL):
+        """fn.get_reply_msg 는 동기 함수이므로 기본 풀에서 실행"""
+        return await executor.run(None, functools.partial(get_reply_msg, room, sender, msg),
+                                  priority=priority)
+
+# 벌크헤드 실행 풀 (명령어 종류별 스레드 풀 - command_manager 의 pool)
+# max_workers: 동시 실행 수 (0 이면 스레드 없이 이벤트 루프에서 실행)
+# max_queue:   실행 대기열 길이
+# overflow:    대기열까지 모두 찼을 때 reject(바쁨 응답) / wait(자리가 날 때까지 대기)
+# 대기열은 FIFO 가 아니라 우선순위 순서 (command_manager.PRIORITY_*, 관리자 요청이 먼저)
+# aging_seconds: 이만큼 기다릴 때마다 우선순위 한 단계 상승 (기본 2초, 낮은 우선순위 굶주림 방지)
+# async 핸들러는 풀을 거치지 않고 이벤트 루프에서 실행된다.
+EXECUTOR_POOLS = {
+    'browser': {'max_workers': 2, 'max_queue': 2, 'overflow': 'reject'},    # Playwright/Selenium, URL 요약
+    'llm':     {'max_workers': 4, 'max_queue': 8, 'overflow': 'reject'},    # AI API 호출
+    'scrape':  {'max_workers': 8, 'max_queue': 32, 'overflow': 'wait'},     # 동기 스크래핑 (기본 풀)
+    'admin':   {'max_workers': 1, 'max_queue': 8, 'overflow': 'wait'},      # 관리/스케줄 명령어
+    'local':   {'max_workers': 0},                                          # 즉시 응답 명령어
 }
+bulkhead = BulkheadScheduler(EXECUTOR_POOLS, default=command_manager.DEFAULT_POOL)
 
 # 캐시 타임아웃 설정 (초 단위)
 CACHE_TIMEOUTS = {
@@ -102,7 +109,26 @@ CACHE_TIMEOUTS = {
 }
 
 # 캐시 크기 제한 (메모리 관리)
-MAX_CACHE_SIZE = 100  # 최대 100개 항목만 캐시
+MAX_CACHE_SIZE = 500                   # 최대 항목 수
+MAX_CACHE_BYTES = 4 * 1024 * 1024      # 최대 4MB (UTF-8 기준)
+
+# 응답 캐시 (중복 요청 방지) - O(1) TTL + LRU 캐시 엔진
+from cache_manager import ResponseCache, STATE_FRESH, STATE_STALE
+response_cache = ResponseCache(max_entries=MAX_CACHE_SIZE, max_bytes=MAX_CACHE_BYTES)
+
+# Stale-while-revalidate 설정
+# soft TTL(CACHE_TIMEOUTS)이 지나면 이전 응답을 즉시 반환하고 백그라운드에서 갱신,
+# hard TTL(soft TTL + stale 기간)이 지나면 기존처럼 새로 조회
+STALE_WHILE_REVALIDATE = True
+STALE_TTL_MULTIPLIER = 5       # stale 보관 기간 = soft TTL x 5
+MAX_STALE_SECONDS = 3600       # stale 보관 최대 1시간
+
+# 인기 명령어 사전 갱신 (선택 기능, error_monitor.usage_stats 기반)
+CACHE_WARMUP_CONFIG = {
+    'ENABLED': False,          # True로 설정 시 서버 시작과 함께 실행
+    'TOP_N': 5,                # 사용량 상위 N개 명령어
+    'INTERVAL': 60,            # 갱신 주기 (초)
+}
 
 # 명령어별 에러 메시지
 ERROR_MESSAGES = {
@@ -115,6 +141,39 @@ ERROR_MESSAGES = {
     'default': '⏱️ 응답 시간이 초과되었습니다.\n잠시 후 다시 시도해주세요.'
 }
 
+# 실행 풀이 가득 찼거나 요청 제한(core.admission)에 걸렸을 때 응답
+BUSY_MESSAGE = '⏳ 지금은 요청이 많아 처리할 수 없습니다.\n잠시 후 다시 시도해주세요.'
+
+# 동일 명령어 동시 요청 합치기 (single-flight)
+from cache_manager import InflightRegistry
+inflight_registry = InflightRegistry()
+
+# 지연 응답 (오래 걸리는 명령어는 바로 접수 응답, 결과는 /api/poll 로 전달)
+DEFERRED_CONFIG = {
+    'ENABLED': True,
+    'THRESHOLD': 10.0,         # 예상 소요 시간(API_TIMEOUTS) 이 이 값 이상이면 지연 응답
+    'MAX_RUNNING': 4,          # 동시에 실행하는 백그라운드 작업 수
+    'RESULT_TTL': 600,         # 결과가 이 시간(초) 안에 수거되지 않으면 버림
+}
+DEFERRED_ACK_MESSAGE = '⏳ 요청을 접수했습니다.\n결과는 준비되는 대로 이 방에 보내드릴게요.\n(작업 ID: {job_id})'
+DEFERRED_DUPLICATE_MESSAGE = '⏳ 같은 요청을 이미 처리하고 있습니다.\n결과는 준비되는 대로 보내드릴게요.\n(작업 ID: {job_id})'
+
+def deliver_deferred_result(room: str, message: str, job_id: str, ttl: float):
+    """지연 응답 결과를 대기 메시지로 전달 (메신저봇이 /api/poll 로 수거)"""
+    from services.schedule_service import schedule_service
+    schedule_service.add_pending_message(room, clean_message_for_kakao(message), job_id, ttl=ttl)
+
+# 대기 메시지 전달 (/api/poll long-poll, /api/kakaotalk 응답에 함께 전달)
+POLL_CONFIG = {
+    'MAX_HOLD': 30,            # long-poll 최대 대기 시간 (초)
+}
+
+deferred_jobs = DeferredJobQueue(
+    deliver=deliver_deferred_result,
+    max_running=DEFERRED_CONFIG['MAX_RUNNING'],
+    result_ttl=DEFERRED_CONFIG['RESULT_TTL']
+)
+
 # API 타임아웃 설정 (초 단위)
 API_TIMEOUTS = {
     # Selenium 사용 명령어 - 긴 타임아웃
@@ -150,6 +209,7 @@ API_TIMEOUTS = {
     # 기본값
     'default': 4.0              # 기본 타임아웃
 }
+PROFILE_TIMEOUT_MARGIN = 5.0    # /프로파일 N: 샘플링 N초 + 응답 정리 여유
 
 # ========================================
 # 캐시 관리 함수들 (중복 제거)
@@ -162,30 +222,45 @@ def get_command_cache_timeout(msg: str) -> int:
             return timeout
     return CACHE_TIMEOUTS.get('default', 30)
 
+def get_command_stale_timeout(cache_timeout: int) -> int:
+    """soft TTL 이후 stale 상태로 보관할 기간 결정"""
+    if not STALE_WHILE_REVALIDATE or cache_timeout <= 0:
+        return 0
+    return min(cache_timeout * STALE_TTL_MULTIPLIER, MAX_STALE_SECONDS)
+
+# URL 감지 정규식 (요청마다 컴파일하지 않도록 미리 컴파일)
+URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+# 명령어 처리 시간 (/metrics) - 라벨은 등록된 명령어 이름, URL 요약은 "URL", 나머지는 "other"
+COMMAND_SECONDS = metrics.histogram(
+    'bot_command_duration_seconds', '메시지 하나를 처리하는 데 걸린 시간 (명령어별)', ['command']
+)
+
+def get_metrics_command(msg: str) -> str:
+    """명령어 처리 시간 라벨 (임의 문자열로 시리즈가 늘어나지 않도록 등록된 이름만)"""
+    cmd = command_manager.find_command(msg)
+    if cmd:
+        return cmd.name
+    return "URL" if URL_RE.search(msg) else "other"
+
 def get_command_api_timeout(msg: str) -> float:
     """명령어별 API 타임아웃 결정"""
     # URL 자동 요약은 명시적으로 긴 타임아웃 적용
     # 정규식으로 메시지 중간에 있는 URL도 감지
-    import re
-    if re.search(r'https?://[^\s<>"{}|\\^`\[\]]+', msg):
+    if URL_RE.search(msg):
         return 15.0  # 15초 (병렬 처리 최적화로 단축)
 
+    # /프로파일 N 은 N초 동안 샘플링 - 샘플링 시간 + 여유 (기본 10초면 지연 응답으로 /api/poll 전달)
+    if msg.startswith('/프로파일'):
+        seconds = profile_seconds(msg)
+        if seconds is not None:
+            return seconds + PROFILE_TIMEOUT_MARGIN
+
     for cmd, timeout in API_TIMEOUTS.items():
         if cmd != 'default' and msg.startswith(cmd):
             return timeout
     return API_TIMEOUTS.get('default', 4.0)
 
-def update_cache_stats(is_hit: bool):
-    """캐시 통계 업데이트"""
-    cache_stats['total_requests'] += 1
-    if is_hit:
-        cache_stats['hits'] += 1
-    else:
-        cache_stats['misses'] += 1
-    
-    if cache_stats['total_requests'] > 0:
-        cache_stats['hit_rate'] = cache_stats['hits'] / cache_stats['total_requests']
-
 def get_timeout_message(msg: str, timeout: float) -> str:
     """명령어별 타임아웃 메시지 생성"""
     for cmd, error_msg in ERROR_MESSAGES.items():
@@ -193,49 +268,114 @@ def get_timeout_message(msg: str, timeout: float) -> str:
             return f"{error_msg}\n\n(제한시간: {timeout}초)"
     return ERROR_MESSAGES['default'] + f"\n\n(제한시간: {timeout}초)"
 
-def save_to_cache(cache_key: str, data: str, timestamp: datetime.datetime):
-    """캐시 저장 및 크기 관리"""
-    response_cache[cache_key] = (data, timestamp)
-    
-    # 캐시 크기 제한
-    if len(response_cache) > MAX_CACHE_SIZE:
-        # LRU(Least Recently Used) 방식으로 제거
-        oldest_key = min(response_cache.keys(), 
-                        key=lambda k: response_cache[k][1])
-        del response_cache[oldest_key]
-        logger.debug(f"캐시 크기 제한 - 가장 오래된 항목 제거: {oldest_key[:30]}")
+def save_to_cache(cache_key: str, data: str, command_name: str, msg: str):
+    """캐시 저장 (TTL은 저장 시점에 CACHE_TIMEOUTS에서 결정, 크기 제한은 캐시 엔진이 처리)"""
+    if not cache_key:
+        return
+    cache_timeout = get_command_cache_timeout(command_manager.normalize_message(msg))
+    if cache_timeout > 0:
+        response_cache.put(
+            cache_key, data,
+            ttl=cache_timeout,
+            stale_ttl=get_command_stale_timeout(cache_timeout),
+            command=command_name
+        )
 
-def try_fallback_cache(room: str, sender: str, msg: str) -> str:
+def try_fallback_cache(cache_key: str) -> str:
     """타임아웃 시 이전 캐시 데이터 활용"""
-    # 유사한 캐시 키 검색
-    for key in response_cache.keys():
-        if f"{room}:{sender}:" in key and msg in key:
-            old_data, old_time = response_cache[key]
-            age_minutes = (datetime.datetime.now() - old_time).total_seconds() / 60
-            logger.info(f"폴백 캐시 사용 ({age_minutes:.1f}분 전 데이터)")
-            return f"⏱️ 최신 정보 조회 실패 ({age_minutes:.1f}분 전 데이터)\n\n{old_data}"
-    return None
+    if not cache_key:
+        return None
+    entry = response_cache.peek(cache_key)
+    if entry is None:
+        return None
+    age_minutes = entry.age() / 60
+    logger.info(f"폴백 캐시 사용 ({age_minutes:.1f}분 전 데이터)")
+    return f"⏱️ 최신 정보 조회 실패 ({age_minutes:.1f}분 전 데이터)\n\n{entry.value}"
 
 async def cleanup_expired_cache():
     """백그라운드 캐시 정리 작업"""
     while True:
         await asyncio.sleep(300)  # 5분마다 실행
         
-        now = datetime.datetime.now()
-        expired_keys = []
+        removed = response_cache.purge_expired()
+        if removed:
+            logger.info(f"백그라운드 캐시 정리: {removed}개 항목 제거")
+
+# 백그라운드 갱신 작업 참조 보관 (GC로 인한 작업 유실 방지)
+_background_tasks = set()
+
+def schedule_background_refresh(room: str, sender: str, msg: str, timeout: float,
+                                cache_key: str, command_name: str):
+    """stale 캐시 항목 백그라운드 갱신 (같은 키의 갱신/요청은 하나로 합쳐짐)"""
+    inflight_key = get_inflight_key(room, sender, msg, cache_key)
+    
+    async def refresh():
+        try:
+            # start_time=-1: 사용자 요청이 아니므로 응답시간 통계에서 제외
+            # 사용자가 기다리지 않는 작업이므로 낮은 우선순위
+            await inflight_registry.run(
+                inflight_key,
+                functools.partial(execute_command, room, sender, msg, timeout,
+                                  cache_key, command_name, -1, command_manager.PRIORITY_LOW),
+                command=command_name
+            )
+        except Exception as e:
+            logger.warning(f"백그라운드 캐시 갱신 실패 ({msg[:20]}): {e}")
+    
+    task = asyncio.ensure_future(refresh())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+def get_hot_commands(top_n: int) -> list:
+    """사용량 상위 명령어 중 사전 갱신 가능한 명령어 (인자 없는 전역 캐시 명령어)"""
+    usage = sorted(
+        list(error_monitor.usage_stats.items()),
+        key=lambda x: x[1]['count'],
+        reverse=True
+    )
+    
+    hot = []
+    for name, _ in usage:
+        cmd = command_manager.find_command(name)
+        if (cmd and cmd.name == name and not cmd.is_prefix and not cmd.admin_only
+                and cmd.cache_scope == command_manager.CACHE_SCOPE_GLOBAL
+                and get_command_cache_timeout(name) > 0):
+            hot.append(name)
+            if len(hot) >= top_n:
+                break
+    return hot
+
+async def warm_hot_commands():
+    """인기 명령어 캐시를 만료 전에 미리 갱신 (선택 기능)"""
+    interval = CACHE_WARMUP_CONFIG['INTERVAL']
+    room, sender = config.get_admin_room(), "warmup"
+    
+    while True:
+        await asyncio.sleep(interval)
         
-        for key, (_, cached_time) in response_cache.items():
-            msg_part = key.split(':')[-1] if ':' in key else ''
-            cache_timeout = get_command_cache_timeout(msg_part)
+        refreshed = []
+        for msg in get_hot_commands(CACHE_WARMUP_CONFIG['TOP_N']):
+            cache_key = get_cache_key(room, sender, msg)
+            entry = response_cache.peek(cache_key)
             
-            if cache_timeout > 0 and (now - cached_time).total_seconds() > cache_timeout:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del response_cache[key]
+            # 다음 주기 전에 soft TTL이 지나는 항목만 갱신
+            if entry is not None and entry.fresh_until - time.time() > interval:
+                continue
+            
+            try:
+                await inflight_registry.run(
+                    get_inflight_key(room, sender, msg, cache_key),
+                    functools.partial(execute_command, room, sender, msg,
+                                      get_command_api_timeout(msg), cache_key, msg, -1,
+                                      command_manager.PRIORITY_LOW),
+                    command=msg
+                )
+                refreshed.append(msg)
+            except Exception as e:
+                logger.warning(f"사전 갱신 실패 ({msg}): {e}")
         
-        if expired_keys:
-            logger.info(f"백그라운드 캐시 정리: {len(expired_keys)}개 항목 제거")
+        if refreshed:
+            logger.info(f"인기 명령어 사전 갱신: {', '.join(refreshed)}")
 
 def clean_message_for_kakao(msg: str) -> str:
     """카카오톡 전송을 위한 메시지 정리"""
@@ -280,9 +420,15 @@ def clean_message_for_kakao(msg: str) -> str:
     
     return msg.strip()
 
-def get_cache_key(room: str, sender: str, msg: str) -> str:
-    """캐시 키 생성"""
-    return f"{room}:{sender}:{msg}"
+def get_cache_key(room: str, sender: str, msg: str):
+    """캐시 키 생성 (command_manager의 cache_scope 기준, 캐시 안 하는 명령어는 None)"""
+    return command_manager.get_cache_key(room, sender, msg)
+
+def get_inflight_key(room: str, sender: str, msg: str, cache_key: str = None) -> str:
+    """동시 요청 합치기 키 생성 (캐시 키와 같은 범위, 캐시 안 하는 명령어는 사용자 단위)"""
+    if cache_key:
+        return cache_key
+    return command_manager.get_cache_key(room, sender, msg, scope=command_manager.CACHE_SCOPE_SENDER)
 
 async def get_reply_with_timeout(room: str, sender: str, msg: str, timeout: float = None):
     """타임아웃이 있는 응답 생성 (개선 버전)"""
@@ -307,50 +453,102 @@ async def get_reply_with_timeout(room: str, sender: str, msg: str, timeout: floa
         timeout = get_command_api_timeout(msg)
         # URL 요약 디버깅 로그
         if msg.startswith('http://') or msg.startswith('https://'):
-            logger.info(f"🔗 URL 요약 요청 감지 - 타임아웃: {timeout}초")
-        logger.debug(f"명령어 '{msg[:20]}' 타임아웃: {timeout}초")
+            logger.info("🔗 URL 요약 요청 감지 - 타임아웃: %s초", timeout)
+        logger.debug("명령어 '%.20s' 타임아웃: %s초", msg, timeout)
     
     # 1. 캐시 확인 (중복 요청 방지)
     cache_key = get_cache_key(room, sender, msg)
-    now = datetime.datetime.now()
     
-    if cache_key in response_cache:
-        cached_data, cached_time = response_cache[cache_key]
-        cache_timeout = get_command_cache_timeout(msg)  # 함수 사용
-        
-        # 캐시 유효성 확인
-        if cache_timeout > 0 and (now - cached_time).total_seconds() < cache_timeout:
-            logger.info(f"캐시 히트: {cache_key[:30]} (TTL: {cache_timeout}초)")
-            update_cache_stats(is_hit=True)  # 통계 업데이트
+    if cache_key:
+        cached_data, state = response_cache.lookup(
+            cache_key, command=command_name, allow_stale=STALE_WHILE_REVALIDATE
+        )
+        annotate(cache=state or "miss")
+        if state == STATE_FRESH:
+            logger.info("캐시 히트: %.30s", cache_key)
+            return cached_data
+        if state == STATE_STALE:
+            # soft TTL 경과 - 이전 응답 즉시 반환 후 백그라운드 갱신
+            logger.info("stale 캐시 히트 (백그라운드 갱신): %.30s", cache_key)
+            schedule_background_refresh(room, sender, msg, timeout, cache_key, command_name)
             return cached_data
+    
+    # 실행 우선순위 (관리자 요청 > 짧은 조회 > 기본 > AI/브라우저)
+    priority = command_manager.get_command_priority(msg, sender)
+    
+    inflight_key = get_inflight_key(room, sender, msg, cache_key)
+    joining = inflight_key in inflight_registry or inflight_key in deferred_jobs
+    annotate(priority=priority, coalesced=joining)
+    
+    # 2. 요청 제한 - 방/사용자/카테고리 토큰 버킷 + 전역 동시 실행 수
+    # 명령어와 URL 요약만 제한 (일반 대화는 핸들러가 없음), 진행 중인 작업에 합류하는 요청과 관리자는 제외
+    category = cmd.category if cmd else "URL" if URL_RE.search(msg) else None
+    if category and not joining and priority != command_manager.PRIORITY_ADMIN:
+        reason = admission.admit(room, sender, category)
+        if reason:
+            annotate(rejected=reason)
+            logger.warning("요청 제한 (%s): %s/%s/%.30s", reason, room, sender, msg)
+            return try_fallback_cache(cache_key) or BUSY_MESSAGE
+    
+    # 동일 명령어가 이미 처리 중이면 그 결과를 함께 기다림 (업스트림 호출 1회로 제한)
+    def run_shared():
+        return inflight_registry.run(
+            inflight_key,
+            lambda: execute_admitted(room, sender, msg, timeout, cache_key, command_name, start_time, priority),
+            command=command_name
+        )
+    
+    # 3. 오래 걸리는 명령어는 접수 응답만 보내고 백그라운드에서 실행 (결과는 /api/poll 로 전달)
+    if DEFERRED_CONFIG['ENABLED'] and timeout >= DEFERRED_CONFIG['THRESHOLD']:
+        async def run_deferred():
+            # 접수 응답으로 끝난 요청과 별개로 백그라운드 실행 시간을 추적
+            with context_scope(None), tracer.trace(command_name, room=room, deferred=True):
+                return await run_shared()
         
-        # 만료된 캐시 제거
-        del response_cache[cache_key]
+        job, is_new = deferred_jobs.submit(inflight_key, room, run_deferred)
+        annotate(deferred=job.job_id)
+        logger.info("지연 응답 %s: %s - %.30s", '접수' if is_new else '합류', job.job_id, msg)
+        message = DEFERRED_ACK_MESSAGE if is_new else DEFERRED_DUPLICATE_MESSAGE
+        return message.format(job_id=job.job_id)
+    
+    return await run_shared()
+
+async def execute_admitted(*args):
+    """사용자 요청 실행 - 전역 동시 실행 수에 포함 (ADMISSION_CONFIG['MAX_CONCURRENT'])"""
+    with admission.running():
+        return await execute_command(*args)
+
+async def execute_command(room: str, sender: str, msg: str, timeout: float,
+                          cache_key: str, command_name: str, start_time: float,
+                          priority: int = command_manager.PRIORITY_NORMAL):
+    """명령어 실제 실행 (타임아웃 처리)
     
-    update_cache_stats(is_hit=False)  # 캐시 미스
+    async 핸들러는 이벤트 루프에서 바로 실행되고 (스레드 점유 없음),
+    동기 핸들러는 명령어의 벌크헤드 풀에서 priority 순서로 실행된다 (풀이 가득 차면 바쁨 응답).
+    기본 처리는 Deadline 으로 남은 시간을 핸들러/HTTP 계층에 전달하고,
+    타임아웃 시 취소해 포기된 작업이 worker 를 계속 점유하지 않게 한다.
+    """
     
-    # 2. 장시간 명령어 처리 (10초 이상)
+    # 2. 장시간 명령어 처리 (10초 이상) - 결과를 끝까지 기다리므로 마감 시간 없음
     if timeout >= 10.0:
         try:
-            logger.info(f"장시간 명령어 처리 시작: {msg}")
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                executor, 
-                functools.partial(get_reply_msg, room, sender, msg)
-            )
+            logger.info("장시간 명령어 처리 시작: %s", msg)
+            result = await get_reply_msg_async(room, sender, msg, executor=bulkhead, priority=priority)
             
-            logger.info(f"장시간 명령어 처리 완료: {result[:100] if result else 'None'}")
+            logger.info("장시간 명령어 처리 완료: %.100s", result)
             
             # 캐시 저장
-            cache_timeout = get_command_cache_timeout(msg)
-            if cache_timeout > 0:
-                save_to_cache(cache_key, result, now)
+            save_to_cache(cache_key, result, command_name, msg)
             
             # 오류 모니터링 - 성공 기록
             error_monitor.log_command_success(command_name, start_time)
             
             return result
             
+        except PoolFull as e:
+            logger.warning("실행 풀 포화: %.30s (%s)", msg, e.pool)
+            return try_fallback_cache(cache_key) or BUSY_MESSAGE
+            
         except Exception as e:
             logger.error(f"장시간 명령어 처리 오류: {e}")
             
@@ -365,33 +563,36 @@ async def get_reply_with_timeout(room: str, sender: str, msg: str, timeout: floa
             return get_timeout_message(msg, timeout)
     
     # 3. 기본 처리 (타임아웃 적용)
+    deadline = Deadline(timeout, name=command_name)
     try:
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(
-            executor,
-            functools.partial(get_reply_msg, room, sender, msg)
+        result = await asyncio.wait_for(
+            get_reply_msg_async(room, sender, msg, executor=bulkhead, deadline=deadline, priority=priority),
+            timeout=timeout
         )
         
-        result = await asyncio.wait_for(future, timeout=timeout)
-        
         # 캐시 저장
-        cache_timeout = get_command_cache_timeout(msg)
-        if cache_timeout > 0:
-            save_to_cache(cache_key, result, now)
+        save_to_cache(cache_key, result, command_name, msg)
         
         return result
         
     except asyncio.TimeoutError:
-        logger.warning(f"타임아웃: {msg[:30]} ({timeout}초 초과)")
+        # 결과 포기 - executor 대기 중이면 건너뛰고, 진행 중인 HTTP 요청은 중단
+        deadline.cancel()
+        logger.warning("타임아웃: %.30s (%s초 초과)", msg, timeout)
         
         # 이전 캐시 데이터 활용 시도
-        fallback_result = try_fallback_cache(room, sender, msg)
+        fallback_result = try_fallback_cache(cache_key)
         if fallback_result:
             return fallback_result
         
         # 사용자 친화적 에러 메시지
         return get_timeout_message(msg, timeout)
     
+    except PoolFull as e:
+        # 풀이 가득 참 - 이전 캐시가 있으면 그것을, 없으면 바쁨 응답 (오류로 집계하지 않음)
+        logger.warning("실행 풀 포화: %.30s (%s)", msg, e.pool)
+        return try_fallback_cache(cache_key) or BUSY_MESSAGE
+    
     except Exception as e:
         logger.error(f"응답 생성 오류: {e}")
         return "⚠️ 처리 중 오류가 발생했습니다."
@@ -402,69 +603,81 @@ async def get_reply_with_timeout(room: str, sender: str, msg: str, timeout: floa
 # ========================================
 # (비동기 처리 제거 - core/router.py에서 동기 처리로 복원)
 
+def json_response(data: dict, request: Request) -> Response:
+    """JSON 응답 생성 - 클라이언트가 받을 수 있으면 UTF-8 그대로 + gzip, 아니면 기존 ASCII 이스케이프"""
+    body, headers = encode_json(data, request.headers)
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+def get_piggyback_messages() -> list:
+    """응답에 함께 보낼 대기 메시지 (room, message 만)"""
+    try:
+        from services.schedule_service import schedule_service
+        messages = schedule_service.get_pending_messages()
+    except Exception as e:
+        logger.error(f"대기 메시지 조회 오류: {e}")
+        return []
+    return [{'room': m['room'], 'message': m['message']} for m in messages]
+
 @app.post("/api/kakaotalk")
 async def handle_message(request: Request):
     """개선된 메시지 처리"""
     response_data = {'is_reply': False}
     room, sender, msg = None, None, None
+    accept_pending = False
     
     try:
         # 1. 요청 파싱
         body = await request.body()
         
-        # 요청 헤더 로깅 (민감 정보 마스킹)
-        safe_headers = {k: '***' if 'auth' in k.lower() or 'api' in k.lower() or 'key' in k.lower() else v
-                        for k, v in request.headers.items()}
-        logger.debug(f"요청 헤더: {safe_headers}")
-        logger.debug(f"요청 메소드: {request.method}")
-        logger.debug(f"Content-Type: {request.headers.get('content-type', 'None')}")
-        logger.debug(f"Body 길이: {len(body)} bytes")
+        content_type = request.headers.get('content-type', '')
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        # 요청 헤더 로깅 (민감 정보 마스킹, DEBUG 레벨일 때만 생성)
+        if debug_enabled:
+            safe_headers = {k: '***' if 'auth' in k.lower() or 'api' in k.lower() or 'key' in k.lower() else v
+                            for k, v in request.headers.items()}
+            logger.debug("요청 헤더: %s", safe_headers)
+            logger.debug("요청 메소드: %s, Content-Type: %s, Body 길이: %d bytes",
+                         request.method, content_type or 'None', len(body))
         
         # Form 데이터 처리 추가 (카카오톡 봇이 form-data로 보낼 수 있음)
-        if request.headers.get('content-type', '').startswith('application/x-www-form-urlencoded'):
+        if content_type.startswith('application/x-www-form-urlencoded'):
             try:
                 form_data = await request.form()
                 data = dict(form_data)
-                logger.debug(f"Form 데이터로 파싱: {data}")
             except:
                 data = {}
         else:
-            # 인코딩 자동 감지
-            try:
-                body_text = body.decode('utf-8')
-            except UnicodeDecodeError:
-                try:
-                    body_text = body.decode('euc-kr')
-                except UnicodeDecodeError:
-                    body_text = body.decode('cp949')
-            
-            # 보안: 민감 정보 보호를 위해 길이만 로깅
-            logger.debug(f"수신 원본 길이: {len(body_text)} bytes")
+            # 선언된 charset 먼저, 실패하면 utf-8 → euc-kr → cp949
+            body_text = decode_body(body, content_type)
             
             # JSON 파싱 시도
             try:
-                data = json.loads(body_text) if body_text else {}
+                data = json_loads(body_text) if body_text else {}
             except json.JSONDecodeError:
                 # JSON이 아닌 경우 쿼리스트링 파싱 시도
                 try:
                     from urllib.parse import parse_qs
                     parsed = parse_qs(body_text)
                     data = {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
-                    logger.debug(f"쿼리스트링으로 파싱: {data}")
                 except:
                     data = {}
         
-        logger.debug(f"최종 파싱된 데이터: {data}")
+        # 보안: 본문 대신 필드 이름과 길이만 로깅
+        if debug_enabled:
+            logger.debug("파싱된 필드: %s", {k: len(str(v)) for k, v in data.items()})
         
         room = data.get('room', '').strip()
         sender = data.get('sender', '').strip()
         msg = data.get('msg', '').strip()
+        # 대기 메시지를 응답에 함께 받는 클라이언트 (pending_messages 를 처리하는 버전만)
+        accept_pending = data.get('accept_pending') in (True, 'true', '1')
         
-        logger.info(f"추출된 필드 - room: [{room}], sender: [{sender}], msg: [{msg}]")
+        logger.debug("추출된 필드 - room: [%s], sender: [%s], msg: [%s]", room, sender, msg)
         
         # 네이버 부동산 명령어 체크
         if msg and msg.startswith("/네이버부동산"):
-            logger.info(f"네이버 부동산 명령어 감지: {msg}")
+            logger.info("네이버 부동산 명령어 감지: %s", msg)
         
         # 필수 필드 확인 (보안: 권한 우회 방지를 위해 필수 필드 누락 시 거부)
         if not room or not sender:
@@ -472,25 +685,27 @@ async def handle_message(request: Request):
             response_data["is_reply"] = False
             response_data["reply_room"] = "system"
             response_data["reply_msg"] = "❌ 인증 오류: 방과 발신자 정보가 필요합니다."
-            json_str = json.dumps(response_data, ensure_ascii=True)
-            return Response(content=json_str, media_type="application/json; charset=utf-8")
+            return json_response(response_data, request)
         if not msg:
             # msg가 비어있으면 빈 응답 반환
-            logger.warning(f"msg 필드 누락 - 빈 메시지")
-            # JSON 응답 생성 (ASCII 이스케이프 사용)
-            json_str = json.dumps(response_data, ensure_ascii=True)
-            return Response(content=json_str, media_type="application/json; charset=utf-8")
+            logger.warning("msg 필드 누락 - 빈 메시지")
+            return json_response(response_data, request)
         
         # 2. 권한 확인
         if not config.is_room_enabled(room):
-            logger.warning(f"허용되지 않은 방: {room}")
-            # JSON 응답 생성 (ASCII 이스케이프 사용)
-            json_str = json.dumps(response_data, ensure_ascii=True)
-            return Response(content=json_str, media_type="application/json; charset=utf-8")
+            logger.warning("허용되지 않은 방: %s", room)
+            return json_response(response_data, request)
 
         # 3. 타임아웃이 있는 응답 생성 (명령어별 동적 타임아웃)
         # URL 자동 요약 등 명령어별 타임아웃 자동 결정
-        reply_msg = await get_reply_with_timeout(room, sender, msg)  # 타임아웃 자동 결정
+        command_label = get_metrics_command(msg)
+        started = time.perf_counter()
+        try:
+            # 요청 추적 (TRACING_CONFIG['SAMPLE_RATE'] 비율, 느린 요청은 /트레이스 · /api/traces)
+            with tracer.trace(command_label, room=room, msg=msg[:30]):
+                reply_msg = await get_reply_with_timeout(room, sender, msg)  # 타임아웃 자동 결정
+        finally:
+            COMMAND_SECONDS.labels(command_label).observe(time.perf_counter() - started)
         
         # 4. 응답 정리 및 전송
         if reply_msg:
@@ -503,9 +718,9 @@ async def handle_message(request: Request):
                 'reply_msg': reply_msg
             }
             
-            logger.info(f"응답 생성: {room} - {reply_msg[:50]}...")
+            logger.info("응답 생성: %s - %.50s...", room, reply_msg)
         else:
-            logger.info(f"응답 없음: {room}/{sender}/{msg[:30]}")
+            logger.info("응답 없음: %s/%s/%.30s", room, sender, msg)
     
     except json.JSONDecodeError as e:
         logger.error(f"JSON 파싱 오류: {e}")
@@ -519,9 +734,11 @@ async def handle_message(request: Request):
             'reply_msg': "⚠️ 일시적인 오류가 발생했습니다."
         }
     
-    # JSON 응답 생성 (ASCII 이스케이프 사용)
-    json_str = json.dumps(response_data, ensure_ascii=True)
-    return Response(content=json_str, media_type="application/json; charset=utf-8")
+    # 대기 메시지(스케줄, 지연 응답)를 응답에 함께 전달 - 별도 폴링 왕복 없이 바로 전송
+    if accept_pending:
+        response_data['pending_messages'] = get_piggyback_messages()
+    
+    return json_response(response_data, request)
 
 @app.get("/")
 async def welcome():
@@ -544,47 +761,147 @@ async def health_check():
     """향상된 상태 체크"""
     now = datetime.datetime.now()
     
-    # 캐시 통계 계산
-    cache_by_command = {}
-    cache_ages = []
+    # 캐시 통계 (카운터 기반 - 캐시 재스캔 없음)
+    stats = response_cache.get_stats()
     
-    for key, (_, cached_time) in response_cache.items():
-        msg_part = key.split(':')[-1] if ':' in key else 'unknown'
-        
-        # 명령어 타입 추출
-        cmd_type = 'unknown'
-        for cmd in CACHE_TIMEOUTS.keys():
-            if msg_part.startswith(cmd):
-                cmd_type = cmd
-                break
-        
-        cache_by_command[cmd_type] = cache_by_command.get(cmd_type, 0) + 1
-        cache_ages.append((now - cached_time).total_seconds())
+    # 실행 풀별 대기열 깊이 / 대기 시간 (우선순위별 대기 시간은 이름으로 표시)
+    pool_stats = bulkhead.get_stats()
+    for pool in pool_stats.values():
+        pool['wait_by_priority'] = {
+            command_manager.PRIORITY_NAMES.get(priority, str(priority)): wait
+            for priority, wait in pool['wait_by_priority'].items()
+        }
     
-    # 평균 캐시 나이 계산
-    avg_cache_age = sum(cache_ages) / len(cache_ages) if cache_ages else 0
+    # HTTP 연결 풀 통계 (requests 는 첫 외부 호출 때 로딩되므로 여기서 import)
+    from services.http_service import get_stats as get_http_stats
     
     return {
         "status": "healthy",
         "cache": {
-            "size": len(response_cache),
-            "limit": MAX_CACHE_SIZE,
-            "by_command": cache_by_command,
-            "avg_age_seconds": round(avg_cache_age, 1),
+            "size": stats['size'],
+            "limit": stats['limit'],
+            "bytes": stats['bytes'],
+            "max_bytes": stats['max_bytes'],
+            "by_command": stats['by_command'],
+            "avg_age_seconds": stats['avg_age_seconds'],
             "stats": {
-                "hits": cache_stats['hits'],
-                "misses": cache_stats['misses'],
-                "hit_rate": f"{cache_stats['hit_rate']*100:.1f}%" if cache_stats['hit_rate'] > 0 else "0.0%",
-                "total_requests": cache_stats['total_requests']
+                "hits": stats['hits'],
+                "stale_hits": stats['stale_hits'],
+                "misses": stats['misses'],
+                "evictions": stats['evictions'],
+                "expirations": stats['expirations'],
+                "hit_rate": f"{stats['hit_rate']*100:.1f}%",
+                "total_requests": stats['total_requests']
             }
         },
+        "coalescing": inflight_registry.get_stats(),
+        "abandoned_work": abandoned_work.get_stats(),
+        "admission": admission.get_stats(),
+        "deferred": deferred_jobs.get_stats(),
+        "tracing": tracer.get_stats(),
+        "logging": log_pipeline.get_stats(),
+        "router": get_router_stats() if get_router_stats else None,
+        "http": get_http_stats(),
+        "parse_pool": parse_pool.get_stats(),
         "performance": {
-            "active_threads": executor._threads.__len__() if hasattr(executor, '_threads') else 0,
-            "max_threads": executor._max_workers
+            "active_threads": sum(pool['running'] for pool in pool_stats.values() if not pool['inline']),
+            "max_threads": sum(pool['max_workers'] for pool in pool_stats.values() if not pool['inline'])
         },
+        "pools": pool_stats,
         "timestamp": now.isoformat()
     }
 
+def collect_runtime_metrics():
+    """/metrics 수집 시점에 읽는 값 (실행 풀, 캐시, 요청 제한, 지연 응답)"""
+    pool_stats = bulkhead.get_stats()
+    queue_depth = MetricFamily('bot_pool_queue_depth', 'gauge', '실행 풀 대기열 깊이', ['pool'])
+    running = MetricFamily('bot_pool_running', 'gauge', '실행 풀에서 실행 중인 작업 수', ['pool'])
+    pool_rejected = MetricFamily('bot_pool_rejected', 'counter', '실행 풀이 가득 차 거절한 요청 수', ['pool'])
+    for name, pool in pool_stats.items():
+        queue_depth.add((name,), pool['queue_depth'])
+        running.add((name,), pool['running'])
+        pool_rejected.add((name,), pool['rejected'])
+
+    cache_stats = response_cache.get_stats()
+    cache_requests = MetricFamily('bot_cache_requests', 'counter',
+                                  '응답 캐시 조회 수 (명령어/결과별)', ['command', 'result'])
+    cache_evictions = MetricFamily('bot_cache_evictions', 'counter',
+                                   '용량 초과로 밀려난 캐시 항목 수 (명령어별)', ['command'])
+    cache_entries = MetricFamily('bot_cache_entries', 'gauge', '캐시 항목 수 (명령어별)', ['command'])
+    for command, stats in cache_stats['by_command'].items():
+        cache_requests.add((command, 'hit'), stats['hits'])
+        cache_requests.add((command, 'stale_hit'), stats['stale_hits'])
+        cache_requests.add((command, 'miss'), stats['misses'])
+        cache_evictions.add((command,), stats['evictions'])
+        cache_entries.add((command,), stats['entries'])
+    cache_bytes = MetricFamily('bot_cache_bytes', 'gauge', '캐시 크기 (UTF-8 바이트)').add((), cache_stats['bytes'])
+
+    admission_stats = admission.get_stats()
+    admitted = MetricFamily('bot_admission_admitted', 'counter', '요청 제한을 통과한 요청 수').add(
+        (), admission_stats['admitted'])
+    rejected = MetricFamily('bot_admission_rejected', 'counter', '요청 제한으로 거절한 요청 수 (사유별)', ['reason'])
+    for reason, count in admission_stats['rejected'].items():
+        rejected.add((reason,), count)
+    in_flight = MetricFamily('bot_commands_in_flight', 'gauge', '실행 중인 명령어 수').add(
+        (), admission_stats['in_flight'])
+
+    deferred_stats = deferred_jobs.get_stats()
+    deferred = MetricFamily('bot_deferred_jobs', 'gauge', '지연 응답 작업 수 (상태별)', ['state'])
+    deferred.add(('running',), deferred_stats['running'])
+    deferred.add(('queued',), deferred_stats['queued'])
+    coalesced = MetricFamily('bot_coalesced_requests', 'counter', '진행 중인 동일 요청에 합류한 요청 수').add(
+        (), inflight_registry.get_stats()['coalesced'])
+
+    return [queue_depth, running, pool_rejected, cache_requests, cache_evictions, cache_entries, cache_bytes,
+            admitted, rejected, in_flight, deferred, coalesced]
+
+metrics.register_collector('runtime', collect_runtime_metrics)
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Prometheus 수집 엔드포인트 (명령어/외부 HTTP 지연 히스토그램, 실행 풀, 캐시, 스케줄 작업)"""
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+@app.get("/api/traces")
+async def slow_traces(limit: int = 10):
+    """가장 느린 요청의 구간별 시간 (풀 대기, 핸들러, HTTP, 파싱, AI 호출)"""
+    return {
+        "tracing": tracer.get_stats(),
+        "traces": tracer.slowest(max(1, min(limit, tracer.keep_slowest)))
+    }
+
+@app.get("/api/profile")
+async def profile_stacks(mode: str = "run", seconds: float = None, hz: float = None, format: str = "collapsed"):
+    """샘플링 프로파일 - collapsed stack (flamegraph.pl, speedscope 입력) 또는 요약 JSON
+
+    mode: run(지금부터 seconds 초 샘플링) / last(마지막 결과) / recent(상시 모드 최근 seconds 초)
+    format: collapsed / json
+    """
+    if mode == "last":
+        result = profiler.last_result
+    elif mode == "recent":
+        result = profiler.recent(seconds) if profiler.continuous else None
+    else:
+        try:
+            # 샘플링은 seconds 초 동안 블로킹이므로 이벤트 루프 밖에서
+            result = await asyncio.to_thread(profiler.profile, seconds, hz)
+        except RuntimeError:
+            return JSONResponse({"error": "profiling already in progress"}, status_code=409)
+    if result is None:
+        return JSONResponse({"error": "no profile", "profiler": profiler.get_stats()}, status_code=404)
+    if format == "json":
+        return result.to_dict()
+    return Response(content=result.collapsed(), media_type="text/plain; charset=utf-8")
+
+@app.get("/api/startup")
+async def startup_report():
+    """서버 시작 시간 리포트 (모듈 import 시간, 무거운 SDK 로딩 여부)"""
+    report = get_runtime_report()
+    report['import_ms'] = round(STARTUP_IMPORT_MS, 1)
+    report['import_budget_ms'] = get_import_budget_ms()
+    report['router'] = get_router_stats() if get_router_stats else None
+    return report
+
 @app.get("/test")
 async def test_endpoint():
     """카카오톡 봇 연결 테스트용 엔드포인트"""
@@ -665,31 +982,39 @@ chart_cache_timeout = 300  # 5분
 # ========================================
 
 @app.post("/api/poll")
-async def poll_pending_messages():
-    """스케줄된 메시지 폴링 엔드포인트 (메신저봇R용)"""
+async def poll_pending_messages(request: Request, wait: float = 0):
+    """대기 메시지 폴링 엔드포인트 (메신저봇R용 - 스케줄 메시지, 지연 응답 결과)
+
+    wait > 0 이면 long-poll: 메시지가 생기면 바로, 없으면 wait 초 뒤에 응답
+    (최대 POLL_CONFIG['MAX_HOLD'] 초)
+    """
     try:
         from services.schedule_service import schedule_service
 
         # 스케줄 메시지 가져오기
-        messages = schedule_service.get_pending_messages()
+        hold = min(max(wait, 0), POLL_CONFIG['MAX_HOLD'])
+        if hold > 0:
+            messages = await schedule_service.wait_for_pending_messages(hold)
+        else:
+            messages = schedule_service.get_pending_messages()
 
-        return {
+        return json_response({
             "success": True,
             "messages": messages,
             "count": len(messages)
-        }
+        }, request)
     except Exception as e:
         logger.error(f"폴링 오류: {e}")
-        return {
+        return json_response({
             "success": False,
             "messages": [],
             "error": str(e)
-        }
+        }, request)
 
 @app.get("/api/poll")
-async def poll_pending_messages_get():
+async def poll_pending_messages_get(request: Request, wait: float = 0):
     """GET 방식 폴링 (테스트용)"""
-    return await poll_pending_messages()
+    return await poll_pending_messages(request, wait)
 
 @app.get("/chart/exchange")
 async def get_exchange_chart():
@@ -819,10 +1144,15 @@ async def get_stock_chart(stock_name: str):
         import glob
         from datetime import datetime, timedelta
         
+        # 종목명/별칭/초성 → 종목 (KRX 종목 인덱스) - 같은 종목은 입력이 달라도 같은 차트 파일
+        symbol = symbol_index.resolve(stock_name)
+        if symbol:
+            stock_name = symbol.name
+        
         # 최근 저장된 차트 확인 (1분 이내)
         current_time = datetime.now()
         charts_dir = 'charts'
-        safe_name = stock_name.replace(' ', '_').replace('/', '_')
+        safe_name = (symbol.code if symbol else stock_name).replace(' ', '_').replace('/', '_')
         
         # 기존 차트 파일 확인
         if os.path.exists(charts_dir):
@@ -846,7 +1176,7 @@ async def get_stock_chart(stock_name: str):
         # 텍스트에서 주식 데이터 파싱
         stock_data = {
             'name': stock_name,
-            'code': '000000'
+            'code': symbol.code if symbol else '000000'
         }
         
         # 현재가 파싱
@@ -921,6 +1251,35 @@ async def startup_event():
     # 백그라운드 캐시 정리 작업 시작
     asyncio.create_task(cleanup_expired_cache())
     logger.info("✅ 백그라운드 캐시 정리 작업 시작 (5분 주기)")
+    
+    # 인기 명령어 사전 갱신 (선택)
+    if CACHE_WARMUP_CONFIG['ENABLED']:
+        asyncio.create_task(warm_hot_commands())
+        logger.info(f"✅ 인기 명령어 사전 갱신 시작 (상위 {CACHE_WARMUP_CONFIG['TOP_N']}개, "
+                    f"{CACHE_WARMUP_CONFIG['INTERVAL']}초 주기)")
+
+    # 상시 저빈도 프로파일링 (선택, /프로파일 상시 켜기 로도 시작)
+    if PROFILER_CONFIG['CONTINUOUS']:
+        profiler.start_continuous()
+        logger.info(f"✅ 상시 프로파일링 시작 ({PROFILER_CONFIG['CONTINUOUS_HZ']}Hz, "
+                    f"최근 {PROFILER_CONFIG['CONTINUOUS_WINDOW']}초 보관)")
+
+    # HTML 추출 worker 프로세스 (미리 띄워서 파서까지 import, 실패하면 이 프로세스에서 추출)
+    if PARSE_POOL_CONFIG['ENABLED']:
+        try:
+            await asyncio.to_thread(parse_pool.start)
+            logger.info(f"✅ HTML 추출 프로세스 풀 시작 ({PARSE_POOL_CONFIG['WORKERS']}개, "
+                        f"{PARSE_POOL_CONFIG['MIN_BYTES'] // 1024}KB 이상 페이지)")
+        except Exception as e:
+            parse_pool.shutdown(wait=False)
+            logger.error(f"❌ HTML 추출 프로세스 풀 시작 실패: {e}")
+
+    # KRX 종목 인덱스 (첫 /주식 요청이 이벤트 루프에서 데이터 파일을 읽지 않도록 미리 적재)
+    try:
+        await asyncio.to_thread(symbol_index.load)
+        logger.info(f"✅ 종목 인덱스 적재 ({len(symbol_index)}개 종목)")
+    except Exception as e:
+        logger.error(f"❌ 종목 인덱스 적재 실패: {e}")
 
     # 스케줄러 초기화
     try:
@@ -936,14 +1295,10 @@ async def startup_event():
     for cmd in preload_commands:
         try:
             logger.info(f"사전 로딩 시작: {cmd}")
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                executor,
-                functools.partial(get_reply_msg, "이국환", "이국환", cmd)
-            )
+            result = await get_reply_msg_async("이국환", "이국환", cmd, executor=bulkhead)
             if result:
                 cache_key = get_cache_key("이국환", "이국환", cmd)
-                response_cache[cache_key] = (result, datetime.datetime.now())
+                save_to_cache(cache_key, result, cmd, cmd)
                 cache_timeout = get_command_cache_timeout(cmd)
                 logger.info(f"✅ {cmd} 사전 로딩 완료 (캐시: {cache_timeout}초)")
         except Exception as e:
@@ -960,18 +1315,27 @@ async def startup_event():
     logger.info(f"  · 관리자 ({len(admin_users)}명): {', '.join(admin_users)}")
     
     logger.info(f"\n🚀 최적화 설정:")
-    logger.info(f"  · 캐시 크기 제한: {MAX_CACHE_SIZE}개")
+    logger.info(f"  · 캐시 크기 제한: {MAX_CACHE_SIZE}개 / {MAX_CACHE_BYTES // 1024}KB")
     logger.info(f"  · 백그라운드 정리: 5분 주기")
     logger.info(f"  · 캐시 히트율 추적: 활성화")
     logger.info(f"  · 사용자 친화적 에러: 활성화")
     logger.info(f"  · 명령어별 캐시 TTL: 0-86400초")
+    logger.info(f"  · Stale-while-revalidate: {'활성화' if STALE_WHILE_REVALIDATE else '비활성화'}")
     logger.info(f"  · 명령어별 API 타임아웃: 1-15초")
+    logger.info(f"  · 실행 풀: " + ", ".join(
+        f"{name}({options['max_workers'] or '인라인'})" for name, options in EXECUTOR_POOLS.items()
+    ))
     logger.info("="*60)
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료시 실행"""
-    executor.shutdown(wait=True)
+    bulkhead.shutdown(wait=True)
+    parse_pool.shutdown(wait=True)
+
+    # 비동기 HTTP 클라이언트 종료 (async 핸들러가 한 번도 실행되지 않았으면 없음)
+    from services.async_http_service import async_http_transport
+    await async_http_transport.aclose()
 
     # 스케줄러 종료
     try:
@@ -983,11 +1347,15 @@ async def shutdown_event():
 
     logger.info("서버 종료됨")
 
+# 모듈 import 완료 (시작 시간 리포트용)
+STARTUP_IMPORT_MS = (time.perf_counter() - _IMPORT_START) * 1000
+
 if __name__ == "__main__":
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=8002,
         reload=False,
-        log_level="info"
+        log_level="info",
+        log_config=None     # uvicorn 접근/오류 로그도 루트 로거(로그 파이프라인)로 전달
     )
\ No newline at end of file
@@ -4,7 +4,7 @@
 requests를 사용한 직접 KOBIS 스크래핑
 """
 
-import requests
+from services import http_service
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import re
@@ -38,7 +38,7 @@ def movie_rank_direct_kobis():
             'sWideAreaCd': ''
         }
         
-        response = requests.post(url, data=data, headers=headers, timeout=10)
+        response = http_service.post(url, data=data, headers=headers, timeout=10)
         response.encoding = 'utf-8'
         
         if response.status_code == 200:
@@ -120,7 +120,7 @@ def movie_rank_naver():
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=5)
+        response = http_service.get(url, headers=headers, timeout=5)
         response.encoding = 'euc-kr'
         soup = BeautifulSoup(response.text, 'html.parser')
         
@@ -3,11 +3,15 @@
 외부 API 호출, 데이터 처리 등의 비즈니스 로직
 """
 
+import logging
+
+_logger = logging.getLogger("bot")
+
 # HTTP 서비스
 try:
     from .http_service import request, fetch_json, fetch_html, HTTPClient
 except ImportError as e:
-    print(f"HTTP service import error: {e}")
+    _logger.warning("HTTP service import error: %s", e)
 
 # DB 서비스
 try:
@@ -21,36 +25,41 @@ try:
         db_service
     )
 except ImportError as e:
-    print(f"DB service import error: {e}")
+    _logger.warning("DB service import error: %s", e)
 
 # AI 서비스
 try:
     from .ai_service import AIService, ai_service
 except ImportError as e:
-    print(f"AI service import error: {e}")
+    _logger.warning("AI service import error: %s", e)
 
 # 웹 스크래핑 서비스
 try:
     from .web_scraping_service import WebScrapingService, web_scraping_service
 except ImportError as e:
-    print(f"Web scraping service import error: {e}")
+    _logger.warning("Web scraping service import error: %s", e)
 
 # 스케줄 서비스
 try:
     from .schedule_service import ScheduleService, schedule_service
 except ImportError as e:
-    print(f"Schedule service import error: {e}")
+    _logger.warning("Schedule service import error: %s", e)
 
 # 임시: fn.py에서 서비스 관련 함수들 노출 (점진적 마이그레이션)
-try:
-    from fn import (
-        web_summary,
-        fortune,
-        zodiac,
-        test
-    )
-except ImportError:
-    pass
+# fn.py 는 무거우므로 처음 접근할 때 import
+_FN_EXPORTS = ('web_summary', 'fortune', 'zodiac', 'test')
+
+
+def __getattr__(name):
+    if name in _FN_EXPORTS:
+        try:
+            import fn
+        except ImportError as e:
+            raise AttributeError(name) from e
+        value = getattr(fn, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'services' has no attribute '{name}'")
 
 __all__ = [
     # HTTP
@@ -11,6 +11,7 @@ from typing import Optional, List, Dict, Any
 from utils.api_manager import APIManager
 from utils.debug_logger import debug_logger
 from utils.text_utils import log, clean_for_kakao
+from utils.tracing import span
 from services.http_service import request, fetch_json
 
 
@@ -52,17 +53,18 @@ class AIService:
             if use_history and room:
                 context = self._get_chat_context(room, sender)
             
-            # 모델별 처리
-            if model == "gemini":
-                return self.gemini_chat(prompt, context)
-            elif model == "gpt":
-                return self.gpt_chat(prompt, context)
-            elif model == "claude":
-                return self.claude_chat(prompt, context)
-            elif model == "perplexity":
-                return self.perplexity_chat(prompt)
-            else:
-                return "지원하지 않는 AI 모델입니다."
+            # 모델별 처리 (추적 중인 요청이면 llm 구간으로 기록)
+            with span("llm", model=model):
+                if model == "gemini":
+                    return self.gemini_chat(prompt, context)
+                elif model == "gpt":
+                    return self.gpt_chat(prompt, context)
+                elif model == "claude":
+                    return self.claude_chat(prompt, context)
+                elif model == "perplexity":
+                    return self.perplexity_chat(prompt)
+                else:
+                    return "지원하지 않는 AI 모델입니다."
                 
         except Exception as e:
             debug_logger.error(f"AI 응답 생성 오류 ({model}): {e}")
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+비동기 HTTP 서비스 모듈
+async 핸들러용 공용 전송 계층 (httpx.AsyncClient)
+
+http_service 와 같은 정책을 사용한다:
+  - 호스트별 연결 풀 (keep-alive), 호스트별 기본 타임아웃
+  - 재시도/백오프 (연결 오류, 502/503/504 - GET 등 멱등 요청만)
+  - 통계는 http_service.host_stats 에 함께 집계 (/health 의 "http")
+  - 명령어 마감 시간(utils.deadline): 남은 시간을 타임아웃으로 사용
+  - 호스트 대체 주소 (http_service.UPSTREAM_OVERRIDES)
+
+클라이언트는 이벤트 루프마다 하나씩 만든다 (httpx 연결은 생성한 루프에 묶임).
+서버 루프에서는 프로세스 수명 동안 같은 클라이언트를 재사용하고,
+run_sync() 로 실행한 임시 루프의 클라이언트는 루프 종료 전에 닫는다.
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Optional, Dict, Any, Union
+from urllib.parse import urlsplit
+
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+from services.http_service import (
+    DEFAULT_HEADERS, HTTP_CONFIG, get_host_timeout, host_stats, html_backend, parse_html, resolve_upstream
+)
+from utils.deadline import abandoned_work, current_deadline
+from utils.debug_logger import debug_logger
+from utils.tracing import span
+
+
+# ========================================
+# 설정
+# ========================================
+ASYNC_HTTP_CONFIG = {
+    'MAX_CONNECTIONS': 200,      # 전체 동시 연결 수 (동시 명령어 수 상한)
+    'MAX_KEEPALIVE': 32,         # 유지할 keep-alive 연결 수
+    'KEEPALIVE_EXPIRY': 30,      # 유휴 연결 유지 시간 (초)
+}
+
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+
+def _to_httpx_timeout(timeout) -> httpx.Timeout:
+    """requests 형식 타임아웃 ((연결, 읽기) 또는 초) → httpx.Timeout"""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _deadline_passed() -> bool:
+    """재시도 전 확인 - 마감 시간이 지났으면 재시도하지 않음"""
+    deadline = current_deadline()
+    return deadline is not None and deadline.expired
+
+
+# ========================================
+# 공용 전송 계층
+# ========================================
+class AsyncHTTPTransport:
+    """프로세스 공용 비동기 HTTP 전송 계층 (이벤트 루프별 클라이언트)"""
+
+    def __init__(self):
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = \
+            weakref.WeakKeyDictionary()
+
+    def client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프의 공용 클라이언트"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=ASYNC_HTTP_CONFIG['MAX_CONNECTIONS'],
+                    max_keepalive_connections=ASYNC_HTTP_CONFIG['MAX_KEEPALIVE'],
+                    keepalive_expiry=ASYNC_HTTP_CONFIG['KEEPALIVE_EXPIRY']
+                )
+            )
+            self._clients[loop] = client
+        return client
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """HTTP 요청 (httpx.AsyncClient.request 와 같은 인자, timeout 생략 시 호스트별 기본값)
+
+        명령어 마감 시간 안에서 호출되면 타임아웃을 남은 시간으로 줄인다.
+        (호출자가 포기하면 작업 자체가 취소되므로 요청도 함께 중단됨)
+        """
+        timeout = kwargs.pop('timeout', None)
+        if timeout is None:
+            timeout = get_host_timeout(url)
+
+        deadline = current_deadline()
+        if deadline is not None:
+            if deadline.expired:
+                abandoned_work.record('stopped_early', deadline.name)
+                raise httpx.TimeoutException(f"deadline exceeded: {url}")
+            timeout = deadline.clamp(timeout)
+        kwargs['timeout'] = _to_httpx_timeout(timeout)
+
+        host = urlsplit(url).hostname or 'unknown'
+        url, kwargs['headers'] = resolve_upstream(url, kwargs.get('headers'))
+
+        async def trace(event_name: str, info: Dict):
+            # 새 TCP 연결을 맺을 때만 발생 (keep-alive 재사용 시에는 없음)
+            if event_name == 'connection.connect_tcp.complete':
+                host_stats.record_new_connection(host)
+
+        kwargs['extensions'] = {**kwargs.get('extensions', {}), 'trace': trace}
+
+        retries = HTTP_CONFIG['RETRY_TOTAL'] if method.upper() in _IDEMPOTENT_METHODS else 0
+        client = self.client()
+        start = time.perf_counter()
+        for attempt in range(retries + 1):
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                if attempt < retries and not _deadline_passed():
+                    await asyncio.sleep(HTTP_CONFIG['RETRY_BACKOFF'] * (2 ** attempt))
+                    continue
+                host_stats.record_request(host, (time.perf_counter() - start) * 1000, error=True)
+                raise
+            if response.status_code in HTTP_CONFIG['RETRY_STATUS'] and attempt < retries and not _deadline_passed():
+                await response.aclose()
+                await asyncio.sleep(HTTP_CONFIG['RETRY_BACKOFF'] * (2 ** attempt))
+                continue
+            break
+
+        host_stats.record_request(host, (time.perf_counter() - start) * 1000,
+                                  error=response.status_code >= 500, status=response.status_code)
+        return response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request('POST', url, **kwargs)
+
+    async def aclose(self):
+        """현재 이벤트 루프의 클라이언트 종료"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'clients': len(self._clients),
+            'max_connections': ASYNC_HTTP_CONFIG['MAX_CONNECTIONS']
+        }
+
+
+async_http_transport = AsyncHTTPTransport()
+
+
+async def get(url: str, **kwargs) -> httpx.Response:
+    """비동기 GET (공용 연결 풀 사용)"""
+    return await async_http_transport.get(url, **kwargs)
+
+
+async def post(url: str, **kwargs) -> httpx.Response:
+    """비동기 POST (공용 연결 풀 사용)"""
+    return await async_http_transport.post(url, **kwargs)
+
+
+async def arequest(
+    url: str,
+    method: str = "get",
+    result: str = "text",
+    params: Optional[Dict] = None,
+    headers: Optional[Dict] = None,
+    data: Optional[Dict] = None,
+    json_data: Optional[Dict] = None,
+    timeout: Optional[float] = None,
+    raise_for_status: bool = True,
+    only: Optional[SoupStrainer] = None
+) -> Optional[Union[str, bytes, Dict, BeautifulSoup]]:
+    """
+    통합 HTTP 요청 함수 (http_service.request 의 비동기 버전)
+
+    Args:
+        url: 요청 URL
+        method: HTTP 메소드 (get/post)
+        result: 응답 형식 (text/json/bs/bytes)
+        params: URL 파라미터
+        headers: 요청 헤더
+        data: POST 데이터 (form-data)
+        json_data: POST JSON 데이터
+        timeout: 타임아웃 (초, 생략 시 호스트별 기본값)
+        raise_for_status: 4xx/5xx 응답을 실패(None)로 처리할지 여부
+        only: result="bs" 에서 파싱할 부분 트리 (http_service.parse_only 결과, 생략 시 페이지 전체)
+
+    Returns:
+        result 타입에 따른 응답 데이터
+    """
+    try:
+        if method.lower() == "get":
+            response = await async_http_transport.get(url, params=params, headers=headers, timeout=timeout)
+        elif method.lower() == "post":
+            if json_data:
+                response = await async_http_transport.post(url, json=json_data, headers=headers, timeout=timeout)
+            else:
+                response = await async_http_transport.post(url, data=data, params=params,
+                                                           headers=headers, timeout=timeout)
+        else:
+            raise ValueError(f"Unsupported method: {method}")
+
+        # 응답 상태 확인
+        if raise_for_status:
+            response.raise_for_status()
+
+        # 결과 형식에 따른 처리
+        if result == "json":
+            return response.json()
+        elif result == "bs":
+            # HTML 파싱은 CPU 작업이므로 이벤트 루프 밖(기본 스레드 풀)에서 실행
+            loop = asyncio.get_running_loop()
+            with span("parse", bytes=len(response.content), parser=html_backend(only is not None)):
+                return await loop.run_in_executor(None, parse_html, response.content, only)
+        elif result == "bytes":
+            # utils.parse_pool 에서 추출할 원본 본문
+            return response.content
+        else:  # text
+            return response.text
+
+    except httpx.TimeoutException:
+        debug_logger.error(f"Request timeout: {url}")
+        return None
+    except httpx.TransportError:
+        debug_logger.error(f"Connection error: {url}")
+        return None
+    except httpx.HTTPStatusError as e:
+        debug_logger.error(f"HTTP error {e.response.status_code}: {url}")
+        return None
+    except Exception as e:
+        debug_logger.error(f"Request error: {e}")
+        return None
+
+
+def run_sync(coro):
+    """async 핸들러를 동기 코드(스케줄러 스레드 등)에서 실행
+
+    임시 이벤트 루프에서 실행하고, 그 루프의 클라이언트는 종료 전에 닫는다.
+    이벤트 루프 스레드 안에서는 호출할 수 없다 (await 사용).
+    """
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await async_http_transport.aclose()
+
+    return asyncio.run(runner())
+
+
+def get_stats() -> Dict[str, Any]:
+    """비동기 전송 계층 상태 (호스트별 통계는 http_service.get_stats)"""
+    return async_http_transport.get_stats()
@@ -3,15 +3,347 @@
 """
 HTTP 서비스 모듈
 HTTP 요청 처리 및 응답 파싱을 담당
+
+모든 외부 요청이 사용하는 공용 전송 계층:
+  - 호스트별 연결 풀 (keep-alive, 풀 크기 제한)
+  - 재시도/백오프 (연결 오류, 502/503/504 - GET 등 멱등 요청만)
+  - 호스트별 기본 타임아웃
+  - 호스트별 지연 시간 / 연결 재사용 통계
+  - 명령어 마감 시간(utils.deadline): 남은 시간을 타임아웃으로 사용, 포기된 명령어는 요청하지 않음
+  - 호스트 대체 주소(UPSTREAM_OVERRIDES): 부하 테스트에서 외부 호스트 대신 로컬 stub 서버로 요청
+  - HTML 파싱(result="bs"): 파서 선택(lxml 설치 시 lxml), 핸들러가 선언한 부분 트리만 파싱(only=parse_only(...))
 """
 
+import threading
+import time
+from collections import defaultdict
+from typing import Optional, Dict, Any, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
+
 import requests
-from bs4 import BeautifulSoup
-from typing import Optional, Dict, Any, Union
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from utils.deadline import abandoned_work, current_deadline
+from utils.metrics import metrics
+from utils.tracing import record as record_span, span
 from utils.debug_logger import debug_logger
+from utils.html_extract import parse_only  # noqa: F401 - 핸들러는 http_service.parse_only 로 사용
+from utils.lazy_import import is_available
 from utils.text_utils import log
 
 
+# ========================================
+# 설정
+# ========================================
+HTTP_CONFIG = {
+    'POOL_CONNECTIONS': 32,      # 유지할 호스트별 풀 개수
+    'POOL_MAXSIZE': 16,          # 호스트당 최대 유지 연결 수
+    'POOL_BLOCK': False,         # 풀이 가득 차면 대기하지 않고 임시 연결 사용
+    'RETRY_TOTAL': 2,            # 재시도 횟수
+    'RETRY_BACKOFF': 0.2,        # 백오프 (0.2s, 0.4s ...)
+    'RETRY_STATUS': (502, 503, 504),
+    'DEFAULT_TIMEOUT': (3.05, 10),  # (연결, 읽기) 초
+}
+
+# 호스트별 기본 타임아웃 (호출 시 timeout 을 주면 그 값 우선)
+HOST_TIMEOUTS = {
+    'finance.naver.com': (2, 5),
+    'm.stock.naver.com': (2, 5),
+    'api.upbit.com': (2, 3),
+    'search.naver.com': (2, 5),
+    'weather.naver.com': (2, 5),
+    'news.naver.com': (2, 8),
+    'www.dhlottery.co.kr': (3, 10),
+}
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# 호스트 → 대체 주소 (비어 있으면 그대로 요청, '*' 는 나머지 모든 호스트)
+# 예: {'*': 'http://127.0.0.1:18080'} - benchmarks/load_test.py 가 stub 서버를 띄우고 설정
+# 원래 호스트는 UPSTREAM_HOST_HEADER 헤더로 전달되고, 타임아웃/통계는 원래 호스트 기준
+UPSTREAM_OVERRIDES: Dict[str, str] = {}
+UPSTREAM_HOST_HEADER = 'X-Upstream-Host'
+
+# result="bs" 파서 (BeautifulSoup 트리 빌더 이름)
+#   BACKEND: 부분 트리(only=)를 선언한 호출에 쓸 파서 - 'auto' 는 lxml 이 설치되어 있으면 lxml, 없으면 html.parser
+#   UNPORTED_BACKEND: only 없이 페이지 전체를 파싱하는 호출 (파서마다 잘못된 HTML 을 고치는 방식이 달라
+#                     선택자를 검증하지 않은 핸들러는 기존 html.parser 결과 그대로 유지)
+HTML_PARSER_CONFIG = {
+    'BACKEND': 'auto',
+    'UNPORTED_BACKEND': 'html.parser',
+}
+
+
+# ========================================
+# 통계
+# ========================================
+UPSTREAM_SECONDS = metrics.histogram(
+    'bot_upstream_request_duration_seconds', '외부 HTTP 요청 시간 (호스트별, 재시도 포함)', ['host']
+)
+UPSTREAM_RESPONSES = metrics.counter(
+    'bot_upstream_responses', '외부 HTTP 응답 수 (호스트/상태 코드별, 연결 실패는 error)', ['host', 'status']
+)
+
+
+class HostStats:
+    """호스트별 요청 수 / 지연 시간 / 연결 재사용 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts = defaultdict(lambda: {
+            'requests': 0,
+            'errors': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'new_connections': 0
+        })
+
+    def record_request(self, host: str, elapsed_ms: float, error: bool = False,
+                       status: Optional[int] = None):
+        """요청 하나 기록 (status 가 None 이면 응답을 받지 못함)
+
+        요청한 스레드/작업에서 호출되므로 추적 중인 요청이면 http 구간으로도 기록한다.
+        """
+        record_span("http", time.perf_counter() - elapsed_ms / 1000, host=host, status=status or 'error')
+        UPSTREAM_SECONDS.labels(host).observe(elapsed_ms / 1000)
+        UPSTREAM_RESPONSES.labels(host, status if status is not None else 'error').inc()
+        with self._lock:
+            stats = self._hosts[host]
+            stats['requests'] += 1
+            stats['total_ms'] += elapsed_ms
+            if elapsed_ms > stats['max_ms']:
+                stats['max_ms'] = elapsed_ms
+            if error:
+                stats['errors'] += 1
+
+    def record_new_connection(self, host: str):
+        with self._lock:
+            self._hosts[host]['new_connections'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            result = {}
+            for host, stats in self._hosts.items():
+                count = stats['requests']
+                reused = max(0, count - stats['new_connections'])
+                result[host] = {
+                    'requests': count,
+                    'errors': stats['errors'],
+                    'avg_ms': round(stats['total_ms'] / count, 1) if count else 0.0,
+                    'max_ms': round(stats['max_ms'], 1),
+                    'new_connections': stats['new_connections'],
+                    'reused_connections': reused,
+                    'reuse_rate': reused / count if count else 0.0
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._hosts.clear()
+
+
+host_stats = HostStats()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        host_stats.record_new_connection(self.host)
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        host_stats.record_new_connection(self.host)
+        return super()._new_conn()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """새 연결 생성 횟수를 기록하는 HTTPAdapter (호스트별 풀은 urllib3 PoolManager)"""
+
+    _POOL_CLASSES = {
+        'http': _CountingHTTPConnectionPool,
+        'https': _CountingHTTPSConnectionPool
+    }
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._POOL_CLASSES
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        manager.pool_classes_by_scheme = self._POOL_CLASSES
+        return manager
+
+
+def create_session(default_headers: Dict = None) -> requests.Session:
+    """연결 풀/재시도가 설정된 세션 생성"""
+    retry = Retry(
+        total=HTTP_CONFIG['RETRY_TOTAL'],
+        connect=HTTP_CONFIG['RETRY_TOTAL'],
+        read=0,  # 읽기 타임아웃은 재시도하지 않음 (명령어 타임아웃이 짧음)
+        status=HTTP_CONFIG['RETRY_TOTAL'],
+        backoff_factor=HTTP_CONFIG['RETRY_BACKOFF'],
+        status_forcelist=HTTP_CONFIG['RETRY_STATUS'],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+        respect_retry_after_header=False
+    )
+    adapter = PooledHTTPAdapter(
+        pool_connections=HTTP_CONFIG['POOL_CONNECTIONS'],
+        pool_maxsize=HTTP_CONFIG['POOL_MAXSIZE'],
+        pool_block=HTTP_CONFIG['POOL_BLOCK'],
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({**DEFAULT_HEADERS, **(default_headers or {})})
+    return session
+
+
+def get_host_timeout(url: str):
+    """URL 호스트의 기본 타임아웃"""
+    host = urlsplit(url).hostname or ''
+    return HOST_TIMEOUTS.get(host, HTTP_CONFIG['DEFAULT_TIMEOUT'])
+
+
+def resolve_upstream(url: str, headers: Optional[Dict] = None) -> Tuple[str, Optional[Dict]]:
+    """UPSTREAM_OVERRIDES 에 있는 호스트면 (대체 주소 URL, 원래 호스트 헤더를 더한 헤더)"""
+    if not UPSTREAM_OVERRIDES:
+        return url, headers
+    parts = urlsplit(url)
+    base = UPSTREAM_OVERRIDES.get(parts.hostname) or UPSTREAM_OVERRIDES.get('*')
+    if not base:
+        return url, headers
+    target = urlsplit(base)
+    url = urlunsplit((target.scheme, target.netloc, parts.path, parts.query, ''))
+    return url, {**(headers or {}), UPSTREAM_HOST_HEADER: parts.hostname or ''}
+
+
+# ========================================
+# 공용 전송 계층
+# ========================================
+class HTTPTransport:
+    """프로세스 공용 HTTP 전송 계층 (이름별 세션, 연결 풀 공유)
+
+    세션은 이름별로 하나씩 만들어지며(기본 'default') 쿠키를 분리해야 하는
+    경우(프록시 등)에만 다른 이름을 사용한다.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session(self, name: str = 'default') -> requests.Session:
+        """이름별 공용 세션"""
+        session = self._sessions.get(name)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(name)
+                if session is None:
+                    session = create_session()
+                    self._sessions[name] = session
+        return session
+
+    def request(self, method: str, url: str, session: str = 'default', **kwargs) -> requests.Response:
+        """HTTP 요청 (requests.request 와 같은 인자, timeout 생략 시 호스트별 기본값)
+
+        명령어 마감 시간 안에서 호출되면 타임아웃을 남은 시간으로 줄이고,
+        마감 시간이 지났으면 요청하지 않고 Timeout 을 발생시킨다.
+        """
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = get_host_timeout(url)
+
+        deadline = current_deadline()
+        if deadline is not None:
+            if deadline.expired:
+                abandoned_work.record('stopped_early', deadline.name)
+                raise requests.exceptions.Timeout(f"deadline exceeded: {url}")
+            kwargs['timeout'] = deadline.clamp(kwargs['timeout'])
+
+        host = urlsplit(url).hostname or 'unknown'
+        url, kwargs['headers'] = resolve_upstream(url, kwargs.get('headers'))
+        start = time.perf_counter()
+        try:
+            response = self.session(session).request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            host_stats.record_request(host, (time.perf_counter() - start) * 1000, error=True)
+            raise
+        host_stats.record_request(host, (time.perf_counter() - start) * 1000,
+                                  error=response.status_code >= 500, status=response.status_code)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """호스트별 지연 시간 / 연결 재사용 통계"""
+        return {
+            'sessions': list(self._sessions),
+            'pool': {
+                'connections': HTTP_CONFIG['POOL_CONNECTIONS'],
+                'maxsize': HTTP_CONFIG['POOL_MAXSIZE']
+            },
+            'hosts': host_stats.get_stats()
+        }
+
+
+http_transport = HTTPTransport()
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """requests.get 대체 (공용 연결 풀 사용)"""
+    return http_transport.get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """requests.post 대체 (공용 연결 풀 사용)"""
+    return http_transport.post(url, **kwargs)
+
+
+def get_session(name: str = 'default') -> requests.Session:
+    """공용 세션 (session.get 을 직접 쓰는 코드용, 통계는 집계되지 않음)"""
+    return http_transport.session(name)
+
+
+def get_stats() -> Dict[str, Any]:
+    """HTTP 통계 (/health 용)"""
+    return http_transport.get_stats()
+
+
+# ========================================
+# HTML 파싱
+# ========================================
+def html_backend(partial: bool = True) -> str:
+    """result="bs" 에 쓸 BeautifulSoup 파서 이름 (partial: only 를 선언한 호출)"""
+    backend = HTML_PARSER_CONFIG['BACKEND' if partial else 'UNPORTED_BACKEND']
+    if backend == 'auto':
+        backend = 'lxml' if is_available('lxml') else 'html.parser'
+    return backend
+
+
+def parse_html(content: Union[bytes, str], only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """응답 본문 → BeautifulSoup (result="bs" 공통, benchmarks/bench_parsers.py 가 같은 경로로 측정)
+
+    바이트로 넘기면 meta charset(EUC-KR 등)을 BeautifulSoup이 판별한다.
+    only(parse_only 결과)를 주면 그 부분 트리만 HTML_PARSER_CONFIG['BACKEND'] 파서로 파싱한다.
+    """
+    return BeautifulSoup(content, html_backend(only is not None), parse_only=only)
+
+
 def request(
     url: str,
     method: str = "get",
@@ -20,49 +352,51 @@ def request(
     headers: Optional[Dict] = None,
     data: Optional[Dict] = None,
     json_data: Optional[Dict] = None,
-    timeout: int = 10
-) -> Optional[Union[str, Dict, BeautifulSoup]]:
+    timeout: Optional[float] = None,
+    raise_for_status: bool = True,
+    only: Optional[SoupStrainer] = None
+) -> Optional[Union[str, bytes, Dict, BeautifulSoup]]:
     """
     통합 HTTP 요청 함수
-    
+
     Args:
         url: 요청 URL
         method: HTTP 메소드 (get/post)
-        result: 응답 형식 (text/json/bs)
+        result: 응답 형식 (text/json/bs/bytes)
         params: URL 파라미터
         headers: 요청 헤더
         data: POST 데이터 (form-data)
         json_data: POST JSON 데이터
-        timeout: 타임아웃 (초)
-    
+        timeout: 타임아웃 (초, 생략 시 호스트별 기본값)
+        raise_for_status: 4xx/5xx 응답을 실패(None)로 처리할지 여부
+        only: result="bs" 에서 파싱할 부분 트리 (parse_only 결과, 생략 시 페이지 전체)
+
     Returns:
         result 타입에 따른 응답 데이터
     """
     try:
         # 기본 헤더 설정
         if headers is None:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        
+            headers = DEFAULT_HEADERS
+
         # 요청 실행
         if method.lower() == "get":
-            response = requests.get(
-                url, 
-                params=params, 
-                headers=headers, 
+            response = http_transport.get(
+                url,
+                params=params,
+                headers=headers,
                 timeout=timeout
             )
         elif method.lower() == "post":
             if json_data:
-                response = requests.post(
+                response = http_transport.post(
                     url,
                     json=json_data,
                     headers=headers,
                     timeout=timeout
                 )
             else:
-                response = requests.post(
+                response = http_transport.post(
                     url,
                     data=data,
                     params=params,
@@ -71,18 +405,23 @@ def request(
                 )
         else:
             raise ValueError(f"Unsupported method: {method}")
-        
+
         # 응답 상태 확인
-        response.raise_for_status()
-        
+        if raise_for_status:
+            response.raise_for_status()
+
         # 결과 형식에 따른 처리
         if result == "json":
             return response.json()
         elif result == "bs":
-            return BeautifulSoup(response.text, 'html.parser')
+            with span("parse", bytes=len(response.content), parser=html_backend(only is not None)):
+                return parse_html(response.content, only)
+        elif result == "bytes":
+            # utils.parse_pool 에서 추출할 원본 본문
+            return response.content
         else:  # text
             return response.text
-            
+
     except requests.exceptions.Timeout:
         debug_logger.error(f"Request timeout: {url}")
         return None
@@ -110,42 +449,37 @@ def fetch_html(url: str, **kwargs) -> Optional[BeautifulSoup]:
 class HTTPClient:
     """
     세션 기반 HTTP 클라이언트
-    쿠키 유지 및 연결 재사용을 위한 클래스
+    쿠키 유지 및 연결 재사용을 위한 클래스 (연결 풀/재시도 설정은 공용 세션과 동일)
     """
-    
+
     def __init__(self, base_url: str = None, default_headers: Dict = None):
-        self.session = requests.Session()
+        self.session = create_session(default_headers)
         self.base_url = base_url
-        
-        # 기본 헤더 설정
-        default_headers = default_headers or {}
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            **default_headers
-        })
-    
+
     def get(self, path: str, **kwargs) -> requests.Response:
         """GET 요청"""
         url = self._build_url(path)
+        kwargs.setdefault('timeout', get_host_timeout(url))
         return self.session.get(url, **kwargs)
-    
+
     def post(self, path: str, **kwargs) -> requests.Response:
         """POST 요청"""
         url = self._build_url(path)
+        kwargs.setdefault('timeout', get_host_timeout(url))
         return self.session.post(url, **kwargs)
-    
+
     def _build_url(self, path: str) -> str:
         """URL 조합"""
         if self.base_url and not path.startswith('http'):
             return f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
         return path
-    
+
     def close(self):
         """세션 종료"""
         self.session.close()
-    
+
     def __enter__(self):
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
\ No newline at end of file
+        self.close()
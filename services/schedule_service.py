@@ -5,10 +5,12 @@
 APScheduler를 사용한 명령어 자동 실행 및 관리
 """
 
+import asyncio
 import os
 import re
 import json
 import sqlite3
+import time
 import uuid
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
@@ -19,8 +21,15 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
 
+from utils.metrics import metrics
+
 logger = logging.getLogger(__name__)
 
+SCHEDULED_JOB_SECONDS = metrics.histogram(
+    'bot_scheduled_job_duration_seconds', '스케줄 작업 실행 시간 (명령어별)', ['command'],
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+
 # 데이터베이스 경로
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'schedules.db')
 CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'schedules.json')
@@ -49,7 +58,11 @@ class ScheduleService:
     def __init__(self):
         self.scheduler: Optional[BackgroundScheduler] = None
         self.pending_messages: List[Dict[str, Any]] = []
+        self.expired_messages = 0   # TTL 안에 수거되지 않아 버려진 메시지 수
         self.lock = Lock()
+        # long-poll 대기자 깨우기 (서버 이벤트 루프의 Event, 스케줄러 스레드에서도 set)
+        self._message_event: Optional[asyncio.Event] = None
+        self._event_loop: Optional[asyncio.AbstractEventLoop] = None
         self._initialized = False
 
     def initialize(self):
@@ -270,6 +283,7 @@ class ScheduleService:
 
     def _execute_scheduled_command(self, job_id: str, room: str, command: str):
         """스케줄된 명령어 실행"""
+        start = time.perf_counter()
         try:
             logger.info(f"스케줄 실행: {job_id} - {command} -> {room}")
 
@@ -280,18 +294,8 @@ class ScheduleService:
             result = get_reply_msg(room, "scheduled", command)
 
             if result:
-                # 대기 메시지에 추가
-                with self.lock:
-                    message_data = {
-                        'room': room,
-                        'message': result,
-                        'job_id': job_id,
-                        'created_at': datetime.now().isoformat()
-                    }
-                    self.pending_messages.append(message_data)
-
-                    # DB에도 저장 (영속성)
-                    self._save_pending_message(room, result, job_id)
+                # 대기 메시지에 추가 (DB에도 저장)
+                self.add_pending_message(room, result, job_id, persist=True)
 
                 logger.info(f"스케줄 실행 완료: {job_id} - 결과 길이: {len(result)}")
 
@@ -303,13 +307,82 @@ class ScheduleService:
 
             # 에러 메시지도 전송
             error_msg = f"⚠️ 스케줄 실행 오류\n명령어: {command}\n오류: {str(e)}"
-            with self.lock:
-                self.pending_messages.append({
-                    'room': room,
-                    'message': error_msg,
-                    'job_id': job_id,
-                    'created_at': datetime.now().isoformat()
-                })
+            self.add_pending_message(room, error_msg, job_id)
+        finally:
+            SCHEDULED_JOB_SECONDS.labels(command.split()[0] if command.split() else "").observe(
+                time.perf_counter() - start)
+
+    def add_pending_message(self, room: str, message: str, job_id: str,
+                            ttl: Optional[float] = None, persist: bool = False):
+        """대기 메시지 추가 (/api/poll 로 전달)
+
+        Args:
+            ttl: 이 시간(초) 안에 수거되지 않으면 버림 (None 이면 만료 없음)
+            persist: DB 에도 저장 (스케줄 메시지)
+        """
+        message_data = {
+            'room': room,
+            'message': message,
+            'job_id': job_id,
+            'created_at': datetime.now().isoformat(),
+            'persisted': persist
+        }
+        if ttl is not None:
+            message_data['expires_at'] = time.time() + ttl
+
+        with self.lock:
+            self.pending_messages.append(message_data)
+            if persist:
+                self._save_pending_message(room, message, job_id)
+        self._notify_waiters()
+
+    def _notify_waiters(self):
+        """long-poll 대기자 깨우기 (어느 스레드에서든 호출 가능)"""
+        loop, event = self._event_loop, self._message_event
+        if loop is None or event is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            event.set()
+        else:
+            loop.call_soon_threadsafe(event.set)
+
+    async def wait_for_pending_messages(self, hold: float, room: str = None) -> List[Dict]:
+        """대기 메시지가 생길 때까지 최대 hold 초 기다렸다가 반환 (long-poll)
+
+        이미 메시지가 있으면 바로 반환하고, 시간 안에 메시지가 없으면 빈 목록.
+        """
+        loop = asyncio.get_running_loop()
+        if self._event_loop is not loop:
+            self._message_event = asyncio.Event()
+            self._event_loop = loop
+        event = self._message_event
+
+        deadline = loop.time() + hold
+        while True:
+            # 확인 전에 clear - 확인과 대기 사이에 들어온 메시지도 놓치지 않음
+            event.clear()
+            messages = self.get_pending_messages(room)
+            remaining = deadline - loop.time()
+            if messages or remaining <= 0:
+                return messages
+            try:
+                await asyncio.wait_for(event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return []
+
+    def _drop_expired_messages(self):
+        """TTL 이 지난 대기 메시지 제거 (self.lock 안에서 호출)"""
+        now = time.time()
+        alive = [m for m in self.pending_messages if m.get('expires_at', now) >= now]
+        expired = len(self.pending_messages) - len(alive)
+        if expired:
+            self.expired_messages += expired
+            self.pending_messages = alive
+            logger.info(f"수거되지 않은 대기 메시지 {expired}개 만료")
 
     def _save_pending_message(self, room: str, message: str, job_id: str):
         """대기 메시지 DB 저장"""
@@ -507,8 +580,9 @@ class ScheduleService:
         return [dict(row) for row in rows]
 
     def get_pending_messages(self, room: str = None) -> List[Dict]:
-        """대기 메시지 조회 및 반환 (polling용)"""
+        """대기 메시지 조회 및 반환 (polling용, TTL 이 지난 메시지는 제외)"""
         with self.lock:
+            self._drop_expired_messages()
             if room:
                 messages = [m for m in self.pending_messages if m['room'] == room]
                 self.pending_messages = [m for m in self.pending_messages if m['room'] != room]
@@ -516,9 +590,10 @@ class ScheduleService:
                 messages = self.pending_messages.copy()
                 self.pending_messages.clear()
 
-            # DB에서도 delivered 표시
+            # DB에서도 delivered 표시 (DB 에 저장된 메시지만)
             if messages:
-                self._mark_messages_delivered([m.get('job_id') for m in messages if m.get('job_id')])
+                self._mark_messages_delivered([m.get('job_id') for m in messages
+                                               if m.get('job_id') and m.get('persisted', True)])
 
             return messages
 
@@ -6,11 +6,13 @@
 """
 
 import urllib.parse
-import requests
+from services import http_service
 from bs4 import BeautifulSoup
 import re
 from datetime import datetime
 
+from utils.symbol_index import symbol_index
+
 def stock_improved(room: str, sender: str, msg: str):
     """개선된 주식 정보 조회 - 네이버 증권 실시간 데이터"""
     
@@ -19,74 +21,14 @@ def stock_improved(room: str, sender: str, msg: str):
         return "📊 사용법: /주식 삼성전자"
     
     try:
-        # 종목 코드 매핑 (자주 검색되는 종목들)
-        stock_mapping = {
-            '삼성전자': '005930',
-            '삼전': '005930',
-            'sk하이닉스': '000660',
-            'SK하이닉스': '000660',
-            '하이닉스': '000660',
-            'NAVER': '035420',
-            '네이버': '035420',
-            '카카오': '035720',
-            'LG에너지솔루션': '373220',
-            'LG에너지': '373220',
-            '현대차': '005380',
-            '현대자동차': '005380',
-            '기아': '000270',
-            '기아자동차': '000270',
-            'SK': '034730',
-            'SK이노베이션': '096770',
-            'SK텔레콤': '017670',
-            'LG화학': '051910',
-            'LG전자': '066570',
-            '포스코': '005490',
-            'POSCO': '005490',
-            '삼성바이오로직스': '207940',
-            '삼성바이오': '207940',
-            '셀트리온': '068270',
-            '삼성SDI': '006400',
-            '현대모비스': '012330',
-            'KB금융': '105560',
-            '신한지주': '055550',
-            '하나금융지주': '086790',
-            '삼성생명': '032830',
-            '삼성화재': '000810',
-            '삼성물산': '028260',
-            'CJ제일제당': '097950',
-            'CJ': '097950',
-            '롯데케미칼': '011170',
-            '한국전력': '015760',
-            '한전': '015760',
-            'KT': '030200',
-            'KT&G': '033780',
-            '대한항공': '003490',
-            '아시아나항공': '020560',
-            '아시아나': '020560',
-            '제주항공': '089590'
-        }
-        
-        # 종목 코드 확인
+        # 종목명/별칭/초성 → 종목코드 (KRX 종목 인덱스, 6자리 숫자는 종목코드로 그대로 사용, 접두어/오타는 후보 안내)
         stock_code = None
         stock_name = keyword
+        symbol = symbol_index.resolve(keyword)
+        if symbol:
+            stock_code, stock_name = symbol.code, symbol.name
         
-        # 입력이 종목 코드인지 확인 (6자리 숫자)
-        if keyword.isdigit() and len(keyword) == 6:
-            stock_code = keyword
-            stock_name = keyword
-        # 매핑된 종목명인지 확인
-        elif keyword in stock_mapping:
-            stock_code = stock_mapping[keyword]
-            stock_name = keyword
-        # 대소문자 구분 없이 매핑 확인
-        else:
-            for key, value in stock_mapping.items():
-                if key.lower() == keyword.lower():
-                    stock_code = value
-                    stock_name = key
-                    break
-        
-        # 종목 코드를 찾지 못한 경우 네이버 검색 시도
+        # 인덱스에서 정하지 못한 경우 네이버 검색 시도 (데이터 파일 갱신 전 신규 상장 등)
         if not stock_code:
             encoded_keyword = urllib.parse.quote(keyword)
             search_url = f"https://finance.naver.com/search/searchList.naver?query={encoded_keyword}"
@@ -97,7 +39,7 @@ def stock_improved(room: str, sender: str, msg: str):
             }
             
             try:
-                response = requests.get(search_url, headers=headers, timeout=5)
+                response = http_service.get(search_url, headers=headers, timeout=5)
                 response.encoding = 'euc-kr'
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
@@ -111,7 +53,7 @@ def stock_improved(room: str, sender: str, msg: str):
                 pass
         
         if not stock_code:
-            return f"❌ '{keyword}' 종목을 찾을 수 없습니다.\n\n💡 정확한 종목명이나 종목코드를 입력해주세요.\n예) /주식 삼성전자, /주식 005930"
+            return symbol_index.not_found_message(keyword)
         
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -120,7 +62,7 @@ def stock_improved(room: str, sender: str, msg: str):
         
         # 종목 상세 페이지에서 정보 추출
         detail_url = f"https://finance.naver.com/item/main.naver?code={stock_code}"
-        detail_response = requests.get(detail_url, headers=headers)
+        detail_response = http_service.get(detail_url, headers=headers)
         detail_response.encoding = 'euc-kr'
         detail_soup = BeautifulSoup(detail_response.text, 'html.parser')
         
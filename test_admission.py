@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+요청 허용(admission control) 테스트 스크립트
+- 토큰 버킷 burst / 충전
+- 방 / 사용자 / 카테고리별 제한, 거절된 요청은 토큰을 쓰지 않음
+- 전역 동시 실행 수 제한
+- 허용/거절 통계
+"""
+
+import time
+
+from core.admission import (REASON_CATEGORY, REASON_CONCURRENCY, REASON_ROOM, REASON_SENDER,
+                            AdmissionController, TokenBucket)
+
+
+def test_token_bucket_refill():
+    """burst 만큼 연속 허용, 이후 rate 속도로 충전"""
+    bucket = TokenBucket(rate=20, burst=3)
+    for _ in range(3):
+        assert bucket.peek()
+        bucket.take()
+    assert not bucket.peek()
+    time.sleep(0.06)
+    assert bucket.peek()
+
+
+def test_sender_and_room_limits():
+    """사용자 제한은 방+사용자 단위, 방 제한은 방 안의 모든 사용자 합계"""
+    admission = AdmissionController({
+        'ROOM': {'rate': 0.01, 'burst': 4},
+        'SENDER': {'rate': 0.01, 'burst': 2},
+    })
+    assert admission.admit("방A", "철수") is None
+    assert admission.admit("방A", "철수") is None
+    assert admission.admit("방A", "철수") == REASON_SENDER
+
+    # 다른 사용자는 영향 없음, 방 전체 burst(4)를 넘으면 방 제한
+    assert admission.admit("방A", "영희") is None
+    assert admission.admit("방A", "영희") is None
+    assert admission.admit("방A", "민수") == REASON_ROOM
+
+    # 다른 방은 영향 없음
+    assert admission.admit("방B", "철수") is None
+
+    stats = admission.get_stats()
+    assert stats['admitted'] == 5
+    assert stats['rejected'] == {REASON_SENDER: 1, REASON_ROOM: 1}
+    assert stats['rejected_by_room'] == {"방A": 2}
+
+
+def test_category_limit_keeps_tokens():
+    """카테고리 제한에 걸린 요청은 방/사용자 토큰을 쓰지 않음"""
+    admission = AdmissionController({
+        'SENDER': {'rate': 0.01, 'burst': 2},
+        'CATEGORY': {'AI': {'rate': 0.01, 'burst': 1}},
+    })
+    assert admission.admit("방", "철수", "AI") is None
+    assert admission.admit("방", "철수", "AI") == REASON_CATEGORY
+    # 사용자 토큰이 하나 남아 있어 다른 카테고리는 허용
+    assert admission.admit("방", "철수", "정보") is None
+    assert admission.get_stats()['rejected_by_category'] == {"AI": 1}
+
+
+def test_concurrency_cap():
+    """동시 실행 수가 상한이면 바로 거절 (대기하지 않음)"""
+    admission = AdmissionController({'MAX_CONCURRENT': 2})
+    with admission.running(), admission.running():
+        assert admission.admit("방", "철수") == REASON_CONCURRENCY
+    assert admission.admit("방", "철수") is None
+    stats = admission.get_stats()
+    assert stats['in_flight'] == 0 and stats['max_in_flight'] == 2
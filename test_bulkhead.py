@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+벌크헤드 실행 풀 테스트 스크립트
+- overflow=reject: 자리가 없으면 PoolFull
+- overflow=wait: 자리가 날 때까지 대기
+- 인라인(local) 풀은 이벤트 루프 스레드에서 실행
+- 느린 풀이 다른 풀의 처리를 막지 않음
+- 우선순위 대기열 (관리자 fast lane, aging)
+- 명령어별 풀/우선순위 설정 (command_manager)
+"""
+
+import asyncio
+import threading
+import time
+
+from core.bulkhead import BulkheadPool, BulkheadScheduler, PoolFull
+
+
+def test_reject_when_full():
+    """worker 1 + 대기열 1 이 차면 세 번째 작업은 즉시 거절"""
+    pool = BulkheadPool("browser", max_workers=1, max_queue=1, overflow="reject")
+
+    async def run():
+        return await asyncio.gather(
+            *[pool.run(time.sleep, 0.2) for _ in range(3)], return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    pool.shutdown()
+
+    rejected = [r for r in results if isinstance(r, PoolFull)]
+    assert len(rejected) == 1, results
+    stats = pool.get_stats()
+    assert stats['rejected'] == 1
+    assert stats['completed'] == 2
+    assert stats['queue_depth'] == 0 and stats['running'] == 0
+    assert stats['max_wait_ms'] >= 150, stats
+
+
+def test_wait_when_full():
+    """overflow=wait 면 자리가 날 때까지 기다렸다가 모두 실행"""
+    pool = BulkheadPool("scrape", max_workers=1, max_queue=0, overflow="wait")
+
+    async def run():
+        return await asyncio.gather(*[pool.run(lambda i=i: i) for i in range(5)])
+
+    assert asyncio.run(run()) == [0, 1, 2, 3, 4]
+    pool.shutdown()
+    stats = pool.get_stats()
+    assert stats['completed'] == 5 and stats['rejected'] == 0
+    assert stats['queue_depth'] == 0
+
+
+def test_inline_pool():
+    """max_workers=0 풀은 스레드 없이 이벤트 루프에서 바로 실행"""
+    pool = BulkheadPool("local", max_workers=0)
+
+    async def run():
+        return await pool.run(threading.get_ident), threading.get_ident()
+
+    ran_on, loop_thread = asyncio.run(run())
+    assert ran_on == loop_thread
+    assert pool.get_stats()['inline'] is True
+
+
+def test_slow_pool_does_not_starve_others():
+    """브라우저 풀이 모두 사용 중이어도 스크래핑 풀은 바로 실행"""
+    scheduler = BulkheadScheduler({
+        'browser': {'max_workers': 1, 'max_queue': 4, 'overflow': 'wait'},
+        'scrape': {'max_workers': 2, 'max_queue': 4, 'overflow': 'wait'},
+    }, default='scrape')
+
+    async def run():
+        slow = [asyncio.ensure_future(scheduler.run('browser', time.sleep, 0.5)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        await scheduler.run('scrape', time.sleep, 0.01)
+        elapsed = time.perf_counter() - start
+        await asyncio.gather(*slow)
+        return elapsed
+
+    elapsed = asyncio.run(run())
+    scheduler.shutdown()
+    assert elapsed < 0.2, f"{elapsed:.2f}s"
+    # 알 수 없는 풀 이름은 기본 풀
+    assert scheduler.pool('unknown') is scheduler.pools['scrape']
+
+
+def _run_order(pool, jobs):
+    """worker 를 하나 점유한 상태에서 (이름, 우선순위, 지연) 작업을 넣고 실행 순서 반환"""
+    order = []
+
+    async def run():
+        blocker = asyncio.ensure_future(pool.run(time.sleep, 0.1))
+        await asyncio.sleep(0.01)
+        tasks = []
+        for name, priority, delay in jobs:
+            await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(pool.run(order.append, name, priority=priority)))
+        await asyncio.gather(blocker, *tasks)
+
+    asyncio.run(run())
+    return order
+
+
+def test_priority_order():
+    """대기열은 FIFO 가 아니라 우선순위 순서, priority 0 은 가득 차도 거절하지 않음"""
+    pool = BulkheadPool("llm", max_workers=1, max_queue=2, overflow="reject", aging_seconds=10)
+    order = _run_order(pool, [("ai-1", 3, 0), ("ai-2", 3, 0), ("admin", 0, 0)])
+    pool.shutdown()
+
+    assert order == ["admin", "ai-1", "ai-2"], order
+    stats = pool.get_stats()
+    assert stats['rejected'] == 0
+    assert {0, 3} <= set(stats['wait_by_priority'])
+    assert stats['wait_by_priority'][3]['count'] == 2
+
+
+def test_priority_aging():
+    """오래 기다린 낮은 우선순위 작업은 나중에 온 높은 우선순위 작업보다 먼저"""
+    pool = BulkheadPool("scrape", max_workers=1, max_queue=8, overflow="wait", aging_seconds=0.02)
+    # low 는 0.05초 먼저 들어와 두 단계 이상 올라감
+    order = _run_order(pool, [("low", 3, 0), ("high", 1, 0.05)])
+    pool.shutdown()
+    assert order == ["low", "high"], order
+
+
+def test_command_pools():
+    """명령어별 풀 지정 (지정하지 않으면 기본 풀)"""
+    from command_manager import DEFAULT_POOL, POOL_ADMIN, POOL_LLM, POOL_LOCAL, command_manager
+
+    assert command_manager.commands["?"].pool == POOL_LLM
+    assert command_manager.commands["/로또"].pool == POOL_LOCAL
+    assert command_manager.commands["/방추가"].pool == POOL_ADMIN
+    assert command_manager.commands["/주식"].pool == DEFAULT_POOL
+
+
+def test_command_priority():
+    """명령어 우선순위 - 관리자 요청 > 공유 캐시 조회 > 기본 > AI"""
+    import config
+    from command_manager import (PRIORITY_ADMIN, PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL,
+                                 get_command_priority)
+
+    admin = config.BOT_CONFIG["ADMIN_USERS"][0]
+    assert get_command_priority("?날씨 어때", admin) == PRIORITY_ADMIN
+    assert get_command_priority("/캐시초기화", "사용자") == PRIORITY_ADMIN
+    assert get_command_priority("/환율", "사용자") == PRIORITY_HIGH
+    assert get_command_priority("/운세", "사용자") == PRIORITY_NORMAL
+    assert get_command_priority("?날씨 어때", "사용자") == PRIORITY_LOW
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+응답 캐시 엔진 테스트 스크립트
+외부 의존성 없이 cache_manager (ResponseCache, InflightRegistry) 동작 확인
+command_manager 캐시 키: 명령어별 범위 (global / room / sender / none), 공백/별칭 정규화
+"""
+
+import asyncio
+import time
+
+from cache_manager import InflightRegistry, ResponseCache
+
+
+def test_get_put_and_stats():
+    """저장/조회 및 명령어별 히트/미스 카운터"""
+    cache = ResponseCache(max_entries=10)
+    assert cache.get("k1", command="/환율") is None
+    cache.put("k1", "값", ttl=60, command="/환율")
+    assert cache.get("k1", command="/환율") == "값"
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 1 and stats['misses'] == 1
+    assert stats['by_command']['/환율'] == {
+        'hits': 1, 'stale_hits': 0, 'misses': 1, 'evictions': 0, 'entries': 1
+    }
+
+
+def test_zero_ttl_not_cached():
+    """TTL 0 명령어는 저장하지 않음"""
+    cache = ResponseCache()
+    cache.put("ai", "답변", ttl=0, command="?")
+    assert len(cache) == 0
+
+
+def test_lru_eviction_by_entries():
+    """항목 수 초과 시 가장 오래 사용되지 않은 항목 제거"""
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", "1", ttl=60, command="/a")
+    cache.put("b", "2", ttl=60, command="/b")
+    cache.get("a")  # a를 최근 사용으로 갱신
+    cache.put("c", "3", ttl=60, command="/c")
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_eviction_by_bytes():
+    """바이트 한도 초과 시 제거"""
+    cache = ResponseCache(max_entries=100, max_bytes=40)
+    cache.put("a", "가" * 5, ttl=60)   # 15 + 1 bytes
+    cache.put("b", "나" * 5, ttl=60)
+    cache.put("c", "다" * 5, ttl=60)
+    assert len(cache) == 2
+    assert cache.get_stats()['bytes'] <= 40
+
+
+def test_ttl_expiry_and_purge():
+    """TTL 만료 후 조회 실패 및 백그라운드 정리"""
+    cache = ResponseCache()
+    cache.put("short", "x", ttl=0.05, command="/주식")
+    cache.put("long", "y", ttl=60, command="/명언")
+    time.sleep(0.1)
+
+    # 만료되어도 폴백용 peek은 가능
+    assert cache.peek("short") is not None
+    assert cache.purge_expired() == 1
+    assert cache.get("short") is None
+    assert cache.get("long") == "y"
+
+
+def test_stale_while_revalidate():
+    """soft TTL 이후 hard TTL 까지는 stale로 조회 가능"""
+    cache = ResponseCache()
+    cache.put("k", "v", ttl=0.05, stale_ttl=60, command="/실시간뉴스")
+    assert cache.lookup("k") == ("v", "fresh")
+    time.sleep(0.1)
+
+    # get()은 fresh만 반환하지만 항목은 폴백용으로 남아 있음
+    assert cache.get("k") is None
+    assert cache.lookup("k") == ("v", "stale")
+    assert cache.purge_expired() == 0
+    assert cache.get_stats()['stale_hits'] == 1
+
+
+def test_reput_keeps_new_ttl():
+    """재저장된 항목은 이전 만료 시각으로 제거되지 않음"""
+    cache = ResponseCache()
+    cache.put("k", "old", ttl=0.05)
+    cache.put("k", "new", ttl=60)
+    time.sleep(0.1)
+    assert cache.purge_expired() == 0
+    assert cache.get("k") == "new"
+
+
+def test_inflight_coalescing():
+    """동시 동일 요청은 작업 1회만 실행"""
+    registry = InflightRegistry()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "결과"
+
+    async def burst():
+        return await asyncio.gather(*[
+            registry.run("/환율", work, command="/환율") for _ in range(10)
+        ])
+
+    results = asyncio.run(burst())
+    assert results == ["결과"] * 10
+    assert len(calls) == 1
+    stats = registry.get_stats()
+    assert stats['executed'] == 1 and stats['coalesced'] == 9
+    assert stats['in_flight'] == 0
+
+
+def test_inflight_error_shared():
+    """작업 실패 시 모든 대기자에게 예외 전달 후 레지스트리 정리"""
+    registry = InflightRegistry()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("실패")
+
+    async def burst():
+        return await asyncio.gather(
+            *[registry.run("k", fail) for _ in range(3)],
+            return_exceptions=True
+        )
+
+    results = asyncio.run(burst())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(registry) == 0
+
+
+def test_cache_key_scopes():
+    """sender 범위는 사용자별, global 범위는 방/사용자와 관계없이 공유, none 은 캐시하지 않음"""
+    from command_manager import get_cache_key
+
+    # /운세 (sender) - 같은 방이라도 사용자가 다르면 다른 키
+    mine = get_cache_key("방", "철수", "/운세")
+    assert mine == get_cache_key("방", "철수", "/운세")
+    assert mine != get_cache_key("방", "영희", "/운세")
+    assert mine != get_cache_key("다른방", "철수", "/운세")
+
+    # /주식 (global) - 모든 방/사용자가 같은 키
+    shared = get_cache_key("방", "철수", "/주식 삼성전자")
+    assert shared == get_cache_key("다른방", "영희", "/주식 삼성전자") == "global:/주식 삼성전자"
+    assert shared != get_cache_key("방", "철수", "/주식 카카오")
+
+    # room 범위 - 방 안에서만 공유
+    assert get_cache_key("방", "철수", "/주식 삼성전자", scope="room") == \
+        get_cache_key("방", "영희", "/주식 삼성전자", scope="room") != \
+        get_cache_key("다른방", "철수", "/주식 삼성전자", scope="room")
+
+    # none - 캐시하지 않음 (AI 대화, 명시적 범위)
+    assert get_cache_key("방", "철수", "?오늘 저녁 뭐 먹지") is None
+    assert get_cache_key("방", "철수", "/주식 삼성전자", scope="none") is None
+
+
+def test_cache_key_normalization():
+    """연속 공백은 하나로, 별칭은 대표 명령어로 (alias 규칙이 있는 명령어만)"""
+    from command_manager import get_cache_key, normalize_message
+
+    assert normalize_message("  /주식   삼성전자 ") == "/주식 삼성전자"
+    assert get_cache_key("방", "철수", "/주식  삼성전자") == get_cache_key("방", "철수", "/주식 삼성전자")
+
+    assert normalize_message("/가이드") == normalize_message("/도움말") == "/명령어"
+    assert get_cache_key("방", "철수", "/가이드") == get_cache_key("방", "철수", "/명령어")
+    # alias 규칙이 없는 명령어(별자리마다 결과가 다름)는 별칭을 그대로 둠
+    assert normalize_message("/양자리") == "/양자리"
+    assert get_cache_key("방", "철수", "/양자리") != get_cache_key("방", "철수", "/물병자리")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+명령어 마감 시간(deadline) 테스트 스크립트
+- 남은 시간으로 타임아웃 제한, 마감 후 HTTP 요청 중단
+- 마감 후에도 0(무제한) 타임아웃을 넘기지 않음 (Google SDK, Playwright)
+- 타임아웃된 명령어: async 작업 취소, executor 대기 작업 건너뛰기
+- 포기된 작업 통계 (abandoned_work)
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from core.dispatch import Route
+from utils.deadline import MIN_TIMEOUT, Deadline, abandoned_work, deadline_scope, remaining_timeout, sdk_request_options
+
+
+def test_clamp_to_remaining():
+    """타임아웃은 남은 시간 이내로 (튜플/None 포함)"""
+    deadline = Deadline(1.0)
+    assert deadline.clamp(10) <= 1.0
+    assert deadline.clamp(0.5) == 0.5
+    connect, read = deadline.clamp((3.05, 10))
+    assert connect <= 1.0 and read <= 1.0
+    assert deadline.clamp(None) <= 1.0
+
+    assert remaining_timeout(5) == 5
+    with deadline_scope(deadline):
+        assert remaining_timeout(5) <= 1.0
+    assert remaining_timeout(5) == 5
+
+
+def test_http_stops_after_deadline():
+    """마감 후에는 HTTP 요청을 보내지 않고 Timeout"""
+    from services import http_service
+
+    abandoned_work.reset()
+    deadline = Deadline(0.5, name="/환율")
+    deadline.cancel()
+    with deadline_scope(deadline):
+        try:
+            http_service.get("http://127.0.0.1:9/")
+            assert False, "Timeout 이 발생해야 함"
+        except requests.exceptions.Timeout:
+            pass
+        # request() 는 기존처럼 None 반환
+        assert http_service.request("http://127.0.0.1:9/") is None
+
+    stats = abandoned_work.get_stats()
+    assert stats['stopped_early'] == 2
+    assert stats['by_command']['/환율']['stopped_early'] == 2
+
+
+def test_expired_deadline_not_unlimited():
+    """마감 후 SDK 타임아웃은 0 이 아닌 최소값, Playwright 크롤링은 브라우저를 쓰지 않음"""
+    import fn
+
+    deadline = Deadline(0.01, name="/뉴스")
+    time.sleep(0.02)
+    with deadline_scope(deadline):
+        assert sdk_request_options() == {'timeout': MIN_TIMEOUT}
+
+    pages = []
+    original = fn.get_playwright_page
+    fn.get_playwright_page = lambda: pages.append(1)
+    try:
+        with deadline_scope(deadline):
+            assert fn._fetch_with_playwright("https://n.news.naver.com/article/1") == (None, None)
+    finally:
+        fn.get_playwright_page = original
+    assert not pages
+
+
+def _run_with_timeout(router, executor, command: str, timeout: float, count: int):
+    """main_improved.execute_command 와 같은 방식으로 실행 (wait_for + 타임아웃 시 cancel)"""
+    async def one():
+        deadline = Deadline(timeout, name=command)
+        try:
+            return await asyncio.wait_for(
+                router.get_reply_msg_async("방", "사용자", command, executor=executor, deadline=deadline),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            deadline.cancel()
+            return "timeout"
+
+    async def run():
+        return await asyncio.gather(*[one() for _ in range(count)])
+
+    return asyncio.run(run())
+
+
+def test_abandoned_sync_work_skipped():
+    """타임아웃된 동기 작업 - 실행 중이던 것은 finished_late, 대기 중이던 것은 건너뜀"""
+    from core import router
+
+    calls = []
+
+    def slow(room, sender, msg):
+        calls.append(msg)
+        time.sleep(0.3)
+        return "늦은 응답"
+
+    router.dispatch_engine.add_exact("/느린동기", Route("/느린동기", slow))
+    abandoned_work.reset()
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    results = _run_with_timeout(router, executor, "/느린동기", 0.1, 3)
+    executor.shutdown(wait=True)
+
+    assert results == ["timeout"] * 3
+    assert len(calls) == 1, calls
+    stats = abandoned_work.get_stats()
+    assert stats['finished_late'] == 1 and stats['skipped'] == 2, stats
+    assert stats['wasted_ms'] > 100
+
+
+def test_abandoned_async_work_cancelled():
+    """타임아웃된 async 작업은 즉시 취소"""
+    from core import router
+
+    finished = []
+
+    async def slow(room, sender, msg):
+        await asyncio.sleep(0.3)
+        finished.append(msg)
+        return "늦은 응답"
+
+    router.dispatch_engine.add_exact("/느린비동기", Route("/느린비동기", slow))
+    abandoned_work.reset()
+
+    start = time.perf_counter()
+    results = _run_with_timeout(router, None, "/느린비동기", 0.1, 5)
+    elapsed = time.perf_counter() - start
+
+    assert results == ["timeout"] * 5
+    assert finished == []
+    assert elapsed < 0.3, f"{elapsed:.2f}s"
+    assert abandoned_work.get_stats()['cancelled'] == 5
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+지연 응답(deferred reply) 테스트 스크립트
+- 작업 큐: 같은 작업 합치기, 결과를 요청한 모든 방에 전달, 동시 실행 수 제한
+- 대기 메시지 TTL (schedule_service)
+- 서버 경로: 오래 걸리는 명령어는 접수 응답 후 /api/poll 로 결과 전달
+"""
+
+import asyncio
+import time
+
+from core.deferred import FAILED_MESSAGE, STATUS_DONE, DeferredJobQueue
+
+
+def test_job_dedup_and_delivery():
+    """같은 key 의 작업은 한 번만 실행하고 결과를 요청한 방마다 전달"""
+    delivered = []
+    calls = []
+    jobs = DeferredJobQueue(deliver=lambda *args: delivered.append(args), result_ttl=30)
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "결과"
+
+    async def run():
+        first, is_new = jobs.submit("key", "방A", work)
+        second, joined_new = jobs.submit("key", "방B", work)
+        assert is_new and not joined_new
+        assert first is second and "key" in jobs
+        await first.task
+        return first
+
+    job = asyncio.run(run())
+    assert calls == [1]
+    assert job.status == STATUS_DONE
+    assert delivered == [("방A", "결과", job.job_id, 30), ("방B", "결과", job.job_id, 30)]
+    stats = jobs.get_stats()
+    assert stats['submitted'] == 1 and stats['deduplicated'] == 1 and stats['completed'] == 1
+    assert "key" not in jobs
+
+
+def test_job_failure_and_limit():
+    """실패한 작업은 안내 메시지 전달, 동시 실행 수는 max_running 이하"""
+    delivered = []
+    jobs = DeferredJobQueue(deliver=lambda *args: delivered.append(args), max_running=2)
+    peak = []
+
+    async def work():
+        peak.append(jobs.running)
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    async def broken():
+        raise RuntimeError("크롤링 실패")
+
+    async def run():
+        submitted = [jobs.submit(f"key{i}", "방", work)[0] for i in range(5)]
+        submitted.append(jobs.submit("broken", "방", broken)[0])
+        await asyncio.gather(*[job.task for job in submitted])
+
+    asyncio.run(run())
+    assert max(peak) <= 2, peak
+    assert [args[1] for args in delivered].count(FAILED_MESSAGE) == 1
+    assert jobs.get_stats()['failed'] == 1
+
+
+def test_pending_message_ttl():
+    """TTL 안에 수거되지 않은 대기 메시지는 버림"""
+    from services.schedule_service import ScheduleService
+
+    service = ScheduleService()
+    service.add_pending_message("방", "만료됨", "job1", ttl=0.01)
+    service.add_pending_message("방", "유지됨", "job2", ttl=60)
+    time.sleep(0.02)
+
+    messages = service.get_pending_messages()
+    assert [m['message'] for m in messages] == ["유지됨"]
+    assert service.expired_messages == 1
+
+
+def test_long_command_deferred():
+    """오래 걸리는 명령어는 바로 접수 응답, 결과는 대기 메시지로"""
+    import main_improved
+    from core import router
+    from core.dispatch import Route
+    from services.schedule_service import schedule_service
+
+    def slow(room, sender, msg):
+        time.sleep(0.1)
+        return "요약 결과"
+
+    router.dispatch_engine.add_exact("/느린요약", Route("/느린요약", slow))
+
+    async def run():
+        start = time.perf_counter()
+        ack = await main_improved.get_reply_with_timeout("방", "사용자", "/느린요약", timeout=12)
+        again = await main_improved.get_reply_with_timeout("방", "사용자", "/느린요약", timeout=12)
+        elapsed = time.perf_counter() - start
+        job_id = ack.rsplit(": ", 1)[1].rstrip(")")
+        pending = [job.task for job in main_improved.deferred_jobs._inflight.values() if job.job_id == job_id]
+        await asyncio.gather(*pending)
+        return ack, again, elapsed, job_id
+
+    ack, again, elapsed, job_id = asyncio.run(run())
+    assert elapsed < 0.1, f"{elapsed:.2f}s"
+    assert "접수" in ack and "이미 처리" in again and job_id in again
+
+    messages = [m for m in schedule_service.get_pending_messages("방") if m['job_id'] == job_id]
+    assert [m['message'] for m in messages] == ["요약 결과"]
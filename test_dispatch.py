@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+디스패치 엔진 테스트 스크립트
+core.dispatch (정확 일치 → 접두사 트라이 → 패턴) 매칭 우선순위 확인
+core.registry (핸들러 지연 로딩) 확인
+core.router async 핸들러 실행 (이벤트 루프에서 await, 동기 호출 브릿지)
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.dispatch import DispatchEngine, Route
+from core.registry import HandlerRegistry
+
+
+def _engine():
+    engine = DispatchEngine()
+    engine.add_exact("/운세", Route("/운세", "fortune_today"))
+    engine.add_prefix("/운세", Route("/운세", "fortune"))
+    engine.add_prefix("/로또", Route("/로또", "lotto"))
+    engine.add_prefix("/로또결과", Route("/로또결과", "lotto_result"))
+    engine.add_prefix("/스케줄", Route("/스케줄", "schedule_add", admin_only=True))
+    engine.add_pattern(Route("로또", "lotto", predicate=lambda m: "로또" in m))
+    engine.add_pattern(Route("인사", "greeting", predicate=lambda m: "안녕" in m))
+    return engine
+
+
+def test_exact_before_prefix():
+    """정확 일치가 같은 이름의 접두사 라우트보다 우선"""
+    engine = _engine()
+    assert engine.match("/운세").handler == "fortune_today"
+    assert engine.match("/운세 1990").handler == "fortune"
+
+
+def test_longest_prefix():
+    """가장 긴 접두사 우선"""
+    engine = _engine()
+    assert engine.match("/로또결과 1100").handler == "lotto_result"
+    assert engine.match("/로또").handler == "lotto"
+
+
+def test_admin_only_falls_through():
+    """관리자 전용 라우트는 일반 사용자에게는 건너뛰고 다음 후보로"""
+    engine = _engine()
+    assert engine.match("/스케줄 매일 09:00", is_admin=True).handler == "schedule_add"
+    assert engine.match("/스케줄 매일 09:00") is None
+    assert engine.match("/스케줄 안녕", is_admin=False).handler == "greeting"
+
+
+def test_patterns_in_order():
+    """패턴은 등록 순서대로 평가, 매칭 없으면 None"""
+    engine = _engine()
+    assert engine.match("안녕 로또 샀어?").handler == "lotto"
+    assert engine.match("안녕하세요").handler == "greeting"
+    assert engine.match("ㅋㅋㅋ") is None
+
+
+def test_registry_loads_on_first_call():
+    """핸들러 모듈은 첫 호출 때 한 번만 로딩"""
+    loads = []
+
+    def loader(name):
+        loads.append(name)
+        return lambda room, sender, msg: f"{name}:{msg}"
+
+    registry = HandlerRegistry(loader)
+    handler = registry.get("exchange")
+    assert registry.get("exchange") is handler
+    assert loads == [] and not handler.loaded
+
+    assert handler("방", "사용자", "/환율") == "exchange:/환율"
+    assert handler("방", "사용자", "/환율") == "exchange:/환율"
+    assert loads == ["exchange"]
+    assert registry.get_stats()['loaded'] == 1
+
+
+def test_registry_load_failure_retries():
+    """로딩 실패 시 대체 응답 후 다음 호출에서 다시 시도"""
+    attempts = []
+
+    def loader(name):
+        attempts.append(name)
+        if len(attempts) == 1:
+            raise ImportError("모듈 없음")
+        return lambda room, sender, msg: "ok"
+
+    handler = HandlerRegistry(loader).get("schedule_add")
+    assert handler("방", "사용자", "/스케줄") == "스케줄 기능을 사용할 수 없습니다."
+    assert handler("방", "사용자", "/스케줄") == "ok"
+    assert len(attempts) == 2
+
+
+def test_registry_detects_async_handler():
+    """async def 핸들러는 로딩 후 is_async"""
+    async def handler(room, sender, msg):
+        return msg
+
+    registry = HandlerRegistry(lambda name: handler if name == "coin" else (lambda *args: "sync"))
+    coin, exchange = registry.get("coin"), registry.get("exchange")
+    coin.load()
+    exchange.load()
+    assert coin.is_async and not exchange.is_async
+    assert registry.get_stats()['async'] == 1
+
+
+def _add_sleep_route(command: str, delay: float):
+    """테스트용 async 라우트 (delay 초 대기 후 응답)"""
+    from core import router
+
+    async def handler(room, sender, msg):
+        await asyncio.sleep(delay)
+        return f"done:{msg}"
+
+    router.dispatch_engine.add_exact(command, Route(command, handler))
+    return router
+
+
+def test_async_handlers_not_bound_by_executor():
+    """async 핸들러 50개 동시 실행 - executor(3 스레드) 크기와 무관"""
+    router = _add_sleep_route("/비동기대기", 0.2)
+    executor = ThreadPoolExecutor(max_workers=3)
+
+    async def run():
+        return await asyncio.gather(*[
+            router.get_reply_msg_async("방", f"사용자{i}", "/비동기대기", executor=executor)
+            for i in range(50)
+        ])
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    executor.shutdown()
+
+    assert results == ["done:/비동기대기"] * 50
+    # 스레드로 실행했다면 50 * 0.2 / 3 ≈ 3.3초
+    assert elapsed < 1.0, f"{elapsed:.2f}s"
+
+
+def test_sync_call_runs_async_handler():
+    """동기 get_reply_msg (스케줄러 등)에서도 async 핸들러 결과 반환"""
+    router = _add_sleep_route("/비동기동기호출", 0)
+    assert router.get_reply_msg("방", "scheduled", "/비동기동기호출") == "done:/비동기동기호출"
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+공용 HTTP 전송 계층 테스트 스크립트
+- keep-alive 연결 재사용 (로컬 HTTP/1.1 서버)
+- 호스트별 기본 타임아웃
+- request() 의 상태 코드 처리
+- 비동기 전송 계층 (async_http_service) 연결 재사용 / 동시 요청
+- 호스트 대체 주소 (UPSTREAM_OVERRIDES, 부하 테스트의 stub 서버)
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from services.http_service import HTTP_CONFIG, HTTPTransport, get_host_timeout, host_stats
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status = 404 if self.path == "/missing" else 200
+        body = b'{"ok": true}'
+        if self.path.startswith("/upstream"):
+            body = json.dumps({"host": self.headers.get("X-Upstream-Host"), "path": self.path}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_connection_reuse():
+    """같은 호스트 연속 요청은 연결 하나를 재사용"""
+    server, base = _serve()
+    transport = HTTPTransport()
+    host_stats.reset()
+    try:
+        for _ in range(5):
+            assert transport.get(f"{base}/").json() == {"ok": True}
+    finally:
+        transport.close()
+        server.shutdown()
+
+    stats = transport.get_stats()['hosts']['127.0.0.1']
+    assert stats['requests'] == 5
+    assert stats['new_connections'] == 1, stats
+    assert stats['reused_connections'] == 4
+
+
+def test_host_timeout():
+    """호스트별 기본 타임아웃, 등록되지 않은 호스트는 기본값"""
+    assert get_host_timeout("https://api.upbit.com/v1/ticker") == (2, 3)
+    assert get_host_timeout("https://example.com/") == HTTP_CONFIG['DEFAULT_TIMEOUT']
+
+
+def test_request_status_handling():
+    """request() 는 4xx 응답 시 None (raise_for_status=False 면 본문 그대로 반환)"""
+    from services import http_service
+
+    server, base = _serve()
+    try:
+        assert http_service.request(f"{base}/", result="json") == {"ok": True}
+        assert http_service.request(f"{base}/missing", result="json") is None
+        assert http_service.request(f"{base}/missing", raise_for_status=False) == '{"ok": true}'
+    finally:
+        server.shutdown()
+
+
+def test_async_connection_reuse():
+    """비동기 전송 계층도 연결 재사용, 통계는 같은 host_stats 에 집계"""
+    from services.async_http_service import arequest, async_http_transport
+
+    server, base = _serve()
+    host_stats.reset()
+
+    async def run():
+        try:
+            results = [await arequest(f"{base}/", result="json") for _ in range(5)]
+            missing = await arequest(f"{base}/missing", result="json")
+            return results, missing
+        finally:
+            await async_http_transport.aclose()
+
+    try:
+        results, missing = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    assert results == [{"ok": True}] * 5
+    assert missing is None
+    stats = host_stats.get_stats()['127.0.0.1']
+    assert stats['requests'] == 6
+    assert stats['new_connections'] == 1, stats
+
+
+def test_async_concurrent_requests():
+    """동시 요청 100개를 한 이벤트 루프에서 처리"""
+    from services.async_http_service import arequest, run_sync
+
+    server, base = _serve()
+
+    async def run():
+        return await asyncio.gather(*[arequest(f"{base}/", result="json") for _ in range(100)])
+
+    try:
+        results = run_sync(run())
+    finally:
+        server.shutdown()
+    assert results == [{"ok": True}] * 100
+
+
+def test_upstream_override():
+    """UPSTREAM_OVERRIDES 의 호스트는 대체 주소로 요청, 원래 호스트는 헤더와 통계에 남음"""
+    from services import http_service
+    from services.async_http_service import arequest, run_sync
+
+    server, base = _serve()
+    host_stats.reset()
+    http_service.UPSTREAM_OVERRIDES['*'] = base
+    try:
+        sync_result = http_service.request("https://finance.naver.com/upstream?code=005930", result="json")
+        async_result = run_sync(arequest("https://m.news.naver.com/upstream/1", result="json"))
+    finally:
+        http_service.UPSTREAM_OVERRIDES.clear()
+        http_service.http_transport.close()
+        server.shutdown()
+
+    assert sync_result == {"host": "finance.naver.com", "path": "/upstream?code=005930"}
+    assert async_result == {"host": "m.news.naver.com", "path": "/upstream/1"}
+    stats = host_stats.get_stats()
+    assert stats["finance.naver.com"]["requests"] == stats["m.news.naver.com"]["requests"] == 1
+    assert http_service.resolve_upstream("https://finance.naver.com/", None) == ("https://finance.naver.com/", None)
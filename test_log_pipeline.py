@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로그 파이프라인 테스트 스크립트
+- 메시지 포맷은 writer 스레드에서 (요청 스레드는 큐에 넣기만)
+- 버퍼링 파일 핸들러 크기 기준 회전
+- 큐가 가득 차면 버림 (요청 스레드를 막지 않음)
+- debug_logger / text_utils.log / fn.log / 핸들러 로딩 실패가 logging 으로 전달됨
+"""
+
+import logging
+import os
+import queue
+import tempfile
+import threading
+
+from utils.log_pipeline import BufferedRotatingFileHandler, LogPipeline
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+def _logger(name: str, pipeline: LogPipeline) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers = [pipeline.handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def test_lazy_formatting():
+    """% 인자는 writer 스레드에서 문자열로 바뀜, 레벨 미달은 레코드도 만들지 않음"""
+    formatted_in = []
+
+    class Probe:
+        def __str__(self):
+            formatted_in.append(threading.current_thread().name)
+            return "probe"
+
+    sink = _ListHandler()
+    pipeline = LogPipeline([sink], flush_interval=0.05)
+    pipeline.start()
+    logger = _logger("test.lazy", pipeline)
+
+    logger.info("값: %s", Probe())
+    logger.debug("디버그: %s", Probe())
+    pipeline.stop()
+
+    assert sink.lines == ["값: probe"]
+    assert formatted_in == ["log-writer"], formatted_in
+    assert pipeline.get_stats()['written'] == 1
+
+
+def test_file_rotation():
+    """MAX_BYTES 를 넘으면 bot.log → bot.log.1 로 회전, 종료 시 버퍼 기록"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "logs", "bot.log")
+        handler = BufferedRotatingFileHandler(path, max_bytes=200, backup_count=2, buffer_bytes=4096)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        pipeline = LogPipeline([handler], flush_interval=0.05)
+        pipeline.start()
+        logger = _logger("test.rotation", pipeline)
+
+        for i in range(12):
+            logger.info("한글 로그 %02d %s", i, "x" * 20)
+        pipeline.stop()
+
+        files = sorted(os.listdir(os.path.dirname(path)))
+        assert files == ["bot.log", "bot.log.1", "bot.log.2"], files
+        for name in files:
+            assert os.path.getsize(os.path.join(os.path.dirname(path), name)) <= 200
+        with open(path, encoding="utf-8") as f:
+            assert f.read().splitlines()[-1].startswith("한글 로그 11")
+
+
+def test_drop_when_queue_full():
+    """writer 가 멈춰 큐가 가득 차도 로그 호출은 막히지 않고 버린 수만 집계"""
+    sink = _ListHandler()
+    pipeline = LogPipeline([sink], queue_size=3)    # start() 하지 않음 = writer 정지
+    logger = _logger("test.drop", pipeline)
+    for i in range(5):
+        logger.info("메시지 %d", i)
+    assert pipeline.get_stats() == {'queued': 3, 'written': 0, 'dropped': 2}
+    assert isinstance(pipeline.queue, queue.Queue)
+
+
+def test_legacy_loggers_use_logging():
+    """debug_logger, text_utils.log, fn.log, 핸들러 로딩 실패는 print 대신 logging 으로 기록"""
+    import fn
+    from core.registry import LazyHandler
+    from utils.debug_logger import debug_logger
+    from utils.text_utils import log
+
+    def missing(name):
+        raise ImportError("없는 모듈")
+
+    sink = _ListHandler()
+    pipeline = LogPipeline([sink], flush_interval=0.05)
+    pipeline.start()
+    for name in ("debug_logger", "bot"):
+        _logger(name, pipeline)
+
+    debug_logger.error("오류 %s", "테스트")
+    debug_logger.log_debug("INFO 레벨에서는 기록 안 됨")
+    log("%s    %s    %s", "방", "사용자", "/주식")
+    fn.log("fn %s", "로그")
+    LazyHandler("없는핸들러", missing).load()
+    pipeline.stop()
+    for name in ("debug_logger", "bot"):
+        logging.getLogger(name).handlers = []
+        logging.getLogger(name).propagate = True
+
+    assert sink.lines == ["오류 테스트", "방    사용자    /주식", "fn 로그",
+                          "핸들러 로딩 실패 (없는핸들러): 없는 모듈"], sink.lines
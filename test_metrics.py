@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+메트릭(/metrics) 테스트 스크립트
+- 히스토그램 버킷은 누적 값, _sum / _count
+- 라벨 값 이스케이프, 같은 이름 재등록
+- collector 값 / 오류 처리
+- /metrics 엔드포인트에 명령어 / 외부 HTTP / 실행 풀 시리즈
+"""
+
+from utils.metrics import MetricFamily, MetricsRegistry
+
+
+def test_histogram_buckets_cumulative():
+    """관측값은 자신보다 크거나 같은 모든 버킷에 포함"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram('test_seconds', '테스트', ['command'], buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.labels('/주식').observe(value)
+
+    text = registry.render()
+    assert 'test_seconds_bucket{command="/주식",le="0.1"} 2' in text
+    assert 'test_seconds_bucket{command="/주식",le="1"} 3' in text
+    assert 'test_seconds_bucket{command="/주식",le="+Inf"} 4' in text
+    assert 'test_seconds_count{command="/주식"} 4' in text
+    assert 'test_seconds_sum{command="/주식"} 3.65' in text
+    assert '# TYPE test_seconds histogram' in text
+
+
+def test_counter_labels_and_reregister():
+    """라벨 값의 따옴표/줄바꿈 이스케이프, 같은 이름으로 다시 등록하면 기존 메트릭"""
+    registry = MetricsRegistry()
+    counter = registry.counter('test_responses', '테스트', ['host', 'status'])
+    assert registry.counter('test_responses', '테스트', ['host', 'status']) is counter
+
+    counter.labels('a"b\nc', 200).inc()
+    counter.labels('a"b\nc', 200).inc(2)
+    assert 'test_responses_total{host="a\\"b\\nc",status="200"} 3' in registry.render()
+
+    try:
+        counter.labels('only-host')
+        assert False, "라벨 개수가 다르면 ValueError"
+    except ValueError:
+        pass
+
+
+def test_collectors():
+    """collector 는 수집 시점에 호출, 실패해도 다른 메트릭은 출력"""
+    registry = MetricsRegistry()
+    depth = {'value': 1}
+    registry.register_collector('pool', lambda: [
+        MetricFamily('test_queue_depth', 'gauge', '테스트', ['pool']).add(('llm',), depth['value'])
+    ])
+    registry.register_collector('broken', lambda: 1 / 0)
+    registry.register_collector('broken2', lambda: {}['missing'])
+
+    depth['value'] = 5
+    text = registry.render()
+    assert 'test_queue_depth{pool="llm"} 5' in text
+    # 실패한 collector 가 여럿이어도 family 는 하나 (collector 이름 라벨)
+    assert text.count('# TYPE bot_metrics_collector_errors gauge') == 1, text
+    assert 'bot_metrics_collector_errors{collector="broken"} 1' in text
+    assert 'bot_metrics_collector_errors{collector="broken2"} 1' in text
+
+
+def test_metrics_endpoint():
+    """/metrics 에 명령어 처리 시간, 외부 HTTP, 실행 풀 / 캐시 시리즈"""
+    from fastapi.testclient import TestClient
+
+    import main_improved
+    from services.http_service import host_stats
+
+    host_stats.record_request('api.example.com', 120.0, status=200)
+
+    client = TestClient(main_improved.app)
+    client.post('/api/kakaotalk', json={'room': '테스트방', 'sender': '테스터', 'msg': '/명령어'})
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain')
+    text = response.text
+    assert 'bot_command_duration_seconds_count{command="/명령어"}' in text
+    assert 'bot_upstream_responses_total{host="api.example.com",status="200"}' in text
+    assert 'bot_upstream_request_duration_seconds_bucket{host="api.example.com",le="0.25"}' in text
+    assert 'bot_pool_queue_depth{pool="browser"} 0' in text
+    assert '# TYPE bot_cache_requests counter' in text
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+HTML 추출 프로세스 풀 테스트 스크립트
+- worker 에서 추출한 결과가 이 프로세스에서 추출한 결과와 같음 (동기 call / async run)
+- 작은 본문, 시작하지 않은 풀은 호출한 쪽에서 실행
+- worker 가 죽으면 새 풀을 만들고 그 작업은 호출한 쪽에서 실행
+- 메모리 상한을 넘는 작업은 MemoryError, 풀은 계속 사용 가능
+"""
+
+import asyncio
+import os
+import signal
+import sys
+
+from utils.html_extract import extract_naver_section, extract_page
+from utils.parse_pool import PARSE_POOL_CONFIG, ParsePool
+
+PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "data", "pages")
+
+
+def _page(name: str) -> bytes:
+    with open(os.path.join(PAGES, name), "rb") as f:
+        return f.read()
+
+
+def _allocate(content: bytes, megabytes: int) -> int:
+    """worker 에서 실행 - megabytes 만큼 할당"""
+    return len(bytearray(megabytes * 1024 * 1024))
+
+
+def _pool(**overrides) -> ParsePool:
+    return ParsePool({**PARSE_POOL_CONFIG, 'WORKERS': 1, 'MIN_BYTES': 0, **overrides})
+
+
+def test_results_match_local():
+    """worker 결과 = 이 프로세스에서 실행한 결과 (제목/본문, 기사 목록)"""
+    blog, section = _page("blog_post_jeju.html"), _page("mnews_section_101.html")
+    pool = _pool()
+    try:
+        assert pool.start()
+        page = pool.call(extract_page, blog, 'html.parser')
+        items = asyncio.run(pool.run(extract_naver_section, section, 'html.parser', True))
+        stats = pool.get_stats()
+    finally:
+        pool.shutdown()
+
+    assert page == extract_page(blog, 'html.parser') and len(page['content']) > 1000
+    assert items == extract_naver_section(section, 'html.parser', True) and len(items) == 12
+    assert stats['process'] == 2 and stats['local'] == 0 and stats['workers'] == 1, stats
+    assert stats['bytes'] == len(blog) + len(section) and stats['max_worker_rss_kb'] > 0
+
+
+def test_local_when_small_or_not_started():
+    """MIN_BYTES 미만이거나 start() 전이면 worker 를 쓰지 않음"""
+    html = b"<html><head><title>t</title></head><body><article>" + b"x" * 200 + b"</article></body></html>"
+    pool = _pool(MIN_BYTES=1024)
+    assert pool.call(extract_page, html, 'html.parser')['title'] == "t"
+    try:
+        pool.start()
+        assert asyncio.run(pool.run(extract_page, html, 'html.parser'))['content'] == "x" * 200
+        stats = pool.get_stats()
+    finally:
+        pool.shutdown()
+    assert stats['local'] == 2 and stats['process'] == 0, stats
+
+    disabled = _pool(ENABLED=False)
+    assert not disabled.start() and not disabled.running
+
+
+def test_broken_pool_falls_back():
+    """worker 가 죽어서 풀이 깨지면 그 작업은 여기서 실행하고 새 풀로 교체"""
+    blog = _page("blog_post_jeju.html")
+    pool = _pool()
+    try:
+        pool.start()
+        for pid in list(pool._executor._processes):
+            os.kill(pid, signal.SIGKILL)
+        page = pool.call(extract_page, blog, 'html.parser')
+        assert page['title'] == extract_page(blog, 'html.parser')['title']
+        # 새 풀에서 다시 worker 로 실행
+        assert pool.call(extract_page, blog, 'html.parser') == page
+        stats = pool.get_stats()
+    finally:
+        pool.shutdown()
+    assert stats['fallbacks'] == 1 and stats['restarts'] == 1 and stats['process'] >= 1, stats
+
+
+def test_memory_limit():
+    """MAX_MEMORY_MB 를 넘게 할당하면 worker 안에서 MemoryError, 풀은 계속 사용"""
+    if sys.platform == "win32":
+        return
+    pool = _pool(MAX_MEMORY_MB=512)
+    try:
+        pool.start()
+        try:
+            pool.call(_allocate, b"", 1024)
+        except MemoryError:
+            pass
+        else:
+            raise AssertionError("MemoryError 가 발생하지 않음")
+        assert pool.call(_allocate, b"", 16) == 16 * 1024 * 1024
+        stats = pool.get_stats()
+    finally:
+        pool.shutdown()
+    assert stats['errors'] == 1 and stats['restarts'] == 0, stats
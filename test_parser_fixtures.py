@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 파서 픽스처 테스트 스크립트
+- benchmarks/data/pages 의 기록된 응답으로 각 핸들러가 기대한 내용을 만들어 내는지
+  (선택자를 바꾸거나 파서를 교체했을 때 결과가 달라지면 실패)
+- 기록되지 않은 URL 을 요청하면 KeyError
+- 파서(html.parser / lxml)와 부분 파싱(only=) 여부에 관계없이 같은 응답
+- parse_only 는 선언한 요소와 그 하위만 남김
+"""
+
+import asyncio
+
+from benchmarks.bench_parsers import CaseRunner, RecordedResponses, check_reply, load_cases
+from services import http_service
+from services.http_service import HTML_PARSER_CONFIG, parse_html, parse_only
+from utils.lazy_import import is_available
+
+
+def test_cases_produce_expected_replies():
+    """모든 케이스가 외부 요청 없이 기대한 응답을 만듦"""
+    loop = asyncio.new_event_loop()
+    try:
+        for case in load_cases():
+            reply, seconds, parse_seconds = CaseRunner(case, loop).run_once()
+            assert check_reply(case, reply) == [], (case['name'], reply)
+            assert 0 <= parse_seconds <= seconds, case['name']
+    finally:
+        loop.close()
+
+
+def test_unrecorded_url():
+    """기록되지 않은 요청은 조용히 None 을 돌려주지 않고 KeyError"""
+    recorded = RecordedResponses(load_cases(["stock"])[0])
+    try:
+        recorded.request("https://finance.naver.com/item/main.naver", params={"code": "000660"}, result="bs")
+    except KeyError as e:
+        assert "code=000660" in str(e)
+    else:
+        raise AssertionError("KeyError 가 발생하지 않음")
+    soup = recorded.request("https://finance.naver.com/item/main.naver", params={"code": "005930"}, result="bs")
+    assert soup.select_one("p.no_today") is not None
+
+
+def test_backends_and_full_page_match():
+    """파서를 바꾸거나 페이지 전체를 파싱해도 핸들러 응답이 같음"""
+    backends = ['html.parser'] + (['lxml'] if is_available('lxml') else [])
+    original = dict(HTML_PARSER_CONFIG)
+    loop = asyncio.new_event_loop()
+    try:
+        for case in load_cases():
+            replies = set()
+            for backend in backends:
+                HTML_PARSER_CONFIG.update(BACKEND=backend, UNPORTED_BACKEND=backend)
+                for full_page in (False, True):
+                    runner = CaseRunner(case, loop)
+                    runner.recorded.full_page = full_page
+                    replies.add(runner.run_once()[0])
+            assert len(replies) == 1, (case['name'], replies)
+    finally:
+        HTML_PARSER_CONFIG.update(original)
+        loop.close()
+
+
+def test_parse_only():
+    """선언한 요소(tag / .class / #id 조합)와 그 하위만 트리에 남고, 나머지 API 는 그대로"""
+    html = (b'<html><body><div id="a" class="box x"><p class="no">1<em>2</em></p></div>'
+            b'<div class="box"><p class="no">3</p></div><table class="t"><tr><td>4</td></tr></table></body></html>')
+    soup = parse_html(html, parse_only('div#a', 'table.t'))
+    assert soup.select_one('#a p.no em').get_text() == "2"
+    assert [p.get_text() for p in soup.select('p.no')] == ["12"]
+    assert soup.select_one('table.t td').get_text() == "4" and soup.body is None
+    assert len(parse_html(html, parse_only('.box.x')).select('p')) == 1
+    assert len(parse_html(html, parse_only('.box')).select('p')) == 2
+    assert parse_html(html).body is not None
+
+    for selector in ('div p', 'a[href]', '#a#b', ''):
+        try:
+            parse_only(selector)
+        except ValueError:
+            continue
+        raise AssertionError(f"ValueError 가 발생하지 않음: {selector!r}")
+
+    # only 를 선언하지 않은 호출은 UNPORTED_BACKEND (기존 html.parser)
+    assert http_service.html_backend(partial=False) == 'html.parser'
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+대기 메시지 전달 테스트 스크립트
+- long-poll: 메시지가 들어오면 바로 응답 (스케줄러 스레드에서 추가해도), 없으면 hold 후 빈 목록
+- 스케줄 실행 오류 메시지도 long-poll 을 깨우고 DB 에 저장하지 않은 메시지로 표시
+- /api/kakaotalk 응답에 대기 메시지 함께 전달 (accept_pending 클라이언트만)
+"""
+
+import asyncio
+import threading
+import time
+
+from services.schedule_service import ScheduleService
+
+
+def test_long_poll_wakes_on_message():
+    """대기 중에 다른 스레드에서 메시지가 추가되면 바로 반환"""
+    service = ScheduleService()
+
+    async def run():
+        threading.Timer(0.1, service.add_pending_message, args=("방", "스케줄 결과", "job1")).start()
+        start = time.perf_counter()
+        messages = await service.wait_for_pending_messages(5)
+        return messages, time.perf_counter() - start
+
+    messages, elapsed = asyncio.run(run())
+    assert [m['message'] for m in messages] == ["스케줄 결과"]
+    assert elapsed < 1.0, f"{elapsed:.2f}s"
+
+
+def test_scheduled_error_wakes_long_poll():
+    """스케줄 명령어가 실패하면 오류 메시지가 대기자를 바로 깨움 (persisted=False)"""
+    from core import router
+
+    service = ScheduleService()
+
+    def broken(room, sender, msg):
+        raise RuntimeError("업스트림 오류")
+
+    async def run():
+        threading.Timer(0.1, service._execute_scheduled_command, args=("job_err", "방", "/주식 삼성전자")).start()
+        start = time.perf_counter()
+        messages = await service.wait_for_pending_messages(5)
+        return messages, time.perf_counter() - start
+
+    original, router.get_reply_msg = router.get_reply_msg, broken
+    try:
+        messages, elapsed = asyncio.run(run())
+    finally:
+        router.get_reply_msg = original
+    assert len(messages) == 1 and "업스트림 오류" in messages[0]['message'], messages
+    assert messages[0]['job_id'] == "job_err" and messages[0]['persisted'] is False
+    assert elapsed < 1.0, f"{elapsed:.2f}s"
+
+
+def test_long_poll_hold_timeout():
+    """메시지가 없으면 hold 시간 뒤 빈 목록, 이미 있으면 바로 반환"""
+    service = ScheduleService()
+
+    async def run():
+        start = time.perf_counter()
+        empty = await service.wait_for_pending_messages(0.2)
+        waited = time.perf_counter() - start
+
+        service.add_pending_message("방", "대기 중", "job2")
+        start = time.perf_counter()
+        ready = await service.wait_for_pending_messages(5)
+        return empty, waited, ready, time.perf_counter() - start
+
+    empty, waited, ready, elapsed = asyncio.run(run())
+    assert empty == [] and 0.15 <= waited < 1.0, waited
+    assert [m['message'] for m in ready] == ["대기 중"] and elapsed < 0.1
+
+
+def test_piggyback_on_reply():
+    """accept_pending 클라이언트에는 응답과 함께 대기 메시지 전달, 아니면 그대로 보관"""
+    from fastapi.testclient import TestClient
+
+    import main_improved
+    from services.schedule_service import schedule_service
+
+    client = TestClient(main_improved.app)
+    schedule_service.add_pending_message("기타1", "아침 뉴스", "job3")
+
+    legacy = client.post("/api/kakaotalk", json={"room": "테스트방", "sender": "사용자", "msg": "/로또"}).json()
+    assert 'pending_messages' not in legacy and legacy['is_reply']
+
+    reply = client.post("/api/kakaotalk", json={
+        "room": "테스트방", "sender": "사용자", "msg": "/로또", "accept_pending": True
+    }).json()
+    assert reply['is_reply']
+    assert {"room": "기타1", "message": "아침 뉴스"} in reply['pending_messages']
+    assert schedule_service.get_pending_messages("기타1") == []
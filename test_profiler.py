@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+샘플링 프로파일러 테스트 스크립트
+- 바쁜 스레드의 스택이 collapsed 형식으로 집계됨, 대기 중인 스레드는 제외
+- 동시에 하나만 샘플링
+- 상시 모드: 최근 샘플 보관
+- /프로파일 명령어, /api/profile 엔드포인트
+"""
+
+import hashlib
+import threading
+import time
+
+from utils.profiler import PROFILER_CONFIG, SamplingProfiler
+
+
+def _busy(stop: threading.Event):
+    while not stop.is_set():
+        hashlib.sha256(b"x" * 4096).digest()
+
+
+def _start_threads():
+    stop = threading.Event()
+    busy = threading.Thread(target=_busy, args=(stop,), name="pool-scrape_0", daemon=True)
+    idle = threading.Thread(target=stop.wait, name="idle-thread", daemon=True)
+    busy.start()
+    idle.start()
+    return stop
+
+
+def test_profile_busy_thread():
+    """바쁜 스레드는 풀 이름(번호 제외)과 함께 집계, 대기 중인 스레드는 제외"""
+    stop = _start_threads()
+    try:
+        result = SamplingProfiler(PROFILER_CONFIG).profile(seconds=0.3, hz=100)
+    finally:
+        stop.set()
+
+    assert 20 <= result.samples <= 31, result.samples
+    threads = dict(result.by_thread())
+    assert "pool-scrape" in threads and "idle-thread" not in threads, threads
+
+    top_name, top_count = result.top_functions(1)[0]
+    assert top_name.startswith("_busy (test_profiler.py:"), top_name
+    for line in result.collapsed().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0 and ";" in stack
+    assert result.overhead_pct < 20
+
+
+def test_single_session():
+    """샘플링 중에 다시 요청하면 RuntimeError"""
+    profiler = SamplingProfiler(PROFILER_CONFIG)
+    errors = []
+
+    def second():
+        time.sleep(0.05)
+        try:
+            profiler.profile(seconds=0.1)
+        except RuntimeError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=second)
+    thread.start()
+    profiler.profile(seconds=0.3, hz=20)
+    thread.join()
+    assert len(errors) == 1
+    assert profiler.last_result is not None and not profiler.running
+
+
+def test_continuous_window():
+    """상시 모드는 저빈도로 샘플을 쌓고, 끄면 비움"""
+    stop = _start_threads()
+    profiler = SamplingProfiler({**PROFILER_CONFIG, 'CONTINUOUS_HZ': 50, 'CONTINUOUS_WINDOW': 60})
+    try:
+        profiler.start_continuous()
+        time.sleep(0.3)
+        result = profiler.recent()
+    finally:
+        profiler.stop_continuous()
+        stop.set()
+
+    assert result.samples >= 5, result.samples
+    assert "pool-scrape" in dict(result.by_thread())
+    # 상시 샘플러 자신은 집계하지 않음
+    assert "profiler" not in dict(result.by_thread())
+    assert not profiler.continuous and profiler.recent().samples == 0
+
+
+def test_profile_command_and_endpoint():
+    """/프로파일 1 → 요약 응답, GET /api/profile?mode=last → collapsed stack"""
+    import config
+    import error_commands
+    from fastapi.testclient import TestClient
+
+    import main_improved
+
+    admin = config.BOT_CONFIG["ADMIN_USERS"][0]
+    stop = _start_threads()
+    try:
+        text = error_commands.profile_report("방", admin, "/프로파일 1")
+    finally:
+        stop.set()
+    assert text.startswith("🔬 프로파일") and "pool-scrape" in text, text
+    assert error_commands.profile_report("방", "일반사용자", "/프로파일").startswith("⚠️")
+
+    client = TestClient(main_improved.app)
+    response = client.get("/api/profile", params={"mode": "last"})
+    assert response.status_code == 200
+    assert "pool-scrape;" in response.text
+    summary = client.get("/api/profile", params={"mode": "last", "format": "json"}).json()
+    assert summary['hz'] == PROFILER_CONFIG['DEFAULT_HZ'] and summary['top_self']
+
+
+def test_profile_command_timeout():
+    """실제 요청 경로: 타임아웃 = 샘플링 시간 + 여유, 기본 10초는 지연 응답 후 대기 메시지로 전달"""
+    import asyncio
+
+    import config
+    import main_improved
+    from services.schedule_service import schedule_service
+
+    admin, room = config.BOT_CONFIG["ADMIN_USERS"][0], config.BOT_CONFIG["ADMIN_ROOM"]
+    timeout_of = main_improved.get_command_api_timeout
+    assert timeout_of("/프로파일") > PROFILER_CONFIG['DEFAULT_SECONDS'] >= main_improved.DEFERRED_CONFIG['THRESHOLD']
+    assert timeout_of("/프로파일 30") > 30 and timeout_of("/프로파일 999") > PROFILER_CONFIG['MAX_SECONDS']
+    assert timeout_of("/프로파일 최근") == timeout_of("/프로파일 상시 켜기") == main_improved.API_TIMEOUTS['default']
+
+    stop = _start_threads()
+    threshold = main_improved.DEFERRED_CONFIG['THRESHOLD']
+
+    async def run():
+        # 기본 타임아웃(4초)보다 짧은 샘플링은 바로 응답
+        direct = await main_improved.get_reply_with_timeout(room, admin, "/프로파일 1")
+        # 지연 응답 경로 (기준을 낮춰 짧게 확인)
+        main_improved.DEFERRED_CONFIG['THRESHOLD'] = 5.0
+        ack = await main_improved.get_reply_with_timeout(room, admin, "/프로파일 1")
+        job_id = ack.rsplit(": ", 1)[1].rstrip(")")
+        pending = [job.task for job in main_improved.deferred_jobs._inflight.values() if job.job_id == job_id]
+        await asyncio.gather(*pending)
+        return direct, ack, job_id
+
+    try:
+        direct, ack, job_id = asyncio.run(run())
+    finally:
+        main_improved.DEFERRED_CONFIG['THRESHOLD'] = threshold
+        stop.set()
+
+    assert direct.startswith("🔬 프로파일") and "pool-scrape" in direct, direct
+    assert "접수" in ack, ack
+    messages = [m['message'] for m in schedule_service.get_pending_messages(room) if m['job_id'] == job_id]
+    assert len(messages) == 1 and messages[0].startswith("🔬 프로파일"), messages
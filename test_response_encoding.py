@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+응답 인코딩 테스트 스크립트
+- 기본은 기존 ASCII 이스케이프 형식 (호환)
+- Accept-Charset: utf-8 이면 UTF-8 그대로, Accept-Encoding: gzip 이면 큰 응답 압축
+- Accept-* 는 토큰 항목이 '*' 보다 우선
+- 요청 본문 charset 처리
+"""
+
+import gzip
+import json
+
+from utils.response_encoding import GZIP_MIN_BYTES, decode_body, encode_json
+
+REPLY = {'is_reply': True, 'reply_room': "테스트방", 'reply_msg': "📊 삼성전자 71,300원 ▲900원"}
+
+
+def test_default_is_ascii():
+    """헤더가 없으면 기존 형식 그대로"""
+    body, headers = encode_json(REPLY, {})
+    assert body == json.dumps(REPLY, ensure_ascii=True).encode()
+    assert 'Content-Encoding' not in headers
+
+
+def test_utf8_mode():
+    """UTF-8 응답은 더 작고 같은 값으로 파싱됨"""
+    body, _ = encode_json(REPLY, {'accept-charset': 'utf-8'})
+    ascii_body, _ = encode_json(REPLY, {})
+    assert "삼성전자".encode() in body
+    assert json.loads(body) == REPLY
+    assert len(body) < len(ascii_body) * 0.8
+
+    # q=0 이면 거부
+    body, _ = encode_json(REPLY, {'accept-charset': 'utf-8;q=0, iso-8859-1'})
+    assert body == ascii_body
+
+
+def test_gzip_threshold():
+    """GZIP_MIN_BYTES 이상인 응답만 압축"""
+    small, headers = encode_json(REPLY, {'accept-encoding': 'gzip, deflate'})
+    assert 'Content-Encoding' not in headers
+
+    large = dict(REPLY, reply_msg="뉴스 " * GZIP_MIN_BYTES)
+    body, headers = encode_json(large, {'accept-charset': 'utf-8', 'accept-encoding': 'gzip, deflate'})
+    assert headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(body)) == large
+
+
+def test_accept_header_precedence():
+    """토큰이 직접 적힌 항목이 '*' 보다 우선, 그다음 q 적용 (항목 순서와 무관)"""
+    from utils.response_encoding import _accepts
+
+    assert not _accepts('*, gzip;q=0', 'gzip')
+    assert not _accepts('gzip;q=0, *', 'gzip')
+    assert _accepts('*;q=0, gzip', 'gzip')
+    assert _accepts('br, *', 'gzip') and not _accepts('br, *;q=0', 'gzip')
+    assert _accepts('gzip;q=0.5', 'gzip') and not _accepts('gzip;q=abc', 'gzip')
+    assert not _accepts('deflate', 'gzip') and not _accepts(None, 'gzip')
+
+    large = dict(REPLY, reply_msg="뉴스 " * GZIP_MIN_BYTES)
+    _, headers = encode_json(large, {'accept-encoding': '*, gzip;q=0'})
+    assert 'Content-Encoding' not in headers
+
+
+def test_decode_body():
+    """선언된 charset 먼저, 없거나 틀리면 utf-8 → euc-kr → cp949"""
+    text = '{"msg": "/주식 삼성전자"}'
+    assert decode_body(text.encode('utf-8')) == text
+    assert decode_body(text.encode('euc-kr')) == text
+    assert decode_body(text.encode('euc-kr'), "application/json; charset=EUC-KR") == text
+    assert decode_body(text.encode('utf-8'), "application/json; charset=unknown") == text
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+서버 시작 시간 회귀 테스트
+- main_improved 콜드 import 가 예산(STARTUP_IMPORT_BUDGET_MS, 기본 3000ms) 이내인지
+- 무거운 SDK(genai, anthropic, openai 등)가 시작 시 import 되지 않는지
+- 지연 import 프록시 동작
+"""
+
+import sys
+
+from utils.lazy_import import get_lazy_import_stats, lazy_attr, lazy_module
+from utils.startup_report import format_report, get_import_budget_ms, measure_cold_import
+
+_report = None
+
+
+def _cold_import_report():
+    """main_improved 콜드 import 측정 (테스트 간 1회만)"""
+    global _report
+    if _report is None:
+        _report = measure_cold_import("main_improved")
+    return _report
+
+
+def test_cold_import_within_budget():
+    """main_improved 콜드 import 시간 예산"""
+    report = _cold_import_report()
+    budget_ms = get_import_budget_ms()
+    assert report['import_ms'] <= budget_ms, format_report(report, budget_ms)
+
+
+def test_heavy_sdks_not_imported_at_startup():
+    """무거운 SDK는 처음 사용할 때만 import"""
+    report = _cold_import_report()
+    assert report['heavy_modules_loaded'] == [], report['heavy_modules_loaded']
+
+
+def test_lazy_module_imports_on_first_use():
+    """속성 접근 전에는 import 하지 않음"""
+    sys.modules.pop("colorsys", None)
+    colorsys = lazy_module("colorsys")
+    assert "colorsys" not in sys.modules
+    assert get_lazy_import_stats()["colorsys"]['loaded'] is False
+
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0)[0] == 0.0
+    assert "colorsys" in sys.modules
+    assert get_lazy_import_stats()["colorsys"]['loaded'] is True
+
+
+def test_lazy_attr_call():
+    """from module import name 지연 버전 - 호출 시 import"""
+    dedent = lazy_attr("textwrap", "dedent")
+    assert dedent("  a\n  b") == "a\nb"
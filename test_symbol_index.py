@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+KRX 종목 인덱스 테스트 스크립트
+- 예전 /주식 stock_mapping 의 이름/별칭이 같은 종목코드로 찾아짐 (대소문자, 공백 무시)
+- 6자리 종목코드, 초성
+- 접두어 / 오타는 바로 찾지 않고 search / 안내 메시지에 후보 (목록에 없는 종목을 다른 종목으로 바꾸지 않음)
+- 여러 종목이 같은 정도로 맞으면 None 이고 search / 안내 메시지에 후보
+- 데이터 파일 형식 (종목코드 중복 없음) 과 쓰기 → 읽기
+"""
+
+import os
+import tempfile
+
+from utils.symbol_index import (SYMBOL_INDEX_CONFIG, SymbolIndex, chosung, jamo, normalize, read_symbols,
+                                symbol_index, write_symbols)
+
+# 예전 stock_mapping (CJ 는 종목명 CJ 가 우선하므로 제외)
+OLD_MAPPING = {
+    '삼성전자': '005930', '삼전': '005930', 'sk하이닉스': '000660', '하이닉스': '000660',
+    'NAVER': '035420', '네이버': '035420', '카카오': '035720', 'LG에너지솔루션': '373220', 'LG에너지': '373220',
+    '현대차': '005380', '현대자동차': '005380', '기아': '000270', '기아자동차': '000270',
+    'SK': '034730', 'SK이노베이션': '096770', 'SK텔레콤': '017670', 'LG화학': '051910', 'LG전자': '066570',
+    '포스코': '005490', 'POSCO': '005490', '삼성바이오로직스': '207940', '삼성바이오': '207940',
+    '셀트리온': '068270', '삼성SDI': '006400', '현대모비스': '012330', 'KB금융': '105560',
+    '신한지주': '055550', '하나금융지주': '086790', '삼성생명': '032830', '삼성화재': '000810',
+    '삼성물산': '028260', 'CJ제일제당': '097950', '롯데케미칼': '011170', '한국전력': '015760',
+    '한전': '015760', 'KT': '030200', 'KT&G': '033780', '대한항공': '003490', '아시아나항공': '020560',
+    '아시아나': '020560', '제주항공': '089590',
+}
+
+
+def test_old_mapping_resolves():
+    """예전 매핑의 이름/별칭 → 같은 종목코드, 이름은 정식 종목명"""
+    for keyword, code in OLD_MAPPING.items():
+        for variant in (keyword, keyword.lower(), f" {keyword} "):
+            symbol = symbol_index.resolve(variant)
+            assert symbol and symbol.code == code, (variant, symbol)
+    assert symbol_index.resolve("삼전").name == "삼성전자"
+    assert symbol_index.resolve("sk 하이닉스").name == "SK하이닉스"
+    assert symbol_index.resolve("CJ").code == "001040"      # 종목명이 별칭보다 우선
+
+
+def test_code_and_chosung():
+    """6자리 종목코드 / 초성 전체 일치"""
+    assert symbol_index.resolve("005930").name == "삼성전자"
+    assert symbol_index.resolve("999999") == ("999999", "999999", "")    # 목록에 없는 종목코드도 그대로
+    assert symbol_index.resolve("0088m0").code == "0088M0"
+    assert symbol_index.resolve("ㅅㅅㅈㅈ").code == "005930"
+    assert symbol_index.resolve("skㅎㅇㄴㅅ").code == "000660"
+    assert symbol_index.resolve("ㅎㄱㅈㄹ").code == "015760"
+
+
+def test_prefix_and_typo_only_suggested():
+    """접두어 / 오타는 resolve 하지 않고 후보로만 안내, RESOLVE_PARTIAL 이면 한 종목일 때 resolve"""
+    cases = {"에코프로비": "247540", "삼송전자": "005930", "셀트리언": "068270", "카카우": "035720"}
+    partial = SymbolIndex({**SYMBOL_INDEX_CONFIG, 'RESOLVE_PARTIAL': True})
+    for query, code in cases.items():
+        assert symbol_index.resolve(query) is None, query
+        assert symbol_index.search(query, 3)[0].code == code, query
+        assert f"({code})" in symbol_index.not_found_message(query), query
+        assert partial.resolve(query).code == code, query
+    # 짧은 질의는 오타로 보지 않음
+    assert partial.resolve("kx") is None
+
+
+def test_unlisted_names_not_replaced():
+    """목록에 있는 우선주는 그 종목, 목록에 없는 이름은 비슷한 다른 종목으로 바꾸지 않음"""
+    assert symbol_index.resolve("삼성전자우").code == "005935"
+    assert symbol_index.resolve("현대차우").code == "005385"
+    for query in ("한섬", "효성"):
+        assert symbol_index.resolve(query) is None, query
+        assert "혹시" in symbol_index.not_found_message(query)
+    # 우선주가 빠진 목록에서도 보통주로 바뀌지 않음
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "symbols.tsv")
+        write_symbols(path, [row for row in read_symbols(SYMBOL_INDEX_CONFIG['PATH']) if row[0] != "005935"], "test")
+        index = SymbolIndex({**SYMBOL_INDEX_CONFIG, 'PATH': path})
+        assert index.resolve("삼성전자우") is None
+        assert index.search("삼성전자우", 1)[0].code == "005930"
+
+
+def test_ambiguous_returns_candidates():
+    """여러 종목이 맞으면 None, search 와 안내 메시지에 후보"""
+    for query in ("삼성", "ㅅㅅ", ""):
+        assert symbol_index.resolve(query) is None, query
+    names = [s.name for s in symbol_index.search("삼성", 20)]
+    assert {"삼성전자", "삼성전기", "삼성SDI"} <= set(names), names
+    assert symbol_index.search("CJ", 3)[0].name == "CJ"
+
+    message = symbol_index.not_found_message("삼성")
+    assert "'삼성' 종목을 찾을 수 없습니다" in message and "(0" in message, message
+    assert "혹시" not in symbol_index.not_found_message("없는종목")
+
+
+def test_hangul_helpers():
+    """정규화 / 초성 / 자모"""
+    assert normalize("ＬＧ 화학") == "lg화학"
+    assert normalize("ㅅㅅ ㅈㅈ") == "ㅅㅅㅈㅈ"        # 호환 자모는 NFKC 로 바꾸지 않음
+    assert normalize("KT&G") == "ktg"
+    assert chosung("lg화학") == "lgㅎㅎ"
+    assert jamo("삼성") == "ㅅㅏㅁㅅㅓㅇ"
+
+
+def test_data_file_and_roundtrip():
+    """데이터 파일: 6자리 종목코드 중복 없음, 시장 KOSPI/KOSDAQ / 쓰기 → 읽기 → 인덱스"""
+    rows = read_symbols(SYMBOL_INDEX_CONFIG['PATH'])
+    codes = [row[0] for row in rows]
+    assert len(codes) == len(set(codes)) and len(rows) >= 100
+    assert all(len(code) == 6 and code.isalnum() and code == code.upper() for code in codes)
+    assert {row[2] for row in rows} == {"KOSPI", "KOSDAQ"}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "symbols.tsv")
+        write_symbols(path, [("000001", "테스트 전자", "KOSDAQ", []), ("000002", "테스트바이오", "KOSPI", ["테바"])],
+                      "test")
+        assert read_symbols(path) == [("000002", "테스트바이오", "KOSPI", ["테바"]),
+                                      ("000001", "테스트 전자", "KOSDAQ", [])]
+        index = SymbolIndex({**SYMBOL_INDEX_CONFIG, 'PATH': path})
+        assert len(index) == 2 and index.resolve("테바").code == "000002"
+        assert index.resolve("테스트전자").market == "KOSDAQ" and index.resolve("삼성전자") is None
+        assert index.get_stats()['markets'] == {"KOSPI": 1, "KOSDAQ": 1}
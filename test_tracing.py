@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+요청 추적(tracing) 테스트 스크립트
+- 구간 중첩 / 오류 표시, 추적하지 않는 요청은 기록 없음
+- 가장 느린 요청 N 개만 보관
+- executor 스레드로 추적 위치 전달 (풀 대기 + 핸들러 + HTTP 구간)
+- /트레이스 관리자 명령어 출력
+"""
+
+import asyncio
+import time
+
+from utils.tracing import Tracer, annotate, format_trace, span
+
+
+def test_nested_spans():
+    """구간은 부모 구간 아래에 기록되고, 예외는 error 속성으로 표시"""
+    tracer = Tracer({'SAMPLE_RATE': 1.0})
+    with tracer.trace("/뉴스", room="방") as trace:
+        annotate(cache="miss")
+        with span("handler", handler="real_news"):
+            with span("http", host="news.naver.com"):
+                time.sleep(0.01)
+            try:
+                with span("parse"):
+                    raise ValueError("broken html")
+            except ValueError:
+                pass
+
+    result = tracer.slowest()[0]
+    assert result['trace_id'] == trace.trace_id
+    assert result['attrs'] == {'room': "방", 'cache': "miss"}
+    handler, http, parse = result['spans']
+    assert handler['parent'] == 0
+    assert http['parent'] == handler['id'] and parse['parent'] == handler['id']
+    assert http['duration_ms'] >= 10
+    assert parse['attrs']['error'] == "ValueError"
+    assert result['duration_ms'] >= http['duration_ms']
+
+
+def test_sampling_and_slowest():
+    """샘플링에서 빠진 요청은 기록하지 않고, 느린 요청 keep_slowest 개만 보관"""
+    tracer = Tracer({'SAMPLE_RATE': 0.0, 'KEEP_SLOWEST': 2})
+    with tracer.trace("/주식") as trace:
+        assert trace is None
+        with span("http") as current:
+            assert current is None
+    assert tracer.get_stats()['skipped'] == 1 and not tracer.slowest()
+
+    for delay in (0.0, 0.03, 0.01, 0.02):
+        with tracer.trace(f"/명령어{delay}", force=True):
+            time.sleep(delay)
+    names = [trace['name'] for trace in tracer.slowest()]
+    assert names == ["/명령어0.03", "/명령어0.02"], names
+
+    tracer.reset()
+    assert tracer.slowest() == []
+
+
+def test_executor_propagation():
+    """동기 핸들러는 풀 스레드에서 실행돼도 같은 요청의 구간으로 기록 (풀 대기 포함)"""
+    from core.bulkhead import BulkheadPool
+    from core.router import _SyncJob
+    from services.http_service import host_stats
+
+    def handler(room, sender, msg):
+        time.sleep(0.02)
+        host_stats.record_request("api.example.com", 15.0, status=200)
+        return "ok"
+
+    pool = BulkheadPool("scrape", max_workers=1, max_queue=4, overflow="wait")
+    tracer = Tracer({'SAMPLE_RATE': 1.0})
+
+    async def run():
+        with tracer.trace("/환율"):
+            return await pool.run(_SyncJob(handler, None, "scrape"), "방", "사용자", "/환율")
+
+    assert asyncio.run(run()) == "ok"
+    pool.shutdown()
+
+    spans = {item['name']: item for item in tracer.slowest()[0]['spans']}
+    assert set(spans) == {"queue", "handler", "http"}, spans
+    assert spans['queue']['attrs'] == {'pool': "scrape"}
+    assert spans['http']['parent'] == spans['handler']['id']
+    assert spans['http']['attrs'] == {'host': "api.example.com", 'status': 200}
+    assert spans['handler']['duration_ms'] >= 20
+
+
+def test_trace_report_command():
+    """/트레이스 - 느린 요청 구간 트리, 샘플 비율 변경"""
+    import config
+    import error_commands
+    from utils.tracing import tracer
+
+    admin = config.BOT_CONFIG["ADMIN_USERS"][0]
+    tracer.reset()
+    with tracer.trace("/블로그", force=True, room="방"):
+        with span("handler", handler="blog_search"):
+            pass
+    text = error_commands.trace_report("방", admin, "/트레이스")
+    assert "/블로그" in text and "└ handler" in text and "handler=blog_search" in text
+
+    previous = tracer.sample_rate
+    try:
+        assert "50%" in error_commands.trace_report("방", admin, "/트레이스 샘플 0.5")
+        assert tracer.sample_rate == 0.5
+    finally:
+        tracer.set_sample_rate(previous)
+    assert error_commands.trace_report("방", "일반사용자", "/트레이스").startswith("⚠️")
+
+
+def test_format_trace():
+    """구간 트리는 깊이만큼 들여쓰기"""
+    tracer = Tracer({'SAMPLE_RATE': 1.0})
+    with tracer.trace("/코인"):
+        with span("handler"):
+            with span("http", host="api.upbit.com"):
+                pass
+    lines = format_trace(tracer.slowest()[0]).splitlines()
+    assert lines[0].startswith("/코인 ")
+    assert lines[1].startswith("  └ handler ")
+    assert lines[2].startswith("    └ http ") and lines[2].endswith("(host=api.upbit.com)")
@@ -3,6 +3,10 @@
 DB 연결 및 쿼리 실행 관련 함수들
 """
 
+import logging
+
+_logger = logging.getLogger("bot")
+
 
 def get_conn():
     """데이터베이스 연결 (임시 구현)
@@ -11,7 +15,7 @@ def get_conn():
         tuple: (connection, cursor) 또는 (None, None)
     """
     # 실제 DB 연결 구현 필요
-    print("⚠️ 데이터베이스 연결이 구현되지 않았습니다.")
+    _logger.warning("⚠️ 데이터베이스 연결이 구현되지 않았습니다.")
     return None, None
 
 
@@ -25,7 +29,7 @@ def fetch_val(query: str, params: tuple = None):
     Returns:
         조회된 단일 값 또는 None
     """
-    print(f"⚠️ DB 쿼리 실행 필요: {query}")
+    _logger.warning("⚠️ DB 쿼리 실행 필요: %s", query)
     return None
 
 
@@ -39,7 +43,7 @@ def fetch_all(query: str, params: tuple = None):
     Returns:
         list: 조회된 모든 행
     """
-    print(f"⚠️ DB 쿼리 실행 필요: {query}")
+    _logger.warning("⚠️ DB 쿼리 실행 필요: %s", query)
     return []
 
 
@@ -53,7 +57,7 @@ def fetch_one(query: str, params: tuple = None):
     Returns:
         조회된 단일 행 또는 None
     """
-    print(f"⚠️ DB 쿼리 실행 필요: {query}")
+    _logger.warning("⚠️ DB 쿼리 실행 필요: %s", query)
     return None
 
 
@@ -67,5 +71,5 @@ def execute(query: str, params: tuple = None):
     Returns:
         bool: 실행 성공 여부
     """
-    print(f"⚠️ DB 쿼리 실행 필요: {query}")
+    _logger.warning("⚠️ DB 쿼리 실행 필요: %s", query)
     return True
\ No newline at end of file
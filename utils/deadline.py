@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+명령어 마감 시간(deadline) 모듈
+명령어 타임아웃을 Deadline 으로 만들어 핸들러와 HTTP 계층에 전달한다 (contextvars).
+
+    deadline = Deadline(4.0, name="/주식")
+    with deadline_scope(deadline):
+        handler(room, sender, msg)      # http_service 는 남은 시간을 타임아웃으로 사용
+
+    deadline.cancel()                   # 호출자가 결과를 포기 (wait_for 타임아웃)
+
+포기된 작업은 abandoned_work 에 집계된다 (/health 의 "abandoned_work").
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+# 0 을 "제한 없음" 으로 보는 라이브러리(Playwright, Google SDK)에 넘기는 타임아웃의 최소값 (초)
+MIN_TIMEOUT = 0.1
+
+
+class DeadlineExceeded(TimeoutError):
+    """마감 시간 초과 또는 호출자가 결과를 포기함"""
+
+
+class Deadline:
+    """명령어 하나의 마감 시간 + 취소 토큰"""
+    __slots__ = ('name', 'timeout', 'started', 'expires_at', 'cancelled_at')
+
+    def __init__(self, timeout: float, name: str = ""):
+        self.name = name
+        self.timeout = timeout
+        self.started = time.monotonic()
+        self.expires_at = self.started + timeout
+        self.cancelled_at = None
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 0 이상)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def cancelled(self) -> bool:
+        """호출자가 결과를 포기했는지"""
+        return self.cancelled_at is not None
+
+    @property
+    def expired(self) -> bool:
+        """포기했거나 마감 시간이 지났는지 (더 이상 일할 필요 없음)"""
+        return self.cancelled_at is not None or time.monotonic() >= self.expires_at
+
+    def cancel(self):
+        """호출자가 결과를 포기함 (대기 중인 작업은 건너뛰고, 진행 중인 HTTP 요청은 중단)"""
+        if self.cancelled_at is None:
+            self.cancelled_at = time.monotonic()
+
+    def cancelled_for_ms(self) -> float:
+        """포기된 뒤 지난 시간 (ms)"""
+        if self.cancelled_at is None:
+            return 0.0
+        return (time.monotonic() - self.cancelled_at) * 1000
+
+    def check(self):
+        """마감 시간이 지났으면 DeadlineExceeded"""
+        if self.expired:
+            raise DeadlineExceeded(f"{self.name or 'command'}: deadline exceeded ({self.timeout}s)")
+
+    def clamp(self, timeout):
+        """타임아웃을 남은 시간 이내로 제한 (None, 초, (연결, 읽기) 모두 지원)"""
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(min(t, remaining) if t is not None else remaining for t in timeout)
+        return min(timeout, remaining)
+
+    def __repr__(self):
+        return f"Deadline({self.name!r}, remaining={self.remaining():.2f}s, cancelled={self.cancelled})"
+
+
+_current_deadline: contextvars.ContextVar = contextvars.ContextVar('deadline', default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 실행 중인 명령어의 마감 시간 (없으면 None)"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]):
+    """with 블록 안의 코드(핸들러, HTTP 호출)에 deadline 적용"""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def remaining_timeout(default):
+    """default 타임아웃을 현재 마감 시간 이내로 제한 (SDK 호출 등에 사용)"""
+    deadline = _current_deadline.get()
+    return default if deadline is None else deadline.clamp(default)
+
+
+def deadline_expired() -> bool:
+    """현재 명령어의 마감 시간이 지났는지 (마감 시간이 없으면 False)"""
+    deadline = _current_deadline.get()
+    return deadline is not None and deadline.expired
+
+
+def sdk_request_options() -> Optional[Dict[str, float]]:
+    """Google SDK request_options (마감 시간이 있을 때만 남은 시간을 timeout 으로)
+
+    마감이 지나 남은 시간이 0 이면 SDK 가 제한 없이 기다리므로 MIN_TIMEOUT 으로 올린다.
+    """
+    deadline = _current_deadline.get()
+    return None if deadline is None else {'timeout': max(deadline.remaining(), MIN_TIMEOUT)}
+
+
+def check_deadline():
+    """현재 명령어의 마감 시간이 지났으면 DeadlineExceeded (긴 반복 작업 중간 확인용)"""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def submit_in_context(executor, fn, *args, **kwargs):
+    """executor.submit 과 같지만 현재 deadline 을 작업 스레드에 전달"""
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+# ========================================
+# 포기된 작업 통계
+# ========================================
+class AbandonedWorkStats:
+    """호출자가 포기한 뒤의 작업 통계
+
+    cancelled:     취소된 async 작업 (이벤트 루프에서 즉시 중단)
+    skipped:       실행 전에 포기되어 건너뛴 동기 작업 (executor 대기열)
+    finished_late: 포기된 뒤에도 끝까지 실행된 동기 작업
+    wasted_ms:     finished_late 작업이 포기 이후 사용한 시간 합
+    stopped_early: 마감 시간이 지나 HTTP 계층에서 보내지 않은 요청
+    """
+    FIELDS = ('cancelled', 'skipped', 'finished_late', 'stopped_early')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._totals = {field: 0 for field in self.FIELDS}
+            self._wasted_ms = 0.0
+            self._by_command: Dict[str, Dict[str, int]] = {}
+
+    def record(self, field: str, command: str = "", wasted_ms: float = 0.0):
+        with self._lock:
+            self._totals[field] += 1
+            self._wasted_ms += wasted_ms
+            if command:
+                counts = self._by_command.setdefault(command, {f: 0 for f in self.FIELDS})
+                counts[field] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._totals,
+                'wasted_ms': round(self._wasted_ms, 1),
+                'by_command': {name: dict(counts) for name, counts in self._by_command.items()}
+            }
+
+
+abandoned_work = AbandonedWorkStats()
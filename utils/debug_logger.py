@@ -2,67 +2,66 @@
 # -*- coding: utf-8 -*-
 """
 디버그 로거 모듈
+기존 debug_logger API 를 유지하면서 표준 logging ('debug_logger' 로거)으로 전달한다.
+출력/파일 기록은 utils.log_pipeline 의 writer 스레드가 한다 (요청 스레드에서 print 하지 않음).
 """
 
-import datetime
-import os
+import logging
+
+_logger = logging.getLogger("debug_logger")
+
 
 class DebugLogger:
     def __init__(self):
         self.enabled = True
         self.log_file = None
+        self._file_handler = None
         
-    def log_debug(self, message):
-        """디버그 메시지 로깅"""
+    def log_debug(self, message, *args):
+        """디버그 메시지 로깅 (args 가 있으면 message % args 를 writer 스레드에서 포맷)"""
         if self.enabled:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_message = f"[{timestamp}] DEBUG: {message}"
-            print(log_message)
-            
-            # 파일로도 저장 (선택적)
-            if self.log_file:
-                try:
-                    with open(self.log_file, 'a', encoding='utf-8') as f:
-                        f.write(log_message + '\n')
-                except Exception:
-                    pass
+            _logger.debug(message, *args)
 
-    def log_error(self, message):
+    def log_error(self, message, *args):
         """에러 메시지 로깅"""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_message = f"[{timestamp}] ERROR: {message}"
-        print(log_message)
-        
-        if self.log_file:
-            try:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_message + '\n')
-            except Exception:
-                pass
+        _logger.error(message, *args)
 
-    def error(self, message):
+    def error(self, message, *args):
         """에러 로깅 (log_error 별칭)"""
-        self.log_error(message)
+        self.log_error(message, *args)
 
-    def info(self, message):
-        """정보 로깅 (log_debug 별칭)"""
-        self.log_debug(message)
+    def info(self, message, *args):
+        """정보 로깅"""
+        if self.enabled:
+            _logger.info(message, *args)
 
-    def debug(self, message):
+    def debug(self, message, *args):
         """디버그 로깅 (log_debug 별칭)"""
-        self.log_debug(message)
+        self.log_debug(message, *args)
 
-    def warn(self, message):
-        """경고 로깅 (log_error 별칭)"""
-        self.log_error(f"WARN: {message}")
+    def warn(self, message, *args):
+        """경고 로깅"""
+        _logger.warning(message, *args)
 
     def set_enabled(self, enabled):
-        """로깅 활성화/비활성화"""
+        """로깅 활성화/비활성화 (디버그/정보 메시지)"""
         self.enabled = enabled
     
     def set_log_file(self, file_path):
-        """로그 파일 경로 설정"""
+        """로그 파일 경로 설정 (debug_logger 메시지만 따로 기록, 파일은 버퍼링 + 회전)"""
+        from utils.log_pipeline import LOGGING_CONFIG, BufferedRotatingFileHandler, add_sink, remove_sink
+
+        if self._file_handler is not None:
+            remove_sink(self._file_handler)
+            self._file_handler = None
         self.log_file = file_path
+        if file_path:
+            handler = BufferedRotatingFileHandler(
+                file_path, LOGGING_CONFIG['MAX_BYTES'], LOGGING_CONFIG['BACKUP_COUNT'], LOGGING_CONFIG['BUFFER_BYTES']
+            )
+            handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s', '%Y-%m-%d %H:%M:%S'))
+            add_sink(handler, _logger.name)
+            self._file_handler = handler
 
 # 싱글톤 인스턴스
-debug_logger = DebugLogger()
\ No newline at end of file
+debug_logger = DebugLogger()
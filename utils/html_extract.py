@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+HTML 추출 모듈
+응답 본문(bytes) → 작은 dict/list 로 바꾸는 순수 함수 모음. utils.parse_pool 의 worker 프로세스에서 실행되므로
+bs4 외에는 import 하지 않는다 (services 패키지를 import 하면 DB/AI 서비스까지 따라 올라옴).
+BeautifulSoup 트리는 프로세스 경계를 넘기지 않고 제목, 본문, 항목 목록만 돌려준다.
+
+    page = extract_page(response.content, 'lxml', encoding=response.encoding)
+    page['title'], page['content'], page['og_description']
+
+    items = extract_naver_section(content, 'lxml', mobile=True)    # [{'title', 'link', 'source'}, ...]
+
+parser 는 호출하는 쪽(http_service.html_backend)이 정해서 넘긴다 (설정은 메인 프로세스 기준).
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+# ========================================
+# 부분 트리 파싱
+# ========================================
+_SIMPLE_SELECTOR_RE = re.compile(r'^([a-zA-Z][\w-]*)?((?:[.#][\w-]+)*)$')
+
+
+def _compile_selector(selector: str) -> Tuple[Optional[str], Optional[str], frozenset]:
+    """'tag.class#id' → (태그, id, 클래스 집합)"""
+    match = _SIMPLE_SELECTOR_RE.match(selector.strip())
+    if not match or not selector.strip():
+        raise ValueError(f"parse_only 는 tag / .class / #id 조합만 지원: {selector!r}")
+    tag, rest = match.group(1), match.group(2)
+    ids = re.findall(r'#([\w-]+)', rest)
+    if len(ids) > 1:
+        raise ValueError(f"id 는 하나만 지정: {selector!r}")
+    return (tag.lower() if tag else None, ids[0] if ids else None,
+            frozenset(re.findall(r'\.([\w-]+)', rest)))
+
+
+def parse_only(*selectors: str) -> SoupStrainer:
+    """파싱할 부분 트리 선언 (핸들러 모듈 상수로 만들어 request/arequest 의 only= 로 전달)
+
+        STOCK_PAGE = parse_only('p.no_today', 'p.no_exday', 'table.no_info')
+        soup = await arequest(url, result="bs", only=STOCK_PAGE)
+
+    선택자는 tag, .class, #id 조합(하위 선택자 없음)이고, 일치하는 요소와 그 하위만 트리에 남는다.
+    나머지는 토큰화만 하고 Tag 를 만들지 않으므로 큰 페이지에서 파싱 시간과 메모리가 줄어든다.
+    결과는 그대로 BeautifulSoup 이라 남긴 부분 안에서는 기존 select/select_one 이 같은 결과를 낸다.
+
+    Raises:
+        ValueError: 지원하지 않는 선택자
+    """
+    rules = [_compile_selector(selector) for selector in selectors]
+
+    def match(name, attrs) -> bool:
+        for tag, element_id, classes in rules:
+            if tag and name != tag:
+                continue
+            if element_id and attrs.get('id') != element_id:
+                continue
+            if classes:
+                value = attrs.get('class') or ''
+                if not classes.issubset(value.split() if isinstance(value, str) else value):
+                    continue
+            return True
+        return False
+
+    strainer = SoupStrainer(match)
+    strainer.selectors = selectors
+    return strainer
+
+
+# 네이버 뉴스 섹션/속보 페이지 (모바일 기사 목록, 데스크톱 랭킹 박스)
+NAVER_SECTION_PAGE = parse_only('li.sa_item', '.rankingnews')
+
+
+def _soup(content: Union[bytes, str], parser: str, encoding: Optional[str] = None,
+          only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """encoding 을 주면 그 인코딩으로 디코딩 (requests 의 response.text 와 같게), 없으면 BeautifulSoup 이 판별"""
+    if encoding and isinstance(content, bytes):
+        content = content.decode(encoding, errors='replace')
+    return BeautifulSoup(content, parser, parse_only=only)
+
+
+def warm_up():
+    """worker 예열 - 파서 모듈까지 import 해 둠 (첫 요청에서 import 시간을 쓰지 않도록)"""
+    for parser in ('html.parser', 'lxml'):
+        try:
+            BeautifulSoup('<p>warm</p>', parser)
+        except FeatureNotFound:       # lxml 미설치
+            pass
+
+
+# ========================================
+# 웹페이지 본문 (/요약 등)
+# ========================================
+
+def extract_main_content(soup):
+    """웹페이지 본문 추출 - 뉴스 사이트 최적화"""
+
+    # 뉴스 사이트별 본문 선택자
+    selectors = [
+        # 네이버 블로그
+        '.se-main-container',  # 네이버 블로그 스마트에디터3
+        '.postViewArea',  # 네이버 블로그 구 에디터
+        '#postViewArea',
+        '.post-view',
+        'div[id^="post-view"]',
+        '.se-component',  # 네이버 블로그 컴포넌트
+
+        # 네이버 엔터/뉴스
+        '.end_ct_area',  # 네이버 엔터 기사
+        '.news_end',  # 네이버 뉴스
+        '#articeBody',  # 네이버 기사 본문
+        '#newsEndContents',  # 네이버 뉴스 본문
+        '.news_view',  # 네이버 뉴스
+        '#articleBodyContents',  # 네이버 뉴스 구버전
+        '.content_area',  # 네이버 뉴스 신버전
+
+        # 일반 사이트
+        '#article-view-content-div',  # bloter.net 등 뉴스 CMS
+        '.article-body',  # bloter.net, 일부 뉴스 사이트
+        'article',  # 일반적인 article 태그
+        '.article_body',  # 다음 뉴스
+        '.article_view',  # 일부 뉴스 사이트
+        '.news_body',  # 일부 뉴스 사이트
+        '.content',  # 일반 콘텐츠
+        'main',  # HTML5 main 태그
+        '[role="main"]',  # ARIA role
+        '.post-content',  # 블로그 형식
+        '.entry-content',  # 워드프레스 등
+    ]
+
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element:
+            # 불필요한 태그 제거
+            for tag in element.select('script, style, aside, nav'):
+                tag.decompose()
+            return element.get_text(separator=' ', strip=True)
+
+    # 못 찾으면 body 전체 (스크립트와 스타일 제외)
+    body = soup.find('body')
+    if body:
+        for tag in body.select('script, style, aside, nav, header, footer'):
+            tag.decompose()
+        return body.get_text(separator=' ', strip=True)[:10000]
+    return ""
+
+
+def extract_page(content: Union[bytes, str], parser: str, encoding: Optional[str] = None,
+                 frame_id: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """웹페이지 → {'title', 'content', 'og_description', 'iframe_src'}
+
+    frame_id 의 iframe(네이버 블로그 mainFrame 등)이 있으면 본문은 추출하지 않고 iframe_src 만 채운다
+    (호출한 쪽이 iframe 주소를 다시 요청해서 extract_page 로 본문을 추출).
+    """
+    soup = _soup(content, parser, encoding)
+
+    # 제목 추출
+    title = None
+    title_elem = soup.find('title')
+    if title_elem:
+        title = title_elem.text.strip()
+    else:
+        og_title = soup.find('meta', property='og:title')
+        if og_title:
+            title = og_title.get('content', '제목 없음')
+
+    page = {'title': title, 'content': None, 'og_description': None, 'iframe_src': None}
+    if frame_id:
+        iframe = soup.find('iframe', {'id': frame_id})
+        if iframe and iframe.get('src'):
+            page['iframe_src'] = iframe.get('src')
+            return page
+
+    page['content'] = extract_main_content(soup)
+    og_desc = soup.find('meta', property='og:description')
+    if og_desc and og_desc.get('content'):
+        page['og_description'] = og_desc.get('content', '').strip()
+    return page
+
+
+# ========================================
+# 네이버 뉴스 섹션
+# ========================================
+
+def _news_item(title_elem, link_elem, source_elem) -> Dict[str, str]:
+    return {
+        'title': title_elem.text.strip() if title_elem else '',
+        'link': link_elem.get('href', '') if link_elem else '',
+        'source': source_elem.text.strip() if source_elem else '',
+    }
+
+
+def extract_naver_section(content: Union[bytes, str], parser: str, mobile: bool = False) -> List[Dict[str, Any]]:
+    """네이버 뉴스 섹션 페이지 → 후보 기사 목록 [{'title', 'link', 'source'}] (페이지 순서)
+
+    모바일: 헤드라인(li.sa_item._SECTION_HEADLINE) 먼저, 8개 미만이면 일반 기사로 12개까지 채움
+    데스크톱: 메인 랭킹 박스의 li, 없으면 모든 랭킹 박스의 li
+    링크가 없는 항목도 그대로 두고(link='') 광고 필터와 개수 제한은 호출한 쪽에서 처리한다.
+    """
+    soup = _soup(content, parser, only=NAVER_SECTION_PAGE)
+
+    if mobile:
+        # 헤드라인 뉴스 먼저 선택
+        news_items = soup.select('li.sa_item._SECTION_HEADLINE')
+
+        # 헤드라인이 8개 미만이면 일반 뉴스에서 추가
+        if len(news_items) < 8:
+            headline_links = set()
+            for item in news_items:
+                link_elem = item.select_one('a[href*="article"]')
+                if link_elem:
+                    headline_links.add(link_elem.get('href', ''))
+
+            for item in soup.select('li.sa_item'):
+                if len(news_items) >= 12:  # 충분히 확보
+                    break
+                link_elem = item.select_one('a[href*="article"]')
+                if link_elem and link_elem.get('href', '') not in headline_links:
+                    news_items.append(item)
+                    headline_links.add(link_elem.get('href', ''))
+
+        items = []
+        for item in news_items:
+            title_elem = item.select_one('.sa_text_strong') or item.select_one('.sa_text_title')
+            items.append(_news_item(title_elem, item.select_one('.sa_text_title'),
+                                    item.select_one('.sa_text_press')))
+        return items
+
+    # 메인 랭킹 뉴스 컨테이너 찾기
+    main_ranking = soup.select_one('.rankingnews.as_type_flat._SECTION_MAINNEWS')
+    if main_ranking:
+        news_items = main_ranking.select('li')
+    else:
+        # 폴백: 모든 rankingnews에서 가져오기
+        news_items = soup.select('.rankingnews li')
+
+    items = []
+    for item in news_items:
+        # article 링크가 있는 a 태그 찾기
+        link_elem = item.select_one('a[href*="article"]')
+        if link_elem:
+            items.append(_news_item(link_elem, link_elem, item.select_one('.rankingnews_press')))
+    return items
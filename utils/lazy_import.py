@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+지연 import 모듈
+무거운 SDK(genai, anthropic, openai 등)를 처음 사용할 때 import 한다.
+
+    genai = lazy_module("google.generativeai")
+    OpenAI = lazy_attr("openai", "OpenAI")
+
+    genai.configure(...)   # 이 시점에 google.generativeai import
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+from typing import Any, Dict
+
+# 지연 import 상태 (모듈 이름 → {'loaded', 'import_ms'})
+_lazy_stats: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def _import(module_name: str):
+    """모듈 import 후 소요 시간 기록 (이미 import 되어 있으면 기록만 유지)"""
+    stats = _lazy_stats.setdefault(module_name, {'loaded': False, 'import_ms': None})
+    if stats['loaded']:
+        return importlib.import_module(module_name)
+
+    with _lock:
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        if not stats['loaded']:
+            stats['import_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            stats['loaded'] = True
+    return module
+
+
+def is_available(module_name: str) -> bool:
+    """모듈 설치 여부 (import 하지 않고 확인)"""
+    try:
+        return importlib.util.find_spec(module_name.split('.')[0]) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """첫 속성 접근 시 import 되는 모듈 프록시"""
+
+    def __init__(self, module_name: str):
+        object.__setattr__(self, '_module_name', module_name)
+        object.__setattr__(self, '_module', None)
+        _lazy_stats.setdefault(module_name, {'loaded': False, 'import_ms': None})
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            module = _import(self._module_name)
+            object.__setattr__(self, '_module', module)
+        return module
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._load(), name, value)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._module_name}' ({state})>"
+
+
+class LazyAttribute:
+    """from module import name 의 지연 버전 (호출/속성 접근 시 import)"""
+
+    def __init__(self, module_name: str, attr: str):
+        self._module_name = module_name
+        self._attr = attr
+        self._target = None
+        _lazy_stats.setdefault(module_name, {'loaded': False, 'import_ms': None})
+
+    def _load(self):
+        target = self._target
+        if target is None:
+            target = getattr(_import(self._module_name), self._attr)
+            self._target = target
+        return target
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __repr__(self):
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<lazy '{self._module_name}.{self._attr}' ({state})>"
+
+
+def lazy_module(module_name: str) -> LazyModule:
+    """import module_name 의 지연 버전"""
+    return LazyModule(module_name)
+
+
+def lazy_attr(module_name: str, attr: str) -> LazyAttribute:
+    """from module_name import attr 의 지연 버전"""
+    return LazyAttribute(module_name, attr)
+
+
+def get_lazy_import_stats() -> Dict[str, Dict[str, Any]]:
+    """지연 import 대상 모듈별 로딩 여부 / import 시간(ms)"""
+    return {name: dict(stats) for name, stats in _lazy_stats.items()}
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로그 파이프라인 모듈
+요청 처리 스레드(이벤트 루프, 실행 풀)는 로그 레코드를 큐에 넣기만 하고,
+메시지 포맷팅과 파일/콘솔 출력은 백그라운드 writer 스레드가 한다.
+
+    from utils.log_pipeline import setup_logging
+    setup_logging()                       # 서버 시작 시 한 번 (LOGGING_CONFIG)
+
+    logger.info("응답 생성: %s", room)    # % 인자는 writer 스레드에서 포맷 (f-string 은 즉시 생성됨)
+
+  - 레벨: 전체 LEVEL + 모듈별 MODULE_LEVELS (환경 변수 LOG_LEVEL 로 전체 레벨 변경)
+  - 파일: FILE 에 버퍼링해서 쓰고 MAX_BYTES 를 넘으면 BACKUP_COUNT 개까지 회전
+  - 큐가 가득 차면 요청 스레드를 막지 않고 레코드를 버린다 (get_stats 의 dropped)
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# ========================================
+# 설정
+# ========================================
+LOGGING_CONFIG = {
+    'LEVEL': os.getenv('LOG_LEVEL', 'INFO'),
+    'MODULE_LEVELS': {                          # 로거 이름별 레벨 (전체 레벨보다 우선)
+        'httpx': 'WARNING',                     # 요청마다 "HTTP Request: ..." INFO 로그
+        'httpcore': 'WARNING',
+        'urllib3': 'WARNING',
+        'apscheduler': 'WARNING',
+        'asyncio': 'WARNING',
+    },
+    'FORMAT': '%(asctime)s - %(levelname)s - %(message)s',
+    'DATE_FORMAT': '%Y-%m-%d %H:%M:%S',
+    'CONSOLE': True,
+    'FILE': os.getenv('LOG_FILE', 'logs/bot.log'),   # 빈 문자열이면 파일에 쓰지 않음
+    'MAX_BYTES': 10 * 1024 * 1024,              # 파일 하나 최대 10MB
+    'BACKUP_COUNT': 5,                          # bot.log.1 ~ bot.log.5
+    'BUFFER_BYTES': 64 * 1024,                  # 파일 쓰기 버퍼
+    'FLUSH_INTERVAL': 1.0,                      # 버퍼를 비우는 주기 (초, 로그가 없을 때도)
+    'QUEUE_SIZE': 10000,                        # 대기 레코드 수 (넘으면 버림)
+}
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """버퍼링 + 크기 기준 회전 파일 핸들러 (writer 스레드 전용)
+
+    RotatingFileHandler 는 레코드마다 flush 하고, 회전 여부를 볼 때 seek 로 버퍼를 비우므로
+    쓴 바이트 수를 직접 세어 회전하고, flush 는 writer 스레드가 주기적으로 호출한다.
+    """
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int, buffer_bytes: int):
+        directory = os.path.dirname(os.path.abspath(filename))
+        os.makedirs(directory, exist_ok=True)
+        self.buffer_bytes = buffer_bytes
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=self.buffer_bytes)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            line = self.format(record) + self.terminator
+            size = len(line.encode('utf-8'))
+            if self.maxBytes and self._size and self._size + size > self.maxBytes:
+                self.doRollover()
+                self._size = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(line)
+            self._size += size
+        except Exception:
+            self.handleError(record)
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """레코드를 포맷하지 않고 그대로 큐에 넣음 (QueueHandler.prepare 는 호출 스레드에서 포맷)"""
+
+    def __init__(self, log_queue: queue.Queue, pipeline: "LogPipeline"):
+        super().__init__(log_queue)
+        self.pipeline = pipeline
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.pipeline.dropped += 1
+
+
+class LogPipeline:
+    """큐 + writer 스레드"""
+
+    def __init__(self, handlers: List[logging.Handler], queue_size: int = 10000, flush_interval: float = 1.0):
+        self.handlers = handlers
+        self.flush_interval = flush_interval
+        self.queue: queue.Queue = queue.Queue(queue_size)
+        self.handler = _LazyQueueHandler(self.queue, self)
+        self.written = 0
+        self.dropped = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                record = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                record = False
+
+            if record is None:      # stop()
+                self._flush()
+                return
+            if record is not False:
+                self._emit(record)
+
+            now = time.monotonic()
+            if now - last_flush >= self.flush_interval:
+                self._flush()
+                last_flush = now
+
+    def _emit(self, record: logging.LogRecord):
+        self.written += 1
+        for handler in list(self.handlers):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _flush(self):
+        for handler in list(self.handlers):
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+    def stop(self):
+        """남은 레코드를 모두 쓰고 종료"""
+        if self._thread is None:
+            return
+        self.queue.put(None)
+        self._thread.join(timeout=5)
+        self._thread = None
+        for handler in self.handlers:
+            handler.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'queued': self.queue.qsize(),
+            'written': self.written,
+            'dropped': self.dropped
+        }
+
+
+_pipeline: Optional[LogPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def setup_logging(config: Dict[str, Any] = None) -> LogPipeline:
+    """루트 로거를 큐 파이프라인으로 교체 (이미 설정했으면 그대로 반환)"""
+    global _pipeline
+    config = {**LOGGING_CONFIG, **(config or {})}
+    with _pipeline_lock:
+        if _pipeline is not None:
+            return _pipeline
+
+        formatter = logging.Formatter(config['FORMAT'], datefmt=config['DATE_FORMAT'])
+        handlers: List[logging.Handler] = []
+        if config['CONSOLE']:
+            handlers.append(logging.StreamHandler(sys.stderr))
+        if config['FILE']:
+            handlers.append(BufferedRotatingFileHandler(
+                config['FILE'], config['MAX_BYTES'], config['BACKUP_COUNT'], config['BUFFER_BYTES']
+            ))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        pipeline = LogPipeline(handlers, config['QUEUE_SIZE'], config['FLUSH_INTERVAL'])
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(pipeline.handler)
+        root.setLevel(config['LEVEL'])
+        for name, level in config['MODULE_LEVELS'].items():
+            logging.getLogger(name).setLevel(level)
+
+        pipeline.start()
+        atexit.register(pipeline.stop)
+        _pipeline = pipeline
+        return pipeline
+
+
+def add_sink(handler: logging.Handler, name: str = None):
+    """추가 출력 대상 (name 을 주면 그 로거와 하위 로거의 레코드만)
+
+    파이프라인이 있으면 writer 스레드에서 쓰고, 없으면 해당 로거에 바로 붙인다.
+    """
+    if name:
+        handler.addFilter(logging.Filter(name))
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.handlers.append(handler)
+            return
+    logging.getLogger(name).addHandler(handler)
+
+
+def remove_sink(handler: logging.Handler):
+    """add_sink 로 추가한 출력 대상 제거"""
+    with _pipeline_lock:
+        if _pipeline is not None and handler in _pipeline.handlers:
+            _pipeline.handlers.remove(handler)
+    for item in handler.filters:
+        logging.getLogger(getattr(item, 'name', None) or None).removeHandler(handler)
+    handler.close()
+
+
+def shutdown_logging():
+    """파이프라인 종료 (남은 로그 기록, 테스트/재설정용)"""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            return
+        logging.getLogger().removeHandler(_pipeline.handler)
+        _pipeline.stop()
+        _pipeline = None
+
+
+def get_stats() -> Optional[Dict[str, Any]]:
+    """파이프라인 통계 (/health, 설정 전이면 None)"""
+    return _pipeline.get_stats() if _pipeline is not None else None
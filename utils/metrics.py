@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+메트릭 레지스트리 모듈
+Prometheus 텍스트 형식(/metrics)으로 내보내는 카운터/히스토그램.
+평균만으로는 보이지 않는 느린 꼬리(p95, p99)를 히스토그램 버킷으로 확인한다.
+
+    from utils.metrics import metrics
+
+    COMMAND_SECONDS = metrics.histogram('bot_command_duration_seconds', '명령어 처리 시간', ['command'])
+    COMMAND_SECONDS.labels('/주식').observe(0.42)
+
+    # 이미 다른 곳에서 집계하는 값(캐시 통계, 풀 대기열 등)은 수집 시점에만 읽음
+    metrics.register_collector('cache', lambda: [MetricFamily(...)])
+
+    metrics.render()    # text/plain; version=0.0.4
+
+기록(observe/inc)은 라벨 조합마다 만들어지는 시리즈 단위로,
+STRIPES 개의 잠금 중 하나만 잡는다 (모든 스레드가 잠금 하나를 두고 경쟁하지 않음).
+"""
+
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 명령어/HTTP 지연 시간 버킷 (초) - 카카오톡 응답 제한(20초)까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0)
+
+STRIPES = 16
+_stripe_locks = [threading.Lock() for _ in range(STRIPES)]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _CounterChild:
+    __slots__ = ('_lock', 'value')
+
+    def __init__(self, lock):
+        self._lock = lock
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class _HistogramChild:
+    __slots__ = ('_lock', '_upper', 'counts', 'sum')
+
+    def __init__(self, lock, upper: Sequence[float]):
+        self._lock = lock
+        self._upper = upper
+        self.counts = [0] * (len(upper) + 1)    # 마지막 칸은 +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self._upper, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class _Metric:
+    """라벨 조합별 시리즈를 가진 메트릭"""
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self, lock):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """라벨 값에 해당하는 시리즈 (처음이면 생성)"""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 라벨 {self.labelnames} 에 값 {key}")
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child(_stripe_locks[hash(key) % STRIPES])
+                    self._children[key] = child
+        return child
+
+    def _items(self):
+        with self._lock:
+            return list(self._children.items())
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self, lock):
+        return _CounterChild(lock)
+
+    def inc(self, amount: float = 1.0):
+        """라벨 없는 카운터"""
+        self.labels().inc(amount)
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, child in self._items():
+            lines.append(f"{self.name}_total{_format_labels(self.labelnames, key)} {_format_value(child.value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self, lock):
+        return _HistogramChild(lock, self.buckets)
+
+    def observe(self, value: float):
+        """라벨 없는 히스토그램"""
+        self.labels().observe(value)
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, child in self._items():
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for upper, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = f'le="{_format_value(upper)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricFamily:
+    """수집 시점에 만드는 메트릭 (gauge/counter, 다른 모듈이 이미 집계하는 값)"""
+
+    def __init__(self, name: str, kind: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.kind = kind
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.samples: List[Tuple[Tuple[str, ...], float]] = []
+
+    def add(self, labels: Sequence[str], value: float) -> "MetricFamily":
+        self.samples.append((tuple(labels), value))
+        return self
+
+    def render(self) -> List[str]:
+        suffix = "_total" if self.kind == "counter" else ""
+        return [f"{self.name}{suffix}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                for labels, value in self.samples]
+
+
+class MetricsRegistry:
+    """메트릭 등록/출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[MetricFamily]]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                # 모듈 재import 등으로 다시 등록하면 기존 메트릭 사용
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, name: str, collector: Callable[[], Iterable[MetricFamily]]):
+        """수집 시점에 호출할 함수 등록 (MetricFamily 목록 반환, 같은 이름은 교체)"""
+        with self._lock:
+            self._collectors[name] = collector
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식"""
+        with self._lock:
+            families = list(self._metrics.values())
+            collectors = list(self._collectors.items())
+        failed = []
+        for name, collector in collectors:
+            try:
+                families.extend(list(collector()))
+            except Exception:
+                # 수집 실패가 /metrics 전체를 막지 않도록
+                failed.append(name)
+        if failed:
+            # 같은 이름의 HELP/TYPE 이 두 번 나오면 Prometheus 가 스크레이프 전체를 버리므로 한 family 로
+            errors = MetricFamily('bot_metrics_collector_errors', 'gauge', '수집 중 오류가 난 collector', ['collector'])
+            for name in failed:
+                errors.add((name,), 1)
+            families.append(errors)
+
+        lines = []
+        for family in families:
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
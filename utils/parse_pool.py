@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+HTML 추출 프로세스 풀 모듈
+큰 페이지를 BeautifulSoup 으로 파싱하는 동안에는 GIL 을 잡고 있어서 이벤트 루프와 다른 실행 풀 스레드가 멈춘다
+(/health 까지 느려짐). 파싱 + 추출 단계를 worker 프로세스에서 실행하고 결과(dict/list)만 돌려받는다.
+
+    from utils.parse_pool import parse_pool
+    from utils.html_extract import extract_page
+
+    page = parse_pool.call(extract_page, response.content, 'lxml')            # 동기 코드 (실행 풀 스레드)
+    items = await parse_pool.run(extract_naver_section, content, 'lxml', True)   # async 핸들러
+
+  - 첫 인자는 응답 본문(bytes)이고, MIN_BYTES 보다 작으면 프로세스 왕복 비용이 더 크므로 호출한 쪽에서 실행
+  - 함수는 worker 에서 import 되므로 가벼운 모듈(utils.html_extract)의 최상위 함수여야 함
+  - 서버 시작 시 start() 로 worker 를 미리 띄우고 파서까지 import 해 둔다 (forkserver 가 미리 import 한 뒤 fork)
+  - 메모리: MAX_TASKS_PER_CHILD 개 처리한 worker 는 새 프로세스로 교체 (Python 3.11+), MAX_MEMORY_MB 는 주소 공간 상한(RLIMIT_AS)
+    상한을 넘는 페이지는 worker 안에서 MemoryError 가 나고 호출한 쪽으로 그대로 전달된다
+  - start() 전이거나 ENABLED 가 False 면 모두 호출한 쪽에서 실행 (테스트/벤치마크/스크립트)
+  - worker 가 죽어서 풀이 깨지면(BrokenProcessPool) 새 풀을 만들고 그 작업은 호출한 쪽에서 실행
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from utils.deadline import DeadlineExceeded, current_deadline
+from utils.metrics import metrics
+
+try:
+    import resource
+except ImportError:         # Windows
+    resource = None
+
+# ========================================
+# 설정
+# ========================================
+PARSE_POOL_CONFIG = {
+    'ENABLED': True,
+    'WORKERS': 2,                   # worker 프로세스 수
+    'MIN_BYTES': 48 * 1024,         # 이보다 작은 본문은 호출한 쪽에서 추출
+    'MAX_TASKS_PER_CHILD': 500,     # 이만큼 처리한 worker 는 교체 (파편화된 힙 반환)
+    'MAX_MEMORY_MB': 1024,          # worker 주소 공간 상한 (0 이면 제한 없음, Linux/macOS 만)
+    'START_METHOD': 'forkserver',   # 없으면 spawn (스레드가 도는 서버 프로세스를 그대로 fork 하지 않음)
+    'PRELOAD': ['utils.html_extract'],
+}
+
+PARSE_SECONDS = metrics.histogram(
+    'bot_parse_seconds', 'HTML 추출 시간 (실행 위치별: process / local, 프로세스 왕복 포함)', ['where']
+)
+
+
+# ========================================
+# worker 프로세스
+# ========================================
+
+def _init_worker(max_memory_mb: int, preload: list):
+    """worker 시작 시 한 번 - 메모리 상한 설정, 추출 모듈/파서 import"""
+    if max_memory_mb and resource is not None:
+        limit = max_memory_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    import importlib
+    for module_name in preload:
+        importlib.import_module(module_name)
+    from utils.html_extract import warm_up
+    warm_up()
+
+
+def _run_task(func: Callable, args: tuple):
+    """worker 에서 func 실행 → (결과, worker 최대 RSS KB)"""
+    result = func(*args)
+    max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else 0
+    return result, max_rss_kb
+
+
+# ========================================
+# 풀
+# ========================================
+
+class ParsePool:
+    """추출 함수를 worker 프로세스에서 실행 (작은 본문 / 풀 없음 / 풀 깨짐은 호출한 쪽에서)"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.min_bytes = config.get('MIN_BYTES', 0)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            'process': 0,           # worker 에서 실행
+            'local': 0,             # 호출한 쪽에서 실행 (작은 본문, 풀 없음)
+            'fallbacks': 0,         # 풀이 깨져서 호출한 쪽에서 다시 실행
+            'errors': 0,            # 추출 함수 예외 (MemoryError 포함)
+            'timeouts': 0,          # 마감 시간까지 결과를 받지 못함
+            'restarts': 0,
+            'bytes': 0,             # worker 로 보낸 본문 크기 합
+            'process_ms': 0.0,
+            'max_ms': 0.0,
+            'max_worker_rss_kb': 0,
+        }
+
+    # ========================================
+    # 시작 / 종료
+    # ========================================
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        method = self.config.get('START_METHOD', 'forkserver')
+        if method not in multiprocessing.get_all_start_methods():
+            method = 'spawn'
+        context = multiprocessing.get_context(method)
+        preload = list(self.config.get('PRELOAD', []))
+        if method == 'forkserver':
+            context.set_forkserver_preload(preload)
+        return ProcessPoolExecutor(
+            max_workers=self.config.get('WORKERS', 2),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.config.get('MAX_MEMORY_MB', 0), preload),
+            max_tasks_per_child=self.config.get('MAX_TASKS_PER_CHILD'),
+        )
+
+    def start(self) -> bool:
+        """worker 프로세스를 띄우고 예열될 때까지 대기 (ENABLED 가 False 면 아무것도 하지 않음)"""
+        if not self.config.get('ENABLED', True):
+            return False
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor()
+            executor = self._executor
+        # worker 는 요청이 있을 때 하나씩 생기므로 worker 수만큼 동시에 넣어서 모두 띄움
+        futures = [executor.submit(os.getpid) for _ in range(self.config.get('WORKERS', 2))]
+        for future in futures:
+            future.result()
+        return True
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def _restart(self, broken: ProcessPoolExecutor):
+        """깨진 풀을 새 풀로 교체 (여러 호출이 동시에 발견해도 한 번만)"""
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = self._create_executor()
+            self._stats['restarts'] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    # ========================================
+    # 실행
+    # ========================================
+
+    def _submit(self, func: Callable, args: tuple):
+        """(executor, future) - 호출한 쪽에서 실행해야 하면 None"""
+        executor = self._executor
+        if executor is None or len(args[0] or b'') < self.min_bytes:
+            return None
+        try:
+            return executor, executor.submit(_run_task, func, args)
+        except BrokenProcessPool:
+            self._restart(executor)
+            self._record('fallbacks')
+            return None
+        except RuntimeError:        # shutdown 진행 중
+            return None
+
+    def _record(self, field: str, size: int = 0, elapsed: float = 0.0, max_rss_kb: int = 0):
+        with self._lock:
+            stats = self._stats
+            stats[field] += 1
+            if field == 'process':
+                stats['bytes'] += size
+                stats['process_ms'] += elapsed * 1000
+                stats['max_ms'] = max(stats['max_ms'], elapsed * 1000)
+                stats['max_worker_rss_kb'] = max(stats['max_worker_rss_kb'], max_rss_kb)
+
+    def _finish(self, executor, func, args, start, outcome):
+        """worker 결과 처리 - (완료 여부, 결과)"""
+        try:
+            result, max_rss_kb = outcome()
+        except BrokenProcessPool:
+            self._restart(executor)
+            self._record('fallbacks')
+            return False, None
+        except Exception:
+            self._record('errors')
+            raise
+        elapsed = time.perf_counter() - start
+        PARSE_SECONDS.labels('process').observe(elapsed)
+        self._record('process', len(args[0]), elapsed, max_rss_kb)
+        return True, result
+
+    def _run_local(self, func: Callable, args: tuple):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            PARSE_SECONDS.labels('local').observe(time.perf_counter() - start)
+            self._record('local')
+
+    def call(self, func: Callable, *args):
+        """동기 코드에서 실행 (명령어 마감 시간까지 대기)
+
+        Raises:
+            DeadlineExceeded: 마감 시간 안에 worker 결과를 받지 못함
+        """
+        submitted = self._submit(func, args)
+        if submitted is None:
+            return self._run_local(func, args)
+        executor, future = submitted
+        deadline = current_deadline()
+        start = time.perf_counter()
+
+        def outcome():
+            try:
+                return future.result(timeout=deadline.remaining() if deadline else None)
+            except FutureTimeout:
+                future.cancel()
+                self._record('timeouts')
+                raise DeadlineExceeded("parse pool result not ready before deadline") from None
+
+        done, result = self._finish(executor, func, args, start, outcome)
+        return result if done else self._run_local(func, args)
+
+    async def run(self, func: Callable, *args):
+        """async 코드에서 실행 (호출한 쪽 실행은 기본 스레드 풀에서, 이벤트 루프를 막지 않음)
+
+        취소되면(명령어 타임아웃) 아직 시작하지 않은 작업은 worker 대기열에서 빠진다.
+        """
+        submitted = self._submit(func, args)
+        if submitted is not None:
+            executor, future = submitted
+            start = time.perf_counter()
+            wrapped = asyncio.wrap_future(future)
+            try:
+                await asyncio.wait({wrapped})
+            except asyncio.CancelledError:
+                wrapped.cancel()
+                raise
+            done, result = self._finish(executor, func, args, start, wrapped.result)
+            if done:
+                return result
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._run_local, func, args)
+
+    def get_stats(self) -> Dict[str, Any]:
+        executor = self._executor
+        processes = getattr(executor, '_processes', None) or {}
+        with self._lock:
+            stats = dict(self._stats)
+        process_ms = stats.pop('process_ms')
+        return {
+            'running': executor is not None,
+            'workers': len(processes),
+            'max_workers': self.config.get('WORKERS', 2),
+            'min_bytes': self.min_bytes,
+            **stats,
+            'avg_ms': round(process_ms / stats['process'], 2) if stats['process'] else 0.0,
+            'max_ms': round(stats['max_ms'], 2),
+        }
+
+
+parse_pool = ParsePool(PARSE_POOL_CONFIG)
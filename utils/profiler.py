@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+샘플링 프로파일러 모듈
+일정 간격으로 모든 스레드의 파이썬 스택(sys._current_frames)을 찍어 어디서 시간을 쓰는지 집계한다.
+결과는 flamegraph.pl / speedscope 가 읽는 collapsed stack 형식("스레드;함수;함수 횟수")으로 낸다.
+
+    from utils.profiler import profiler
+
+    result = profiler.profile(seconds=10, hz=100)   # 호출한 스레드에서 10초 동안 샘플링
+    result.collapsed()                              # flamegraph 입력
+    result.top_functions(5)                         # [(함수, 샘플 수), ...]
+
+    profiler.start_continuous()                     # 상시 모드: 낮은 빈도로 최근 WINDOW 초 보관
+    profiler.recent(60).collapsed()
+
+관리자 명령어 /프로파일 과 GET /api/profile 에서 사용한다.
+샘플 한 번은 스택을 읽기만 하므로(추적 훅 없음) 100Hz 에서도 운영 중에 켤 수 있다 (overhead_pct 참고).
+"""
+
+import collections
+import os
+import re
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# ========================================
+# 설정
+# ========================================
+PROFILER_CONFIG = {
+    'DEFAULT_SECONDS': 10,         # /프로파일 기본 샘플링 시간
+    'MAX_SECONDS': 60,
+    'DEFAULT_HZ': 100,             # 초당 샘플 수
+    'MAX_HZ': 250,
+    'MAX_DEPTH': 64,               # 스택 최대 깊이 (넘으면 바깥쪽 프레임 생략)
+    'INCLUDE_IDLE': False,         # 대기 중인 스레드(큐/락/select 대기)도 집계할지
+    'CONTINUOUS': False,           # 서버 시작 시 상시 모드 시작
+    'CONTINUOUS_HZ': 2,            # 상시 모드 초당 샘플 수
+    'CONTINUOUS_WINDOW': 300,      # 상시 모드 보관 시간 (초)
+}
+
+# 스레드가 일을 하지 않고 기다리는 중인 가장 안쪽 프레임 (파일, 함수)
+IDLE_FRAMES = {
+    ('threading.py', 'wait'),
+    ('threading.py', '_wait_for_tstate_lock'),
+    ('queue.py', 'get'),
+    ('selectors.py', 'select'),
+    ('thread.py', '_worker'),              # concurrent.futures 유휴 worker
+    ('profiler.py', '_run_continuous'),
+}
+
+_THREAD_NUMBER_RE = re.compile(r'[_-]?\d+$')
+
+
+class ProfileResult:
+    """샘플링 결과 (collapsed stack 별 샘플 수)"""
+
+    def __init__(self, counts: collections.Counter, samples: int, duration: float, hz: float,
+                 sampling_seconds: float, started: float):
+        self.counts = counts
+        self.samples = samples              # 샘플링 횟수 (스레드 수와 무관)
+        self.duration = duration
+        self.hz = hz
+        self.sampling_seconds = sampling_seconds
+        self.started = started
+
+    @property
+    def overhead_pct(self) -> float:
+        """샘플링에 쓴 시간 비율 (GIL 을 잡는 시간)"""
+        return self.sampling_seconds / self.duration * 100 if self.duration else 0.0
+
+    def collapsed(self) -> str:
+        """flamegraph 입력 (많은 순)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.counts.most_common())
+
+    def top_functions(self, limit: int = 10, inclusive: bool = False) -> List[Tuple[str, int]]:
+        """샘플이 많은 함수 - self: 가장 안쪽 프레임, inclusive: 스택 어디든 포함"""
+        totals = collections.Counter()
+        for stack, count in self.counts.items():
+            frames = stack.split(";")[1:]           # 첫 항목은 스레드 이름
+            if not frames:
+                continue
+            if inclusive:
+                for frame in set(frames):
+                    totals[frame] += count
+            else:
+                totals[frames[-1]] += count
+        return totals.most_common(limit)
+
+    def by_thread(self) -> List[Tuple[str, int]]:
+        totals = collections.Counter()
+        for stack, count in self.counts.items():
+            totals[stack.split(";", 1)[0]] += count
+        return totals.most_common()
+
+    def to_dict(self, limit: int = 20) -> Dict[str, Any]:
+        return {
+            'started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started)),
+            'duration': round(self.duration, 2),
+            'hz': self.hz,
+            'samples': self.samples,
+            'stacks': sum(self.counts.values()),
+            'overhead_pct': round(self.overhead_pct, 2),
+            'threads': dict(self.by_thread()),
+            'top_self': self.top_functions(limit),
+            'top_inclusive': self.top_functions(limit, inclusive=True)
+        }
+
+
+class SamplingProfiler:
+    """요청 시 샘플링 + 상시 저빈도 샘플링"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.include_idle = config.get('INCLUDE_IDLE', False)
+        self.max_depth = config.get('MAX_DEPTH', 64)
+        self._labels: Dict[Any, str] = {}
+        self._session_lock = threading.Lock()
+        self.last_result: Optional[ProfileResult] = None
+
+        self.continuous_hz = config.get('CONTINUOUS_HZ', 2)
+        self.window = config.get('CONTINUOUS_WINDOW', 300)
+        self._recent: collections.deque = collections.deque()    # (시각, 샘플링 시간, 스택 목록)
+        self._recent_lock = threading.Lock()
+        self._continuous_stop: Optional[threading.Event] = None
+
+    # ========================================
+    # 스택 읽기
+    # ========================================
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def sample(self) -> List[str]:
+        """현재 모든 스레드의 스택 (collapsed, 호출한 스레드 제외)"""
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            code = frame.f_code
+            if not self.include_idle and (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                continue
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(self._label(frame.f_code))
+                frame = frame.f_back
+            # 풀 스레드 번호는 합쳐서 표시 (pool-scrape_3 → pool-scrape)
+            labels.append(_THREAD_NUMBER_RE.sub('', names.get(ident, 'thread')) or 'thread')
+            stacks.append(";".join(reversed(labels)))
+        return stacks
+
+    # ========================================
+    # 요청 시 샘플링
+    # ========================================
+
+    def profile(self, seconds: float = None, hz: float = None) -> ProfileResult:
+        """호출한 스레드에서 seconds 초 동안 hz 빈도로 샘플링 (동시에 하나만)
+
+        Raises:
+            RuntimeError: 다른 샘플링이 진행 중
+        """
+        seconds = min(seconds or self.config['DEFAULT_SECONDS'], self.config['MAX_SECONDS'])
+        hz = min(hz or self.config['DEFAULT_HZ'], self.config['MAX_HZ'])
+        if not self._session_lock.acquire(blocking=False):
+            raise RuntimeError("profiling already in progress")
+        try:
+            result = self._collect(seconds, hz)
+        finally:
+            self._session_lock.release()
+        self.last_result = result
+        return result
+
+    @property
+    def running(self) -> bool:
+        return self._session_lock.locked()
+
+    def _collect(self, seconds: float, hz: float) -> ProfileResult:
+        interval = 1.0 / hz
+        counts = collections.Counter()
+        samples = 0
+        sampling = 0.0
+        started = time.time()
+        start = time.perf_counter()
+        deadline = start + seconds
+        next_tick = start
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            counts.update(self.sample())
+            samples += 1
+            sampling += time.perf_counter() - now
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()     # 밀린 샘플은 건너뜀
+        return ProfileResult(counts, samples, time.perf_counter() - start, hz, sampling, started)
+
+    # ========================================
+    # 상시 모드
+    # ========================================
+
+    @property
+    def continuous(self) -> bool:
+        return self._continuous_stop is not None
+
+    def start_continuous(self, hz: float = None, window: float = None):
+        """상시 저빈도 샘플링 시작 (최근 window 초 보관)"""
+        if self._continuous_stop is not None:
+            return
+        self.continuous_hz = hz or self.continuous_hz
+        self.window = window or self.window
+        stop = threading.Event()
+        self._continuous_stop = stop
+        threading.Thread(target=self._run_continuous, args=(stop,), name="profiler", daemon=True).start()
+
+    def stop_continuous(self):
+        if self._continuous_stop is not None:
+            self._continuous_stop.set()
+            self._continuous_stop = None
+        with self._recent_lock:
+            self._recent.clear()
+
+    def _run_continuous(self, stop: threading.Event):
+        interval = 1.0 / self.continuous_hz
+        while not stop.wait(interval):
+            now = time.perf_counter()
+            stacks = self.sample()
+            elapsed = time.perf_counter() - now
+            with self._recent_lock:
+                self._recent.append((time.time(), elapsed, stacks))
+                cutoff = time.time() - self.window
+                while self._recent and self._recent[0][0] < cutoff:
+                    self._recent.popleft()
+
+    def recent(self, seconds: float = None) -> ProfileResult:
+        """상시 모드에서 최근 seconds 초(기본 전체 보관 시간)의 샘플"""
+        cutoff = time.time() - (seconds or self.window)
+        with self._recent_lock:
+            items = [item for item in self._recent if item[0] >= cutoff]
+        counts = collections.Counter()
+        for _, _, stacks in items:
+            counts.update(stacks)
+        started = items[0][0] if items else time.time()
+        duration = (items[-1][0] - started + 1.0 / self.continuous_hz) if items else 0.0
+        sampling = sum(elapsed for _, elapsed, _ in items)
+        return ProfileResult(counts, len(items), duration, self.continuous_hz, sampling, started)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'running': self.running,
+            'continuous': self.continuous,
+            'continuous_hz': self.continuous_hz,
+            'window': self.window,
+            'recent_samples': len(self._recent),
+            'last': self.last_result.to_dict(limit=5) if self.last_result else None
+        }
+
+
+def requested_seconds(msg: str) -> Optional[int]:
+    """/프로파일 메시지 → 샘플링 시간(초), 바로 응답하는 하위 명령(최근 / 상시)은 None"""
+    parts = msg.split()
+    if len(parts) > 1 and parts[1] in ("최근", "상시"):
+        return None
+    seconds = PROFILER_CONFIG['DEFAULT_SECONDS']
+    if len(parts) > 1:
+        try:
+            seconds = min(PROFILER_CONFIG['MAX_SECONDS'], max(1, int(parts[1])))
+        except ValueError:
+            pass
+    return seconds
+
+
+def format_result(result: ProfileResult, title: str, limit: int = 8) -> str:
+    """카카오톡 응답용 요약 (스레드별 / 함수별 상위)"""
+    if not result.counts:
+        return f"{title}\n\n샘플이 없습니다 (모든 스레드가 대기 중)."
+    total = sum(result.counts.values())
+    lines = [title,
+             f"{result.duration:.1f}초 · {result.hz:g}Hz · 샘플 {result.samples}회 · 오버헤드 {result.overhead_pct:.2f}%",
+             "", "【스레드】"]
+    for name, count in result.by_thread()[:limit]:
+        lines.append(f"  {name} {count * 100 / total:.0f}%")
+    lines.append("【함수 (self)】")
+    for name, count in result.top_functions(limit):
+        lines.append(f"  {count * 100 / total:.0f}% {name}")
+    lines.append("【함수 (하위 포함)】")
+    for name, count in result.top_functions(limit, inclusive=True):
+        lines.append(f"  {count * 100 / total:.0f}% {name}")
+    return "\n".join(lines)
+
+
+profiler = SamplingProfiler(PROFILER_CONFIG)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+봇 응답 인코딩 모듈
+/api/kakaotalk, /api/poll 응답 JSON 을 클라이언트가 받을 수 있는 가장 작은 형식으로 만든다.
+
+  - ascii (기본, 호환): ensure_ascii JSON - 한글 한 글자가 \\uXXXX 6바이트
+  - utf8: 요청 Accept-Charset 에 utf-8 이 있으면 UTF-8 그대로 (한글 3바이트, orjson 으로 직렬화)
+  - gzip: 요청 Accept-Encoding 에 gzip 이 있고 본문이 GZIP_MIN_BYTES 이상이면 압축
+
+    body, headers = encode_json(data, request.headers)
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+"""
+
+import gzip
+import json
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json (결과는 같고 느림)
+    orjson = None
+
+JSON_MEDIA_TYPE = "application/json; charset=utf-8"
+
+# gzip 설정 - 작은 응답은 압축 헤더(약 20바이트)와 CPU 비용이 더 큼
+GZIP_MIN_BYTES = 512
+GZIP_LEVEL = 5
+
+# 요청 본문 인코딩 (선언된 charset 이 없거나 틀렸을 때 순서대로 시도)
+FALLBACK_CHARSETS = ('utf-8', 'euc-kr', 'cp949')
+
+
+def _accepts(header: Optional[str], token: str) -> bool:
+    """Accept-* 헤더에 token 이 있는지 (q=0 은 거부로 처리)
+
+    모든 항목을 확인하고 token 이 직접 적힌 항목이 '*' 보다 우선한다 ('*, gzip;q=0' 은 gzip 거부).
+    """
+    if not header:
+        return False
+    exact = wildcard = None
+    for part in header.lower().split(','):
+        name, *params = part.split(';')
+        name = name.strip()
+        if name not in (token, '*'):
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.strip().partition('=')
+            if key.strip() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name == token:
+            exact = q
+        else:
+            wildcard = q
+    q = exact if exact is not None else wildcard
+    return q is not None and q > 0
+
+
+def dumps_ascii(data: Any) -> bytes:
+    """기존 형식 (ensure_ascii, 공백 포함)"""
+    return json.dumps(data, ensure_ascii=True).encode('ascii')
+
+
+def dumps_utf8(data: Any) -> bytes:
+    """UTF-8 그대로, 공백 없는 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads(text) -> Any:
+    """JSON 파싱 (str/bytes)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def encode_json(data: Any, request_headers: Mapping[str, str]) -> Tuple[bytes, Dict[str, str]]:
+    """요청 헤더에 맞춰 응답 본문과 헤더 생성
+
+    Returns:
+        (본문 바이트, 응답 헤더) - Content-Type 은 JSON_MEDIA_TYPE
+    """
+    headers = {'Vary': 'Accept-Charset, Accept-Encoding'}
+
+    if _accepts(request_headers.get('accept-charset'), 'utf-8'):
+        body = dumps_utf8(data)
+    else:
+        body = dumps_ascii(data)
+
+    if len(body) >= GZIP_MIN_BYTES and _accepts(request_headers.get('accept-encoding'), 'gzip'):
+        body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+        headers['Content-Encoding'] = 'gzip'
+
+    return body, headers
+
+
+def decode_body(body: bytes, content_type: str = "") -> str:
+    """요청 본문 디코딩 - Content-Type 의 charset 먼저, 실패하면 FALLBACK_CHARSETS 순서로"""
+    charsets = list(FALLBACK_CHARSETS)
+    _, _, declared = content_type.lower().partition('charset=')
+    declared = declared.split(';')[0].strip().strip('"')
+    if declared:
+        charsets.insert(0, declared)
+
+    for charset in charsets:
+        try:
+            return body.decode(charset)
+        except (UnicodeDecodeError, LookupError):
+            continue
+    return body.decode('utf-8', errors='replace')
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+서버 시작 시간 리포트
+`python -X importtime` 결과를 집계해 어떤 모듈이 시작 시간을 차지하는지 보여준다.
+
+사용법:
+    python -m utils.startup_report                 # main_improved 콜드 import 리포트
+    python -m utils.startup_report --top 20 --json
+    python -m utils.startup_report --budget 2000   # 예산(ms) 초과 시 종료 코드 1
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+from utils.lazy_import import get_lazy_import_stats
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 시 import 되면 안 되는 무거운 모듈 (처음 사용할 때 import)
+HEAVY_MODULES = [
+    "google.generativeai",
+    "anthropic",
+    "openai",
+    "googleapiclient",
+    "youtube_transcript_api",
+    "matplotlib",
+    "playwright",
+]
+
+# main_improved 콜드 import 예산 (환경변수 STARTUP_IMPORT_BUDGET_MS 로 변경 가능)
+DEFAULT_IMPORT_BUDGET_MS = 3000
+
+
+def get_import_budget_ms() -> float:
+    """콜드 import 예산 (ms)"""
+    return float(os.getenv("STARTUP_IMPORT_BUDGET_MS", DEFAULT_IMPORT_BUDGET_MS))
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """-X importtime 출력 파싱 → [{'module', 'self_us', 'cumulative_us', 'depth'}]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append({
+                'module': name.strip(),
+                'self_us': int(self_us),
+                'cumulative_us': int(cumulative_us),
+                # 들여쓰기 2칸 = 한 단계 (0 이면 최상위 import)
+                'depth': (len(name) - len(name.lstrip()) - 1) // 2
+            })
+        except ValueError:
+            continue
+    return rows
+
+
+def measure_cold_import(module: str = "main_improved", top: int = 15) -> Dict[str, Any]:
+    """새 프로세스에서 module 을 import 하고 시간/무거운 모듈 로딩 여부 측정"""
+    code = (
+        "import sys, time\n"
+        "before = set(sys.modules)\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        "loaded = sorted(set(sys.modules) - before)\n"
+        "import json\n"
+        "print(json.dumps({'import_ms': elapsed, 'modules': loaded}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=ROOT
+    )
+    if result.returncode != 0:
+        error_lines = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(error_lines[-1] if error_lines else f"{module} import 실패")
+
+    measured = json.loads(result.stdout.strip().splitlines()[-1])
+    loaded = set(measured['modules'])
+    # 인터프리터 시작 시 로딩된 모듈 제외 (module import 중 로딩된 것만)
+    rows = [r for r in parse_importtime(result.stderr) if r['module'] in loaded]
+
+    # module 이 직접 import 한 모듈 (depth 1) 을 누적 시간 순으로
+    direct = sorted((r for r in rows if r['depth'] == 1),
+                    key=lambda r: r['cumulative_us'], reverse=True)
+    return {
+        'module': module,
+        'import_ms': round(measured['import_ms'], 1),
+        'module_count': len(loaded),
+        'heavy_modules_loaded': [name for name in HEAVY_MODULES if name in loaded],
+        'top_imports': [
+            {'module': r['module'], 'cumulative_ms': round(r['cumulative_us'] / 1000, 1),
+             'self_ms': round(r['self_us'] / 1000, 1)}
+            for r in direct[:top]
+        ]
+    }
+
+
+def get_runtime_report() -> Dict[str, Any]:
+    """현재 프로세스 기준 리포트 (무거운 모듈 로딩 여부, 지연 import 시간)"""
+    return {
+        'module_count': len(sys.modules),
+        'heavy_modules_loaded': [name for name in HEAVY_MODULES if name in sys.modules],
+        'lazy_imports': get_lazy_import_stats()
+    }
+
+
+def format_report(report: Dict[str, Any], budget_ms: float) -> str:
+    """CLI 출력용 텍스트"""
+    status = "✅" if report['import_ms'] <= budget_ms else "❌"
+    lines = [
+        f"📦 {report['module']} 콜드 import: {report['import_ms']:.1f}ms "
+        f"(예산 {budget_ms:.0f}ms) {status}",
+        f"로딩된 모듈: {report['module_count']}개",
+        f"무거운 모듈: {', '.join(report['heavy_modules_loaded']) or '없음'}",
+        "",
+        f"{'모듈':<40}{'누적(ms)':>10}{'자체(ms)':>10}",
+    ]
+    for row in report['top_imports']:
+        lines.append(f"{row['module']:<40}{row['cumulative_ms']:>10.1f}{row['self_ms']:>10.1f}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 시작 시간 리포트")
+    parser.add_argument("--module", default="main_improved")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget", type=float, default=None, help="콜드 import 예산 (ms)")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    budget_ms = args.budget if args.budget is not None else get_import_budget_ms()
+    report = measure_cold_import(args.module, args.top)
+    report['budget_ms'] = budget_ms
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(report, budget_ms))
+    return 0 if report['import_ms'] <= budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
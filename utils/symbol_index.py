@@ -0,0 +1,466 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+KRX 종목 인덱스 모듈
+KOSPI/KOSDAQ 상장 종목명/종목코드를 data/krx_symbols.tsv 에서 읽어 메모리 인덱스로 만든다.
+/주식 명령어와 차트 엔드포인트가 종목명 → 종목코드를 외부 검색 없이 찾는다.
+
+    from utils.symbol_index import symbol_index
+
+    symbol = symbol_index.resolve("삼전")          # Symbol(code='005930', name='삼성전자', market='KOSPI')
+    symbol_index.resolve("ㅅㅅㅈㅈ")                 # 초성
+    symbol_index.resolve("삼송전자")                 # 오타 (자모 단위 편집 거리)
+    symbol_index.search("삼성", limit=5)            # 후보 목록 (못 찾았을 때 안내용)
+
+  - 처음 사용할 때 파일을 읽는다 (서버 시작 시간에 포함되지 않음)
+  - 종목명과 별칭을 정규화(소문자, 공백/기호 제거)한 키로 찾는다
+      정확히 일치: dict (O(1))
+      접두어 / 초성: 정렬된 키 배열 + 같은 순서의 종목 번호 array 에서 bisect
+      오타: 자모로 풀어 쓴 키를 길이별로 나눠 두고 길이가 비슷한 키만 편집 거리 계산
+  - resolve 는 종목코드 / 종목명·별칭 일치 / 초성 전체 일치로 한 종목이 정해질 때만 돌려준다
+    접두어·오타는 목록에 없는 종목('삼성전자우', '한섬')을 다른 종목으로 바꿔 버릴 수 있으므로
+    search 후보로만 안내 (RESOLVE_PARTIAL - 전체 상장 목록으로 갱신한 뒤에만 켠다)
+  - 목록 갱신: python -m utils.symbol_index --refresh (KRX KIND 상장법인목록, 별칭은 종목코드 기준으로 유지)
+"""
+
+import argparse
+import os
+import re
+import sys
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
+
+from utils.metrics import metrics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ========================================
+# 설정
+# ========================================
+SYMBOL_INDEX_CONFIG = {
+    'PATH': os.path.join(ROOT, 'data', 'krx_symbols.tsv'),
+    'MAX_TYPOS': 2,                 # 오타 허용 편집 거리 상한 (자모 단위, 자모 4개당 1까지)
+    'SUGGESTIONS': 3,               # 못 찾았을 때 안내할 후보 수
+    'RESOLVE_PARTIAL': False,       # 유일한 접두어 / 가장 가까운 오타도 resolve (전체 상장 목록일 때만)
+    'KIND_URL': 'https://kind.krx.co.kr/corpgeneral/corpList.do',
+    'KIND_MARKETS': {'KOSPI': 'stockMkt', 'KOSDAQ': 'kosdaqMkt'},
+}
+
+SYMBOL_LOOKUPS = metrics.counter(
+    'bot_symbol_lookups_total', '종목 인덱스 조회 (찾은 방법별: code / exact / chosung / prefix / fuzzy / miss)', ['match']
+)
+
+
+class Symbol(NamedTuple):
+    code: str
+    name: str
+    market: str         # KOSPI / KOSDAQ (목록에 없는 종목코드는 '')
+
+
+# ========================================
+# 한글 정규화 / 초성 / 자모
+# ========================================
+_CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JUNGSUNG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+_JONGSUNG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+             'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+_NOT_KEY_RE = re.compile(r'[^0-9a-z가-힣ㄱ-ㅣ]')
+_JAMO_RE = re.compile(r'[ㄱ-ㅎ]')
+_CODE_RE = re.compile(r'^\d[0-9A-Z]{4}\d$')         # 005930, 신규 상장 영문 포함 코드 0088M0
+
+
+def normalize(text: str) -> str:
+    """검색 키 - 'SK 하이닉스', 'sk-하이닉스' → 'sk하이닉스'
+
+    전각 문자 등은 NFKC 로 바꾸되 초성 입력(ㄱ-ㅎ 호환 자모)은 NFKC 가 첫가끝 자모로 바꿔 버리므로 그대로 둔다.
+    """
+    text = unicodedata.normalize('NFC', text)
+    text = ''.join(ch if 'ㄱ' <= ch <= 'ㅣ' else unicodedata.normalize('NFKC', ch) for ch in text)
+    return _NOT_KEY_RE.sub('', text.lower())
+
+
+def chosung(key: str) -> str:
+    """정규화된 키의 초성 ('lg화학' → 'lgㅎㅎ', 한글이 아닌 글자는 그대로)"""
+    out = []
+    for ch in key:
+        offset = ord(ch) - 0xAC00
+        out.append(_CHOSUNG[offset // 588] if 0 <= offset < 11172 else ch)
+    return ''.join(out)
+
+
+def jamo(key: str) -> str:
+    """정규화된 키를 자모로 풀어 씀 ('성' → 'ㅅㅓㅇ') - 오타 편집 거리를 글자보다 잘게 계산"""
+    out = []
+    for ch in key:
+        offset = ord(ch) - 0xAC00
+        if 0 <= offset < 11172:
+            out.append(_CHOSUNG[offset // 588] + _JUNGSUNG[offset % 588 // 28] + _JONGSUNG[offset % 28])
+        else:
+            out.append(ch)
+    return ''.join(out)
+
+
+def _char_mask(value: str) -> int:
+    """문자 집합 비트마스크 - 편집 한 번은 질의에만 있는 문자 종류를 최대 하나 줄이므로
+    (질의 마스크 & ~후보 마스크) 의 비트 수가 limit 를 넘는 후보는 편집 거리 계산 없이 제외"""
+    mask = 0
+    for ch in value:
+        mask |= 1 << (ord(ch) & 0x7F)
+    return mask
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """레벤슈타인 거리 (limit 를 넘으면 계산을 멈추고 limit + 1)"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+# ========================================
+# 데이터 파일
+# ========================================
+
+def read_symbols(path: str) -> List[tuple]:
+    """TSV (종목코드, 종목명, 시장, 별칭) → [(code, name, market, [alias, ...])] ('#' 줄은 주석)"""
+    rows = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line or line.startswith('#'):
+                continue
+            fields = line.split('\t') + ['', '']
+            code, name, market, aliases = fields[:4]
+            rows.append((code, name, market, [a.strip() for a in aliases.split(',') if a.strip()]))
+    return rows
+
+
+def write_symbols(path: str, rows: List[tuple], source: str):
+    """read_symbols 의 반대 - 임시 파일에 쓴 뒤 교체 (읽는 중인 서버가 반쯤 쓴 파일을 보지 않도록)"""
+    rows = sorted(rows, key=lambda row: (row[2] != 'KOSPI', row[2], row[0]))
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write("# KRX 상장 종목 (종목코드, 종목명, 시장, 별칭 - 쉼표 구분)\n")
+        f.write("# 갱신: python -m utils.symbol_index --refresh (KRX KIND 상장법인목록, 별칭은 종목코드 기준으로 유지)\n")
+        f.write(f"# source: {source}\n")
+        for code, name, market, aliases in rows:
+            f.write('\t'.join([code, name, market, ','.join(aliases)]) + '\n')
+    os.replace(tmp_path, path)
+
+
+# ========================================
+# 인덱스
+# ========================================
+
+class SymbolIndex:
+    """종목명/별칭/초성/오타 → 종목 (파일은 처음 조회할 때 읽음)"""
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    # ========================================
+    # 적재
+    # ========================================
+
+    def _build(self, rows: List[tuple]):
+        # 종목 번호(id) 순서의 배열
+        codes, names, markets = [], [], []
+        by_code: Dict[str, int] = {}
+        name_keys: Dict[str, int] = {}
+        alias_keys: Dict[str, int] = {}
+        entries = []                # (키, 종목 번호) - 종목명과 별칭
+        for code, name, market, aliases in rows:
+            symbol_id = len(codes)
+            codes.append(code)
+            names.append(name)
+            markets.append(market)
+            by_code[code] = symbol_id
+            for key in [normalize(name)] + [normalize(alias) for alias in aliases]:
+                if key:
+                    entries.append((key, symbol_id))
+            name_keys.setdefault(normalize(name), symbol_id)
+            for alias in aliases:
+                alias_keys.setdefault(normalize(alias), symbol_id)
+        # 같은 키면 종목명이 별칭보다 우선 ('CJ' 는 CJ제일제당 별칭이 아니라 종목 CJ)
+        exact = {**alias_keys, **name_keys}
+        exact.pop('', None)
+
+        entries = sorted(set(entries))
+        keys = [key for key, _ in entries]
+        key_ids = array('H', [symbol_id for _, symbol_id in entries])
+
+        chosung_entries = sorted((chosung(key), symbol_id) for key, symbol_id in entries)
+        jamo_keys = [jamo(key) for key in keys]
+        jamo_masks = [_char_mask(value) for value in jamo_keys]
+        jamo_buckets: Dict[int, array] = {}
+        for position, value in enumerate(jamo_keys):
+            jamo_buckets.setdefault(len(value), array('H')).append(position)
+
+        self._codes, self._names, self._markets = codes, names, markets
+        self._by_code, self._exact = by_code, exact
+        self._keys, self._key_ids = keys, key_ids
+        self._chosung_keys = [key for key, _ in chosung_entries]
+        self._chosung_ids = array('H', [symbol_id for _, symbol_id in chosung_entries])
+        self._jamo_keys, self._jamo_masks, self._jamo_buckets = jamo_keys, jamo_masks, jamo_buckets
+
+    def load(self, path: Optional[str] = None):
+        """데이터 파일을 읽어 인덱스 교체 (--refresh 후 다시 읽을 때도 사용)"""
+        rows = read_symbols(path or self.config['PATH'])
+        with self._lock:
+            self._build(rows)
+            self._loaded = True
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            with self._lock:
+                if self._loaded:
+                    return
+                self._build(read_symbols(self.config['PATH']))
+                self._loaded = True
+
+    def _symbol(self, symbol_id: int) -> Symbol:
+        return Symbol(self._codes[symbol_id], self._names[symbol_id], self._markets[symbol_id])
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._codes)
+
+    # ========================================
+    # 조회
+    # ========================================
+
+    def get(self, code: str) -> Optional[Symbol]:
+        """종목코드 → 종목"""
+        self._ensure_loaded()
+        symbol_id = self._by_code.get(code)
+        return self._symbol(symbol_id) if symbol_id is not None else None
+
+    def lookup(self, name: str) -> Optional[Symbol]:
+        """종목명/별칭 정확히 일치 (대소문자, 공백, 기호 무시)"""
+        self._ensure_loaded()
+        symbol_id = self._exact.get(normalize(name))
+        return self._symbol(symbol_id) if symbol_id is not None else None
+
+    def _range_ids(self, keys: List[str], ids: array, prefix: str) -> List[int]:
+        """정렬된 keys 에서 prefix 로 시작하는 키의 종목 번호 (짧은 키, 파일 순서 먼저, 중복 제거)"""
+        matches = []
+        position = bisect_left(keys, prefix)
+        while position < len(keys) and keys[position].startswith(prefix):
+            matches.append((len(keys[position]), ids[position]))
+            position += 1
+        seen, result = set(), []
+        for _, symbol_id in sorted(matches):
+            if symbol_id not in seen:
+                seen.add(symbol_id)
+                result.append(symbol_id)
+        return result
+
+    def _prefix_ids(self, key: str) -> List[int]:
+        return self._range_ids(self._keys, self._key_ids, key) if key else []
+
+    def _chosung_ids_for(self, key: str) -> List[int]:
+        """초성 질의 ('ㅅㅅㅈㅈ', 'skㅎㅇㄴㅅ') - 초성이 없는 질의는 빈 목록"""
+        if not _JAMO_RE.search(key) or any('가' <= ch <= '힣' for ch in key):
+            return []
+        return self._range_ids(self._chosung_keys, self._chosung_ids, key)
+
+    def _fuzzy_ids(self, key: str) -> List[tuple]:
+        """[(편집 거리, 종목 번호)] 거리순 - 자모 4개당 1, 최대 MAX_TYPOS"""
+        query = jamo(key)
+        limit = min(self.config.get('MAX_TYPOS', 2), len(query) // 4)
+        if limit <= 0:
+            return []
+        query_mask = _char_mask(query)
+        masks = self._jamo_masks
+        best: Dict[int, int] = {}
+        for length in range(len(query) - limit, len(query) + limit + 1):
+            for position in self._jamo_buckets.get(length, ()):
+                if (query_mask & ~masks[position]).bit_count() > limit:
+                    continue
+                distance = _edit_distance(query, self._jamo_keys[position], limit)
+                symbol_id = self._key_ids[position]
+                if distance <= limit and distance < best.get(symbol_id, limit + 1):
+                    best[symbol_id] = distance
+        return sorted((distance, symbol_id) for symbol_id, distance in best.items())
+
+    def prefix(self, text: str, limit: int = 10) -> List[Symbol]:
+        """종목명/별칭이 text 로 시작하는 종목 (짧은 이름 먼저)"""
+        self._ensure_loaded()
+        return [self._symbol(i) for i in self._prefix_ids(normalize(text))[:limit]]
+
+    def chosung(self, text: str, limit: int = 10) -> List[Symbol]:
+        """초성이 text 로 시작하는 종목"""
+        self._ensure_loaded()
+        return [self._symbol(i) for i in self._chosung_ids_for(normalize(text))[:limit]]
+
+    def fuzzy(self, text: str, limit: int = 10) -> List[Symbol]:
+        """오타를 허용해 가까운 종목 (편집 거리순)"""
+        self._ensure_loaded()
+        return [self._symbol(i) for _, i in self._fuzzy_ids(normalize(text))[:limit]]
+
+    def resolve(self, query: str) -> Optional[Symbol]:
+        """명령어 입력 → 종목 (한 종목으로 정해지지 않으면 None)
+
+        순서: 종목코드 (6자리) → 종목명/별칭 일치 → 초성 전체 일치
+        (RESOLVE_PARTIAL 일 때만 → 유일한 접두어 → 가장 가까운 오타 하나)
+        목록에 없는 6자리 종목코드도 그대로 돌려준다 (신규 상장 등, 이름은 종목코드).
+        """
+        self._ensure_loaded()
+        query = query.strip()
+        if _CODE_RE.match(query.upper()):
+            code = query.upper()
+            SYMBOL_LOOKUPS.labels('code').inc()
+            return self.get(code) or Symbol(code, code, '')
+
+        key = normalize(query)
+        if not key:
+            SYMBOL_LOOKUPS.labels('miss').inc()
+            return None
+        symbol_id = self._exact.get(key)
+        if symbol_id is not None:
+            SYMBOL_LOOKUPS.labels('exact').inc()
+            return self._symbol(symbol_id)
+
+        chosung_ids = self._chosung_ids_for(key)
+        if chosung_ids:
+            # 초성이 정확히 같은 종목이 하나면 그 종목 ('ㅅㅅㅈㅈ' → 삼성전자, 'ㅅㅅ' 는 여러 개라 None)
+            whole = [i for i in chosung_ids if chosung(normalize(self._names[i])) == key]
+            if len(whole) == 1:
+                SYMBOL_LOOKUPS.labels('chosung').inc()
+                return self._symbol(whole[0])
+            SYMBOL_LOOKUPS.labels('miss').inc()
+            return None
+
+        if not self.config.get('RESOLVE_PARTIAL', False):
+            SYMBOL_LOOKUPS.labels('miss').inc()
+            return None
+
+        prefix_ids = self._prefix_ids(key)
+        if len(prefix_ids) == 1:
+            SYMBOL_LOOKUPS.labels('prefix').inc()
+            return self._symbol(prefix_ids[0])
+
+        if not prefix_ids:
+            fuzzy = self._fuzzy_ids(key)
+            if fuzzy and (len(fuzzy) == 1 or fuzzy[0][0] < fuzzy[1][0]):
+                SYMBOL_LOOKUPS.labels('fuzzy').inc()
+                return self._symbol(fuzzy[0][1])
+        SYMBOL_LOOKUPS.labels('miss').inc()
+        return None
+
+    def search(self, query: str, limit: int = 10) -> List[Symbol]:
+        """후보 목록 - 일치, 초성, 접두어, 오타 순으로 중복 없이"""
+        self._ensure_loaded()
+        key = normalize(query)
+        if not key:
+            return []
+        ids = []
+        if key in self._exact:
+            ids.append(self._exact[key])
+        ids += self._chosung_ids_for(key)
+        ids += self._prefix_ids(key)
+        ids += [i for _, i in self._fuzzy_ids(key)]
+        seen, result = set(), []
+        for symbol_id in ids:
+            if symbol_id not in seen:
+                seen.add(symbol_id)
+                result.append(self._symbol(symbol_id))
+        return result[:limit]
+
+    def not_found_message(self, keyword: str) -> str:
+        """/주식 에서 종목을 정하지 못했을 때 안내 (후보가 있으면 함께)"""
+        message = f"❌ '{keyword}' 종목을 찾을 수 없습니다.\n\n"
+        candidates = self.search(keyword, self.config.get('SUGGESTIONS', 3))
+        if candidates:
+            message += "🔎 혹시 이 종목인가요?\n"
+            message += ''.join(f"  • {s.name} ({s.code})\n" for s in candidates)
+            message += "\n"
+        return message + "💡 정확한 종목명이나 종목코드를 입력해주세요.\n예) /주식 삼성전자, /주식 005930"
+
+    def get_stats(self) -> Dict:
+        self._ensure_loaded()
+        markets: Dict[str, int] = {}
+        for market in self._markets:
+            markets[market] = markets.get(market, 0) + 1
+        return {'symbols': len(self._codes), 'keys': len(self._keys), 'markets': markets}
+
+
+symbol_index = SymbolIndex(SYMBOL_INDEX_CONFIG)
+
+
+# ========================================
+# 목록 갱신 (KRX KIND 상장법인목록)
+# ========================================
+
+def fetch_kind_listing(market: str) -> List[tuple]:
+    """KIND 상장법인목록 다운로드 (EUC-KR HTML 표) → [(code, name, market)]"""
+    from bs4 import BeautifulSoup
+    from services import http_service
+
+    response = http_service.get(SYMBOL_INDEX_CONFIG['KIND_URL'], params={
+        'method': 'download',
+        'searchType': '13',
+        'marketType': SYMBOL_INDEX_CONFIG['KIND_MARKETS'][market],
+    }, timeout=30)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.content.decode('euc-kr', errors='replace'), 'html.parser')
+    rows = soup.select('tr')
+    header = [cell.get_text(strip=True) for cell in rows[0].select('th, td')]
+    name_col, code_col = header.index('회사명'), header.index('종목코드')
+    listing = []
+    for row in rows[1:]:
+        cells = [cell.get_text(strip=True) for cell in row.select('td')]
+        if len(cells) > max(name_col, code_col) and cells[code_col]:
+            listing.append((cells[code_col].zfill(6), cells[name_col], market))
+    return listing
+
+
+def refresh(path: Optional[str] = None) -> int:
+    """KIND 목록으로 데이터 파일을 다시 씀 (기존 별칭은 종목코드 기준으로 유지) → 종목 수"""
+    path = path or SYMBOL_INDEX_CONFIG['PATH']
+    aliases = {code: alias for code, _, _, alias in read_symbols(path)} if os.path.exists(path) else {}
+    rows = []
+    for market in SYMBOL_INDEX_CONFIG['KIND_MARKETS']:
+        listing = fetch_kind_listing(market)
+        if not listing:
+            raise RuntimeError(f"{market} 목록이 비어 있음 (KIND 응답 형식 변경?)")
+        rows += [(code, name, market, aliases.get(code, [])) for code, name, market in listing]
+    write_symbols(path, rows, f"KRX KIND {datetime.now().strftime('%Y-%m-%d')}")
+    return len(rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="KRX 종목 인덱스")
+    parser.add_argument('query', nargs='*', help="검색할 종목명/초성/종목코드")
+    parser.add_argument('--refresh', action='store_true', help="KRX KIND 에서 상장 종목 목록을 받아 데이터 파일 갱신")
+    parser.add_argument('--path', default=SYMBOL_INDEX_CONFIG['PATH'])
+    args = parser.parse_args()
+
+    if args.refresh:
+        print(f"✅ {refresh(args.path)}개 종목 저장: {args.path}")
+    index = SymbolIndex({**SYMBOL_INDEX_CONFIG, 'PATH': args.path})
+    if not args.query:
+        print(index.get_stats())
+    for query in args.query:
+        resolved = index.resolve(query)
+        print(f"{query} → {resolved.name} ({resolved.code})" if resolved else f"{query} → 없음")
+        for symbol in index.search(query, 5):
+            print(f"    {symbol.name} ({symbol.code}, {symbol.market})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
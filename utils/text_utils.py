@@ -3,17 +3,20 @@
 텍스트 처리 및 정제 관련 함수들
 """
 
+import logging
 import re
-from datetime import datetime
 
 
-def log(message: str):
-    """로그 출력 함수
+_logger = logging.getLogger("bot")
+
+
+def log(message: str, *args):
+    """로그 출력 함수 (utils.log_pipeline 의 writer 스레드에서 기록)
     
     Args:
-        message: 출력할 로그 메시지
+        message: 출력할 로그 메시지 (args 가 있으면 message % args 를 나중에 포맷)
     """
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
+    _logger.info(message, *args)
 
 
 def clean_for_kakao(text: str) -> str:
@@ -67,5 +70,5 @@ def clean_for_kakao(text: str) -> str:
         return text
         
     except Exception as e:
-        print(f"텍스트 정제 오류: {e}")
+        _logger.warning("텍스트 정제 오류: %s", e)
         return text[:5000] if text else ""
\ No newline at end of file
@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+요청 추적(tracing) 모듈
+요청 하나의 처리 시간이 어디에 쓰였는지(풀 대기, HTTP, HTML 파싱, AI 호출) 구간(span)으로 기록하고
+가장 느린 요청 KEEP_SLOWEST 개를 메모리에 보관한다 (/트레이스, /api/traces).
+
+    from utils.tracing import span, tracer
+
+    with tracer.trace("/뉴스", room=room):      # 요청 단위 (SAMPLE_RATE 비율만 기록)
+        ...
+        with span("http", host=host):           # 요청 안의 구간 (contextvars 로 전달)
+            ...
+
+샘플링되지 않은 요청에서 span() 은 ContextVar 조회 한 번으로 끝난다.
+executor 스레드는 contextvars 를 물려받지 않으므로 current_context() 를 넘겨
+context_scope() 로 이어 붙인다 (core.router._SyncJob).
+"""
+
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+# ========================================
+# 설정
+# ========================================
+TRACING_CONFIG = {
+    'SAMPLE_RATE': 0.1,        # 기록할 요청 비율 (0 이면 끔, 1 이면 모든 요청)
+    'KEEP_SLOWEST': 20,        # 보관할 느린 요청 수
+    'MAX_SPANS': 200,          # 요청 하나에 기록할 최대 구간 수 (반복문 안의 HTTP 호출 등)
+}
+
+
+class Span:
+    """구간 하나 (시작/끝은 요청 시작 기준 ms)"""
+    __slots__ = ('span_id', 'parent_id', 'name', 'attrs', 'start_ms', 'end_ms')
+
+    def __init__(self, span_id: int, parent_id: Optional[int], name: str, attrs: Dict[str, Any], start_ms: float):
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.attrs = attrs
+        self.start_ms = start_ms
+        self.end_ms = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.span_id,
+            'parent': self.parent_id,
+            'name': self.name,
+            'start_ms': round(self.start_ms, 1),
+            'duration_ms': round(self.end_ms - self.start_ms, 1) if self.end_ms is not None else None,
+            'attrs': self.attrs
+        }
+
+
+class Trace:
+    """요청 하나의 구간 목록 (span_id 0 이 요청 전체)"""
+
+    def __init__(self, name: str, attrs: Dict[str, Any], max_spans: int):
+        self.trace_id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.attrs = attrs
+        self.created = time.time()
+        self.started = time.perf_counter()
+        self.duration_ms = None
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self.max_spans = max_spans
+        self._ids = itertools.count(1)
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def start_span(self, name: str, parent_id: int, attrs: Dict[str, Any],
+                   start_ms: float = None) -> Optional[Span]:
+        if len(self.spans) >= self.max_spans:
+            self.dropped += 1
+            return None
+        span = Span(next(self._ids), parent_id, name, attrs,
+                    self.elapsed_ms() if start_ms is None else start_ms)
+        self.spans.append(span)
+        return span
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trace_id': self.trace_id,
+            'name': self.name,
+            'attrs': self.attrs,
+            'time': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.created)),
+            'duration_ms': round(self.duration_ms, 1) if self.duration_ms is not None else None,
+            'spans': [span.to_dict() for span in list(self.spans)],
+            'dropped_spans': self.dropped
+        }
+
+
+# (Trace, 부모 span_id) - 없으면 추적하지 않는 요청
+_current: contextvars.ContextVar = contextvars.ContextVar('trace', default=None)
+
+
+def current_context():
+    """현재 추적 위치 (다른 스레드로 넘길 때)"""
+    return _current.get()
+
+
+@contextmanager
+def context_scope(context):
+    """다른 스레드에서 current_context() 로 받은 추적 위치 이어 붙이기"""
+    token = _current.set(context)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """현재 요청 안의 구간 기록 (추적 중이 아니면 아무것도 하지 않음)"""
+    context = _current.get()
+    if context is None:
+        yield None
+        return
+
+    trace, parent_id = context
+    current = trace.start_span(name, parent_id, attrs)
+    if current is None:
+        yield None
+        return
+
+    token = _current.set((trace, current.span_id))
+    try:
+        yield current
+    except BaseException as e:
+        current.attrs['error'] = type(e).__name__
+        raise
+    finally:
+        current.end_ms = trace.elapsed_ms()
+        _current.reset(token)
+
+
+def record(name: str, started: float, **attrs):
+    """이미 끝난 구간 기록 (started: time.perf_counter() 값, 예: 풀 대기 시간)"""
+    context = _current.get()
+    if context is None:
+        return
+    trace, parent_id = context
+    current = trace.start_span(name, parent_id, attrs, start_ms=(started - trace.started) * 1000)
+    if current is not None:
+        current.end_ms = trace.elapsed_ms()
+
+
+def annotate(**attrs):
+    """현재 구간(구간 밖이면 요청 전체)에 속성 추가 (캐시 히트, 거절 사유 등)"""
+    context = _current.get()
+    if context is None:
+        return
+    trace, span_id = context
+    if span_id == 0:
+        trace.attrs.update(attrs)
+        return
+    for item in reversed(trace.spans):
+        if item.span_id == span_id:
+            item.attrs.update(attrs)
+            return
+
+
+class Tracer:
+    """요청 샘플링 + 가장 느린 요청 보관"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.sample_rate = config.get('SAMPLE_RATE', 0.0)
+        self.keep_slowest = config.get('KEEP_SLOWEST', 20)
+        self.max_spans = config.get('MAX_SPANS', 200)
+
+        self._slowest: List[tuple] = []    # (duration_ms, 순번, Trace) 최소 힙
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self.traced = 0
+        self.skipped = 0
+
+    def set_sample_rate(self, rate: float):
+        self.sample_rate = min(1.0, max(0.0, rate))
+
+    @contextmanager
+    def trace(self, name: str, force: bool = False, **attrs):
+        """요청 하나 추적 (샘플링에서 빠지면 Trace 대신 None)"""
+        if _current.get() is not None:
+            # 이미 추적 중인 요청 안 (구간으로만 기록)
+            yield None
+            return
+        if not (force or (self.sample_rate and random.random() < self.sample_rate)):
+            self.skipped += 1
+            yield None
+            return
+
+        trace = Trace(name, attrs, self.max_spans)
+        token = _current.set((trace, 0))
+        try:
+            yield trace
+        except BaseException as e:
+            trace.attrs['error'] = type(e).__name__
+            raise
+        finally:
+            _current.reset(token)
+            trace.duration_ms = trace.elapsed_ms()
+            self._keep(trace)
+
+    def _keep(self, trace: Trace):
+        with self._lock:
+            self.traced += 1
+            item = (trace.duration_ms, next(self._seq), trace)
+            if len(self._slowest) < self.keep_slowest:
+                heapq.heappush(self._slowest, item)
+            elif trace.duration_ms > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, item)
+
+    def slowest(self, limit: int = None) -> List[Dict[str, Any]]:
+        """가장 느린 요청부터 (to_dict)"""
+        with self._lock:
+            items = sorted(self._slowest, reverse=True)[:limit]
+        return [trace.to_dict() for _, _, trace in items]
+
+    def reset(self):
+        with self._lock:
+            self._slowest.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'sample_rate': self.sample_rate,
+            'traced': self.traced,
+            'skipped': self.skipped,
+            'kept': len(self._slowest),
+            'keep_slowest': self.keep_slowest
+        }
+
+
+def format_trace(trace: Dict[str, Any]) -> str:
+    """Trace.to_dict() 를 구간 트리 텍스트로 (카카오톡 응답용)"""
+    children: Dict[Optional[int], List[Dict[str, Any]]] = {}
+    for item in trace['spans']:
+        children.setdefault(item['parent'], []).append(item)
+
+    attrs = dict(trace['attrs'])
+    room = attrs.pop('room', None)
+    attrs.pop('msg', None)
+    lines = [f"{trace['name']} {trace['duration_ms']:,.0f}ms · {trace['time'][11:]}" + (f" · {room}" if room else "")]
+    if attrs:
+        lines.append("  " + " ".join(f"{k}={v}" for k, v in attrs.items()))
+
+    def walk(parent_id: int, depth: int):
+        for item in children.get(parent_id, []):
+            duration = f"{item['duration_ms']:,.0f}ms" if item['duration_ms'] is not None else "진행 중"
+            detail = " ".join(f"{k}={v}" for k, v in item['attrs'].items())
+            lines.append(f"{'  ' * depth}└ {item['name']} {duration}" + (f" ({detail})" if detail else ""))
+            walk(item['id'], depth + 1)
+
+    walk(0, 1)
+    if trace['dropped_spans']:
+        lines.append(f"  … 구간 {trace['dropped_spans']}개 생략")
+    return "\n".join(lines)
+
+
+tracer = Tracer(TRACING_CONFIG)
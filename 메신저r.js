@@ -8,14 +8,18 @@ var POLL_URL = 'http://129.212.236.253:8002/api/poll';
 // var POLL_URL = 'http://localhost:8002/api/poll';
 
 // ===== 스케줄 폴링 설정 =====
-var POLL_INTERVAL = 60000;  // 1분 (밀리초)
+var POLL_INTERVAL = 60000;  // 1분 (밀리초) - long-poll 스레드를 쓸 수 없을 때만 사용
+var LONG_POLL_WAIT = 25;    // long-poll 대기 시간 (초, 서버 최대 30초)
 var lastPollTime = 0;
 var isPolling = false;
 
 function response(room, msg, sender, isGroupChat, replier, ImageDB) {
     try {
-        // 스케줄 폴링 실행 (메시지가 올 때마다 1분 간격으로 체크)
-        pollScheduledMessages(replier);
+        // 대기 메시지 수신: long-poll 스레드 시작 (한 번만)
+        // 스레드를 쓸 수 없으면 메시지가 올 때마다 1분 간격으로 체크
+        if (!startPolling()) {
+            pollScheduledMessages(replier, 0);
+        }
 
         // 1. 기본적인 정보 확인 - 토스트로 표시
         if (msg === "/테스트") {
@@ -36,7 +40,8 @@ function response(room, msg, sender, isGroupChat, replier, ImageDB) {
         var postData = {
             room: room,
             sender: sender,
-            msg: msg
+            msg: msg,
+            accept_pending: true  // 대기 메시지(스케줄, 지연 응답)를 응답에 함께 받음
         };
         
         var jsonString = JSON.stringify(postData);
@@ -46,6 +51,7 @@ function response(room, msg, sender, isGroupChat, replier, ImageDB) {
             .ignoreContentType(true)
             .ignoreHttpErrors(true)
             .header("Content-Type", "application/json; charset=utf-8")
+            .header("Accept-Charset", "utf-8")  // 한글을 \uXXXX 이스케이프 없이 받음 (gzip 은 Jsoup 기본)
             .requestBody(jsonString)
             .timeout(20000)  // 20초 타임아웃 (URL 요약에 시간 소요)
             .method(org.jsoup.Connection.Method.POST)
@@ -69,6 +75,11 @@ function response(room, msg, sender, isGroupChat, replier, ImageDB) {
         if (result && result.is_reply === true && result.reply_msg) {
             replier.reply(result.reply_msg);
         }
+
+        // 응답에 함께 온 대기 메시지 전송
+        if (result && result.pending_messages) {
+            deliverPendingMessages(result.pending_messages);
+        }
         
     } catch (error) {
         // 오류 발생 시 간단한 메시지만 출력
@@ -85,63 +96,83 @@ function responseFix(room, msg, sender, isGroupChat, replier, ImageDB) {
 
 // ===== 스케줄 폴링 기능 =====
 // 서버에서 대기 중인 스케줄 메시지를 가져와서 전송
-function pollScheduledMessages(replier) {
-    if (isPolling) return;  // 중복 실행 방지
+// wait > 0 이면 long-poll (서버가 메시지가 생길 때까지 최대 wait 초 대기)
+// 서버 응답을 정상적으로 받았으면 true
+function pollScheduledMessages(replier, wait) {
+    if (isPolling) return false;  // 중복 실행 방지
 
     var currentTime = new Date().getTime();
-    if (currentTime - lastPollTime < POLL_INTERVAL) return;  // 1분 간격 체크
+    if (!wait && currentTime - lastPollTime < POLL_INTERVAL) return false;  // 1분 간격 체크
 
     isPolling = true;
     lastPollTime = currentTime;
 
     try {
-        var httpResponse = org.jsoup.Jsoup.connect(POLL_URL)
+        var httpResponse = org.jsoup.Jsoup.connect(POLL_URL + "?wait=" + (wait || 0))
             .ignoreContentType(true)
             .ignoreHttpErrors(true)
             .header("Content-Type", "application/json; charset=utf-8")
-            .timeout(10000)
+            .header("Accept-Charset", "utf-8")
+            .timeout(((wait || 0) + 10) * 1000)
             .method(org.jsoup.Connection.Method.POST)
             .execute();
 
         var responseText = httpResponse.body();
         var result = JSON.parse(responseText);
 
-        if (result && result.success && result.messages && result.messages.length > 0) {
-            for (var i = 0; i < result.messages.length; i++) {
-                var msg = result.messages[i];
-                if (msg.room && msg.message) {
-                    // 해당 방으로 메시지 전송
-                    Api.replyRoom(msg.room, msg.message);
-                }
-            }
+        if (result && result.success && result.messages) {
+            deliverPendingMessages(result.messages);
+            return true;
         }
     } catch (error) {
         // 폴링 오류는 무시 (서버 일시 중단 등)
     } finally {
         isPolling = false;
     }
+    return false;
+}
+
+function deliverPendingMessages(messages) {
+    for (var i = 0; i < messages.length; i++) {
+        var msg = messages[i];
+        if (msg.room && msg.message) {
+            // 해당 방으로 메시지 전송
+            Api.replyRoom(msg.room, msg.message);
+        }
+    }
 }
 
-// 주기적 폴링을 위한 타이머 (메신저R에서 지원하는 경우)
-// 참고: 메신저R 버전에 따라 setInterval이 지원되지 않을 수 있음
-// 그 경우 response 함수 내에서 호출하여 사용
-var pollTimer = null;
+// long-poll 스레드 (메시지가 생기면 바로 응답을 받으므로 폴링 간격 없이 반복)
+// 스레드를 만들 수 없으면 false 를 반환하고 response 함수 내에서 폴링
+var pollThread = null;
+var pollRunning = false;
 function startPolling() {
-    if (pollTimer) return;
+    if (pollThread) return true;
     try {
-        pollTimer = setInterval(function() {
-            pollScheduledMessages(null);
-        }, POLL_INTERVAL);
+        pollRunning = true;
+        pollThread = new java.lang.Thread(new java.lang.Runnable({
+            run: function() {
+                while (pollRunning) {
+                    // 서버 오류(연결 실패 등)면 잠시 쉬었다가 재시도
+                    if (!pollScheduledMessages(null, LONG_POLL_WAIT)) {
+                        java.lang.Thread.sleep(5000);
+                    }
+                }
+            }
+        }));
+        pollThread.setDaemon(true);
+        pollThread.start();
+        return true;
     } catch (e) {
-        // setInterval 미지원 시 response에서 폴링
+        pollThread = null;
+        pollRunning = false;
+        return false;
     }
 }
 
 function stopPolling() {
-    if (pollTimer) {
-        clearInterval(pollTimer);
-        pollTimer = null;
-    }
+    pollRunning = false;
+    pollThread = null;
 }
 
 // =====================================================